@@ -0,0 +1,157 @@
+"""Analysis-CRS feature geometries shared by one processing run.
+
+Duplicate matching, numbering and label-anchor weighting each reprojected
+the same merged features to the analysis CRS with
+``MetricContext.to_analysis_geometry``.  :class:`AnalysisGeometryStore`
+keeps each transformed geometry with its bounding box, so the later passes
+of a run read it back instead of transforming again.
+
+Entries are keyed by ``(layer id, feature id, geometry revision, analysis
+CRS)``.  A pass that repairs a feature with ``makeValid`` calls
+:meth:`AnalysisGeometryStore.invalidate`, which starts a new revision; the
+stale entry is never read again and ages out of the least-recently-used
+order.  The store is capped by an estimate of the coordinates it holds.
+
+QGIS is an optional import, as in :mod:`study_geometry`; the metric context
+and the size estimate are injectable, so the store is testable without QGIS.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+
+try:
+    from .study_geometry import _copy, crs_key
+except ImportError:
+    # Importable outside the plugin package, like the other run helpers.
+    from study_geometry import _copy, crs_key
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Two doubles per coordinate plus the per-geometry bookkeeping of QGIS/GEOS.
+_COORDINATE_BYTES = 16
+_ENTRY_OVERHEAD_BYTES = 256
+
+StoredGeometry = namedtuple("StoredGeometry", ("geometry", "bounds"))
+
+
+def _estimated_size(geometry):
+    try:
+        coordinates = geometry.constGet().nCoordinates()
+    except AttributeError:
+        coordinates = 0
+    return _ENTRY_OVERHEAD_BYTES + _COORDINATE_BYTES * int(coordinates)
+
+
+class AnalysisGeometryStore:
+    """Least-recently-used analysis-CRS geometries for one processing run."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, size_of=None):
+        self.max_bytes = max(1, int(max_bytes))
+        self._size_of = size_of or _estimated_size
+        self._entries = OrderedDict()
+        self._revisions = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def revision(self, layer_id, feature_id):
+        """Return the current geometry revision of one feature."""
+        return self._revisions.get((layer_id, feature_id), 0)
+
+    def invalidate(self, layer_id, feature_id):
+        """Start a new revision after the feature's geometry changed."""
+        key = (layer_id, feature_id)
+        self._revisions[key] = self._revisions.get(key, 0) + 1
+        self.invalidations += 1
+
+    def _key(self, metric_context, layer_id, feature_id):
+        return (
+            layer_id,
+            feature_id,
+            self.revision(layer_id, feature_id),
+            crs_key(metric_context.analysis_crs),
+        )
+
+    def _hit(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return StoredGeometry(_copy(entry[0]), entry[1])
+
+    def _store(self, key, geometry):
+        bounds = geometry.boundingBox()
+        size = self._size_of(geometry)
+        self.misses += 1
+        if size > self.max_bytes:
+            return StoredGeometry(_copy(geometry), bounds)
+        self._entries[key] = (geometry, bounds, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _key, (_geometry, _bounds, evicted_size) = self._entries.popitem(
+                last=False
+            )
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+        return StoredGeometry(_copy(geometry), bounds)
+
+    def get(
+        self,
+        metric_context,
+        layer_id,
+        feature_id,
+        geometry,
+        source_crs=None,
+    ):
+        """Return the feature's :class:`StoredGeometry` in the analysis CRS.
+
+        ``geometry`` is the feature's geometry in ``source_crs``; it is
+        transformed only when the current revision is not stored yet.
+        """
+        key = self._key(metric_context, layer_id, feature_id)
+        stored = self._hit(key)
+        if stored is not None:
+            return stored
+        return self._store(
+            key,
+            metric_context.to_analysis_geometry(geometry, source_crs),
+        )
+
+    def get_many(self, metric_context, layer_id, items, source_crs=None):
+        """Return stored geometries for ``(feature_id, geometry)`` items.
+
+        Missing features are transformed together with
+        ``MetricContext.to_analysis_geometries``, which batches flat points.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        missing = []
+        for position, (feature_id, _geometry) in enumerate(items):
+            key = self._key(metric_context, layer_id, feature_id)
+            results[position] = self._hit(key)
+            if results[position] is None:
+                missing.append((position, key))
+        if missing:
+            transformed = metric_context.to_analysis_geometries(
+                [items[position][1] for position, _key in missing],
+                source_crs,
+            )
+            for (position, key), geometry in zip(missing, transformed):
+                results[position] = self._store(key, geometry)
+        return results
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "analysis_geometry_hits": self.hits,
+            "analysis_geometry_misses": self.misses,
+            "analysis_geometry_evictions": self.evictions,
+            "analysis_geometry_invalidations": self.invalidations,
+        }
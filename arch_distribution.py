@@ -9,22 +9,47 @@ from qgis.core import (QgsProject, QgsVectorLayer, QgsGeometry, QgsFeature,
                        QgsFillSymbol,
                        QgsPalLayerSettings, QgsTextFormat, QgsVectorLayerSimpleLabeling,
                        QgsCoordinateTransform, QgsWkbTypes, QgsRectangle,
-                       QgsSpatialIndex, QgsDistanceArea, QgsVectorFileWriter,
+                       QgsDistanceArea, QgsVectorFileWriter,
                        QgsApplication, Qgis,
                        QgsPrintLayout, QgsLayoutItemMap, QgsLayoutPoint,
-                       QgsLayoutSize, QgsUnitTypes, QgsLayoutExporter)
+                       QgsLayoutSize, QgsUnitTypes, QgsLayoutExporter,
+                       QgsVectorLayerFeatureSource)
 
 import json
 import hashlib
 import os.path
 import processing
+import sqlite3
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import replace
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 from .cartographic_filtering import is_insignificant_extent_fragment
 from .arch_distribution_dialog import ArchDistributionDialog, get_plugin_version
+from .analysis_geometry_store import AnalysisGeometryStore
+from .buffer_tiers import BufferTiers
+from .disjoint_set import DisjointSet
+from .geometry_digests import GeometryDigests
+from .extent_clipping import (
+    ExtentClipper,
+    bounds_disjoint,
+    rectangle_bounds,
+    rectangle_tuple,
+)
+from .heritage_candidate_metrics import (
+    METRIC_COLUMNS,
+    SHAPELY_AVAILABLE,
+    collect_candidates,
+    default_scan_thread_count,
+    default_worker_count,
+    evaluation_record,
+    known_pair_metrics,
+)
 from .heritage_grouping import (
     canonical_heritage_text,
     resolve_heritage_group,
@@ -47,22 +72,38 @@ from .heritage_matching import (
     detect_source_role,
     canonical_name,
     evaluate_candidate,
+    evaluate_candidates,
     is_designated_role,
     is_generic_name,
     load_matching_rules,
     matching_rules_metadata,
+    roles_can_pair,
+    screen_candidates,
     selected_content_fingerprint,
     source_priority,
 )
 from .heritage_matching_dialog import DuplicateReviewDialog
+from .heritage_similarity import SimilarityMemo
 from .heritage_identity_store import DecisionStore, build_source_identity
-from .metric_context import MetricContext, MetricContextError
+from .heritage_metric_cache import CandidateMetricCache
+from .metric_context import (
+    MetricContext,
+    MetricContextError,
+    transform_point_geometries,
+)
+from .prepared_geometry import PreparedGeometryCache
 from .preservation_actions import (
     PRESERVATION_ACTION_FIELD_CANDIDATES,
     PRESERVATION_ACTION_STYLES,
     normalize_preservation_action,
     recognized_preservation_actions,
 )
+from .review_queue import (
+    ReviewCheckpoint,
+    ReviewQueue,
+    ReviewStream,
+    cross_family_priority,
+)
 from .run_artifacts import (
     build_run_manifest,
     deterministic_content_hash,
@@ -75,6 +116,22 @@ from .run_artifacts import (
     sha256_file,
     sha256_file_bundle,
 )
+from .source_snapshot_cache import (
+    STATUS_INVALID,
+    STATUS_REPAIRED,
+    STATUS_VALID,
+    CachedIdentity,
+    SourceSnapshotCache,
+    open_snapshot,
+    restore_source_feature,
+    snapshot_feature,
+    snapshot_fields,
+    snapshot_key,
+    write_snapshot,
+)
+from .spatial_index import bulk_spatial_index, geometry_bounds
+from .study_geometry import StudyGeometry
+from .zone_lookup import ZoneLookup
 
 LEGACY_KOREAN_ENCODING = "CP949"
 ENCODING_OVERRIDE_PROPERTY = "ArchDistribution/encoding_override"
@@ -90,6 +147,11 @@ TOPO_BOUNDARY_EXCLUDE_CODE = "H0017334"
 SAFE_BUFFER_DIST_GEOGRAPHIC = 0.000001
 SAFE_BUFFER_DIST_PROJECTED = 0.01
 MATCH_POLICY_VERSION = "source-aware-v2"
+CANDIDATE_WORKERS_PREF_KEY = "ArchDistribution/candidate_workers"
+POINT_TRANSFORM_BATCH_SIZE = 2048
+PER_PAIR_EVALUATION_BATCH = 2048
+# Open the streaming review on a partial page once this much time has passed.
+FIRST_REVIEW_SECONDS = 2.0
 
 
 class DuplicateReviewCancelled(Exception):
@@ -116,6 +178,14 @@ def _json_safe_attribute(value):
     return str(value)
 
 
+def _geometry_payload(geometry):
+    """Return WKB bytes for hashing, or WKT when serialization fails."""
+    try:
+        return bytes(geometry.asWkb())
+    except (TypeError, ValueError):
+        return geometry.asWkt()
+
+
 def format_buffer_label(distance_m, use_km=False):
     """Return a compact map label while keeping the source value in metres."""
     value = float(distance_m)
@@ -231,6 +301,9 @@ class ArchDistribution:
         # Connect the run signal to the processing method
         self.dlg.run_requested.connect(self.process_distribution_map)
         self.dlg.renumber_requested.connect(self.process_renumbering)
+        self.dlg.purge_cache_requested.connect(
+            self.purge_source_snapshot_cache
+        )
         self.dlg.exec_()
 
     def log(self, message):
@@ -397,8 +470,13 @@ class ArchDistribution:
         self._pending_decision_store = None
         self._pending_decision_store_path = None
         self._pending_decision_store_dirty = False
+        self._review_checkpoint = None
         run_started_at = datetime.now().astimezone()
         self._current_processing_stats = {}
+        self._prepared_geometries = PreparedGeometryCache()
+        self._study_geometries = {}
+        self._geometry_digests = GeometryDigests()
+        self._analysis_geometries = AnalysisGeometryStore()
 
         try:
             current_step = 0
@@ -610,20 +688,10 @@ class ArchDistribution:
 
                     buffer_geoms = []
                     if settings.get('buffers'):
-                        combined_study = QgsGeometry()
-                        for f in analysis_study_layer.getFeatures():
-                            if not f.hasGeometry():
-                                continue
-                            if combined_study.isNull():
-                                combined_study = f.geometry()
-                            else:
-                                combined_study = combined_study.combine(f.geometry())
-
-                        if not combined_study.isNull():
-                            sorted_buffers = sorted(settings['buffers'])
-                            for dist in sorted_buffers:
-                                bg = combined_study.buffer(dist, STUDY_BUFFER_SEGMENTS)
-                                buffer_geoms.append({'dist': dist, 'geom': bg})
+                        buffer_geoms = self._study_geometry(
+                            analysis_study_layer
+                        ).buffers(settings['buffers'], STUDY_BUFFER_SEGMENTS)
+                        if buffer_geoms:
                             self.log(f"버퍼 구간 처리 준비 완료 ({len(buffer_geoms)}단계).")
 
                         if settings.get('sort_order') != 1:
@@ -801,6 +869,10 @@ class ArchDistribution:
             if 'progress' in locals():
                 progress.close()
             self._active_progress = None
+            self._prepared_geometries = None
+            self._study_geometries = None
+            self._geometry_digests = None
+            self._analysis_geometries = None
 
     def process_preservation_area_map(self, settings):
         """Create a numbered, categorized preservation-area result layer."""
@@ -1112,6 +1184,8 @@ class ArchDistribution:
     def process_renumbering(self, layer):
         """Renumber the specific layer based on current UI settings."""
         self.log(f"레이어 '{layer.name()}' 번호 새로고침 중...")
+        self._study_geometries = {}
+        self._analysis_geometries = AnalysisGeometryStore()
 
         try:
             # 1. Get Settings (Sort Order & Study Area)
@@ -1162,18 +1236,10 @@ class ArchDistribution:
             # [NEW] Calculate Buffer Geometries (Renumbering context)
             buffer_geoms = []
             if settings.get('buffers') and analysis_study_layer:
-                combined_study = QgsGeometry()
-                for f in analysis_study_layer.getFeatures():
-                    if combined_study.isNull():
-                        combined_study = f.geometry()
-                    else:
-                        combined_study = combined_study.combine(f.geometry())
-
-                if not combined_study.isNull():
-                    sorted_buffers = sorted(settings['buffers'])
-                    for dist in sorted_buffers:
-                        bg = combined_study.buffer(dist, STUDY_BUFFER_SEGMENTS)
-                        buffer_geoms.append({'dist': dist, 'geom': bg})
+                buffer_geoms = self._study_geometry(
+                    analysis_study_layer
+                ).buffers(settings['buffers'], STUDY_BUFFER_SEGMENTS)
+                if buffer_geoms:
                     self.log(f"버퍼 구간 적용 ({len(buffer_geoms)}단계).")
 
             # 3. Call Numbering Logic
@@ -1225,6 +1291,10 @@ class ArchDistribution:
         except Exception as e:
             self.log(f"오류 발생: {str(e)}")
             QMessageBox.critical(self.dlg, "오류", f"번호 부여 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            # Like process_main, release the run's analysis geometries.
+            self._study_geometries = None
+            self._analysis_geometries = None
 
     def perform_scan(self, settings):
         """Execute smart scan and update dialog."""
@@ -1396,13 +1466,16 @@ class ArchDistribution:
         self._active_output_transaction = None
 
     def _review_decision_store_path(self):
-        """Return a project-local decision file or a safe user-data fallback."""
+        """Return a project-local decision file or a safe user-data fallback.
+
+        The SQLite store migrates a ``.json`` store of the same name once.
+        """
         project = QgsProject.instance()
         project_file = str(project.fileName() or "").strip()
         if project_file:
             return os.path.join(
                 os.path.dirname(project_file),
-                "ArchDistribution_review_decisions.json",
+                "ArchDistribution_review_decisions.sqlite",
             )
 
         app_data = QtCore.QStandardPaths.writableLocation(
@@ -1412,13 +1485,242 @@ class ArchDistribution:
         return os.path.join(
             base_dir,
             "ArchDistribution",
-            "review_decisions.json",
+            "review_decisions.sqlite",
+        )
+
+    def _candidate_metric_cache_path(self):
+        """Return the candidate-metric cache stored beside the decisions."""
+        decision_path = Path(self._review_decision_store_path())
+        prefix = (
+            "ArchDistribution_"
+            if decision_path.name.startswith("ArchDistribution_")
+            else ""
+        )
+        return str(
+            decision_path.with_name(f"{prefix}candidate_metrics.sqlite")
+        )
+
+    def _open_candidate_metric_cache(self, matching_context):
+        """Open the persistent pair-metric cache, or ``None`` if unusable."""
+        analysis_crs = matching_context.analysis_crs
+        try:
+            return CandidateMetricCache.open(
+                self._candidate_metric_cache_path(),
+                ruleset_sha256=matching_rules_metadata().get("sha256"),
+                analysis_crs=analysis_crs.authid() or analysis_crs.toWkt(),
+            )
+        except (OSError, sqlite3.Error) as exc:
+            self.log(
+                "⚠️ 후보 도형 지표 캐시를 열 수 없어 모든 쌍을 새로 "
+                f"비교합니다: {exc}"
+            )
+            return None
+
+    def _close_candidate_metric_cache(self, metric_cache):
+        """Persist new pair metrics; a cache failure never fails the run."""
+        try:
+            metric_cache.save()
+        except (OSError, sqlite3.Error) as exc:
+            self.log(f"⚠️ 후보 도형 지표 캐시를 저장하지 못했습니다: {exc}")
+        finally:
+            metric_cache.close()
+        statistics = getattr(self, "_current_processing_stats", None)
+        if not isinstance(statistics, dict):
+            statistics = {}
+            self._current_processing_stats = statistics
+        for key, value in metric_cache.statistics().items():
+            statistics[key] = statistics.get(key, 0) + value
+        self.log(
+            "후보 도형 지표 캐시: "
+            f"{metric_cache.reused_pair_count}쌍 재사용, "
+            f"{metric_cache.stored_pair_count}쌍 새로 계산"
+        )
+
+    def _open_source_snapshot_cache(self):
+        """Open the preprocessed source cache, or ``None`` if unusable."""
+        try:
+            return SourceSnapshotCache.open(
+                self._user_data_directory() / "source_snapshots"
+            )
+        except (OSError, sqlite3.Error) as exc:
+            self.log(
+                "⚠️ 원천 전처리 캐시를 열 수 없어 모든 원천을 새로 "
+                f"정리합니다: {exc}"
+            )
+            return None
+
+    def _source_snapshot_key(
+        self,
+        layer,
+        target_crs,
+        job,
+        transform_context=None,
+    ):
+        """Key a source's normalized features, or ``None`` if not cacheable.
+
+        Only file-backed layers have the checksums the key needs.  The key
+        includes the coordinate operation the project's transform context
+        selects, so a changed datum transformation misses the cache.
+        """
+        checksums = self._artifact_input_checksums(
+            [self._artifact_layer_summary(layer)]
+        )
+        if not checksums:
+            return None
+        if transform_context is None:
+            transform_context = QgsProject.instance().transformContext()
+        coordinate_operation = (
+            ""
+            if layer.crs() == target_crs
+            else transform_context.calculateCoordinateOperation(
+                layer.crs(), target_crs
+            )
+        )
+        source_uri = str(layer.source() or "")
+        return snapshot_key(
+            source_checksums=[item["bundle_sha256"] for item in checksums],
+            target_crs=target_crs.toWkt(),
+            coordinate_operation=coordinate_operation,
+            encoding=str(layer.dataProvider().encoding() or ""),
+            provider=layer.providerType(),
+            layer_options=source_uri.split("|", 1)[1:],
+            subset=layer.subsetString(),
+            fields=[field.name() for field in layer.fields()],
+            geometry_type=job["geometry_type"],
+            role=job["source_role"],
+            identity_fields=[
+                job["name_field"],
+                job["project_name_field"],
+                job["addr_field"],
+                job["code_field"],
+            ],
+        )
+
+    def _prepare_source_snapshot_job(
+        self,
+        job,
+        key,
+        snapshot_cache,
+        extent_geom,
+    ):
+        """Point a scan job at its cached snapshot, or make it build one."""
+        extent_rect = (
+            QgsRectangle(extent_geom.boundingBox())
+            if extent_geom is not None else None
+        )
+        path = snapshot_cache.lookup(key)
+        snapshot = open_snapshot(path) if path is not None else None
+        if snapshot is not None:
+            request = QgsFeatureRequest()
+            if extent_rect is not None:
+                request.setFilterRect(extent_rect)
+            job.update(
+                snapshot=snapshot,
+                source=snapshot,
+                request=request,
+                used_extent_filter=extent_rect is not None,
+            )
+            self.log("  -> 원천 전처리 캐시 사용")
+            return
+        job.update(
+            snapshot_key=key,
+            snapshot_fields=snapshot_fields(),
+            request=QgsFeatureRequest(),
+            candidate_bounds=(
+                rectangle_tuple(extent_rect)
+                if job["used_extent_filter"] else None
+            ),
+        )
+
+    def _store_source_snapshots(self, snapshot_cache, jobs, scans, target_crs):
+        """Write the snapshots built by cache-miss scans and evict by size."""
+        stored = 0
+        for job, scan in zip(jobs, scans):
+            features = scan.get("snapshot_features")
+            if features is None:
+                continue
+            key = job["snapshot_key"]
+            path = snapshot_cache.path_for(key)
+            try:
+                write_snapshot(
+                    path,
+                    features,
+                    target_crs,
+                    QgsProject.instance().transformContext(),
+                )
+                snapshot_cache.store(
+                    key,
+                    path,
+                    feature_count=len(features),
+                    layer_name=job["layer_name"],
+                )
+                stored += 1
+            except (OSError, sqlite3.Error) as exc:
+                self.log(
+                    "⚠️ 원천 전처리 캐시를 저장하지 못했습니다: "
+                    f"{job['layer_name']} ({exc})"
+                )
+        return stored
+
+    def purge_source_snapshot_cache(self):
+        """Delete every preprocessed source snapshot on user request."""
+        snapshot_cache = self._open_source_snapshot_cache()
+        if snapshot_cache is None:
+            return
+        try:
+            count, freed = snapshot_cache.purge()
+        except (OSError, sqlite3.Error) as exc:
+            self.log(f"⚠️ 원천 전처리 캐시를 비우지 못했습니다: {exc}")
+            return
+        finally:
+            snapshot_cache.close()
+        message = (
+            f"원천 전처리 캐시 {count}건을 삭제했습니다 "
+            f"({freed / (1024 * 1024):.1f} MB)."
         )
+        self.log(message)
+        QMessageBox.information(self.dlg, "캐시 비우기", message)
+
+    @staticmethod
+    def _candidate_metric_key(fingerprint, wkb):
+        """Bind a source fingerprint to the analysis geometry it measures.
+
+        The checksum keeps a cached pair from surviving a geometry edit made
+        to the merged layer after its ``SRC_FP`` was written.
+        """
+        if not fingerprint:
+            return ""
+        return f"{fingerprint}:{zlib.crc32(wkb):08x}"
 
     def _clear_pending_decision_store(self):
+        store = getattr(self, "_pending_decision_store", None)
+        if store is not None:
+            store.close()
+        checkpoint = getattr(self, "_review_checkpoint", None)
+        if checkpoint is not None:
+            checkpoint.close()
         self._pending_decision_store = None
         self._pending_decision_store_path = None
         self._pending_decision_store_dirty = False
+        self._review_checkpoint = None
+
+    def _review_page_confirmer(self, policy_version):
+        """Return the dialog callback that checkpoints confirmed pages."""
+        checkpoint = getattr(self, "_review_checkpoint", None)
+        if checkpoint is None:
+            return None
+
+        def confirm(decisions):
+            try:
+                written = checkpoint.confirm(decisions, policy_version)
+            except Exception as exc:
+                self.log(f"⚠️ 확정한 검토 결정을 중간 저장하지 못했습니다: {exc}")
+                raise
+            if written:
+                self.log(f"확정한 검토 결정 {written}건을 중간 저장했습니다.")
+            return written
+
+        return confirm
 
     def _decision_cache_provenance(self):
         """Return a path-free fingerprint of the reusable review cache."""
@@ -1447,6 +1749,10 @@ class ArchDistribution:
         try:
             store.save(path)
             self.log(f"검토 결정 저장 완료: {path} ({len(store)}건)")
+            checkpoint = getattr(self, "_review_checkpoint", None)
+            if checkpoint is not None:
+                # The main store now holds every confirmed page.
+                checkpoint.discard()
         except Exception as exc:
             # A decision-cache write failure must not discard an otherwise
             # complete map result.
@@ -1597,29 +1903,46 @@ class ArchDistribution:
             results.append(fingerprint)
         return results
 
-    @staticmethod
-    def _artifact_layer_content_hash(layer):
+    def _artifact_layer_content_hash(self, layer):
         """Hash normalized feature content independently of transient IDs."""
         field_names = [field.name() for field in layer.fields()]
-        records = []
+        digests = self._geometry_digest_service()
+        digest_source = (layer.id(), "normalized-wkb")
+        features = []
+        geometry_hashes = {}
+        pending = []
         for feature in layer.getFeatures():
-            attributes = {
-                name: _json_safe_attribute(feature[name])
-                for name in field_names
-            }
+            features.append(feature)
+            if digests.get(digest_source, feature.id()) is not None:
+                continue
             try:
                 normalized_geometry = QgsGeometry(feature.geometry())
                 # GEOS normalization canonicalizes ring direction, ring start,
                 # and multipart order so equivalent geometry has one content
                 # digest even when a provider serializes its WKB differently.
                 normalized_geometry.normalize()
-                geometry_hash = hashlib.sha256(
-                    bytes(normalized_geometry.asWkb())
-                ).hexdigest()
+                pending.append(
+                    (feature.id(), bytes(normalized_geometry.asWkb()))
+                )
             except (AttributeError, RuntimeError, TypeError, ValueError):
-                geometry_hash = hashlib.sha256(
+                geometry_hashes[feature.id()] = hashlib.sha256(
                     feature.geometry().asWkt().encode("utf-8")
                 ).hexdigest()
+        geometry_hashes.update(digests.digest_many(
+            digest_source,
+            pending,
+            max_workers=self._candidate_worker_count(len(pending)),
+        ))
+        records = []
+        for feature in features:
+            attributes = {
+                name: _json_safe_attribute(feature[name])
+                for name in field_names
+            }
+            geometry_hash = geometry_hashes.get(feature.id()) or digests.get(
+                digest_source,
+                feature.id(),
+            )
             stable_key = (
                 attributes.get("SRC_UID")
                 or attributes.get("NUMBER_KEY")
@@ -2056,6 +2379,12 @@ class ArchDistribution:
                     for layer, _kind in output_layers
                 ]
                 output_hashes.extend(layer_hashes)
+                processing_stats.update(
+                    self._geometry_digest_service().statistics()
+                )
+                processing_stats.update(
+                    self._analysis_geometry_store().statistics()
+                )
                 processing_stats.update({
                     # Runtime callers retain usable artifact paths; manifest
                     # schema v2 strips them to public-safe filename/hash rows.
@@ -2552,15 +2881,9 @@ class ArchDistribution:
             # Try getting feature count
             if layer.featureCount() == 0:
                 return None
-            # Fallback to manual combine if extent is weird
-            combined_geom = QgsGeometry()
-            for feat in layer.getFeatures():
-                if feat.hasGeometry():
-                    if combined_geom.isNull():
-                        combined_geom = feat.geometry()
-                    else:
-                        combined_geom = combined_geom.combine(feat.geometry())
-            if combined_geom.isNull():
+            # Fall back to the dissolved study area if the extent is weird
+            combined_geom = self._study_geometry(layer).geometry()
+            if combined_geom is None:
                 return None
             pt = combined_geom.centroid().asPoint()
             return QgsPointXY(pt.x(), pt.y())
@@ -3031,28 +3354,453 @@ class ArchDistribution:
         digest = hashlib.sha1(pair.encode("utf-8")).hexdigest()[:16]
         return f"rel:{digest}"
 
+    def _prepared_geometry_cache(self):
+        """Return the prepared-engine cache shared by this run's passes."""
+        cache = getattr(self, "_prepared_geometries", None)
+        if cache is None:
+            cache = PreparedGeometryCache()
+            self._prepared_geometries = cache
+        return cache
+
+    def _analysis_geometry_store(self):
+        """Return the analysis-CRS geometries shared by this run's passes."""
+        store = getattr(self, "_analysis_geometries", None)
+        if store is None:
+            store = AnalysisGeometryStore()
+            self._analysis_geometries = store
+        return store
+
+    def _geometry_digest_service(self):
+        """Return the geometry digests shared by this run's hash consumers."""
+        digests = getattr(self, "_geometry_digests", None)
+        if digests is None:
+            digests = GeometryDigests()
+            self._geometry_digests = digests
+        return digests
+
+    def _merged_fingerprints(self, layer, pending):
+        """Return ``SRC_FP`` values for merged features stored without one.
+
+        ``pending`` holds ``(feature_id, geometry, identity_fields)``.  The
+        geometry digests come from the run's shared service, hashed as one
+        batch so a large layer uses the worker threads.
+        """
+        if not pending:
+            return {}
+        digests = self._geometry_digest_service().digest_many(
+            (layer.id(), "wkb"),
+            [
+                (feature_id, partial(_geometry_payload, geometry))
+                for feature_id, geometry, _identity_fields in pending
+            ],
+            max_workers=self._candidate_worker_count(len(pending)),
+        )
+        return {
+            feature_id: build_source_identity(
+                geometry_digest=digests[feature_id],
+                **identity_fields,
+            ).content_fingerprint
+            for feature_id, _geometry, identity_fields in pending
+        }
+
+    def _study_geometry(self, layer, transform_context=None):
+        """Return ``layer`` dissolved once and shared by this run's passes."""
+        cache = getattr(self, "_study_geometries", None)
+        if cache is None:
+            cache = {}
+            self._study_geometries = cache
+        study = cache.get(layer.id())
+        if study is None:
+            if transform_context is None:
+                transform_context = QgsProject.instance().transformContext()
+            study = StudyGeometry.from_layer(layer, transform_context)
+            cache[layer.id()] = study
+        return study
+
+    def _buffer_tiers(self, layer, buffers, geometry_of):
+        """Return :class:`BufferTiers` over ``buffers`` in ``layer``'s CRS.
+
+        ``geometry_of(key)`` returns a feature's layer-CRS geometry for the
+        ring tests near a ring edge, which use prepared buffer engines.
+        """
+        cache = self._prepared_geometry_cache()
+        rings = [
+            cache.prepared(
+                ("buffer-tier", layer.id(), index, item["dist"]),
+                item["geom"],
+            )
+            for index, item in enumerate(buffers)
+        ]
+        return BufferTiers(
+            [item["dist"] for item in buffers],
+            lambda key, ring_index: rings[ring_index].intersects(
+                geometry_of(key)
+            ),
+        )
+
+    def _record_buffer_tier_stats(self, tiers):
+        """Add one tiering pass's counters to the run statistics."""
+        statistics = getattr(self, "_current_processing_stats", None)
+        if not isinstance(statistics, dict):
+            return
+        for name, value in tiers.statistics().items():
+            statistics[name] = int(statistics.get(name, 0)) + value
+
+    def _record_prepared_geometry_stats(self):
+        """Copy the run's prepared-predicate counters into the statistics."""
+        cache = getattr(self, "_prepared_geometries", None)
+        if cache is None:
+            return
+        statistics = getattr(self, "_current_processing_stats", None)
+        if not isinstance(statistics, dict):
+            statistics = {}
+            self._current_processing_stats = statistics
+        statistics.update(cache.statistics())
+
+    def _report_candidate_progress(self, processed, total):
+        """Keep the progress dialog responsive between evaluation batches."""
+        progress = getattr(self, "_active_progress", None)
+        if not progress:
+            return
+        progress.setLabelText(
+            "자료 종류별 중복 후보를 비교하는 중입니다... "
+            f"({processed}/{total})"
+        )
+        QCoreApplication.processEvents()
+        if progress.wasCanceled():
+            raise ProcessingCancelled()
+
+    def _candidate_worker_count(self, feature_count):
+        """Return the configured candidate-comparison process count."""
+        setting = str(
+            QtCore.QSettings().value(CANDIDATE_WORKERS_PREF_KEY, "auto")
+            or "auto"
+        ).strip().lower()
+        if setting == "auto":
+            return default_worker_count(feature_count)
+        try:
+            return max(1, int(setting))
+        except ValueError:
+            return 1
+
+    def _bulk_candidates(
+        self,
+        wkbs,
+        records,
+        tolerance,
+        *,
+        preset,
+        ruleset,
+        **options,
+    ):
+        """Measure and evaluate candidate pairs with the array engine.
+
+        Large layers are split into spatial tiles and evaluated in worker
+        processes; the merged rows equal the single-process result.  Returns
+        a ``CandidateCollection`` or ``None`` when the engine cannot run, in
+        which case the caller keeps the per-pair GEOS path.  Exceptions
+        raised by the progress, row or idle callbacks, such as a cancelled
+        review, propagate instead of triggering a fallback.
+        """
+        evaluation_records = [evaluation_record(record) for record in records]
+        workers = self._candidate_worker_count(len(wkbs))
+        callback_errors = []
+
+        def guarded(callback):
+            # Remember what the caller's own callbacks raised, so it is not
+            # mistaken for an engine failure.
+            if callback is None:
+                return None
+
+            def call(*args):
+                try:
+                    return callback(*args)
+                except Exception as exc:
+                    callback_errors.append(exc)
+                    raise
+
+            return call
+
+        options = {
+            key: guarded(value) if key.endswith("_callback") else value
+            for key, value in options.items()
+        }
+        progress_callback = guarded(self._report_candidate_progress)
+        if workers > 1:
+            try:
+                collection = collect_candidates(
+                    wkbs,
+                    evaluation_records,
+                    search_distance=tolerance,
+                    preset=preset,
+                    rules=ruleset,
+                    workers=workers,
+                    progress_callback=progress_callback,
+                    **options,
+                )
+            except (ProcessingCancelled, DuplicateReviewCancelled):
+                raise
+            except Exception as exc:
+                if any(exc is error for error in callback_errors):
+                    raise
+                self.log(
+                    "⚠️ 병렬 후보 비교를 사용할 수 없어 단일 프로세스로 "
+                    f"진행합니다: {exc}"
+                )
+            else:
+                self.log(
+                    f"후보 비교를 {collection.worker_count}개 프로세스, "
+                    f"{collection.tile_count}개 공간 타일로 나누어 실행했습니다."
+                )
+                return collection
+        try:
+            return collect_candidates(
+                wkbs,
+                evaluation_records,
+                search_distance=tolerance,
+                preset=preset,
+                rules=ruleset,
+                progress_callback=progress_callback,
+                **options,
+            )
+        except (ProcessingCancelled, DuplicateReviewCancelled):
+            raise
+        except Exception as exc:
+            if any(exc is error for error in callback_errors):
+                raise
+            self.log(
+                "⚠️ 일괄 도형 비교를 사용할 수 없어 쌍별 비교로 진행합니다: "
+                f"{exc}"
+            )
+            return None
+
+    def _per_pair_candidates(
+        self,
+        records,
+        geometries,
+        role_indexes,
+        tolerance,
+        candidate_pairs,
+        append_candidate,
+        *,
+        preset,
+        ruleset,
+        cache_scope="",
+        metric_cache=None,
+        metric_keys=None,
+        known_metrics=None,
+        idle_callback=None,
+    ):
+        """Measure spatial-index hits with one prepared engine per feature.
+
+        Only the indexes of roles the policy can pair with a record's role
+        are queried.  Pairs found in ``known_metrics`` skip GEOS entirely;
+        new measurements are recorded in ``metric_cache``.  Each feature's
+        hits pass the attribute screen first, so pairs without any name,
+        address or project signal never reach the overlay.  Measured pairs
+        are evaluated in batches, so ``append_candidate`` sees candidates
+        while the scan runs; ``idle_callback()`` follows every progress
+        checkpoint.  Returns the number of role indexes skipped and of
+        pairs screened out.
+        """
+        prepared_geometries = self._prepared_geometry_cache()
+        measured_ids = []
+        measured_values = []
+        partner_roles = {
+            role: [
+                other_role for other_role in role_indexes
+                if roles_can_pair(role, other_role)
+            ]
+            for role in role_indexes
+        }
+        skipped_queries = 0
+        screened_pairs = 0
+        similarity_memo = SimilarityMemo()
+
+        def evaluate_measured():
+            # Feature ids index ``records`` directly, so the batch needs no
+            # position mapping.
+            if not measured_ids:
+                return
+            accepted = evaluate_candidates(
+                records,
+                [pair[0] for pair in measured_ids],
+                [pair[1] for pair in measured_ids],
+                dict(zip(METRIC_COLUMNS, zip(*measured_values))),
+                preset=preset,
+                rules=ruleset,
+                similarity_memo=similarity_memo,
+            )
+            measured_ids.clear()
+            measured_values.clear()
+            for feature_id, other_id, evaluated in accepted:
+                append_candidate(
+                    feature_id,
+                    records[feature_id],
+                    other_id,
+                    records[other_id],
+                    evaluated,
+                )
+
+        for scan_index, (feature_id, record) in enumerate(records.items()):
+            if scan_index % 250 == 0:
+                evaluate_measured()
+                progress = getattr(self, "_active_progress", None)
+                if progress:
+                    progress.setLabelText(
+                        "자료 종류별 중복 후보를 비교하는 중입니다..."
+                    )
+                    QCoreApplication.processEvents()
+                    if progress.wasCanceled():
+                        raise ProcessingCancelled()
+                if idle_callback is not None:
+                    idle_callback()
+            elif len(measured_ids) >= PER_PAIR_EVALUATION_BATCH:
+                evaluate_measured()
+            if record["role"] == ROLE_PROTECTION_ZONE:
+                continue
+            geom = geometries[feature_id]
+            prepared = None
+            search_rect = QgsRectangle(geom.boundingBox())
+            search_rect.grow(tolerance)
+            other_roles = partner_roles[record["role"]]
+            skipped_queries += len(role_indexes) - len(other_roles)
+            other_ids = []
+            for other_role in other_roles:
+                for other_id in role_indexes[other_role].intersects(
+                    search_rect
+                ):
+                    if other_id == feature_id:
+                        continue
+                    pair = tuple(sorted((feature_id, other_id)))
+                    if pair in candidate_pairs:
+                        continue
+                    candidate_pairs.add(pair)
+                    other = records.get(other_id)
+                    if other and other["role"] != ROLE_PROTECTION_ZONE:
+                        other_ids.append(other_id)
+            screens = screen_candidates(
+                records,
+                [feature_id] * len(other_ids),
+                other_ids,
+                rules=ruleset,
+                similarity_memo=similarity_memo,
+            )
+            for other_id, screen in zip(other_ids, screens):
+                if screen is None:
+                    screened_pairs += 1
+                    continue
+                other = records[other_id]
+                other_geom = geometries[other_id]
+                values = (
+                    known_pair_metrics(
+                        known_metrics,
+                        metric_keys[feature_id],
+                        metric_keys[other_id],
+                    )
+                    if known_metrics else None
+                )
+                if values is None:
+                    try:
+                        if prepared is None:
+                            prepared = prepared_geometries.prepared(
+                                (cache_scope, feature_id), geom
+                            )
+                        values = self._pair_metric_values(
+                            prepared, geom, other_geom, screen
+                        )
+                    except Exception as exc:
+                        self.log(
+                            "⚠️ 중복 후보 도형 비교 실패: "
+                            f"{record['name']} ↔ {other['name']} ({exc})"
+                        )
+                        continue
+                    if values is None:
+                        screened_pairs += 1
+                        continue
+                    if metric_cache is not None:
+                        metric_cache.record(
+                            metric_keys[feature_id],
+                            metric_keys[other_id],
+                            values,
+                        )
+
+                measured_ids.append((feature_id, other_id))
+                measured_values.append(values)
+
+        evaluate_measured()
+        return skipped_queries, screened_pairs
+
     @staticmethod
-    def _geometry_boundary_distance(left_geometry, right_geometry):
-        """Measure boundary-to-boundary distance on QGIS 3.28+.
+    def _pair_metric_values(prepared, geom, other_geom, screen=None):
+        """Measure one candidate pair; values follow ``METRIC_COLUMNS``.
 
-        ``QgsGeometry.boundary()`` was added after some supported QGIS
-        releases.  The abstract geometry API exposes the same operation on
-        older LTR builds, so contained polygons no longer collapse to a
-        misleading zero geometry distance.
+        With a :class:`PairScreen` the pair is dropped (``None``) before the
+        overlay metrics when its geometry cannot satisfy the screen.
         """
+        intersects = prepared.intersects(other_geom)
+        if screen is not None and not (
+            intersects or not screen.requires_intersection
+        ):
+            return None
+        distance = 0.0 if intersects else prepared.distance(other_geom)
+        if screen is not None and not screen.allows(intersects, distance):
+            return None
+        centroid_distance = geom.centroid().distance(other_geom.centroid())
         try:
-            left_boundary = left_geometry.boundary()
-            right_boundary = right_geometry.boundary()
-        except AttributeError:
-            left_raw = left_geometry.constGet().boundary()
-            right_raw = right_geometry.constGet().boundary()
-            if left_raw is None or right_raw is None:
-                return left_geometry.distance(right_geometry)
-            left_boundary = QgsGeometry(left_raw.clone())
-            right_boundary = QgsGeometry(right_raw.clone())
-        if left_boundary.isEmpty() or right_boundary.isEmpty():
-            return left_geometry.distance(right_geometry)
-        return left_boundary.distance(right_boundary)
+            boundary_distance = prepared.boundary_distance(other_geom)
+        except RuntimeError:
+            boundary_distance = distance
+        left_family = QgsWkbTypes.geometryType(geom.wkbType())
+        right_family = QgsWkbTypes.geometryType(other_geom.wkbType())
+        family_names = {
+            QgsWkbTypes.PointGeometry: "point",
+            QgsWkbTypes.LineGeometry: "line",
+            QgsWkbTypes.PolygonGeometry: "polygon",
+        }
+        geometry_pair = "_".join((
+            family_names.get(left_family, "unknown"),
+            family_names.get(right_family, "unknown"),
+        ))
+        overlap_ratio = 0.0
+        coverage_left = 0.0
+        coverage_right = 0.0
+        iou = 0.0
+        area_ratio = 0.0
+        if intersects:
+            intersection = prepared.intersection(other_geom)
+            if intersection and not intersection.isEmpty():
+                left_area = geom.area()
+                right_area = other_geom.area()
+                intersection_area = intersection.area()
+                min_area = min(left_area, right_area)
+                max_area = max(left_area, right_area)
+                if min_area > 0 and intersection_area > 0:
+                    coverage_left = intersection_area / left_area
+                    coverage_right = intersection_area / right_area
+                    overlap_ratio = intersection_area / min_area
+                    union_area = left_area + right_area - intersection_area
+                    iou = (
+                        intersection_area / union_area
+                        if union_area > 0 else 0.0
+                    )
+                    area_ratio = min_area / max_area
+                else:
+                    # Point/line candidates remain reviewable but the
+                    # ruleset forbids their automatic merge.
+                    overlap_ratio = 1.0
+        return (
+            intersects,
+            overlap_ratio,
+            distance,
+            coverage_left,
+            coverage_right,
+            iou,
+            area_ratio,
+            centroid_distance,
+            boundary_distance,
+            geometry_pair,
+        )
 
     @staticmethod
     def _protection_name_key(value):
@@ -3188,9 +3936,12 @@ class ArchDistribution:
         features = {}
         records = {}
         geometries = {}
-        spatial_index = QgsSpatialIndex()
+        role_bounds = {}
+        missing_fingerprints = []
+        source_geometries = []
         invalid_fixed = 0
         matching_context = MetricContext.from_layer(layer)
+        analysis_store = self._analysis_geometry_store()
 
         layer.startEditing()
         for scan_index, feature in enumerate(layer.getFeatures()):
@@ -3214,13 +3965,10 @@ class ArchDistribution:
                     layer.changeGeometry(feature.id(), geom)
                     feature.setGeometry(geom)
                     invalid_fixed += 1
+                    analysis_store.invalidate(layer.id(), feature.id())
 
             features[feature.id()] = feature
-            metric_geom = matching_context.to_analysis_geometry(
-                geom,
-                layer.crs(),
-            )
-            geometries[feature.id()] = metric_geom
+            source_geometries.append((feature.id(), geom))
             record = {
                 "uid": uid,
                 "role": role,
@@ -3258,27 +4006,47 @@ class ArchDistribution:
                 else ""
             )
             if not stored_fingerprint:
-                try:
-                    geometry_payload = bytes(geom.asWkb())
-                except (TypeError, ValueError):
-                    geometry_payload = geom.asWkt()
-                stored_fingerprint = build_source_identity(
-                    role,
-                    native_code=record["code"],
-                    name=record["site_name"],
-                    project_name=record["project_name"],
-                    address=record["address"],
-                    geometry=geometry_payload,
-                    extra_content={
-                        "source": _json_safe_attribute(record["source"]),
+                missing_fingerprints.append((
+                    feature.id(),
+                    geom,
+                    {
+                        "role": role,
+                        "native_code": record["code"],
+                        "name": record["site_name"],
+                        "project_name": record["project_name"],
+                        "address": record["address"],
+                        "extra_content": {
+                            "source": _json_safe_attribute(record["source"]),
+                        },
                     },
-                ).content_fingerprint
+                ))
             record["fingerprint"] = stored_fingerprint
             records[feature.id()] = record
-            indexed_feature = QgsFeature(feature)
-            indexed_feature.setGeometry(metric_geom)
-            spatial_index.addFeature(indexed_feature)
         layer.commitChanges()
+        for feature_id, fingerprint in self._merged_fingerprints(
+            layer,
+            missing_fingerprints,
+        ).items():
+            records[feature_id]["fingerprint"] = fingerprint
+        for (feature_id, _geometry), stored in zip(
+            source_geometries,
+            analysis_store.get_many(
+                matching_context,
+                layer.id(),
+                source_geometries,
+                layer.crs(),
+            ),
+        ):
+            geometries[feature_id] = stored.geometry
+            # Every role keeps an index, even one whose features all lack a
+            # geometry, because both candidate paths look roles up by name.
+            bounds = role_bounds.setdefault(records[feature_id]["role"], [])
+            if not stored.geometry.isEmpty():
+                bounds.append((feature_id, stored.bounds))
+        role_indexes = {
+            role: bulk_spatial_index(items)
+            for role, items in role_bounds.items()
+        }
 
         if invalid_fixed:
             self.log(
@@ -3290,177 +4058,222 @@ class ArchDistribution:
             ruleset["thresholds"]["exact_name_distance_m"]
         )
         candidate_pairs = set()
-        candidates = []
-
-        for scan_index, (feature_id, record) in enumerate(records.items()):
-            if scan_index % 250 == 0:
-                progress = getattr(self, "_active_progress", None)
-                if progress:
-                    progress.setLabelText(
-                        "자료 종류별 중복 후보를 비교하는 중입니다..."
-                    )
-                    QCoreApplication.processEvents()
-                    if progress.wasCanceled():
-                        raise ProcessingCancelled()
-            if record["role"] == ROLE_PROTECTION_ZONE:
-                continue
-            geom = geometries[feature_id]
-            search_rect = QgsRectangle(geom.boundingBox())
-            search_rect.grow(tolerance)
-            for other_id in spatial_index.intersects(search_rect):
-                if other_id == feature_id:
-                    continue
-                pair = tuple(sorted((feature_id, other_id)))
-                if pair in candidate_pairs:
-                    continue
-                candidate_pairs.add(pair)
+        streamed_pairs = set()
+        new_candidates = []
+        new_orders = []
+        # Candidates reach the review queue while generation still runs; the
+        # dialog opens on the first page instead of after the last pair.
+        review_queue = ReviewQueue()
+        stream = ReviewStream(
+            review_queue,
+            decision_store if reuse_saved_decisions else None,
+            policy_version,
+        )
+        if decision_store is not None and reuse_saved_decisions:
+            changed_sources = decision_store.stale_decisions({
+                record["uid"]: record["fingerprint"]
+                for record in records.values()
+            })
+            if changed_sources:
+                self.log(
+                    "원본이 바뀐 자료와 연결된 이전 검토 결정 "
+                    f"{len(changed_sources)}건은 재사용하지 않습니다."
+                )
+        review_dialog = None
+        review_started = time.monotonic()
 
-                other = records.get(other_id)
-                if not other or other["role"] == ROLE_PROTECTION_ZONE:
-                    continue
-                other_geom = geometries[other_id]
-                try:
-                    intersects = geom.intersects(other_geom)
-                    distance = 0.0 if intersects else geom.distance(other_geom)
-                    centroid_distance = geom.centroid().distance(
-                        other_geom.centroid()
-                    )
-                    try:
-                        boundary_distance = (
-                            self._geometry_boundary_distance(
-                                geom, other_geom
-                            )
-                        )
-                    except RuntimeError:
-                        boundary_distance = distance
-                    left_family = QgsWkbTypes.geometryType(geom.wkbType())
-                    right_family = QgsWkbTypes.geometryType(
-                        other_geom.wkbType()
-                    )
-                    family_names = {
-                        QgsWkbTypes.PointGeometry: "point",
-                        QgsWkbTypes.LineGeometry: "line",
-                        QgsWkbTypes.PolygonGeometry: "polygon",
-                    }
-                    geometry_pair = "_".join((
-                        family_names.get(left_family, "unknown"),
-                        family_names.get(right_family, "unknown"),
-                    ))
-                    overlap_ratio = 0.0
-                    coverage_left = 0.0
-                    coverage_right = 0.0
-                    iou = 0.0
-                    area_ratio = 0.0
-                    if intersects:
-                        intersection = geom.intersection(other_geom)
-                        if (
-                            intersection
-                            and not intersection.isEmpty()
-                        ):
-                            left_area = geom.area()
-                            right_area = other_geom.area()
-                            intersection_area = intersection.area()
-                            min_area = min(left_area, right_area)
-                            max_area = max(left_area, right_area)
-                            if min_area > 0 and intersection_area > 0:
-                                coverage_left = intersection_area / left_area
-                                coverage_right = intersection_area / right_area
-                                overlap_ratio = intersection_area / min_area
-                                union_area = (
-                                    left_area + right_area - intersection_area
-                                )
-                                iou = (
-                                    intersection_area / union_area
-                                    if union_area > 0 else 0.0
-                                )
-                                area_ratio = min_area / max_area
-                            else:
-                                # Point/line candidates remain reviewable but
-                                # the ruleset forbids their automatic merge.
-                                overlap_ratio = 1.0
-                except Exception as exc:
-                    self.log(
-                        "⚠️ 중복 후보 도형 비교 실패: "
-                        f"{record['name']} ↔ {other['name']} ({exc})"
-                    )
-                    continue
+        def open_review():
+            dialog = DuplicateReviewDialog(
+                review_queue,
+                parent=self.dlg,
+                ui_lang=getattr(self.dlg, "ui_lang", "ko"),
+                zoom_callback=lambda candidate: (
+                    self._zoom_duplicate_candidate(layer, candidate)
+                ),
+                streaming=True,
+                confirm_callback=self._review_page_confirmer(policy_version),
+            )
+            dialog.setModal(True)
+            return dialog
+
+        def review_idle():
+            """Queue the candidates found so far and update the review."""
+            nonlocal review_dialog
+            arrived = bool(new_candidates)
+            if arrived:
+                stream.add(new_candidates, new_orders)
+                new_candidates.clear()
+                new_orders.clear()
+            if decision_provider is not None:
+                return
+            if review_dialog is None:
+                if len(review_queue) >= review_queue.page_size or (
+                    review_queue
+                    and time.monotonic() - review_started
+                    >= FIRST_REVIEW_SECONDS
+                ):
+                    review_dialog = open_review()
+                    review_dialog.show()
+                return
+            if arrived:
+                review_dialog.candidates_arrived()
+            # Generation holds the event loop; let the reviewer work between
+            # batches and while the tile workers run.
+            QCoreApplication.processEvents()
+            if not review_dialog.isVisible():
+                raise DuplicateReviewCancelled()
 
-                evaluated = evaluate_candidate(
-                    record,
-                    other,
-                    intersects=intersects,
-                    overlap_ratio=overlap_ratio,
-                    distance=distance,
-                    preset=preset,
-                    coverage_left=coverage_left,
-                    coverage_right=coverage_right,
-                    iou=iou,
-                    area_ratio=area_ratio,
-                    centroid_distance=centroid_distance,
-                    boundary_distance=boundary_distance,
-                    geometry_pair=geometry_pair,
-                    rules=ruleset,
+        def append_candidate(
+            feature_id, record, other_id, other, evaluated, order=None
+        ):
+            # A failed bulk pass falls back after streaming some rows; the
+            # retry finds the same pairs again.
+            pair = tuple(sorted((feature_id, other_id)))
+            if pair in streamed_pairs:
+                return
+            streamed_pairs.add(pair)
+            item = evaluated.as_dict()
+            item.update({
+                "left_role": record["role"],
+                "left_source": record["source"],
+                "left_name": record["name"],
+                "left_address": record["address"],
+                "left_fingerprint": record["fingerprint"],
+                "left_feature_id": feature_id,
+                "right_role": other["role"],
+                "right_source": other["source"],
+                "right_name": other["name"],
+                "right_address": other["address"],
+                "right_fingerprint": other["fingerprint"],
+                "right_feature_id": other_id,
+            })
+            new_candidates.append(item)
+            new_orders.append(order)
+
+        ordered_ids = list(records)
+        ordered_records = [records[feature_id] for feature_id in ordered_ids]
+        ordered_wkbs = [
+            bytes(geometries[feature_id].asWkb()) for feature_id in ordered_ids
+        ]
+        metric_keys = [
+            self._candidate_metric_key(record["fingerprint"], wkb)
+            for record, wkb in zip(ordered_records, ordered_wkbs)
+        ]
+        metric_cache = self._open_candidate_metric_cache(matching_context)
+        try:
+            known_metrics = (
+                metric_cache.known_metrics(metric_keys)
+                if metric_cache is not None else {}
+            )
+        except sqlite3.Error as exc:
+            self.log(f"⚠️ 후보 도형 지표 캐시를 읽지 못했습니다: {exc}")
+            known_metrics = {}
+        # Roles the policy never compares are filtered before any geometry
+        # work, exactly as the per-role indexes below are never queried.
+        role_order = list(role_indexes)
+        role_pairs = {
+            (left_pos, right_pos)
+            for left_pos, left_role in enumerate(role_order)
+            for right_pos, right_role in enumerate(role_order)
+            if left_pos <= right_pos and roles_can_pair(left_role, right_role)
+        }
+
+        def stream_rows(rows):
+            # Record positions order the bulk rows, as in the sorted
+            # collection the finished list came from.
+            for left_pos, right_pos, evaluated in rows:
+                append_candidate(
+                    ordered_ids[left_pos],
+                    ordered_records[left_pos],
+                    ordered_ids[right_pos],
+                    ordered_records[right_pos],
+                    evaluated,
+                    order=(left_pos, right_pos),
                 )
-                if not evaluated:
-                    continue
-                item = evaluated.as_dict()
-                item.update({
-                    "left_role": record["role"],
-                    "left_source": record["source"],
-                    "left_name": record["name"],
-                    "left_address": record["address"],
-                    "left_fingerprint": record["fingerprint"],
-                    "left_feature_id": feature_id,
-                    "right_role": other["role"],
-                    "right_source": other["source"],
-                    "right_name": other["name"],
-                    "right_address": other["address"],
-                    "right_fingerprint": other["fingerprint"],
-                    "right_feature_id": other_id,
-                })
-                candidates.append(item)
+            review_idle()
 
-        candidates.sort(
-            key=lambda item: (
-                not item.get("auto_apply", False),
-                -float(item.get("score", 0)),
-                str(item.get("left_name", "")),
-                str(item.get("right_name", "")),
+        try:
+            collection = (
+                self._bulk_candidates(
+                    ordered_wkbs,
+                    ordered_records,
+                    tolerance,
+                    preset=preset,
+                    ruleset=ruleset,
+                    groups=[
+                        role_order.index(record["role"])
+                        for record in ordered_records
+                    ],
+                    group_pairs=role_pairs,
+                    metric_keys=metric_keys,
+                    known_metrics=known_metrics,
+                    rows_callback=stream_rows,
+                    idle_callback=review_idle,
+                )
+                if SHAPELY_AVAILABLE else None
+            )
+            if collection is None:
+                skipped_queries, screened_pairs = self._per_pair_candidates(
+                    records,
+                    geometries,
+                    role_indexes,
+                    tolerance,
+                    candidate_pairs,
+                    append_candidate,
+                    preset=preset,
+                    ruleset=ruleset,
+                    cache_scope=layer.id(),
+                    metric_cache=metric_cache,
+                    metric_keys=dict(zip(ordered_ids, metric_keys)),
+                    known_metrics=known_metrics,
+                    idle_callback=review_idle,
+                )
+            elif metric_cache is not None:
+                for left_pos, right_pos, values in collection.measured:
+                    metric_cache.record(
+                        metric_keys[left_pos], metric_keys[right_pos], values
+                    )
+            if metric_cache is not None:
+                # Both records of a known pair are unchanged, so the pair is
+                # still current even when the policy rejected it.
+                metric_cache.mark_used(known_metrics)
+        except Exception:
+            # A cancelled or failed generation must not leave the streaming
+            # review open over the plugin dialog.
+            if review_dialog is not None:
+                review_dialog.reject()
+            raise
+        finally:
+            if metric_cache is not None:
+                self._close_candidate_metric_cache(metric_cache)
+        if collection is not None:
+            for left_pos, right_pos, message in collection.failures:
+                self.log(
+                    "⚠️ 중복 후보 도형 비교 실패: "
+                    f"{ordered_records[left_pos]['name']} ↔ "
+                    f"{ordered_records[right_pos]['name']} ({message})"
+                )
+            checked_pair_count = collection.checked_pair_count
+            skipped_note = (
+                f"역할 조합으로 {collection.skipped_pair_count}쌍 제외"
             )
-        )
+            screened_pairs = collection.screened_pair_count
+        else:
+            checked_pair_count = len(candidate_pairs)
+            skipped_note = f"역할 조합으로 색인 조회 {skipped_queries}건 생략"
+            self._record_prepared_geometry_stats()
+
+        review_idle()
+        candidates = stream.candidates
         self.log(
-            f"공간 인덱스 후보 비교 완료: {len(candidate_pairs)}쌍 검사, "
+            f"공간 인덱스 후보 비교 완료: {checked_pair_count}쌍 검사, "
+            f"{skipped_note}, 속성 사전 검사로 {screened_pairs}쌍 제외, "
             f"{len(candidates)}쌍 검토 대상"
         )
 
-        reused_decisions = []
-        pending_candidates = []
-        stale_decisions = 0
-        if decision_store is not None and reuse_saved_decisions:
-            for candidate in candidates:
-                try:
-                    lookup = decision_store.lookup(
-                        candidate["left_uid"],
-                        candidate["left_fingerprint"],
-                        candidate["right_uid"],
-                        candidate["right_fingerprint"],
-                        policy_version=policy_version,
-                    )
-                except (TypeError, ValueError):
-                    pending_candidates.append(candidate)
-                    continue
-                if lookup.reusable:
-                    reused = dict(candidate)
-                    reused["decision"] = lookup.decision
-                    reused["decision_source"] = "reused"
-                    reused_decisions.append(reused)
-                else:
-                    if lookup.status == "stale":
-                        stale_decisions += 1
-                    pending_candidates.append(candidate)
-        else:
-            pending_candidates = list(candidates)
-
+        reused_decisions = stream.reused_decisions()
+        pending_candidates = stream.pending
+        stale_decisions = stream.stale_count
         if reused_decisions:
             self.log(
                 f"이전 검토 결정 {len(reused_decisions)}건을 재사용했습니다."
@@ -3472,21 +4285,22 @@ class ArchDistribution:
             )
 
         if pending_candidates and decision_provider is not None:
-            reviewed_decisions = decision_provider(pending_candidates)
+            reviewed_decisions = decision_provider(review_queue.drain())
             if reviewed_decisions is None:
                 raise DuplicateReviewCancelled()
         elif pending_candidates:
-            dialog = DuplicateReviewDialog(
-                pending_candidates,
-                parent=self.dlg,
-                ui_lang=getattr(self.dlg, "ui_lang", "ko"),
-                zoom_callback=lambda candidate: (
-                    self._zoom_duplicate_candidate(layer, candidate)
-                ),
-            )
-            if dialog.exec_() != dialog.Accepted:
+            if review_dialog is None:
+                review_dialog = open_review()
+            elif not review_dialog.isVisible():
+                raise DuplicateReviewCancelled()
+            review_dialog.generation_finished()
+            if review_dialog.exec_() != review_dialog.Accepted:
                 raise DuplicateReviewCancelled()
-            reviewed_decisions = dialog.decisions()
+            # Rows were loaded in arrival order; restore the review order
+            # the finished candidate list would have had.
+            reviewed_decisions = stream.in_review_order(
+                review_dialog.decisions()
+            )
         else:
             reviewed_decisions = []
 
@@ -3638,30 +4452,14 @@ class ArchDistribution:
         # Confirmed I/II excavation parts form a true equivalence component.
         # Resolve the whole component once so three or more pair decisions do
         # not depend on candidate iteration order or stale cached attributes.
-        area_parent = {}
-
-        def area_find(uid):
-            area_parent.setdefault(uid, uid)
-            while area_parent[uid] != uid:
-                area_parent[uid] = area_parent[area_parent[uid]]
-                uid = area_parent[uid]
-            return uid
-
-        def area_union(left_uid, right_uid):
-            left_root = area_find(left_uid)
-            right_root = area_find(right_uid)
-            if left_root != right_root:
-                area_parent[max(left_root, right_root)] = min(
-                    left_root, right_root
-                )
-
+        area_sets = DisjointSet()
         for item in decisions:
             if (
                 item.get("decision") == DECISION_MERGE
                 and item.get("pair_kind") == "excavation_area_parts"
                 and item.get("relation_type") == "same_entity"
             ):
-                area_union(
+                area_sets.union(
                     str(item["left_uid"]),
                     str(item["right_uid"]),
                 )
@@ -3764,14 +4562,11 @@ class ArchDistribution:
                 if statuses.get(right_uid) == STATUS_UNIQUE:
                     statuses[right_uid] = STATUS_KEPT_SEPARATE
 
-        area_components = {}
-        for uid in area_parent:
-            area_components.setdefault(area_find(uid), []).append(uid)
         geometry_group_index = layer.fields().indexFromName(
             "GEOMETRY_GROUP_KEY"
         )
         group_index = layer.fields().indexFromName("GROUP_KEY")
-        for component in area_components.values():
+        for component in area_sets.components():
             representative_uid = min(
                 component,
                 key=lambda uid: (
@@ -3993,6 +4788,7 @@ class ArchDistribution:
         layer_records = {}
         layers_by_id = {layer.id(): layer for layer in layers}
         metric_context = MetricContext.from_layer(layers[0])
+        analysis_store = self._analysis_geometry_store()
         family_names = {
             QgsWkbTypes.PointGeometry: "point",
             QgsWkbTypes.LineGeometry: "line",
@@ -4019,6 +4815,8 @@ class ArchDistribution:
                 )
             }
             records = {}
+            missing_fingerprints = []
+            source_geometries = []
             layer.startEditing()
             for feature in layer.getFeatures():
                 if not feature.hasGeometry():
@@ -4029,10 +4827,8 @@ class ArchDistribution:
                     if fixed and not fixed.isEmpty():
                         geometry = fixed
                         layer.changeGeometry(feature.id(), geometry)
-                metric_geometry = metric_context.to_analysis_geometry(
-                    geometry,
-                    layer.crs(),
-                )
+                        analysis_store.invalidate(layer.id(), feature.id())
+                source_geometries.append((feature.id(), geometry))
                 uid = str(
                     feature[indexes["SRC_UID"]]
                     or f"{layer.id()}:feature:{feature.id()}"
@@ -4063,19 +4859,20 @@ class ArchDistribution:
                 )
                 fingerprint = str(feature[indexes["SRC_FP"]] or "").strip()
                 if not fingerprint:
-                    try:
-                        geometry_payload = bytes(geometry.asWkb())
-                    except (TypeError, ValueError):
-                        geometry_payload = geometry.asWkt()
-                    fingerprint = build_source_identity(
-                        role,
-                        native_code=code,
-                        name=site_name,
-                        project_name=project_name,
-                        address=address,
-                        geometry=geometry_payload,
-                        extra_content={"source": _json_safe_attribute(source)},
-                    ).content_fingerprint
+                    missing_fingerprints.append((
+                        feature.id(),
+                        geometry,
+                        {
+                            "role": role,
+                            "native_code": code,
+                            "name": site_name,
+                            "project_name": project_name,
+                            "address": address,
+                            "extra_content": {
+                                "source": _json_safe_attribute(source),
+                            },
+                        },
+                    ))
                 records[feature.id()] = {
                     "uid": uid,
                     "fingerprint": fingerprint,
@@ -4088,9 +4885,23 @@ class ArchDistribution:
                     "code": code,
                     "feature_id": feature.id(),
                     "layer_id": layer.id(),
-                    "geometry": metric_geometry,
                 }
             layer.commitChanges()
+            for feature_id, fingerprint in self._merged_fingerprints(
+                layer,
+                missing_fingerprints,
+            ).items():
+                records[feature_id]["fingerprint"] = fingerprint
+            for (feature_id, _geometry), stored in zip(
+                source_geometries,
+                analysis_store.get_many(
+                    metric_context,
+                    layer.id(),
+                    source_geometries,
+                    layer.crs(),
+                ),
+            ):
+                records[feature_id]["geometry"] = stored.geometry
             layer_records[layer.id()] = records
 
         ruleset = load_matching_rules()
@@ -4099,100 +4910,179 @@ class ArchDistribution:
         usable_layers = [
             layer for layer in layers if layer.id() in layer_records
         ]
-        for left_pos, left_layer in enumerate(usable_layers):
-            left_family = left_layer.geometryType()
-            for right_layer in usable_layers[left_pos + 1:]:
-                right_family = right_layer.geometryType()
-                if left_family == right_family:
+
+        def append_candidate(
+            left_layer, left_id, left, right_layer, right_id, right, evaluated
+        ):
+            item = evaluated.as_dict()
+            # Cross-family evidence always requires an explicit
+            # human decision, regardless of preset or score.
+            item["auto_apply"] = False
+            item.update({
+                "left_role": left["role"],
+                "left_source": left["source"],
+                "left_name": left["name"],
+                "left_address": left["address"],
+                "left_fingerprint": left["fingerprint"],
+                "left_feature_id": left_id,
+                "left_layer_id": left_layer.id(),
+                "right_role": right["role"],
+                "right_source": right["source"],
+                "right_name": right["name"],
+                "right_address": right["address"],
+                "right_fingerprint": right["fingerprint"],
+                "right_feature_id": right_id,
+                "right_layer_id": right_layer.id(),
+            })
+            candidates.append(item)
+
+        ordered = [
+            (layer_pos, layer, feature_id, record)
+            for layer_pos, layer in enumerate(usable_layers)
+            for feature_id, record in layer_records[layer.id()].items()
+        ]
+        group_pairs = {
+            (left_pos, right_pos)
+            for left_pos, left_layer in enumerate(usable_layers)
+            for right_pos in range(left_pos + 1, len(usable_layers))
+            if left_layer.geometryType()
+            != usable_layers[right_pos].geometryType()
+        }
+        collection = (
+            self._bulk_candidates(
+                [bytes(item[3]["geometry"].asWkb()) for item in ordered],
+                [item[3] for item in ordered],
+                tolerance,
+                preset=preset,
+                ruleset=ruleset,
+                groups=[item[0] for item in ordered],
+                group_pairs=group_pairs,
+                families=[
+                    family_names.get(item[1].geometryType(), "unknown")
+                    for item in ordered
+                ],
+                area_overlap=False,
+            )
+            if SHAPELY_AVAILABLE and group_pairs else None
+        )
+        if collection is not None:
+            for left_pos, right_pos, message in collection.failures:
+                self.log(
+                    "⚠️ 형상 계열 간 후보 비교 실패: "
+                    f"{ordered[left_pos][3]['name']} ↔ "
+                    f"{ordered[right_pos][3]['name']} ({message})"
+                )
+            for left_pos, right_pos, evaluated in collection.rows:
+                _left_group, left_layer, left_id, left = ordered[left_pos]
+                _right_group, right_layer, right_id, right = ordered[right_pos]
+                append_candidate(
+                    left_layer, left_id, left,
+                    right_layer, right_id, right,
+                    evaluated,
+                )
+        # Without the array engine, one spatial index over every family
+        # yields each cross-family pair once, from the record of the earlier
+        # layer, in a single pass.
+        pairwise = collection is None and bool(group_pairs)
+        ordered_families = [item[1].geometryType() for item in ordered]
+        shared_index = (
+            bulk_spatial_index(geometry_bounds(
+                (position, item[3]["geometry"])
+                for position, item in enumerate(ordered)
+            ))
+            if pairwise else None
+        )
+        prepared_geometries = self._prepared_geometry_cache()
+        similarity_memo = SimilarityMemo()
+        for left_pos, (_left_group, left_layer, left_id, left) in enumerate(
+            ordered if pairwise else ()
+        ):
+            left_family = ordered_families[left_pos]
+            left_geometry = left["geometry"]
+            prepared = None
+            search_rect = QgsRectangle(left_geometry.boundingBox())
+            search_rect.grow(tolerance)
+            right_positions = sorted(
+                right_pos
+                for right_pos in shared_index.intersects(search_rect)
+                if right_pos > left_pos
+                and ordered_families[right_pos] != left_family
+            )
+            # Position 0 is the left record, the hits follow it.
+            screens = screen_candidates(
+                [left] + [ordered[item][3] for item in right_positions],
+                [0] * len(right_positions),
+                range(1, len(right_positions) + 1),
+                rules=ruleset,
+                similarity_memo=similarity_memo,
+            )
+            for right_pos, screen in zip(right_positions, screens):
+                if screen is None:
                     continue
-                right_index = QgsSpatialIndex()
-                for right_id, right in layer_records[right_layer.id()].items():
-                    indexed = QgsFeature()
-                    indexed.setId(right_id)
-                    indexed.setGeometry(right["geometry"])
-                    right_index.addFeature(indexed)
-                for left_id, left in layer_records[left_layer.id()].items():
-                    left_geometry = left["geometry"]
-                    search_rect = QgsRectangle(left_geometry.boundingBox())
-                    search_rect.grow(tolerance)
-                    for right_id in right_index.intersects(search_rect):
-                        right = layer_records[right_layer.id()].get(right_id)
-                        if right is None:
-                            continue
-                        right_geometry = right["geometry"]
-                        try:
-                            intersects = left_geometry.intersects(right_geometry)
-                            distance = (
-                                0.0 if intersects
-                                else left_geometry.distance(right_geometry)
-                            )
-                            centroid_distance = left_geometry.centroid().distance(
-                                right_geometry.centroid()
-                            )
-                            boundary_distance = self._geometry_boundary_distance(
-                                left_geometry,
-                                right_geometry,
-                            )
-                        except Exception as exc:
-                            self.log(
-                                "⚠️ 형상 계열 간 후보 비교 실패: "
-                                f"{left['name']} ↔ {right['name']} ({exc})"
-                            )
-                            continue
-                        # Intersection area has no comparable denominator across
-                        # unlike dimensions.  A binary topological intersection
-                        # keeps the pair reviewable, while evaluate_candidate's
-                        # geometry gate prevents automatic action.
-                        overlap_ratio = 1.0 if intersects else 0.0
-                        geometry_pair = "_".join((
-                            family_names.get(left_family, "unknown"),
-                            family_names.get(right_family, "unknown"),
-                        ))
-                        evaluated = evaluate_candidate(
-                            left,
-                            right,
-                            intersects=intersects,
-                            overlap_ratio=overlap_ratio,
-                            distance=distance,
-                            preset=preset,
-                            coverage_left=0.0,
-                            coverage_right=0.0,
-                            iou=0.0,
-                            area_ratio=0.0,
-                            centroid_distance=centroid_distance,
-                            boundary_distance=boundary_distance,
-                            geometry_pair=geometry_pair,
-                            rules=ruleset,
+                _right_group, right_layer, right_id, right = ordered[right_pos]
+                right_geometry = right["geometry"]
+                try:
+                    if prepared is None:
+                        prepared = prepared_geometries.prepared(
+                            (left_layer.id(), left_id), left_geometry
                         )
-                        if not evaluated:
-                            continue
-                        item = evaluated.as_dict()
-                        # Cross-family evidence always requires an explicit
-                        # human decision, regardless of preset or score.
-                        item["auto_apply"] = False
-                        item.update({
-                            "left_role": left["role"],
-                            "left_source": left["source"],
-                            "left_name": left["name"],
-                            "left_address": left["address"],
-                            "left_fingerprint": left["fingerprint"],
-                            "left_feature_id": left_id,
-                            "left_layer_id": left_layer.id(),
-                            "right_role": right["role"],
-                            "right_source": right["source"],
-                            "right_name": right["name"],
-                            "right_address": right["address"],
-                            "right_fingerprint": right["fingerprint"],
-                            "right_feature_id": right_id,
-                            "right_layer_id": right_layer.id(),
-                        })
-                        candidates.append(item)
+                    intersects = prepared.intersects(right_geometry)
+                    if screen.requires_intersection and not intersects:
+                        continue
+                    distance = (
+                        0.0 if intersects
+                        else prepared.distance(right_geometry)
+                    )
+                    if not screen.allows(intersects, distance):
+                        continue
+                    centroid_distance = left_geometry.centroid().distance(
+                        right_geometry.centroid()
+                    )
+                    boundary_distance = prepared.boundary_distance(
+                        right_geometry
+                    )
+                except Exception as exc:
+                    self.log(
+                        "⚠️ 형상 계열 간 후보 비교 실패: "
+                        f"{left['name']} ↔ {right['name']} ({exc})"
+                    )
+                    continue
+                # Intersection area has no comparable denominator across
+                # unlike dimensions.  A binary topological intersection
+                # keeps the pair reviewable, while evaluate_candidate's
+                # geometry gate prevents automatic action.
+                overlap_ratio = 1.0 if intersects else 0.0
+                geometry_pair = "_".join((
+                    family_names.get(left_family, "unknown"),
+                    family_names.get(ordered_families[right_pos], "unknown"),
+                ))
+                evaluated = evaluate_candidate(
+                    left,
+                    right,
+                    intersects=intersects,
+                    overlap_ratio=overlap_ratio,
+                    distance=distance,
+                    preset=preset,
+                    coverage_left=0.0,
+                    coverage_right=0.0,
+                    iou=0.0,
+                    area_ratio=0.0,
+                    centroid_distance=centroid_distance,
+                    boundary_distance=boundary_distance,
+                    geometry_pair=geometry_pair,
+                    rules=ruleset,
+                    similarity_memo=similarity_memo,
+                )
+                if not evaluated:
+                    continue
+                append_candidate(
+                    left_layer, left_id, left,
+                    right_layer, right_id, right,
+                    evaluated,
+                )
+        if pairwise:
+            self._record_prepared_geometry_stats()
 
-        candidates.sort(key=lambda item: (
-            -float(item.get("score", 0)),
-            str(item.get("left_uid", "")),
-            str(item.get("right_uid", "")),
-        ))
         self.log(
             "형상 계열 간 중복 후보 검토 준비 완료: "
             f"{len(candidates)}쌍 (자동 처리 없음)"
@@ -4200,41 +5090,34 @@ class ArchDistribution:
         reused_decisions = []
         pending = []
         if decision_store is not None and reuse_saved_decisions:
-            for candidate in candidates:
-                try:
-                    lookup = decision_store.lookup(
-                        candidate["left_uid"],
-                        candidate["left_fingerprint"],
-                        candidate["right_uid"],
-                        candidate["right_fingerprint"],
-                        policy_version=policy_version,
-                    )
-                except (TypeError, ValueError):
-                    pending.append(candidate)
-                    continue
-                if lookup.reusable:
-                    reused = dict(candidate)
-                    reused["decision"] = lookup.decision
-                    reused["decision_source"] = "reused"
-                    reused_decisions.append(reused)
-                else:
-                    pending.append(candidate)
+            lookups = decision_store.lookup_many(
+                candidates,
+                policy_version=policy_version,
+            )
+            for candidate, lookup in lookups.reusable:
+                reused = dict(candidate)
+                reused["decision"] = lookup.decision
+                reused["decision_source"] = "reused"
+                reused_decisions.append(reused)
+            pending = lookups.pending
         else:
             pending = list(candidates)
 
+        review_queue = ReviewQueue(pending, key=cross_family_priority)
         if pending and decision_provider is not None:
-            reviewed = decision_provider(pending)
+            reviewed = decision_provider(review_queue.drain())
             if reviewed is None:
                 raise DuplicateReviewCancelled()
         elif pending:
             dialog = DuplicateReviewDialog(
-                pending,
+                review_queue,
                 parent=self.dlg,
                 ui_lang=getattr(self.dlg, "ui_lang", "ko"),
                 zoom_callback=lambda candidate: self._zoom_cross_family_candidate(
                     layers_by_id,
                     candidate,
                 ),
+                confirm_callback=self._review_page_confirmer(policy_version),
             )
             if dialog.exec_() != dialog.Accepted:
                 raise DuplicateReviewCancelled()
@@ -4264,7 +5147,9 @@ class ArchDistribution:
                 item.setdefault("decision_source", "human_review")
             normalized_reviewed.append(item)
         reviewed = normalized_reviewed
-        decisions = reused_decisions + reviewed
+        decisions = (
+            sorted(reused_decisions, key=cross_family_priority) + reviewed
+        )
 
         decision_store_dirty = False
         if decision_store is not None:
@@ -4296,20 +5181,8 @@ class ArchDistribution:
                     "role": str(feature[indexes["SOURCE_ROLE"]] or ROLE_OTHER),
                 }
 
-        parent = {uid: uid for uid in entries}
-        entity_parent = {uid: uid for uid in entries}
-
-        def find(mapping, uid):
-            while mapping[uid] != uid:
-                mapping[uid] = mapping[mapping[uid]]
-                uid = mapping[uid]
-            return uid
-
-        def union(mapping, left_uid, right_uid):
-            left_root = find(mapping, left_uid)
-            right_root = find(mapping, right_uid)
-            if left_root != right_root:
-                mapping[max(left_root, right_root)] = min(left_root, right_root)
+        number_sets = DisjointSet(entries)
+        entity_sets = number_sets.fresh()
 
         relations = {uid: set() for uid in entries}
         relation_types = {uid: set() for uid in entries}
@@ -4372,9 +5245,9 @@ class ArchDistribution:
                         statuses[uid] = STATUS_LINKED
                 continue
 
-            union(parent, left_uid, right_uid)
+            number_sets.union(left_uid, right_uid)
             if relation_type == "same_entity":
-                union(entity_parent, left_uid, right_uid)
+                entity_sets.union(left_uid, right_uid)
             statuses[left_uid] = STATUS_USER_MERGED
             statuses[right_uid] = STATUS_USER_MERGED
 
@@ -4387,18 +5260,10 @@ class ArchDistribution:
                 ),
             )
 
-        number_components = {}
-        entity_components = {}
-        for uid in entries:
-            number_components.setdefault(find(parent, uid), []).append(uid)
-            entity_components.setdefault(find(entity_parent, uid), []).append(uid)
-
         for layer in usable_layers:
             layer.startEditing()
 
-        for component in number_components.values():
-            if len(component) < 2:
-                continue
+        for component in number_sets.components(min_size=2):
             rep_uid = representative(component)
             rep_entry = entries[rep_uid]
             rep_feature = rep_entry["feature"]
@@ -4422,9 +5287,7 @@ class ArchDistribution:
                     1 if uid == rep_uid else 0,
                 )
 
-        for component in entity_components.values():
-            if len(component) < 2:
-                continue
+        for component in entity_sets.components(min_size=2):
             rep_uid = representative(component)
             rep_entry = entries[rep_uid]
             rep_feature = rep_entry["feature"]
@@ -4527,11 +5390,10 @@ class ArchDistribution:
         target_crs,
         zone_name_field,
     ):
-        """Index Zone geometries once in the heritage output CRS."""
+        """Index and prepare Zone geometries in the heritage output CRS."""
         if not zone_layer or not zone_name_field:
-            return None, {}
+            return None
 
-        spatial_index = QgsSpatialIndex()
         zone_records = {}
         transform = None
         if zone_layer.crs() != target_crs:
@@ -4561,15 +5423,584 @@ class ArchDistribution:
             if zone_geom.isEmpty():
                 continue
 
-            indexed_feature = QgsFeature(zone_feature)
-            indexed_feature.setGeometry(zone_geom)
-            spatial_index.addFeature(indexed_feature)
             zone_records[zone_feature.id()] = (
                 zone_geom,
                 zone_feature[zone_name_field],
             )
 
-        return spatial_index, zone_records
+        spatial_index = bulk_spatial_index(geometry_bounds(
+            (zone_id, zone_geom)
+            for zone_id, (zone_geom, _zone_name) in zone_records.items()
+        ))
+        return ZoneLookup(spatial_index, zone_records)
+
+    def _scan_heritage_source(self, job, context, checkpoint):
+        """Collect the subset features of one source layer.
+
+        Several layers are scanned on worker threads, so this reads only
+        ``job["source"]`` and the values captured in ``job`` and
+        ``context``.  ``checkpoint(layer_name)`` is called every 500
+        features and raises :class:`ProcessingCancelled` on cancellation.
+        """
+        layer = job["layer"]
+        layer_name = job["layer_name"]
+        geometry_type = job["geometry_type"]
+        source_fields = job["source_fields"]
+        fields = job["fields"]
+        source_role = job["source_role"]
+        name_field = job["name_field"]
+        heritage_name_field = job["heritage_name_field"]
+        project_name_field = job["project_name_field"]
+        addr_field = job["addr_field"]
+        code_field = job["code_field"]
+        preservation_action_field = job["preservation_action_field"]
+        preservation_site_id_field = job["preservation_site_id_field"]
+        copied_source_fields = job["copied_source_fields"]
+        extent_clipper = context["extent_clipper"]
+        study_geom = context["study_geom"]
+        exclusion_list = context["exclusion_list"]
+        filter_categories = context["filter_categories"]
+        clip_filter_context = context["clip_filter_context"]
+        zone_lookup = context["zone_lookup"]
+        preservation_only = context["preservation_only"]
+
+        # Transforms are not shared between threads; each scan builds its own.
+        transform = None
+        if job["source_crs"] != context["target_crs"]:
+            transform = QgsCoordinateTransform(
+                job["source_crs"],
+                context["target_crs"],
+                context["transform_context"],
+            )
+
+        new_features = []
+        fingerprint_records = []
+        zone_tagging_seconds = 0.0
+        excluded_extent_slivers = 0
+        geometry_repairs = 0
+        invalid_geometry_exclusions = 0
+        candidate_feature_count = 0
+        # A cached snapshot already holds normalized features; a cache miss
+        # normalizes the whole layer once so the next run can reuse it.
+        snapshot = job.get("snapshot")
+        snapshot_features = [] if job.get("snapshot_key") else None
+        candidate_bounds = job.get("candidate_bounds")
+        features = job["source"].getFeatures(job["request"])
+        if (
+            snapshot is None
+            and transform is not None
+            and job["wkb_type"] == QgsWkbTypes.Point
+        ):
+            scanned = self._with_point_transforms(features, transform)
+        else:
+            scanned = ((feat, None) for feat in features)
+        batched_point_transforms = 0
+        scan_started = time.perf_counter()
+        for scan_index, (feat, transformed_point) in enumerate(scanned):
+            if scan_index % 500 == 0:
+                checkpoint(layer_name)
+            cached_identity = None
+            source_geometry_payload = None
+            if snapshot is not None:
+                status = feat["SRC_STATUS"]
+                geom = (
+                    QgsGeometry(feat.geometry())
+                    if feat.hasGeometry() else None
+                )
+                if status != STATUS_INVALID and geom is not None:
+                    cached_identity = CachedIdentity(
+                        feat["SRC_UID"],
+                        feat["SRC_FP"],
+                    )
+                feat = restore_source_feature(feat, source_fields)
+            else:
+                if transformed_point is not None:
+                    batched_point_transforms += 1
+                geom, status, source_geometry_payload = (
+                    self._normalize_source_geometry(
+                        feat,
+                        transform,
+                        geometry_type,
+                        layer_name,
+                        transformed=transformed_point,
+                    )
+                )
+                if snapshot_features is not None:
+                    if status != STATUS_INVALID:
+                        cached_identity = self._scan_source_identity(
+                            job,
+                            feat,
+                            source_geometry_payload,
+                        )
+                    snapshot_features.append(snapshot_feature(
+                        job["snapshot_fields"],
+                        geom,
+                        feat,
+                        status,
+                        cached_identity,
+                    ))
+                    # The snapshot covers the whole layer; only features
+                    # the extent prefilter would have returned are scanned.
+                    if candidate_bounds is not None and (
+                        geom is None
+                        or bounds_disjoint(
+                            candidate_bounds,
+                            rectangle_tuple(geom.boundingBox()),
+                        )
+                    ):
+                        continue
+            candidate_feature_count += 1
+            if status == STATUS_INVALID or geom is None:
+                invalid_geometry_exclusions += 1
+                continue
+            if status == STATUS_REPAIRED:
+                geometry_repairs += 1
+
+            # Retrieve Attributes for filtering
+            val_name = feat[name_field] if name_field else ""
+
+            # [NEW] Check Exclusion List (Specific Blacklist)
+            # If the name is in the user's exclusion list, skip it.
+            if exclusion_list and val_name in exclusion_list:
+                # Log removed item occasionally?
+                # self.log(f"  - 사용자 제외: {val_name}")
+                continue
+
+            # Check Category Filters (Legacy Reference Data)
+            if self.should_exclude(val_name, filter_categories):
+                continue
+
+            # The distribution-map workflow clips to its map extent. The
+            # dedicated preservation workflow intentionally keeps all input
+            # polygons and therefore passes no extent.
+            if extent_clipper is None or extent_clipper.intersects(geom):
+                # [NEW FIX] Clip geometry to extent bounds
+                # This handles MultiPolygon features where parts are outside the extent
+                clipped_geom = (
+                    extent_clipper.clip(geom)
+                    if extent_clipper is not None
+                    else QgsGeometry(geom)
+                )
+                if clipped_geom.isEmpty():
+                    continue  # No part inside extent
+                if (
+                    geometry_type == 2
+                    and clip_filter_context
+                ):
+                    clipped_bounds = clipped_geom.boundingBox()
+                    if is_insignificant_extent_fragment(
+                        original_area=geom.area(),
+                        clipped_area=clipped_geom.area(),
+                        clipped_width=clipped_bounds.width(),
+                        clipped_height=clipped_bounds.height(),
+                        **clip_filter_context,
+                    ):
+                        excluded_extent_slivers += 1
+                        continue
+
+                # We exclude sites that are entirely within the study area (as they are 'internal')
+                # But we include ones that overlap or are outside
+                is_entirely_inside = clipped_geom.within(study_geom) if not study_geom.isNull() else False
+
+                if not is_entirely_inside:
+                    # [FIX] Included internal sites as well (User Request: Prevent aggressive data loss)
+                    # Originally: if not is_entirely_inside:
+                    # Now: Allow all (since we clipped to extent already)
+                    pass
+
+                if True:  # Always proceed if it intersects extent
+                    new_feat = QgsFeature(fields)
+                    new_feat.setGeometry(clipped_geom)  # Use clipped geometry
+
+                    # [NEW] Attribute Extraction
+                    val_name = feat[name_field] if name_field else ""
+                    val_heritage = feat[heritage_name_field] if heritage_name_field else ""
+                    val_project = feat[project_name_field] if project_name_field else ""
+                    val_address = feat[addr_field] if addr_field else ""
+                    native_code = (
+                        feat[code_field]
+                        if code_field and feat[code_field] is not None
+                        else None
+                    )
+                    preservation_site_id = (
+                        feat[preservation_site_id_field]
+                        if (
+                            preservation_site_id_field
+                            and feat[preservation_site_id_field] is not None
+                        ) else None
+                    )
+                    source_attributes = {
+                        source_field.name(): _json_safe_attribute(
+                            feat[source_field.name()]
+                        )
+                        for source_field in source_fields
+                    }
+                    source_identity = (
+                        cached_identity
+                        or self._scan_source_identity(
+                            job,
+                            feat,
+                            source_geometry_payload,
+                        )
+                    )
+                    raw_preservation_action = (
+                        feat[preservation_action_field]
+                        if preservation_action_field else ""
+                    )
+                    preservation_action = normalize_preservation_action(
+                        raw_preservation_action
+                    )
+                    # [NEW] Filtering Logic
+                    # 1. Smart Filter (Era/Type from JSON)
+                    if self.should_exclude(val_name, filter_categories):  # filter_categories is actually 'filter_items' list
+                        continue
+
+                    # Group every record with the same project name before
+                    # numbering. If the project field is empty, the helper
+                    # falls back to heritage/site names and explicit area
+                    # suffixes such as "I 지역" or "II-1,2,3지역".
+                    grouping = resolve_heritage_group(
+                        val_project,
+                        val_name,
+                        val_heritage,
+                        fallback_key=source_identity.uid,
+                        preservation_action=preservation_action,
+                        preservation_number_scope=(
+                            self._preservation_number_scope(
+                                layer,
+                                supplier_site_id=preservation_site_id,
+                                supplier_id_field=(
+                                    preservation_site_id_field
+                                ),
+                                site_name=val_name,
+                                heritage_name=val_heritage,
+                                address=val_address,
+                            )
+                            if preservation_only else None
+                        ),
+                    )
+                    display_name = grouping["display_name"]
+                    investigation_key = (
+                        f"{source_role}:{grouping['investigation_key']}"
+                        if grouping.get("investigation_key")
+                        else None
+                    )
+                    site_entity_key = (
+                        f"{source_role}:{grouping['site_entity_key']}"
+                    )
+                    number_key = (
+                        f"{source_role}:{grouping['number_key']}"
+                    )
+                    geometry_group_key = (
+                        f"{source_role}:{grouping['geometry_group_key']}"
+                    )
+
+                    # Map attributes
+                    new_feat["유적명"] = display_name if display_name else "N/A"
+                    new_feat["주소"] = val_address or "N/A"
+                    new_feat["국가유산명"] = val_heritage
+                    # [NEW] Zone Intersection Check
+                    val_zone = ""
+                    if zone_lookup:
+                        zone_started = time.perf_counter()
+                        zone_names = zone_lookup.zone_names(clipped_geom)
+                        zone_tagging_seconds += (
+                            time.perf_counter() - zone_started
+                        )
+                        if zone_names:
+                            val_zone = ", ".join(zone_names)
+
+                    # Map attributes
+                    new_feat["유적명"] = display_name if display_name else "N/A"
+                    new_feat["주소"] = val_address or "N/A"
+                    new_feat["국가유산명"] = val_heritage
+                    new_feat["사업명"] = val_project
+                    new_feat["허용기준"] = val_zone if val_zone else None
+                    new_feat["보존조치"] = preservation_action or None
+                    new_feat["SRC_NAME"] = val_name
+                    new_feat["SRC_ACTION"] = raw_preservation_action
+                    new_feat["SRC_COUNT"] = 1
+
+                    source_record = dict(source_attributes)
+                    source_record["_source_layer"] = layer_name
+                    source_record["_source_uid"] = source_identity.uid
+                    new_feat["SRC_JSON"] = json.dumps(
+                        [source_record],
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                        default=str,
+                    )
+
+                    for source_name in copied_source_fields:
+                        new_feat[source_name] = feat[source_name]
+
+                    # This public field is a measurement, never an alias
+                    # for an unverified supplier AREA column.  The original
+                    # value is still preserved in its source field/SRC_JSON.
+                    new_feat["면적_m2"] = (
+                        clipped_geom.area()
+                        if geometry_type == 2 else 0.0
+                    )
+
+                    new_feat["원본레이어"] = layer_name
+                    new_feat["HERITAGE_CODE"] = (
+                        str(native_code)
+                        if native_code is not None
+                        else None
+                    )
+                    new_feat["SRC_UID"] = source_identity.uid
+                    new_feat["SRC_FP"] = (
+                        source_identity.content_fingerprint
+                    )
+                    new_feat["SOURCE_ROLE"] = source_role
+                    new_feat["INVESTIGATION_KEY"] = investigation_key
+                    new_feat["SITE_ENTITY_KEY"] = site_entity_key
+                    # ENTITY_KEY remains a documented compatibility alias.
+                    new_feat["ENTITY_KEY"] = site_entity_key
+                    new_feat["GEOMETRY_GROUP_KEY"] = geometry_group_key
+                    new_feat["RELATION_KEY"] = None
+                    new_feat["RELATION_TYPE"] = (
+                        "legal_boundary_site"
+                        if source_role == ROLE_PROTECTION_ZONE
+                        else None
+                    )
+                    new_feat["MATCH_STATUS"] = (
+                        STATUS_PROTECTION_ZONE
+                        if source_role == ROLE_PROTECTION_ZONE
+                        else STATUS_UNIQUE
+                    )
+                    new_feat["MATCH_SCORE"] = 0.0
+                    new_feat["MATCH_RULE"] = None
+                    new_feat["REP_SOURCE"] = source_role
+                    new_feat["LINKED_IDS"] = None
+                    new_feat["IS_REP"] = (
+                        0
+                        if source_role == ROLE_PROTECTION_ZONE
+                        else 1
+                    )
+                    new_feat["NUMBER_KEY"] = (
+                        ""
+                        if source_role == ROLE_PROTECTION_ZONE
+                        else number_key
+                    )
+                    new_feat["GROUP_KEY"] = geometry_group_key
+                    new_features.append(new_feat)
+                    fingerprint_records.append({
+                        "role": source_role,
+                        "content_fingerprint": (
+                            source_identity.content_fingerprint
+                        ),
+                    })
+
+        return {
+            "new_features": new_features,
+            "fingerprint_records": fingerprint_records,
+            "candidate_feature_count": candidate_feature_count,
+            "excluded_extent_slivers": excluded_extent_slivers,
+            "geometry_repairs": geometry_repairs,
+            "invalid_geometry_exclusions": invalid_geometry_exclusions,
+            "zone_tagging_seconds": zone_tagging_seconds,
+            "batched_point_transforms": batched_point_transforms,
+            "snapshot_features": snapshot_features,
+            "elapsed_seconds": time.perf_counter() - scan_started,
+        }
+
+    @staticmethod
+    def _with_point_transforms(features, transform):
+        """Yield ``(feature, transformed_point)`` pairs for point features.
+
+        Points are read ahead in batches of
+        :data:`POINT_TRANSFORM_BATCH_SIZE` and reprojected with one
+        transform call per batch.  ``transformed_point`` is ``None`` for a
+        feature that must be transformed on its own.
+        """
+        batch = []
+        for feature in features:
+            batch.append(feature)
+            if len(batch) >= POINT_TRANSFORM_BATCH_SIZE:
+                yield from zip(batch, transform_point_geometries(
+                    [item.geometry() for item in batch],
+                    transform,
+                ))
+                batch = []
+        if batch:
+            yield from zip(batch, transform_point_geometries(
+                [item.geometry() for item in batch],
+                transform,
+            ))
+
+    @staticmethod
+    def _normalize_source_geometry(
+        feat,
+        transform,
+        geometry_type,
+        layer_name,
+        transformed=None,
+    ):
+        """Return ``(geometry, status, source_wkb)`` for one source feature.
+
+        ``geometry`` is in the target CRS and repaired when needed.  An
+        ``STATUS_INVALID`` feature keeps its transformed geometry, if any,
+        so a snapshot can still place it within an extent.  ``transformed``
+        is the feature's geometry already reprojected in a batch.
+        """
+        if not feat.hasGeometry():
+            return None, STATUS_INVALID, None
+        source_geometry = QgsGeometry(feat.geometry())
+        source_geometry_payload = _geometry_payload(source_geometry)
+        if transformed is not None:
+            geom = transformed
+        else:
+            geom = QgsGeometry(source_geometry)
+            try:
+                if transform is not None:
+                    geom.transform(transform)
+            except Exception as error:
+                raise MetricContextError(
+                    f"좌표 변환 실패: {layer_name} 객체 {feat.id()}"
+                ) from error
+        if geom.isNull() or geom.isEmpty():
+            return None, STATUS_INVALID, source_geometry_payload
+        status = STATUS_VALID
+        if not geom.isGeosValid():
+            repaired = geom.makeValid()
+            if not repaired or repaired.isEmpty():
+                return geom, STATUS_INVALID, source_geometry_payload
+            geom = repaired
+            status = STATUS_REPAIRED
+        if QgsWkbTypes.geometryType(geom.wkbType()) != geometry_type:
+            return geom, STATUS_INVALID, source_geometry_payload
+        return geom, status, source_geometry_payload
+
+    @staticmethod
+    def _scan_source_identity(job, feat, source_geometry_payload):
+        """Build the source identity of one scanned feature.
+
+        The geometry digest is shared through the run's digest service when
+        the job carries one.
+        """
+        name_field = job["name_field"]
+        project_name_field = job["project_name_field"]
+        addr_field = job["addr_field"]
+        code_field = job["code_field"]
+        digests = job.get("geometry_digests")
+        geometry_digest = (
+            digests.digest(
+                (job["lid"], "source-wkb"),
+                feat.id(),
+                source_geometry_payload,
+            )
+            if digests is not None
+            else None
+        )
+        return build_source_identity(
+            job["source_role"],
+            native_code=(
+                feat[code_field]
+                if code_field and feat[code_field] is not None
+                else None
+            ),
+            name=feat[name_field] if name_field else "",
+            project_name=(
+                feat[project_name_field] if project_name_field else ""
+            ),
+            address=feat[addr_field] if addr_field else "",
+            geometry=source_geometry_payload,
+            extra_content={
+                source_field.name(): _json_safe_attribute(
+                    feat[source_field.name()]
+                )
+                for source_field in job["source_fields"]
+            },
+            geometry_digest=geometry_digest,
+        )
+
+    def _source_scan_checkpoint(self, layer_name):
+        progress = getattr(self, "_active_progress", None)
+        if progress:
+            progress.setLabelText(
+                f"{layer_name} 도곽 후보를 확인하는 중입니다..."
+            )
+            QCoreApplication.processEvents()
+            if progress.wasCanceled():
+                raise ProcessingCancelled()
+
+    def _scan_heritage_sources(self, jobs, context):
+        """Scan every job's source layer and return results in job order.
+
+        Layers are independent until their subsets are merged, so when two
+        or more are large they are scanned on a thread pool while this
+        thread keeps the progress dialog responsive.  The pool is sized by
+        ``default_scan_thread_count``, not the candidate process setting.
+        A cancellation stops the remaining scans at their next checkpoint.
+        """
+        workers = min(
+            len(jobs),
+            default_scan_thread_count(
+                job["source_feature_count"] for job in jobs
+            ),
+        )
+        if workers <= 1:
+            return [
+                self._scan_heritage_source(
+                    job,
+                    context,
+                    self._source_scan_checkpoint,
+                )
+                for job in jobs
+            ]
+
+        stop = threading.Event()
+        user_cancelled = False
+
+        def checkpoint(_layer_name):
+            if stop.is_set():
+                raise ProcessingCancelled()
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="ArchDistributionScan",
+        ) as executor:
+            # Worker threads must not touch the layers themselves; each
+            # reads a detached snapshot created here on the main thread.
+            futures = [
+                executor.submit(
+                    self._scan_heritage_source,
+                    dict(
+                        job,
+                        source=QgsVectorLayerFeatureSource(job["source"]),
+                    ),
+                    context,
+                    checkpoint,
+                )
+                for job in jobs
+            ]
+            running = set(futures)
+            while running:
+                finished, running = wait(running, timeout=0.1)
+                if any(future.exception() for future in finished):
+                    stop.set()
+                progress = getattr(self, "_active_progress", None)
+                if progress:
+                    progress.setLabelText(
+                        "원천 레이어를 병렬로 확인하는 중입니다... "
+                        f"({len(futures) - len(running)}/{len(futures)})"
+                    )
+                    QCoreApplication.processEvents()
+                    if progress.wasCanceled():
+                        user_cancelled = True
+                        stop.set()
+
+        for future in futures:
+            error = future.exception()
+            if error is not None and not isinstance(
+                error,
+                ProcessingCancelled,
+            ):
+                raise error
+        if user_cancelled:
+            raise ProcessingCancelled()
+        return [future.result() for future in futures]
 
     def consolidate_heritage_layers(
         self,
@@ -4629,11 +6060,9 @@ class ArchDistribution:
         # Merge study area geometries for fast intersection check
         study_geom = QgsGeometry()
         if study_layer:
-            for f in study_layer.getFeatures():
-                if study_geom.isNull():
-                    study_geom = f.geometry()
-                else:
-                    study_geom = study_geom.combine(f.geometry())
+            study_geom = (
+                self._study_geometry(study_layer).geometry() or QgsGeometry()
+            )
             target_crs = study_layer.crs()
         else:
             target_crs = None
@@ -4647,8 +6076,7 @@ class ArchDistribution:
                 return None
 
         zone_name_field = None
-        zone_spatial_index = None
-        zone_records = {}
+        zone_lookup = None
         if zone_layer:
             zone_name_field = self.find_field(
                 zone_layer,
@@ -4664,18 +6092,40 @@ class ArchDistribution:
                 ],
             )
             if zone_name_field:
-                zone_spatial_index, zone_records = (
-                    self._build_zone_spatial_lookup(
-                        zone_layer,
-                        target_crs,
-                        zone_name_field,
-                    )
+                zone_lookup = self._build_zone_spatial_lookup(
+                    zone_layer,
+                    target_crs,
+                    zone_name_field,
                 )
                 self.log(
                     "현상변경 허용구간 공간 인덱스 준비 완료: "
-                    f"{len(zone_records)}건"
+                    f"{len(zone_lookup)}건"
                 )
 
+        if (
+            filter_categories is not None
+            and not hasattr(self, "reference_data")
+        ):
+            # should_exclude loads this lazily; load it once before the
+            # source scans share it between threads.
+            self.load_reference_data()
+        scan_context = {
+            "extent_clipper": (
+                ExtentClipper(extent_geom)
+                if extent_geom is not None else None
+            ),
+            "study_geom": study_geom,
+            "target_crs": target_crs,
+            "transform_context": QgsProject.instance().transformContext(),
+            "exclusion_list": exclusion_list,
+            "filter_categories": filter_categories,
+            "clip_filter_context": clip_filter_context,
+            "zone_lookup": zone_lookup,
+            "preservation_only": preservation_only,
+        }
+        snapshot_cache = None
+        snapshot_cache_opened = False
+        scan_jobs = []
         for lid in heritage_layer_ids:
             layer = QgsProject.instance().mapLayer(lid)
             if not layer or layer.type() != 0:
@@ -4853,20 +6303,7 @@ class ArchDistribution:
             subset_pr.addAttributes(standard_fields)
             subset_layer.updateFields()
 
-            # Reproject if necessary
-            do_reproject = layer.crs() != target_crs
-            if do_reproject:
-                from qgis.core import QgsCoordinateTransform
-                transform = QgsCoordinateTransform(layer.crs(), target_crs, QgsProject.instance())
-
-            new_features = []
-            fingerprint_records = []
-            excluded_extent_slivers = 0
-            geometry_repairs = 0
-            invalid_geometry_exclusions = 0
             source_feature_count = layer.featureCount()
-            candidate_feature_count = 0
-            scan_started = time.perf_counter()
             code_field = self.find_field(
                 layer,
                 ["유산코드", "HERITAGE_CODE", "CODE"],
@@ -4882,298 +6319,84 @@ class ArchDistribution:
                     target_crs,
                 )
             )
-            for scan_index, feat in enumerate(
-                layer.getFeatures(feature_request)
-            ):
-                candidate_feature_count += 1
-                if scan_index % 500 == 0:
-                    progress = getattr(self, "_active_progress", None)
-                    if progress:
-                        progress.setLabelText(
-                            f"{layer.name()} 도곽 후보를 확인하는 중입니다..."
-                        )
-                        QCoreApplication.processEvents()
-                        if progress.wasCanceled():
-                            raise ProcessingCancelled()
-                if not feat.hasGeometry():
-                    invalid_geometry_exclusions += 1
-                    continue
-
-                source_geometry = QgsGeometry(feat.geometry())
-                try:
-                    source_geometry_payload = bytes(source_geometry.asWkb())
-                except (TypeError, ValueError):
-                    source_geometry_payload = source_geometry.asWkt()
-                geom = QgsGeometry(source_geometry)
-                try:
-                    if do_reproject:
-                        geom.transform(transform)
-                except Exception as error:
-                    raise MetricContextError(
-                        f"좌표 변환 실패: {layer.name()} 객체 {feat.id()}"
-                    ) from error
-                if geom.isNull() or geom.isEmpty():
-                    invalid_geometry_exclusions += 1
-                    continue
-                if not geom.isGeosValid():
-                    repaired = geom.makeValid()
-                    if repaired and not repaired.isEmpty():
-                        geom = repaired
-                        geometry_repairs += 1
-                    else:
-                        invalid_geometry_exclusions += 1
-                        continue
-                if QgsWkbTypes.geometryType(geom.wkbType()) != layer.geometryType():
-                    invalid_geometry_exclusions += 1
-                    continue
-
-                # Retrieve Attributes for filtering
-                val_name = feat[name_field] if name_field else ""
-
-                # [NEW] Check Exclusion List (Specific Blacklist)
-                # If the name is in the user's exclusion list, skip it.
-                if exclusion_list and val_name in exclusion_list:
-                    # Log removed item occasionally?
-                    # self.log(f"  - 사용자 제외: {val_name}")
-                    continue
-
-                # Check Category Filters (Legacy Reference Data)
-                if self.should_exclude(val_name, filter_categories):
-                    continue
-
-                # The distribution-map workflow clips to its map extent. The
-                # dedicated preservation workflow intentionally keeps all input
-                # polygons and therefore passes no extent.
-                if extent_geom is None or geom.intersects(extent_geom):
-                    # [NEW FIX] Clip geometry to extent bounds
-                    # This handles MultiPolygon features where parts are outside the extent
-                    clipped_geom = (
-                        geom.intersection(extent_geom)
-                        if extent_geom is not None
-                        else QgsGeometry(geom)
-                    )
-                    if clipped_geom.isEmpty():
-                        continue  # No part inside extent
-                    if (
-                        layer.geometryType() == 2
-                        and clip_filter_context
-                    ):
-                        clipped_bounds = clipped_geom.boundingBox()
-                        if is_insignificant_extent_fragment(
-                            original_area=geom.area(),
-                            clipped_area=clipped_geom.area(),
-                            clipped_width=clipped_bounds.width(),
-                            clipped_height=clipped_bounds.height(),
-                            **clip_filter_context,
-                        ):
-                            excluded_extent_slivers += 1
-                            continue
-
-                    # We exclude sites that are entirely within the study area (as they are 'internal')
-                    # But we include ones that overlap or are outside
-                    is_entirely_inside = clipped_geom.within(study_geom) if not study_geom.isNull() else False
-
-                    if not is_entirely_inside:
-                        # [FIX] Included internal sites as well (User Request: Prevent aggressive data loss)
-                        # Originally: if not is_entirely_inside:
-                        # Now: Allow all (since we clipped to extent already)
-                        pass
-
-                    if True:  # Always proceed if it intersects extent
-                        new_feat = QgsFeature(subset_layer.fields())
-                        new_feat.setGeometry(clipped_geom)  # Use clipped geometry
-
-                        # [NEW] Attribute Extraction
-                        val_name = feat[name_field] if name_field else ""
-                        val_heritage = feat[heritage_name_field] if heritage_name_field else ""
-                        val_project = feat[project_name_field] if project_name_field else ""
-                        val_address = feat[addr_field] if addr_field else ""
-                        native_code = (
-                            feat[code_field]
-                            if code_field and feat[code_field] is not None
-                            else None
-                        )
-                        preservation_site_id = (
-                            feat[preservation_site_id_field]
-                            if (
-                                preservation_site_id_field
-                                and feat[preservation_site_id_field] is not None
-                            ) else None
-                        )
-                        source_attributes = {
-                            source_field.name(): _json_safe_attribute(
-                                feat[source_field.name()]
-                            )
-                            for source_field in layer.fields()
-                        }
-                        source_identity = build_source_identity(
-                            source_role,
-                            native_code=native_code,
-                            name=val_name,
-                            project_name=val_project,
-                            address=val_address,
-                            geometry=source_geometry_payload,
-                            extra_content=source_attributes,
-                        )
-                        raw_preservation_action = (
-                            feat[preservation_action_field]
-                            if preservation_action_field else ""
-                        )
-                        preservation_action = normalize_preservation_action(
-                            raw_preservation_action
-                        )
-                        # [NEW] Filtering Logic
-                        # 1. Smart Filter (Era/Type from JSON)
-                        if self.should_exclude(val_name, filter_categories):  # filter_categories is actually 'filter_items' list
-                            continue
-
-                        # Group every record with the same project name before
-                        # numbering. If the project field is empty, the helper
-                        # falls back to heritage/site names and explicit area
-                        # suffixes such as "I 지역" or "II-1,2,3지역".
-                        grouping = resolve_heritage_group(
-                            val_project,
-                            val_name,
-                            val_heritage,
-                            fallback_key=source_identity.uid,
-                            preservation_action=preservation_action,
-                            preservation_number_scope=(
-                                self._preservation_number_scope(
-                                    layer,
-                                    supplier_site_id=preservation_site_id,
-                                    supplier_id_field=(
-                                        preservation_site_id_field
-                                    ),
-                                    site_name=val_name,
-                                    heritage_name=val_heritage,
-                                    address=val_address,
-                                )
-                                if preservation_only else None
-                            ),
-                        )
-                        display_name = grouping["display_name"]
-                        investigation_key = (
-                            f"{source_role}:{grouping['investigation_key']}"
-                            if grouping.get("investigation_key")
-                            else None
-                        )
-                        site_entity_key = (
-                            f"{source_role}:{grouping['site_entity_key']}"
-                        )
-                        number_key = (
-                            f"{source_role}:{grouping['number_key']}"
-                        )
-                        geometry_group_key = (
-                            f"{source_role}:{grouping['geometry_group_key']}"
-                        )
-
-                        # Map attributes
-                        new_feat["유적명"] = display_name if display_name else "N/A"
-                        new_feat["주소"] = val_address or "N/A"
-                        new_feat["국가유산명"] = val_heritage
-                        # [NEW] Zone Intersection Check
-                        val_zone = ""
-                        if zone_spatial_index and zone_records:
-                            zone_names = []
-                            for zone_feature_id in sorted(
-                                zone_spatial_index.intersects(
-                                    clipped_geom.boundingBox()
-                                )
-                            ):
-                                zone_record = zone_records.get(
-                                    zone_feature_id
-                                )
-                                if not zone_record:
-                                    continue
-                                zone_geom, z_name = zone_record
-                                if zone_geom.intersects(clipped_geom):
-                                    if z_name:
-                                        zone_names.append(str(z_name))
-                            if zone_names:
-                                val_zone = ", ".join(zone_names)
-
-                        # Map attributes
-                        new_feat["유적명"] = display_name if display_name else "N/A"
-                        new_feat["주소"] = val_address or "N/A"
-                        new_feat["국가유산명"] = val_heritage
-                        new_feat["사업명"] = val_project
-                        new_feat["허용기준"] = val_zone if val_zone else None
-                        new_feat["보존조치"] = preservation_action or None
-                        new_feat["SRC_NAME"] = val_name
-                        new_feat["SRC_ACTION"] = raw_preservation_action
-                        new_feat["SRC_COUNT"] = 1
-
-                        source_record = dict(source_attributes)
-                        source_record["_source_layer"] = layer.name()
-                        source_record["_source_uid"] = source_identity.uid
-                        new_feat["SRC_JSON"] = json.dumps(
-                            [source_record],
-                            ensure_ascii=False,
-                            separators=(",", ":"),
-                            default=str,
-                        )
-
-                        for source_name in copied_source_fields:
-                            new_feat[source_name] = feat[source_name]
-
-                        # This public field is a measurement, never an alias
-                        # for an unverified supplier AREA column.  The original
-                        # value is still preserved in its source field/SRC_JSON.
-                        new_feat["면적_m2"] = (
-                            clipped_geom.area()
-                            if layer.geometryType() == 2 else 0.0
-                        )
-
-                        new_feat["원본레이어"] = layer.name()
-                        new_feat["HERITAGE_CODE"] = (
-                            str(native_code)
-                            if native_code is not None
-                            else None
-                        )
-                        new_feat["SRC_UID"] = source_identity.uid
-                        new_feat["SRC_FP"] = (
-                            source_identity.content_fingerprint
-                        )
-                        new_feat["SOURCE_ROLE"] = source_role
-                        new_feat["INVESTIGATION_KEY"] = investigation_key
-                        new_feat["SITE_ENTITY_KEY"] = site_entity_key
-                        # ENTITY_KEY remains a documented compatibility alias.
-                        new_feat["ENTITY_KEY"] = site_entity_key
-                        new_feat["GEOMETRY_GROUP_KEY"] = geometry_group_key
-                        new_feat["RELATION_KEY"] = None
-                        new_feat["RELATION_TYPE"] = (
-                            "legal_boundary_site"
-                            if source_role == ROLE_PROTECTION_ZONE
-                            else None
-                        )
-                        new_feat["MATCH_STATUS"] = (
-                            STATUS_PROTECTION_ZONE
-                            if source_role == ROLE_PROTECTION_ZONE
-                            else STATUS_UNIQUE
-                        )
-                        new_feat["MATCH_SCORE"] = 0.0
-                        new_feat["MATCH_RULE"] = None
-                        new_feat["REP_SOURCE"] = source_role
-                        new_feat["LINKED_IDS"] = None
-                        new_feat["IS_REP"] = (
-                            0
-                            if source_role == ROLE_PROTECTION_ZONE
-                            else 1
-                        )
-                        new_feat["NUMBER_KEY"] = (
-                            ""
-                            if source_role == ROLE_PROTECTION_ZONE
-                            else number_key
-                        )
-                        new_feat["GROUP_KEY"] = geometry_group_key
-                        new_features.append(new_feat)
-                        fingerprint_records.append({
-                            "role": source_role,
-                            "content_fingerprint": (
-                                source_identity.content_fingerprint
-                            ),
-                        })
-
+            job = {
+                "lid": lid,
+                "layer": layer,
+                "layer_name": layer.name(),
+                "source": layer,
+                "request": feature_request,
+                "used_extent_filter": used_extent_filter,
+                "source_crs": layer.crs(),
+                "source_fields": layer.fields(),
+                "source_feature_count": source_feature_count,
+                "geometry_type": layer.geometryType(),
+                "subset_layer": subset_layer,
+                "fields": subset_layer.fields(),
+                "source_role": source_role,
+                "name_field": name_field,
+                "heritage_name_field": heritage_name_field,
+                "project_name_field": project_name_field,
+                "addr_field": addr_field,
+                "code_field": code_field,
+                "preservation_action_field": preservation_action_field,
+                "preservation_site_id_field": preservation_site_id_field,
+                "copied_source_fields": copied_source_fields,
+                "geometry_digests": self._geometry_digest_service(),
+                "wkb_type": layer.wkbType(),
+            }
+            source_snapshot_key = self._source_snapshot_key(
+                layer,
+                target_crs,
+                job,
+                scan_context["transform_context"],
+            )
+            if source_snapshot_key is not None and not snapshot_cache_opened:
+                snapshot_cache = self._open_source_snapshot_cache()
+                snapshot_cache_opened = True
+            if source_snapshot_key is not None and snapshot_cache is not None:
+                self._prepare_source_snapshot_job(
+                    job,
+                    source_snapshot_key,
+                    snapshot_cache,
+                    extent_geom,
+                )
+            scan_jobs.append(job)
+
+        scan_results = self._scan_heritage_sources(scan_jobs, scan_context)
+        if snapshot_cache is not None:
+            stored_snapshots = self._store_source_snapshots(
+                snapshot_cache,
+                scan_jobs,
+                scan_results,
+                target_crs,
+            )
+            processing_stats = getattr(
+                self, "_current_processing_stats", None
+            )
+            if isinstance(processing_stats, dict):
+                processing_stats.update(snapshot_cache.statistics())
+            self.log(
+                "원천 전처리 캐시: "
+                f"{snapshot_cache.hit_count}건 재사용, "
+                f"{stored_snapshots}건 새로 저장"
+            )
+            snapshot_cache.close()
+        for job, scan in zip(scan_jobs, scan_results):
+            lid = job["lid"]
+            layer = job["layer"]
+            source_role = job["source_role"]
+            subset_layer = job["subset_layer"]
+            subset_pr = subset_layer.dataProvider()
+            used_extent_filter = job["used_extent_filter"]
+            source_feature_count = job["source_feature_count"]
+            new_features = scan["new_features"]
+            fingerprint_records = scan["fingerprint_records"]
+            candidate_feature_count = scan["candidate_feature_count"]
+            excluded_extent_slivers = scan["excluded_extent_slivers"]
+            geometry_repairs = scan["geometry_repairs"]
+            invalid_geometry_exclusions = scan["invalid_geometry_exclusions"]
+            zone_tagging_seconds = scan["zone_tagging_seconds"]
+            elapsed_seconds = scan["elapsed_seconds"]
             if new_features:
                 fingerprint = selected_content_fingerprint(
                     fingerprint_records
@@ -5205,7 +6428,6 @@ class ArchDistribution:
                     "id": lid,
                     "name": layer.name(),
                 }
-                elapsed_seconds = time.perf_counter() - scan_started
                 filter_label = (
                     "도곽 선필터"
                     if used_extent_filter
@@ -5225,6 +6447,12 @@ class ArchDistribution:
                         "collected_count": len(new_features),
                         "extent_prefilter": used_extent_filter,
                         "elapsed_seconds": round(elapsed_seconds, 6),
+                        "zone_tagging_seconds": round(
+                            zone_tagging_seconds, 6
+                        ),
+                        "batched_point_transforms": (
+                            scan["batched_point_transforms"]
+                        ),
                         "geometry_repairs": geometry_repairs,
                         "invalid_geometry_exclusions": (
                             invalid_geometry_exclusions
@@ -5236,10 +6464,14 @@ class ArchDistribution:
                     f"최종 {len(new_features)}개소 수집 "
                     f"({elapsed_seconds:.2f}초)"
                 )
+                if zone_lookup:
+                    self.log(
+                        "  -> 허용기준 태깅: "
+                        f"{zone_tagging_seconds:.2f}초"
+                    )
                 subset_pr.addFeatures(new_features)
                 temp_layers.append(subset_layer)
             else:
-                elapsed_seconds = time.perf_counter() - scan_started
                 processing_stats = getattr(
                     self,
                     "_current_processing_stats",
@@ -5254,6 +6486,12 @@ class ArchDistribution:
                         "collected_count": 0,
                         "extent_prefilter": used_extent_filter,
                         "elapsed_seconds": round(elapsed_seconds, 6),
+                        "zone_tagging_seconds": round(
+                            zone_tagging_seconds, 6
+                        ),
+                        "batched_point_transforms": (
+                            scan["batched_point_transforms"]
+                        ),
                         "geometry_repairs": geometry_repairs,
                         "invalid_geometry_exclusions": (
                             invalid_geometry_exclusions
@@ -5316,6 +6554,23 @@ class ArchDistribution:
 
             self.move_layer_to_group(layer, src_group)
 
+        if zone_lookup:
+            zone_tagging_total = sum(
+                scan["zone_tagging_seconds"] for scan in scan_results
+            )
+            processing_stats = getattr(
+                self, "_current_processing_stats", None
+            )
+            if isinstance(processing_stats, dict):
+                processing_stats["zone_tagging_seconds"] = round(
+                    zone_tagging_total, 6
+                )
+                processing_stats.update(zone_lookup.statistics())
+            self.log(
+                f"허용기준 태깅 합계: {zone_tagging_total:.2f}초 "
+                f"(구역 내부 조기 판정 {zone_lookup.contained_lookups}건)"
+            )
+
         if not temp_layers:
             return None
 
@@ -5340,6 +6595,11 @@ class ArchDistribution:
                     "이전 검토 결정 불러오기 완료: "
                     f"{len(decision_store)}건"
                 )
+            elif decision_store.load_status == "migrated":
+                self.log(
+                    "기존 JSON 검토 결정을 SQLite 저장소로 옮겼습니다: "
+                    f"{len(decision_store)}건"
+                )
             elif decision_store.load_status in {
                 "malformed",
                 "unsupported_schema",
@@ -5348,6 +6608,25 @@ class ArchDistribution:
                     "⚠️ 기존 검토 결정 파일을 안전하게 무시하고 "
                     "새 검토로 진행합니다."
                 )
+            # Pages confirmed in a run that never committed are reused as
+            # if that run had saved them.
+            checkpoint = ReviewCheckpoint(
+                ReviewCheckpoint.path_for(decision_store_path)
+            )
+            self._review_checkpoint = checkpoint
+            try:
+                merged = checkpoint.merge_into(decision_store)
+            except Exception as exc:
+                merged = 0
+                self.log(
+                    "⚠️ 중간 저장된 검토 결정을 읽지 못해 건너뜁니다: "
+                    f"{exc}"
+                )
+            if merged:
+                self.log(f"중간 저장된 검토 결정 {merged}건을 이어받았습니다.")
+                self._pending_decision_store = decision_store
+                self._pending_decision_store_path = decision_store_path
+                self._pending_decision_store_dirty = True
 
         family_labels = {0: "점", 1: "선", 2: "면"}
         results = []
@@ -5418,6 +6697,12 @@ class ArchDistribution:
             self._pending_decision_store = decision_store
             self._pending_decision_store_path = decision_store_path
             self._pending_decision_store_dirty = True
+        elif (
+            decision_store is not None
+            and getattr(self, "_pending_decision_store", None)
+            is not decision_store
+        ):
+            decision_store.close()
         return {
             "main": main_layers[0] if main_layers else None,
             "main_layers": main_layers,
@@ -5553,23 +6838,16 @@ class ArchDistribution:
             metric_context = self._build_metric_context(layers[0], {})
         buffer_geoms = list(buffer_geoms or [])
 
-        base_analysis = None
+        study = None
         if isinstance(study_layer_or_centroid, QgsVectorLayer):
-            combined = QgsGeometry()
-            for feature in study_layer_or_centroid.getFeatures():
-                if not feature.hasGeometry():
-                    continue
-                combined = (
-                    QgsGeometry(feature.geometry())
-                    if combined.isNull()
-                    else combined.combine(feature.geometry())
-                )
-            if not combined.isNull():
-                base_analysis = metric_context.to_analysis_geometry(
-                    combined,
-                    study_layer_or_centroid.crs(),
-                )
+            study = self._study_geometry(
+                study_layer_or_centroid,
+                metric_context.transform_context,
+            )
+            if study.is_empty():
+                study = None
 
+        analysis_store = self._analysis_geometry_store()
         records = []
         layer_states = []
         for layer_index, layer in enumerate(layers):
@@ -5612,6 +6890,9 @@ class ArchDistribution:
                     for item in buffer_geoms
                 ]
 
+            extent_clipper = (
+                ExtentClipper(target_extent) if target_extent else None
+            )
             managed_subset = '"번호" IS NOT NULL'
             property_name = "ArchDistribution/renumber_base_subset"
             current_subset = layer.subsetString().strip()
@@ -5636,6 +6917,7 @@ class ArchDistribution:
 
             layer.startEditing()
             outside_ids = []
+            inside_features = []
             for feature in layer.getFeatures():
                 geometry = QgsGeometry(feature.geometry())
                 if not geometry.isGeosValid():
@@ -5643,11 +6925,12 @@ class ArchDistribution:
                     if fixed and not fixed.isEmpty():
                         geometry = fixed
                         layer.changeGeometry(feature.id(), geometry)
+                        analysis_store.invalidate(layer.id(), feature.id())
                 inside = True
-                if target_extent:
-                    inside = geometry.intersects(target_extent)
+                if extent_clipper:
+                    inside = extent_clipper.intersects(geometry)
                     if inside and layer.geometryType() in (1, 2):
-                        clipped = geometry.intersection(target_extent)
+                        clipped = extent_clipper.clip(geometry)
                         inside = (
                             not clipped.isEmpty()
                             and (
@@ -5683,24 +6966,48 @@ class ArchDistribution:
                     )
                     outside_ids.append(feature.id())
                     continue
+                inside_features.append((feature, geometry))
 
-                analysis_geometry = metric_context.to_analysis_geometry(
-                    geometry,
-                    layer.crs(),
+            # Matching usually stored these already; the rest are
+            # transformed in one batch, which reprojects points together.
+            stored_geometries = analysis_store.get_many(
+                metric_context,
+                layer.id(),
+                [
+                    (feature.id(), geometry)
+                    for feature, geometry in inside_features
+                ],
+                layer.crs(),
+            )
+            # Tiers follow from the study distance measured below; only
+            # features near a ring edge are tested against the ring.
+            tiers = (
+                self._buffer_tiers(
+                    layer,
+                    transformed_buffers,
+                    lambda position: inside_features[position][1],
                 )
+                if transformed_buffers else None
+            )
+            for position, ((feature, geometry), stored) in enumerate(zip(
+                inside_features,
+                stored_geometries,
+            )):
+                analysis_geometry = stored.geometry
                 distance = (
-                    analysis_geometry.distance(base_analysis)
-                    if base_analysis is not None else 0.0
-                )
-                tier = 0
-                if transformed_buffers:
-                    tier = len(transformed_buffers)
-                    for tier_index, buffer_item in enumerate(
-                        transformed_buffers
-                    ):
-                        if geometry.intersects(buffer_item["geom"]):
-                            tier = tier_index
-                            break
+                    study.distance(
+                        analysis_geometry,
+                        metric_context.analysis_crs,
+                    )
+                    if study is not None else 0.0
+                )
+                tier = (
+                    tiers.tier(
+                        position,
+                        distance if study is not None else None,
+                    )
+                    if tiers is not None else 0
+                )
                 name = str(
                     feature[indexes["유적명"]]
                     if indexes["유적명"] >= 0 else ""
@@ -5753,6 +7060,8 @@ class ArchDistribution:
                     "anchor_weight": weight,
                     "anchor_tiebreak": (layer_index, feature.id()),
                 })
+            if tiers is not None:
+                self._record_buffer_tier_stats(tiers)
             layer_states.append({
                 "layer": layer,
                 "outside_ids": outside_ids,
@@ -5885,19 +7194,15 @@ class ArchDistribution:
         label_anchor_idx = layer.fields().indexFromName(label_anchor_field_name)
         number_key_idx = layer.fields().indexFromName("NUMBER_KEY")
 
-        # Prepare base geometry for precise distance calculation
-        base_geom = None
+        # The dissolved study area measures distances in the analysis CRS.
+        study = None
         if isinstance(study_layer_or_centroid, QgsVectorLayer):
-            # Merge study layer into one geometry
-            combined = QgsGeometry()
-            for f in study_layer_or_centroid.getFeatures():
-                if combined.isNull():
-                    combined = f.geometry()
-                else:
-                    combined = combined.combine(f.geometry())
-            # Transform if needed? usually assume same CRS if passed from main logic
-            if combined and not combined.isNull():
-                base_geom = combined
+            study = self._study_geometry(
+                study_layer_or_centroid,
+                metric_context.transform_context,
+            )
+            if study.is_empty():
+                study = None
 
         # Prepare transformation for Extent and Buffers
         target_extent = extent_geom
@@ -5914,17 +7219,8 @@ class ArchDistribution:
                 for b in buffer_geoms:
                     bg = QgsGeometry(b['geom'])
                     bg.transform(tr)
-
-                    # Also transform base_geom if it came from study_layer (which is in extent_crs usually)
-                    # Wait, study_layer is from project, likely same as extent_crs.
-                    # We need base_geom in LAYER crs for distance calculation.
                     transformed_buffers.append({'dist': b['dist'], 'geom': bg})
 
-                if base_geom:
-                    # base_geom is from study_layer. Its CRS is study_layer.crs() which IS extent_crs.
-                    # So we need to transform it to layer.crs()
-                    base_geom.transform(tr)
-
                 self.log(f"좌표 변환 적용됨: {extent_crs.authid()} -> {layer.crs().authid()}")
             except Exception as error:
                 raise MetricContextError(
@@ -5933,6 +7229,8 @@ class ArchDistribution:
         else:
             transformed_buffers = buffer_geoms  # No transform needed
 
+        extent_clipper = ExtentClipper(target_extent) if target_extent else None
+
         # Determine Max Limit Geometry (Largest Buffer)
         limit_geom = None
         if transformed_buffers:
@@ -5986,10 +7284,10 @@ class ArchDistribution:
             # merely touching the frame at a point/edge is not a printable
             # intersection and must not receive a number.
             inside_extent = True
-            if target_extent:
-                inside_extent = geom.intersects(target_extent)
+            if extent_clipper:
+                inside_extent = extent_clipper.intersects(geom)
                 if inside_extent and layer.geometryType() in (1, 2):
-                    clipped_for_test = geom.intersection(target_extent)
+                    clipped_for_test = extent_clipper.clip(geom)
                     if layer.geometryType() == 2:
                         inside_extent = (
                             not clipped_for_test.isEmpty()
@@ -6039,12 +7337,6 @@ class ArchDistribution:
         # Sorting Logic
         sorted_features = []
 
-        measurement_base_geom = None
-        if base_geom:
-            measurement_base_geom = metric_context.to_analysis_geometry(
-                base_geom,
-                layer.crs(),
-            )
         measurement_origin = None
         if isinstance(study_layer_or_centroid, QgsPointXY):
             measurement_origin = metric_context.transform_point(
@@ -6053,13 +7345,24 @@ class ArchDistribution:
                 metric_context.analysis_crs,
             )
 
-        def get_dist(feat_geom):
-            metric_geom = metric_context.to_analysis_geometry(
-                feat_geom,
-                layer.crs(),
+        # Point layers are reprojected in one batch that every sort reuses.
+        analysis_geometries = {
+            f.id(): stored.geometry
+            for f, stored in zip(
+                all_features,
+                self._analysis_geometry_store().get_many(
+                    metric_context,
+                    layer.id(),
+                    [(f.id(), f.geometry()) for f in all_features],
+                    layer.crs(),
+                ),
             )
-            if measurement_base_geom:
-                return metric_geom.distance(measurement_base_geom)
+        }
+
+        def get_dist(feat):
+            metric_geom = analysis_geometries[feat.id()]
+            if study is not None:
+                return study.distance(metric_geom, metric_context.analysis_crs)
             if measurement_origin is not None:
                 point = metric_geom.centroid().asPoint()
                 return ((point.x() - measurement_origin.x()) ** 2 +
@@ -6072,50 +7375,30 @@ class ArchDistribution:
             # Calculate distances for ALL valid features first
             feat_dists = []
             for f in all_features:
-                d = get_dist(f.geometry())
+                d = get_dist(f)
                 feat_dists.append({'feat': f, 'dist': d, 'dist_str': f"{d:.1f}m"})
 
             if transformed_buffers:
-                # Tiered Sorting
-                # 1. Bucket features into rings
-                # Ring 0: Inside Buffer 0
-                # Ring 1: Inside Buffer 1 AND NOT Inside Buffer 0
-                # ...
-                # Actually, simpler:
-                # Iterate buffers ascending. Assign feature to FIRST buffer it intersects.
-
-                # Careful: 'intersects' checks geometry overlap.
-                # Distance based check is cleaner if we trust distance?
-                # But polygon buffers might handle holes/islands better.
-                # Let's use Geometry Intersection for robustness with complex shapes.
-
-                remaining = feat_dists[:]
-                tiered_result = []
-
-                for b_info in transformed_buffers:
-                    b_geom = b_info['geom']
-                    in_this_tier = []
-                    next_remaining = []
-
-                    for item in remaining:
-                        # Check intersection
-                        if item['feat'].geometry().intersects(b_geom):
-                            in_this_tier.append(item)
-                        else:
-                            next_remaining.append(item)
-
-                    # Sort this tier by distance
-                    in_this_tier.sort(key=lambda x: x['dist'])
-                    tiered_result.extend(in_this_tier)
-
-                    remaining = next_remaining
-
-                # If anything remains (shouldn't if limit_geom check worked, but floating point issues?)
-                if remaining:
-                    remaining.sort(key=lambda x: x['dist'])
-                    tiered_result.extend(remaining)
-
-                sorted_features = tiered_result
+                # Each feature joins the first ring it intersects.  Away
+                # from a ring edge its distance to the study area decides;
+                # near an edge a prepared intersects against the ring does.
+                tiers = self._buffer_tiers(
+                    layer,
+                    transformed_buffers,
+                    lambda position: feat_dists[position]['feat'].geometry(),
+                )
+                buckets = [[] for _ in range(len(tiers) + 1)]
+                for position, item in enumerate(feat_dists):
+                    buckets[tiers.tier(
+                        position,
+                        item['dist'] if study is not None else None,
+                    )].append(item)
+                self._record_buffer_tier_stats(tiers)
+
+                sorted_features = []
+                for bucket in buckets:
+                    bucket.sort(key=lambda x: x['dist'])
+                    sorted_features.extend(bucket)
 
             else:
                 # No buffers, just pure distance sort
@@ -6126,12 +7409,11 @@ class ArchDistribution:
             temp = [
                 {
                     'feat': f,
-                    'sort_val': -metric_context.to_analysis_geometry(
-                        f.geometry(),
-                        layer.crs(),
-                    ).centroid().asPoint().y(),
+                    'sort_val': -analysis_geometries[
+                        f.id()
+                    ].centroid().asPoint().y(),
                     'dist_str': None,
-                    'dist': get_dist(f.geometry()),
+                    'dist': get_dist(f),
                 }
                 for f in all_features
             ]
@@ -6144,7 +7426,7 @@ class ArchDistribution:
                     'feat': f,
                     'sort_val': f["유적명"],
                     'dist_str': None,
-                    'dist': get_dist(f.geometry()),
+                    'dist': get_dist(f),
                 }
                 for f in all_features
             ]
@@ -6245,7 +7527,7 @@ class ArchDistribution:
             layer.changeAttributeValue(
                 feat.id(),
                 numeric_dist_idx,
-                float(item.get('dist', get_dist(feat.geometry()))),
+                float(item['dist'] if 'dist' in item else get_dist(feat)),
             )
 
         for feature_id in label_anchor_by_key.values():
@@ -6550,6 +7832,9 @@ class ArchDistribution:
         safe_extent = local_extent.buffer(safe_buffer_dist, 5)
 
         clip_mask = safe_extent
+        # The buffered extent has rounded corners, but anything inside the
+        # unbuffered rectangle is still wholly inside the mask.
+        inner_bounds = rectangle_bounds(local_extent)
         if local_limit_buffer:
             if not local_limit_buffer.isGeosValid():
                 local_limit_buffer = local_limit_buffer.makeValid()
@@ -6565,6 +7850,10 @@ class ArchDistribution:
                     clip_mask = safe_extent
 
         self.log(f"DEBUG: Clipping Mask Ready. BBox: {clip_mask.boundingBox().toString()}")
+        clipper = ExtentClipper(
+            clip_mask,
+            inner_bounds=inner_bounds if clip_mask is safe_extent else None,
+        )
 
         # 4. Iterate and Split
         idx = layer.fields().indexFromName(field_name)
@@ -6612,9 +7901,9 @@ class ArchDistribution:
                     geom = geom.makeValid()
 
                 # Check Intersection with Clip Mask (Extent or Extent∩Buffer)
-                if geom.intersects(clip_mask):
+                if clipper.intersects(geom):
                     try:
-                        res = geom.intersection(clip_mask)
+                        res = clipper.clip(geom)
                         if not res.isGeosValid():
                             res = res.makeValid()
 
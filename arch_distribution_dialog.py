@@ -135,6 +135,7 @@ class ArchDistributionDialog(QtWidgets.QDialog, FORM_CLASS):
     run_requested = QtCore.pyqtSignal(dict)
     renumber_requested = QtCore.pyqtSignal(object)
     scan_requested = QtCore.pyqtSignal(dict)
+    purge_cache_requested = QtCore.pyqtSignal()
 
     def __init__(self, parent=None):
         """Constructor."""
@@ -529,6 +530,15 @@ class ArchDistributionDialog(QtWidgets.QDialog, FORM_CLASS):
         )
         duplicate_layout.addWidget(self.chkReuseReviewDecisions)
 
+        cache_row = QtWidgets.QHBoxLayout()
+        cache_row.addStretch(1)
+        self.btnPurgeSourceCache = QtWidgets.QPushButton()
+        self.btnPurgeSourceCache.clicked.connect(
+            self._request_source_cache_purge
+        )
+        cache_row.addWidget(self.btnPurgeSourceCache)
+        duplicate_layout.addLayout(cache_row)
+
         self.lblRoleHelp = QtWidgets.QLabel()
         self.lblRoleHelp.setWordWrap(True)
         self.lblRoleHelp.setStyleSheet("color:#555; font-size:10px;")
@@ -1945,6 +1955,20 @@ class ArchDistributionDialog(QtWidgets.QDialog, FORM_CLASS):
                     "matching policy are unchanged. Changed data is reviewed again.",
                 )
             )
+            self.btnPurgeSourceCache.setText(
+                self._t(
+                    "원천 전처리 캐시 비우기",
+                    "Clear source preprocessing cache",
+                )
+            )
+            self.btnPurgeSourceCache.setToolTip(
+                self._t(
+                    "좌표 변환·도형 복구를 마친 원천 레이어 사본을 모두 "
+                    "삭제합니다. 다음 실행에서 다시 만듭니다.",
+                    "Delete every reprojected and repaired source-layer "
+                    "copy. The next run builds them again.",
+                )
+            )
             self.lblRoleHelp.setText(
                 self._t(
                     "레이어명과 필드로 자동 판정합니다. 잘못 판정된 "
@@ -2670,6 +2694,21 @@ class ArchDistributionDialog(QtWidgets.QDialog, FORM_CLASS):
 
         self.renumber_requested.emit(layer)
 
+    def _request_source_cache_purge(self):
+        """Confirm, then ask the plugin to delete cached source snapshots."""
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            self._t("캐시 비우기", "Clear cache"),
+            self._t(
+                "저장된 원천 전처리 캐시를 모두 삭제할까요?\n"
+                "원본 자료와 검토 결정은 삭제되지 않습니다.",
+                "Delete every cached source snapshot?\n"
+                "Source data and review decisions are kept.",
+            ),
+        )
+        if answer == QtWidgets.QMessageBox.Yes:
+            self.purge_cache_requested.emit()
+
     def renumber_current_layer(self):
         """Renumber the currently active layer without re-running matching."""
         layer = iface.activeLayer() if iface else None
@@ -0,0 +1,90 @@
+"""Buffer-tier assignment from precomputed study-area distances.
+
+Distance numbering puts each feature in the first study-area buffer ring it
+intersects.  Testing that with ``intersects`` costs one GEOS call against a
+large curved polygon per ring and per remaining feature.  Every ring is the
+study area buffered by a known distance, and numbering already measures
+each feature's metric distance to the study area, so :class:`BufferTiers`
+compares those two numbers instead.
+
+A buffer polygon only approximates its circle arcs with chords, and the
+rings are tested in the layer CRS while distances are measured in the
+analysis CRS.  A feature whose distance lies within
+:meth:`BufferTiers.edge_tolerance` of a ring distance is therefore still
+decided by the ring test the caller supplies, normally a prepared-engine
+``intersects``, so the tiers stay identical to the polygon tests.
+
+The module has no QGIS imports.
+"""
+
+from __future__ import annotations
+
+import math
+
+
+# Chord sagitta of a 20-segment quadrant is about 0.3 % of the radius; the
+# margin also absorbs the small CRS distortion of a transformed ring.
+DEFAULT_RELATIVE_TOLERANCE = 0.01
+DEFAULT_ABSOLUTE_TOLERANCE = 1.0
+
+
+class BufferTiers:
+    """First buffer ring containing each feature, ``len(rings)`` for none.
+
+    ``ring_distances`` are the ascending buffer distances in the unit of
+    the feature distances.  ``ring_test(key, ring_index)`` answers whether
+    the feature named by ``key`` intersects a ring; it is called only for
+    features near that ring's edge or without a distance.
+    """
+
+    def __init__(
+        self,
+        ring_distances,
+        ring_test,
+        relative_tolerance=DEFAULT_RELATIVE_TOLERANCE,
+        absolute_tolerance=DEFAULT_ABSOLUTE_TOLERANCE,
+    ):
+        self.ring_distances = [float(distance) for distance in ring_distances]
+        self._ring_test = ring_test
+        self.relative_tolerance = float(relative_tolerance)
+        self.absolute_tolerance = float(absolute_tolerance)
+        self.distance_decisions = 0
+        self.ring_tests = 0
+
+    def __len__(self):
+        return len(self.ring_distances)
+
+    def edge_tolerance(self, ring_distance):
+        """Return the band around ``ring_distance`` left to the ring test."""
+        return max(
+            self.absolute_tolerance,
+            self.relative_tolerance * abs(ring_distance),
+        )
+
+    def tier(self, key, distance=None):
+        """Return the index of the first ring the feature intersects.
+
+        ``distance`` of ``None`` or a non-finite value decides every ring
+        with the ring test.
+        """
+        known = distance is not None and math.isfinite(distance)
+        for ring_index, ring_distance in enumerate(self.ring_distances):
+            if known:
+                tolerance = self.edge_tolerance(ring_distance)
+                if distance <= ring_distance - tolerance:
+                    self.distance_decisions += 1
+                    return ring_index
+                if distance > ring_distance + tolerance:
+                    self.distance_decisions += 1
+                    continue
+            self.ring_tests += 1
+            if self._ring_test(key, ring_index):
+                return ring_index
+        return len(self.ring_distances)
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "tier_distance_decisions": self.distance_decisions,
+            "tier_ring_tests": self.ring_tests,
+        }
@@ -145,20 +145,34 @@ def create_plugin_zip():
         "LICENSES.md",
         "README.md",
         "__init__.py",
+        "analysis_geometry_store.py",
         "arch_distribution.py",
         "arch_distribution_dialog.py",
         "arch_distribution_dialog_base.ui",
+        "buffer_tiers.py",
         "cartographic_filtering.py",
+        "disjoint_set.py",
+        "extent_clipping.py",
+        "geometry_digests.py",
         "icon.png",
+        "heritage_candidate_metrics.py",
         "heritage_grouping.py",
         "heritage_identity_store.py",
         "heritage_matching.py",
         "heritage_matching_dialog.py",
+        "heritage_metric_cache.py",
+        "heritage_similarity.py",
         "matching_rules.json",
         "metric_context.py",
         "metadata.txt",
+        "prepared_geometry.py",
         "preservation_actions.py",
+        "review_queue.py",
         "run_artifacts.py",
+        "source_snapshot_cache.py",
+        "spatial_index.py",
+        "study_geometry.py",
+        "zone_lookup.py",
     }
     optional_reference_assets = {
         "reference_data.json",
@@ -0,0 +1,106 @@
+"""Array-backed disjoint sets for duplicate-decision grouping.
+
+Merge decisions are pairwise, while representatives, ``NUMBER_KEY`` and
+entity keys belong to whole components.  :class:`DisjointSet` maps each UID
+to an integer slot once and keeps parents and ranks in ``array('i')``, so a
+nationwide run holds two machine integers per UID instead of a second
+UID-to-UID dictionary per partition.  :meth:`DisjointSet.fresh` starts
+another partition over the same slots.
+
+Roots are found with path halving and joined by rank.  Components are
+returned in the order of their first-added member, with members in the
+order they were added, independent of the order of the unions.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+
+class DisjointSet:
+    """Union-find over hashable items such as source UIDs."""
+
+    def __init__(self, items=()):
+        self._slots = {}
+        self._items = []
+        self._parent = array("i")
+        self._rank = array("i")
+        for item in items:
+            self.add(item)
+
+    def fresh(self):
+        """Return an unjoined partition sharing this set's item slots.
+
+        Items added to either partition afterwards are known to both.
+        """
+        other = DisjointSet()
+        other._slots = self._slots
+        other._items = self._items
+        other._grow()
+        return other
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._slots
+
+    def _grow(self):
+        for slot in range(len(self._parent), len(self._items)):
+            self._parent.append(slot)
+            self._rank.append(0)
+
+    def add(self, item):
+        """Register ``item`` as a singleton unless it is known; return its slot."""
+        slot = self._slots.get(item)
+        if slot is None:
+            slot = self._slots[item] = len(self._items)
+            self._items.append(item)
+        self._grow()
+        return slot
+
+    def _root(self, slot):
+        parent = self._parent
+        while parent[slot] != slot:
+            parent[slot] = parent[parent[slot]]
+            slot = parent[slot]
+        return slot
+
+    def find(self, item):
+        """Return the representative item of ``item``'s component."""
+        return self._items[self._root(self.add(item))]
+
+    def union(self, left, right):
+        """Join the components of two items; return whether they differed."""
+        left_root = self._root(self.add(left))
+        right_root = self._root(self.add(right))
+        if left_root == right_root:
+            return False
+        rank = self._rank
+        if rank[left_root] < rank[right_root] or (
+            rank[left_root] == rank[right_root] and right_root < left_root
+        ):
+            left_root, right_root = right_root, left_root
+        self._parent[right_root] = left_root
+        if rank[left_root] == rank[right_root]:
+            rank[left_root] += 1
+        return True
+
+    def connected(self, left, right):
+        return self.find(left) == self.find(right)
+
+    def components(self, min_size=1):
+        """Return components of at least ``min_size`` items, in a fixed order.
+
+        With ``min_size=2`` singletons are never materialised as lists.
+        """
+        self._grow()
+        roots = array("i", map(self._root, range(len(self._items))))
+        sizes = array("i", [0]) * len(roots)
+        for root in roots:
+            sizes[root] += 1
+        groups = {}
+        for slot, root in enumerate(roots):
+            if sizes[root] >= min_size:
+                groups.setdefault(root, []).append(self._items[slot])
+        return list(groups.values())
@@ -0,0 +1,143 @@
+"""Bounding-box fast paths for clipping features to the map extent.
+
+The map extent is an axis-aligned rectangle, yet every candidate feature used
+to go through a GEOS ``intersects`` and ``intersection`` against it.  Most
+features of a map sheet lie wholly inside or wholly outside that rectangle,
+which their bounding boxes already prove.  :class:`ExtentClipper` decides
+those cases from the bounds and hands only features crossing the boundary to
+GEOS, so clipped output is the same geometry the GEOS path produced.
+
+``QgsGeometry.clipped`` was not used for the crossing features: GEOS
+``ClipByRect`` may return invalid polygons and keeps boundary-only contacts
+differently from ``intersection``.
+
+QGIS is an optional import, as in :mod:`prepared_geometry`; the bounds and
+rectangle helpers work on plain coordinates and are testable without QGIS.
+"""
+
+from __future__ import annotations
+
+
+try:  # pragma: no cover - availability is environment-specific
+    from qgis.core import QgsGeometry
+
+    QGIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised outside QGIS
+    QGIS_AVAILABLE = False
+
+
+def rectangle_bounds_of_ring(points):
+    """Return ``(xmin, ymin, xmax, ymax)`` when a closed ring is a rectangle.
+
+    The ring must consist of four distinct axis-aligned corners (plus the
+    closing point); anything else returns ``None``.
+    """
+    points = [(float(x), float(y)) for x, y in points]
+    if len(points) == 5 and points[0] == points[-1]:
+        points = points[:-1]
+    if len(points) != 4:
+        return None
+    xs = sorted({x for x, _y in points})
+    ys = sorted({y for _x, y in points})
+    if len(xs) != 2 or len(ys) != 2:
+        return None
+    if {(x, y) for x in xs for y in ys} != set(points):
+        return None
+    for index, (x, y) in enumerate(points):
+        next_x, next_y = points[(index + 1) % 4]
+        if x != next_x and y != next_y:
+            return None
+    return xs[0], ys[0], xs[1], ys[1]
+
+
+def rectangle_bounds(geometry):
+    """Return the bounds of a geometry that is exactly one rectangle."""
+    if geometry is None or geometry.isEmpty():
+        return None
+    if geometry.isMultipart():
+        polygons = geometry.asMultiPolygon()
+    else:
+        polygons = [geometry.asPolygon()]
+    if len(polygons) != 1 or len(polygons[0]) != 1:
+        return None
+    return rectangle_bounds_of_ring(
+        (point.x(), point.y()) for point in polygons[0][0]
+    )
+
+
+def rectangle_tuple(rectangle):
+    return (
+        rectangle.xMinimum(),
+        rectangle.yMinimum(),
+        rectangle.xMaximum(),
+        rectangle.yMaximum(),
+    )
+
+
+def bounds_disjoint(left, right):
+    """Whether two closed ``(xmin, ymin, xmax, ymax)`` boxes share no point."""
+    return (
+        left[2] < right[0]
+        or right[2] < left[0]
+        or left[3] < right[1]
+        or right[3] < left[1]
+    )
+
+
+def bounds_contain(outer, inner):
+    return (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
+
+
+OUTSIDE = "outside"
+INSIDE = "inside"
+CROSSING = "crossing"
+
+
+class ExtentClipper:
+    """Clip geometries to ``mask`` with bounding-box fast paths.
+
+    ``inner_bounds`` is a rectangle known to lie inside ``mask``; it defaults
+    to the mask itself when the mask is a rectangle.  Features inside it are
+    returned unclipped, and features whose bounds miss the mask's bounds are
+    rejected without GEOS.
+    """
+
+    def __init__(self, mask, inner_bounds=None):
+        self.mask = mask
+        self.bounds = rectangle_tuple(mask.boundingBox())
+        self.inner_bounds = (
+            rectangle_bounds(mask) if inner_bounds is None else inner_bounds
+        )
+
+    def relation(self, geometry):
+        if geometry is None or geometry.isEmpty():
+            return OUTSIDE
+        bounds = rectangle_tuple(geometry.boundingBox())
+        if bounds_disjoint(self.bounds, bounds):
+            return OUTSIDE
+        if self.inner_bounds is not None and bounds_contain(
+            self.inner_bounds,
+            bounds,
+        ):
+            return INSIDE
+        return CROSSING
+
+    def intersects(self, geometry):
+        relation = self.relation(geometry)
+        if relation == CROSSING:
+            return geometry.intersects(self.mask)
+        return relation == INSIDE
+
+    def clip(self, geometry):
+        """Return ``geometry`` clipped to the mask (a copy when inside)."""
+        relation = self.relation(geometry)
+        if relation == INSIDE:
+            return QgsGeometry(geometry)
+        if relation == OUTSIDE:
+            return QgsGeometry()
+        return geometry.intersection(self.mask)
@@ -0,0 +1,154 @@
+"""Run-scoped geometry digests shared by identity, matching and manifests.
+
+One processing run hashed the same geometries several times: the source
+scan for ``SRC_UID``/``SRC_FP``, duplicate matching when a merged row had no
+``SRC_FP``, and the run manifest for each output layer's content hash.
+:class:`GeometryDigests` computes each feature's digest once per run, keyed
+by the layer it came from, the geometry form hashed and the feature id.
+
+Digests use :func:`heritage_identity_store.geometry_signature`, so a
+cached value can be passed to :func:`build_source_identity` unchanged.
+``hashlib`` releases the GIL for larger buffers;
+:meth:`GeometryDigests.digest_many` therefore hashes large batches on a
+thread pool.  Payload callables are
+always resolved on the calling thread, which keeps QGIS objects there.
+
+Like :mod:`heritage_identity_store`, this module has no QGIS imports.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+try:
+    from .heritage_identity_store import geometry_signature
+except ImportError:
+    # Importable outside the plugin package, like the other run helpers.
+    from heritage_identity_store import geometry_signature
+
+
+# Below this many payload bytes a pool costs more than it saves.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+_CHUNKS_PER_WORKER = 4
+
+
+def _payload_size(payload):
+    if isinstance(payload, (bytes, bytearray, memoryview, str)):
+        return len(payload)
+    return 0
+
+
+def _signatures(payloads):
+    return [geometry_signature(payload) for payload in payloads]
+
+
+class GeometryDigests:
+    """Geometry signatures cached by ``(source, feature_id)``.
+
+    ``source`` is any hashable naming a layer and the geometry form hashed,
+    for example ``(layer.id(), "wkb")``.  Callers must use a new instance,
+    or a new source key, once the geometries behind a key can change.
+    """
+
+    def __init__(self, parallel_min_bytes=PARALLEL_MIN_BYTES):
+        self.parallel_min_bytes = parallel_min_bytes
+        self._digests = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.reused = 0
+        self.parallel_batches = 0
+
+    def __len__(self):
+        return len(self._digests)
+
+    def get(self, source, feature_id):
+        """Return a cached digest, or ``None``."""
+        with self._lock:
+            return self._digests.get((source, feature_id))
+
+    def digest(self, source, feature_id, payload):
+        """Return the digest of one feature, hashing ``payload`` on a miss.
+
+        ``payload`` is WKB bytes, WKT text, or a callable returning either,
+        so a cache hit skips serializing the geometry as well.
+        """
+        key = (source, feature_id)
+        with self._lock:
+            cached = self._digests.get(key)
+            if cached is not None:
+                self.reused += 1
+                return cached
+        if callable(payload):
+            payload = payload()
+        value = geometry_signature(payload)
+        with self._lock:
+            value = self._digests.setdefault(key, value)
+            self.computed += 1
+        return value
+
+    def digest_many(self, source, items, max_workers=1):
+        """Return ``{feature_id: digest}`` for ``(feature_id, payload)`` items.
+
+        Missing digests are hashed together; with more than one worker and
+        at least :attr:`parallel_min_bytes` of payload they are split into
+        chunks hashed on a thread pool.
+        """
+        results = {}
+        pending_ids = []
+        pending_payloads = []
+        with self._lock:
+            for feature_id, payload in items:
+                cached = self._digests.get((source, feature_id))
+                if cached is not None:
+                    results[feature_id] = cached
+                    self.reused += 1
+                else:
+                    pending_ids.append(feature_id)
+                    pending_payloads.append(payload)
+        if not pending_ids:
+            return results
+        pending_payloads = [
+            payload() if callable(payload) else payload
+            for payload in pending_payloads
+        ]
+        workers = max(1, min(int(max_workers or 1), len(pending_payloads)))
+        total_bytes = sum(_payload_size(payload) for payload in pending_payloads)
+        if workers > 1 and total_bytes >= self.parallel_min_bytes:
+            chunk_size = max(
+                1,
+                -(-len(pending_payloads) // (workers * _CHUNKS_PER_WORKER)),
+            )
+            chunks = [
+                pending_payloads[start:start + chunk_size]
+                for start in range(0, len(pending_payloads), chunk_size)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="ArchDistributionDigest",
+            ) as executor:
+                digests = [
+                    value
+                    for chunk in executor.map(_signatures, chunks)
+                    for value in chunk
+                ]
+            parallel = True
+        else:
+            digests = _signatures(pending_payloads)
+            parallel = False
+        with self._lock:
+            for feature_id, value in zip(pending_ids, digests):
+                value = self._digests.setdefault((source, feature_id), value)
+                results[feature_id] = value
+            self.computed += len(pending_ids)
+            if parallel:
+                self.parallel_batches += 1
+        return results
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "geometry_digests_computed": self.computed,
+            "geometry_digests_reused": self.reused,
+            "geometry_digest_parallel_batches": self.parallel_batches,
+        }
@@ -0,0 +1,1057 @@
+"""Bulk candidate-pair geometry metrics for source-aware matching.
+
+The plugin used to measure every spatial-index hit with one GEOS call per
+metric.  This module computes the same candidate metric table for a whole
+merged layer with Shapely 2 array operations and then feeds
+:func:`heritage_matching.evaluate_candidate` in batches.
+
+The module deliberately has no QGIS dependency, so the engine can be
+benchmarked in a normal Python runtime.  Shapely 2 and NumPy are optional:
+callers check :data:`SHAPELY_AVAILABLE` and keep their per-pair path when the
+QGIS Python runtime does not ship them.
+
+Large layers can be split into spatial tiles and evaluated in worker
+processes by :func:`collect_candidates`.  Each bounding-box pair is owned by
+exactly one tile, and the merged rows are sorted by record position, so the
+parallel result equals the in-process result row for row.  A
+``rows_callback`` receives each tile's accepted rows as soon as the tile
+completes, which lets review start before the slowest tile finishes.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+import math
+import multiprocessing
+import os
+import sys
+
+try:  # pragma: no cover - availability is environment-specific
+    import numpy as np
+    import shapely
+    from shapely.errors import GEOSException
+
+    SHAPELY_AVAILABLE = int(shapely.__version__.split(".")[0]) >= 2
+except (ImportError, ValueError):  # pragma: no cover - exercised without Shapely
+    np = None
+    shapely = None
+    GEOSException = RuntimeError
+    SHAPELY_AVAILABLE = False
+
+try:
+    from .heritage_matching import (
+        DEFAULT_MATCHING_RULES,
+        evaluate_candidates,
+        screen_candidates,
+    )
+    from .heritage_similarity import SimilarityMemo
+except ImportError:
+    # Keep the engine directly runnable by validation scripts outside a
+    # loaded QGIS plugin package, like the policy module it feeds.
+    from heritage_matching import (
+        DEFAULT_MATCHING_RULES,
+        evaluate_candidates,
+        screen_candidates,
+    )
+    from heritage_similarity import SimilarityMemo
+
+
+DEFAULT_BATCH_SIZE = 2048
+# Below this size process start-up and WKB transfer cost more than they save.
+PARALLEL_MIN_FEATURES = 20_000
+MAX_AUTO_WORKERS = 8
+# How often the tiled path hands control back while it waits for tiles.
+IDLE_CALLBACK_SECONDS = 0.1
+# Source scans run on threads, so a smaller layer is already worth one.
+SCAN_PARALLEL_MIN_FEATURES = 5_000
+TILES_PER_WORKER = 4
+
+# The matching policy reads only these record keys; worker processes receive
+# this plain subset instead of the plugin's attribute values.
+EVALUATION_FIELDS = (
+    "uid",
+    "role",
+    "name",
+    "site_name",
+    "heritage_name",
+    "project_name",
+    "address",
+)
+
+# Shapely type ids: Point, LineString, LinearRing, Polygon, MultiPoint,
+# MultiLineString, MultiPolygon.  Collections stay "unknown" exactly as
+# QgsWkbTypes.geometryType() reports them.
+_FAMILY_BY_TYPE_ID = {
+    0: "point",
+    1: "line",
+    2: "line",
+    3: "polygon",
+    4: "point",
+    5: "line",
+    6: "polygon",
+}
+
+METRIC_COLUMNS = (
+    "intersects",
+    "overlap_ratio",
+    "distance",
+    "coverage_left",
+    "coverage_right",
+    "iou",
+    "area_ratio",
+    "centroid_distance",
+    "boundary_distance",
+    "geometry_pair",
+)
+_COVERAGE_POSITIONS = (
+    METRIC_COLUMNS.index("coverage_left"),
+    METRIC_COLUMNS.index("coverage_right"),
+)
+_PAIR_POSITION = METRIC_COLUMNS.index("geometry_pair")
+
+
+@dataclass(frozen=True)
+class CandidateMetricTable:
+    """Columnar geometry evidence for spatially reduced candidate pairs.
+
+    ``left`` and ``right`` are positions in the caller's record sequence and
+    ``left < right`` for every row.  Each metric column has one value per row
+    and carries the keyword of :func:`evaluate_candidate` it feeds.
+    ``checked_pair_count`` counts every bounding-box hit that was compared,
+    including pairs the caller excluded by role, and ``skipped_pair_count``
+    counts hits dropped because their groups never pair.
+    ``screened_pair_count`` counts pairs rejected by the attribute
+    pre-screen or the intersection/distance gate before overlay metrics.
+    ``failures`` keeps ``(left, right, message)`` for pairs GEOS could not
+    measure, and ``reused_rows`` lists the rows taken from known metrics.
+    """
+
+    left: tuple
+    right: tuple
+    intersects: tuple
+    overlap_ratio: tuple
+    distance: tuple
+    coverage_left: tuple
+    coverage_right: tuple
+    iou: tuple
+    area_ratio: tuple
+    centroid_distance: tuple
+    boundary_distance: tuple
+    geometry_pair: tuple
+    checked_pair_count: int = 0
+    skipped_pair_count: int = 0
+    failures: tuple = ()
+    reused_rows: tuple = ()
+    screened_pair_count: int = 0
+
+    def __len__(self):
+        return len(self.left)
+
+    def metrics(self, row):
+        """Return the ``evaluate_candidate`` keyword arguments for a row."""
+        return {
+            column: getattr(self, column)[row] for column in METRIC_COLUMNS
+        }
+
+    def values(self, row):
+        """Return a row's metrics as a tuple in :data:`METRIC_COLUMNS` order."""
+        return tuple(getattr(self, column)[row] for column in METRIC_COLUMNS)
+
+
+def reverse_metrics(values):
+    """Return metric values of the same pair measured from the other side.
+
+    Only the directional coverages and the geometry-pair label change.
+    """
+    values = list(values)
+    left, right = _COVERAGE_POSITIONS
+    values[left], values[right] = values[right], values[left]
+    first, _separator, second = str(values[_PAIR_POSITION]).partition("_")
+    values[_PAIR_POSITION] = f"{second}_{first}"
+    return tuple(values)
+
+
+def known_pair_metrics(known_metrics, left_key, right_key):
+    """Return known metric values oriented from ``left_key`` to ``right_key``.
+
+    ``known_metrics`` maps ``(key, key)`` pairs to values in
+    :data:`METRIC_COLUMNS` order and may hold either orientation.  Returns
+    ``None`` when the pair was never measured.
+    """
+    values = known_metrics.get((left_key, right_key))
+    if values is not None:
+        return values
+    values = known_metrics.get((right_key, left_key))
+    if values is not None:
+        return reverse_metrics(values)
+    return None
+
+
+def evaluation_record(record):
+    """Return the picklable subset of ``record`` read by the matching policy.
+
+    QGIS attribute values such as ``NULL`` variants become ``None``; other
+    non-primitive values are converted to text.
+    """
+    plain = {}
+    for key in EVALUATION_FIELDS:
+        value = record.get(key)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            plain[key] = value
+        elif hasattr(value, "isNull") and value.isNull():
+            plain[key] = None
+        else:
+            plain[key] = str(value)
+    return plain
+
+
+def default_worker_count(feature_count, cpu_count=None):
+    """Return the automatic worker count for a layer of ``feature_count``.
+
+    Small layers stay in-process.  Larger layers leave one core for the QGIS
+    interface and never start more than :data:`MAX_AUTO_WORKERS` processes.
+    """
+    if int(feature_count) < PARALLEL_MIN_FEATURES:
+        return 1
+    available = os.cpu_count() if cpu_count is None else cpu_count
+    return max(1, min(MAX_AUTO_WORKERS, int(available or 1) - 1))
+
+
+def default_scan_thread_count(feature_counts, cpu_count=None):
+    """Return the source-scan thread count for layers of ``feature_counts``.
+
+    Unlike :func:`default_worker_count` this sizes a thread pool over whole
+    layers: it counts the layers of at least
+    :data:`SCAN_PARALLEL_MIN_FEATURES`, because a scan that waits on one
+    large layer gains nothing from scanning the small ones beside it.
+    """
+    large_layers = sum(
+        1 for count in feature_counts
+        if int(count) >= SCAN_PARALLEL_MIN_FEATURES
+    )
+    if large_layers < 2:
+        return 1
+    available = os.cpu_count() if cpu_count is None else cpu_count
+    return max(1, min(MAX_AUTO_WORKERS, large_layers, int(available or 1) - 1))
+
+
+def _require_shapely():
+    if not SHAPELY_AVAILABLE:
+        raise RuntimeError(
+            "The bulk candidate-metrics engine requires Shapely 2 and NumPy."
+        )
+
+
+def geometries_from_wkb(wkbs):
+    """Return a Shapely geometry array for a sequence of WKB payloads."""
+    _require_shapely()
+    payload = np.empty(len(wkbs), dtype=object)
+    payload[:] = [bytes(item) if item is not None else None for item in wkbs]
+    return shapely.from_wkb(payload)
+
+
+def candidate_pair_indices(geometries, search_distance):
+    """Return sorted ``(left, right)`` bounding-box hits with ``left < right``.
+
+    A pair is a hit when one geometry's bounding box, grown by
+    ``search_distance`` on every side, intersects the other's bounding box.
+    This is the relation a ``QgsSpatialIndex`` query with a grown rectangle
+    produces, and it is symmetric, so each unordered pair appears once.
+    """
+    _require_shapely()
+    if len(geometries) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    distance = float(search_distance)
+    tree = shapely.STRtree(geometries)
+    bounds = shapely.bounds(geometries)
+    search = shapely.box(
+        bounds[:, 0] - distance,
+        bounds[:, 1] - distance,
+        bounds[:, 2] + distance,
+        bounds[:, 3] + distance,
+    )
+    search[shapely.is_missing(geometries) | shapely.is_empty(geometries)] = None
+    left, right = tree.query(search)
+    keep = left < right
+    left = left[keep]
+    right = right[keep]
+    order = np.lexsort((right, left))
+    return left[order], right[order]
+
+
+def _geometry_families(geometries):
+    type_ids = shapely.get_type_id(geometries)
+    return [_FAMILY_BY_TYPE_ID.get(int(type_id), "unknown") for type_id in type_ids]
+
+
+def _measure_pairs(
+    geometries,
+    centroids,
+    boundaries,
+    areas,
+    left,
+    right,
+    area_overlap=True,
+    distance_limits=None,
+):
+    """Measure one chunk of pairs; GEOS errors propagate to the caller.
+
+    With ``distance_limits`` (NaN where a pair must intersect, see
+    :class:`heritage_matching.PairScreen`) pairs that cannot match are
+    dropped after the intersection and distance tests.  Returns the kept
+    ``left`` and ``right`` positions and the metric arrays.
+    """
+    first = geometries[left]
+    second = geometries[right]
+    intersects = shapely.intersects(first, second)
+    if distance_limits is not None:
+        nearby = intersects | ~np.isnan(distance_limits)
+        left, right, first, second = (
+            left[nearby], right[nearby], first[nearby], second[nearby]
+        )
+        intersects = intersects[nearby]
+        distance_limits = distance_limits[nearby]
+    count = len(left)
+
+    distance = np.zeros(count, dtype=float)
+    apart = ~intersects
+    if apart.any():
+        distance[apart] = shapely.distance(first[apart], second[apart])
+    if distance_limits is not None:
+        viable = intersects | (distance <= distance_limits)
+        left, right, first, second = (
+            left[viable], right[viable], first[viable], second[viable]
+        )
+        intersects = intersects[viable]
+        distance = distance[viable]
+        count = len(left)
+
+    centroid_distance = shapely.distance(centroids[left], centroids[right])
+
+    # QgsGeometry.boundary() is empty for points and collections; the plugin
+    # then reports the ordinary geometry distance instead.
+    first_boundary = boundaries[left]
+    second_boundary = boundaries[right]
+    has_boundaries = ~(
+        shapely.is_missing(first_boundary)
+        | shapely.is_missing(second_boundary)
+        | shapely.is_empty(first_boundary)
+        | shapely.is_empty(second_boundary)
+    )
+    boundary_distance = np.zeros(count, dtype=float)
+    if (~has_boundaries).any():
+        boundary_distance[~has_boundaries] = shapely.distance(
+            first[~has_boundaries], second[~has_boundaries]
+        )
+    if has_boundaries.any():
+        boundary_distance[has_boundaries] = shapely.distance(
+            first_boundary[has_boundaries], second_boundary[has_boundaries]
+        )
+
+    overlap_ratio = np.zeros(count, dtype=float)
+    coverage_left = np.zeros(count, dtype=float)
+    coverage_right = np.zeros(count, dtype=float)
+    iou = np.zeros(count, dtype=float)
+    area_ratio = np.zeros(count, dtype=float)
+    touching = np.flatnonzero(intersects)
+    if not area_overlap:
+        # Intersection area has no comparable denominator across unlike
+        # dimensions, so only the binary topological relation is reported.
+        overlap_ratio[touching] = 1.0
+    elif len(touching):
+        intersection = shapely.intersection(first[touching], second[touching])
+        present = ~shapely.is_empty(intersection)
+        touching = touching[present]
+        intersection_area = shapely.area(intersection[present])
+        left_area = areas[left[touching]]
+        right_area = areas[right[touching]]
+        min_area = np.minimum(left_area, right_area)
+        max_area = np.maximum(left_area, right_area)
+        areal = (min_area > 0) & (intersection_area > 0)
+        # Point/line candidates remain reviewable but the ruleset forbids
+        # their automatic merge.
+        overlap_ratio[touching[~areal]] = 1.0
+        rows = touching[areal]
+        shared = intersection_area[areal]
+        left_area = left_area[areal]
+        right_area = right_area[areal]
+        union_area = left_area + right_area - shared
+        coverage_left[rows] = shared / left_area
+        coverage_right[rows] = shared / right_area
+        overlap_ratio[rows] = shared / min_area[areal]
+        iou[rows] = np.divide(
+            shared,
+            union_area,
+            out=np.zeros(len(rows), dtype=float),
+            where=union_area > 0,
+        )
+        area_ratio[rows] = min_area[areal] / max_area[areal]
+
+    return left, right, (
+        intersects,
+        overlap_ratio,
+        distance,
+        coverage_left,
+        coverage_right,
+        iou,
+        area_ratio,
+        centroid_distance,
+        boundary_distance,
+    )
+
+
+def build_candidate_metric_table(
+    wkbs,
+    records,
+    *,
+    search_distance,
+    excluded_roles=(),
+    groups=None,
+    group_pairs=None,
+    families=None,
+    area_overlap=True,
+    batch_size=DEFAULT_BATCH_SIZE,
+    geometries=None,
+    pairs=None,
+    metric_keys=None,
+    known_metrics=None,
+    prescreen=False,
+    rules=None,
+    similarity_memo=None,
+):
+    """Compute the candidate metric table for one merged layer.
+
+    ``wkbs`` and ``records`` are parallel sequences in analysis-CRS metres.
+    Pairs where either record's ``role`` is in ``excluded_roles`` are counted
+    as checked when the other record is comparable, but are not measured.  A
+    pre-parsed ``geometries`` array may replace ``wkbs`` to avoid decoding the
+    same payload twice, and ``pairs`` may replace the bounding-box search with
+    precomputed ``(left, right)`` position arrays.
+
+    When ``groups`` is given, only pairs whose unordered group pair appears
+    in ``group_pairs`` are checked; cross-family
+    matching uses one group per source layer.  ``families`` overrides the
+    geometry family reported for each record, and ``area_overlap=False``
+    reports a binary overlap without area evidence.
+
+    ``metric_keys`` gives each record a content key such as its source
+    fingerprint.  Pairs whose keys appear in ``known_metrics`` (see
+    :func:`known_pair_metrics`) take those values without any GEOS work.
+
+    ``prescreen=True`` applies :func:`heritage_matching.screen_candidates`
+    under ``rules`` first and measures overlay metrics only for pairs that
+    can still become candidates, so the table then holds only the rows
+    :func:`evaluate_metric_table` may accept.
+    """
+    _require_shapely()
+    if geometries is None:
+        geometries = geometries_from_wkb(wkbs)
+    excluded = np.array(
+        [record.get("role") in excluded_roles for record in records],
+        dtype=bool,
+    )
+    if pairs is None:
+        left, right = candidate_pair_indices(geometries, search_distance)
+    else:
+        left = np.asarray(pairs[0], dtype=np.intp)
+        right = np.asarray(pairs[1], dtype=np.intp)
+    skipped_pair_count = 0
+    if groups is not None:
+        group_ids = np.asarray(groups, dtype=np.intp)
+        allowed = np.zeros(
+            (int(group_ids.max(initial=0)) + 1,) * 2, dtype=bool
+        )
+        for left_group, right_group in group_pairs or ():
+            if max(left_group, right_group) < len(allowed):
+                allowed[left_group, right_group] = True
+                allowed[right_group, left_group] = True
+        grouped = allowed[group_ids[left], group_ids[right]]
+        skipped_pair_count = int((~grouped).sum())
+        left = left[grouped]
+        right = right[grouped]
+    checked = ~(excluded[left] & excluded[right])
+    comparable = ~(excluded[left] | excluded[right])
+    checked_pair_count = int(checked.sum())
+    left = left[comparable]
+    right = right[comparable]
+
+    screened_pair_count = 0
+    limits = None
+    if prescreen:
+        screens = screen_candidates(
+            records,
+            left.tolist(),
+            right.tolist(),
+            rules=rules,
+            similarity_memo=similarity_memo,
+        )
+        passed = np.array([screen is not None for screen in screens], dtype=bool)
+        limits = np.array(
+            [
+                np.nan if screen.distance_limit is None
+                else float(screen.distance_limit)
+                for screen in screens
+                if screen is not None
+            ],
+            dtype=float,
+        )
+        screened_pair_count = int((~passed).sum())
+        left = left[passed]
+        right = right[passed]
+
+    reused = []
+    if known_metrics and metric_keys is not None:
+        measure = np.ones(len(left), dtype=bool)
+        for row, (first, second) in enumerate(zip(left.tolist(), right.tolist())):
+            values = known_pair_metrics(
+                known_metrics, metric_keys[first], metric_keys[second]
+            )
+            if values is not None:
+                reused.append((first, second, tuple(values), True))
+                measure[row] = False
+        left = left[measure]
+        right = right[measure]
+        if limits is not None:
+            limits = limits[measure]
+
+    # Per-geometry inputs are only derived for records that are measured.
+    needed = np.union1d(left, right)
+    centroids = np.empty(len(geometries), dtype=object)
+    centroids[needed] = shapely.centroid(geometries[needed])
+    boundaries = np.empty(len(geometries), dtype=object)
+    for position in needed.tolist():
+        try:
+            boundaries[position] = shapely.boundary(geometries[position])
+        except GEOSException:
+            boundaries[position] = None
+    areas = np.zeros(len(geometries), dtype=float)
+    areas[needed] = shapely.area(geometries[needed])
+    if families is None:
+        families = _geometry_families(geometries)
+
+    columns = [[] for _ in range(9)]
+    kept_left = []
+    kept_right = []
+    failures = []
+    step = max(1, int(batch_size))
+    for start in range(0, len(left), step):
+        chunk_left = left[start:start + step]
+        chunk_right = right[start:start + step]
+        chunk_limits = None if limits is None else limits[start:start + step]
+        try:
+            measured = [_measure_pairs(
+                geometries, centroids, boundaries, areas,
+                chunk_left, chunk_right, area_overlap, chunk_limits,
+            )]
+        except GEOSException:
+            # Isolate the failing pair(s) so one broken geometry costs only
+            # its own candidates, as in the per-pair path.
+            measured = []
+            for offset, (pair_left, pair_right) in enumerate(
+                zip(chunk_left, chunk_right)
+            ):
+                try:
+                    measured.append(_measure_pairs(
+                        geometries, centroids, boundaries, areas,
+                        np.array([pair_left]), np.array([pair_right]),
+                        area_overlap,
+                        None if chunk_limits is None
+                        else chunk_limits[offset:offset + 1],
+                    ))
+                except GEOSException as error:
+                    failures.append((int(pair_left), int(pair_right), str(error)))
+        for measured_left, measured_right, values in measured:
+            kept_left.extend(measured_left.tolist())
+            kept_right.extend(measured_right.tolist())
+            for column, value in zip(columns, values):
+                column.extend(value.tolist())
+
+    if limits is not None:
+        screened_pair_count += len(left) - len(kept_left) - len(failures)
+    rows = [
+        (
+            first,
+            second,
+            (bool(values[0]),) + tuple(values[1:]) + (
+                f"{families[first]}_{families[second]}",
+            ),
+            False,
+        )
+        for first, second, *values in zip(kept_left, kept_right, *columns)
+    ]
+    if reused:
+        rows.extend(reused)
+        rows.sort(key=lambda row: row[:2])
+    metric_values = list(zip(*(row[2] for row in rows))) or [
+        () for _column in METRIC_COLUMNS
+    ]
+    return CandidateMetricTable(
+        left=tuple(row[0] for row in rows),
+        right=tuple(row[1] for row in rows),
+        checked_pair_count=checked_pair_count,
+        skipped_pair_count=skipped_pair_count,
+        failures=tuple(failures),
+        reused_rows=tuple(
+            position for position, row in enumerate(rows) if row[3]
+        ),
+        screened_pair_count=screened_pair_count,
+        **{
+            column: tuple(values)
+            for column, values in zip(METRIC_COLUMNS, metric_values)
+        },
+    )
+
+
+def evaluate_metric_table(
+    records,
+    table,
+    *,
+    preset,
+    rules=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    batch_callback=None,
+    similarity_memo=None,
+):
+    """Yield ``(left, right, MatchCandidate)`` for accepted table rows.
+
+    Each batch is one :func:`heritage_matching.evaluate_candidates` call.
+    ``batch_callback(processed, total)`` runs after each batch, which lets a
+    caller report progress or raise to cancel between batches.  Name ratios
+    are memoised for the whole table unless a ``similarity_memo`` is shared.
+    """
+    active_rules = rules or DEFAULT_MATCHING_RULES
+    memo = SimilarityMemo() if similarity_memo is None else similarity_memo
+    total = len(table)
+    step = max(1, int(batch_size))
+    for start in range(0, total, step):
+        stop = min(total, start + step)
+        yield from evaluate_candidates(
+            records,
+            table.left[start:stop],
+            table.right[start:stop],
+            {
+                column: getattr(table, column)[start:stop]
+                for column in METRIC_COLUMNS
+            },
+            preset=preset,
+            rules=active_rules,
+            similarity_memo=memo,
+        )
+        if batch_callback is not None:
+            batch_callback(stop, total)
+
+
+@dataclass(frozen=True)
+class CandidateCollection:
+    """Accepted candidate rows for one layer, in ``(left, right)`` order.
+
+    ``rows`` holds ``(left, right, MatchCandidate)`` with record positions.
+    ``worker_count`` is the number of processes that produced the rows; one
+    means the in-process path ran.  When metric keys were supplied,
+    ``measured`` holds ``(left, right, values)`` for every pair measured in
+    this call, accepted or not, so the caller can persist them.
+    """
+
+    rows: tuple
+    checked_pair_count: int = 0
+    skipped_pair_count: int = 0
+    failures: tuple = ()
+    tile_count: int = 1
+    worker_count: int = 1
+    measured: tuple = ()
+    reused_pair_count: int = 0
+    screened_pair_count: int = 0
+
+
+def partition_tiles(geometries, search_distance, tile_count):
+    """Split record positions into spatial tiles with a search halo.
+
+    Every non-empty geometry is at *home* in exactly one grid tile, chosen by
+    its bounding-box centre.  A tile's members are its home records plus all
+    records whose bounding box reaches the home records' envelope grown by
+    ``search_distance``; this halo contains every partner a home record can
+    have.  Returns ``(members, home)`` pairs where ``members`` are sorted
+    positions and ``home`` is a boolean mask over ``members``.
+    """
+    _require_shapely()
+    halo = float(search_distance)
+    usable = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    positions = np.flatnonzero(usable)
+    if not len(positions):
+        return []
+    bounds = shapely.bounds(geometries)
+    centre_x = (bounds[positions, 0] + bounds[positions, 2]) / 2.0
+    centre_y = (bounds[positions, 1] + bounds[positions, 3]) / 2.0
+    columns = max(1, int(math.ceil(math.sqrt(max(1, int(tile_count))))))
+    rows = max(1, int(math.ceil(max(1, int(tile_count)) / columns)))
+
+    def grid_cells(values, cells):
+        low = values.min()
+        span = values.max() - low
+        if not span > 0:
+            return np.zeros(len(values), dtype=np.intp)
+        cell = np.floor((values - low) / span * cells).astype(np.intp)
+        return np.minimum(cell, cells - 1)
+
+    tile_ids = (
+        grid_cells(centre_y, rows) * columns + grid_cells(centre_x, columns)
+    )
+    tree = shapely.STRtree(geometries)
+    tiles = []
+    for tile_id in np.unique(tile_ids):
+        home_positions = positions[tile_ids == tile_id]
+        envelope = bounds[home_positions]
+        reach = shapely.box(
+            envelope[:, 0].min() - halo,
+            envelope[:, 1].min() - halo,
+            envelope[:, 2].max() + halo,
+            envelope[:, 3].max() + halo,
+        )
+        members = np.union1d(home_positions, tree.query(reach))
+        tiles.append((members, np.isin(members, home_positions)))
+    return tiles
+
+
+def _measured_pairs(table):
+    """Return every comparable pair of ``table``, including GEOS failures."""
+    return list(zip(table.left, table.right)) + [
+        (first, second) for first, second, _message in table.failures
+    ]
+
+
+def _fresh_metrics(table):
+    """Return ``(left, right, values)`` for rows measured by GEOS."""
+    reused = set(table.reused_rows)
+    return [
+        (table.left[row], table.right[row], table.values(row))
+        for row in range(len(table))
+        if row not in reused
+    ]
+
+
+def _known_metrics_within(known_by_key, keys):
+    """Return the known metrics whose two keys both occur in ``keys``."""
+    wanted = {key for key in keys if key}
+    return {
+        pair: values
+        for key in wanted
+        for pair, values in known_by_key.get(key, ())
+        if pair[1] in wanted
+    }
+
+
+def _evaluate_tile(task):
+    """Measure and evaluate the pairs owned by one tile.
+
+    Runs in a worker process.  A pair belongs to the tile that is home to its
+    lower position, so tiles never report the same pair twice.
+    """
+    geometries = geometries_from_wkb(task["wkbs"])
+    members = task["members"]
+    left, right = candidate_pair_indices(geometries, task["search_distance"])
+    owned = np.asarray(task["home"], dtype=bool)[left]
+    options = task["options"]
+    memo = SimilarityMemo()
+    groups = options.get("groups")
+    families = options.get("families")
+    metric_keys = task.get("metric_keys")
+    table = build_candidate_metric_table(
+        None,
+        task["records"],
+        search_distance=task["search_distance"],
+        excluded_roles=options.get("excluded_roles", ()),
+        groups=None if groups is None else [groups[item] for item in members],
+        group_pairs=options.get("group_pairs"),
+        families=(
+            None if families is None else [families[item] for item in members]
+        ),
+        area_overlap=options.get("area_overlap", True),
+        batch_size=options.get("batch_size", DEFAULT_BATCH_SIZE),
+        geometries=geometries,
+        pairs=(left[owned], right[owned]),
+        metric_keys=metric_keys,
+        known_metrics=task.get("known_metrics"),
+        prescreen=options.get("prescreen", False),
+        rules=options.get("rules"),
+        similarity_memo=memo,
+    )
+    return {
+        "pairs": [
+            (members[first], members[second])
+            for first, second in _measured_pairs(table)
+        ],
+        "checked_pair_count": table.checked_pair_count,
+        "skipped_pair_count": table.skipped_pair_count,
+        "failures": [
+            (members[first], members[second], message)
+            for first, second, message in table.failures
+        ],
+        "measured": [
+            (members[first], members[second], values)
+            for first, second, values in (
+                _fresh_metrics(table) if metric_keys is not None else ()
+            )
+        ],
+        "reused_pair_count": len(table.reused_rows),
+        "screened_pair_count": table.screened_pair_count,
+        "rows": [
+            (members[first], members[second], evaluated)
+            for first, second, evaluated in evaluate_metric_table(
+                task["records"],
+                table,
+                preset=options["preset"],
+                rules=options.get("rules"),
+                batch_size=options.get("batch_size", DEFAULT_BATCH_SIZE),
+                similarity_memo=memo,
+            )
+        ],
+    }
+
+
+def _spawn_context():
+    """Return a spawn context that starts a Python interpreter.
+
+    Inside QGIS ``sys.executable`` is the desktop application on Windows and
+    macOS, so worker processes are pointed at the bundled interpreter.
+    """
+    context = multiprocessing.get_context("spawn")
+    executable = os.path.basename(sys.executable or "").lower()
+    if not executable.startswith("python"):
+        for folder in (sys.exec_prefix, os.path.dirname(sys.executable or "")):
+            for name in ("python.exe", "python3", "python"):
+                candidate = os.path.join(folder, name)
+                if os.path.isfile(candidate):
+                    context.set_executable(candidate)
+                    return context
+            candidate = os.path.join(folder, "bin", "python3")
+            if os.path.isfile(candidate):
+                context.set_executable(candidate)
+                return context
+    return context
+
+
+def collect_candidates(
+    wkbs,
+    records,
+    *,
+    search_distance,
+    preset,
+    rules=None,
+    excluded_roles=(),
+    groups=None,
+    group_pairs=None,
+    families=None,
+    area_overlap=True,
+    workers=1,
+    tile_count=None,
+    candidate_pairs=None,
+    metric_keys=None,
+    known_metrics=None,
+    prescreen=True,
+    batch_size=DEFAULT_BATCH_SIZE,
+    progress_callback=None,
+    rows_callback=None,
+    idle_callback=None,
+):
+    """Measure and evaluate every candidate pair of one merged layer.
+
+    ``records`` must be picklable when ``workers`` is greater than one; use
+    :func:`evaluation_record`.  With one worker the metric table and policy
+    evaluation run in-process and ``progress_callback(processed, total)``
+    receives evaluation batches.  With more workers the layer is split by
+    :func:`partition_tiles`, each tile runs in a separate process from WKB,
+    and the callback receives completed tiles.  Pairs already present in
+    ``candidate_pairs`` are skipped and new ones are added, so callers can
+    share one de-duplication set between passes.  Either way the rows are
+    returned sorted by ``(left, right)`` and are identical.
+
+    With ``metric_keys``, pairs found in ``known_metrics`` are evaluated
+    from those values and the collection reports the remaining, freshly
+    measured pairs in ``measured``.  The attribute pre-screen of
+    :func:`build_candidate_metric_table` runs unless ``prescreen=False``;
+    it never changes the rows.
+
+    ``rows_callback(rows)`` receives the accepted rows as they are found:
+    per evaluation batch in-process, per completed tile otherwise.  Across
+    calls the rows are those of the returned collection, not yet sorted.
+    The tiled path calls ``idle_callback()`` at least every
+    :data:`IDLE_CALLBACK_SECONDS` while it waits, so a caller can keep its
+    interface responsive or raise to cancel; tiles still running are then
+    abandoned, not awaited.
+    """
+    _require_shapely()
+    options = {
+        "excluded_roles": tuple(excluded_roles),
+        "groups": None if groups is None else list(groups),
+        "group_pairs": (
+            None if group_pairs is None
+            else tuple(tuple(pair) for pair in group_pairs)
+        ),
+        "families": None if families is None else list(families),
+        "area_overlap": area_overlap,
+        "prescreen": prescreen,
+        "batch_size": batch_size,
+        "preset": preset,
+        "rules": rules,
+    }
+    seen = set() if candidate_pairs is None else candidate_pairs
+    worker_count = max(1, int(workers or 1))
+    geometries = geometries_from_wkb(wkbs)
+    totals = {
+        "checked_pair_count": 0,
+        "skipped_pair_count": 0,
+        "reused_pair_count": 0,
+        "screened_pair_count": 0,
+    }
+    rows = []
+    failures = []
+    measured = []
+
+    def merge(result):
+        """Add one result's counters; return the pairs no earlier call saw."""
+        for name in totals:
+            totals[name] += result[name]
+        fresh = set()
+        for pair in result["pairs"]:
+            if pair in seen:
+                continue
+            seen.add(pair)
+            fresh.add(pair)
+        failures.extend(
+            failure for failure in result["failures"] if failure[:2] in fresh
+        )
+        measured.extend(
+            entry for entry in result["measured"] if entry[:2] in fresh
+        )
+        return fresh
+
+    def accept(fresh, accepted):
+        accepted = [row for row in accepted if row[:2] in fresh]
+        rows.extend(accepted)
+        if accepted and rows_callback is not None:
+            rows_callback(accepted)
+
+    if worker_count == 1:
+        memo = SimilarityMemo()
+        table = build_candidate_metric_table(
+            None,
+            records,
+            search_distance=search_distance,
+            excluded_roles=options["excluded_roles"],
+            groups=options["groups"],
+            group_pairs=options["group_pairs"],
+            families=options["families"],
+            area_overlap=area_overlap,
+            batch_size=batch_size,
+            geometries=geometries,
+            metric_keys=metric_keys,
+            known_metrics=known_metrics,
+            prescreen=prescreen,
+            rules=rules,
+            similarity_memo=memo,
+        )
+        fresh = merge({
+            "pairs": _measured_pairs(table),
+            "checked_pair_count": table.checked_pair_count,
+            "skipped_pair_count": table.skipped_pair_count,
+            "failures": list(table.failures),
+            "measured": (
+                _fresh_metrics(table) if metric_keys is not None else []
+            ),
+            "reused_pair_count": len(table.reused_rows),
+            "screened_pair_count": table.screened_pair_count,
+        })
+        batch = []
+
+        def evaluated_batch(processed, total):
+            accept(fresh, batch)
+            batch.clear()
+            if progress_callback is not None:
+                progress_callback(processed, total)
+
+        for row in evaluate_metric_table(
+            records,
+            table,
+            preset=preset,
+            rules=rules,
+            batch_size=batch_size,
+            batch_callback=evaluated_batch,
+            similarity_memo=memo,
+        ):
+            batch.append(row)
+        tiles = [None]
+    else:
+        tiles = partition_tiles(
+            geometries,
+            search_distance,
+            tile_count or worker_count * TILES_PER_WORKER,
+        )
+        known_by_key = {}
+        for pair, values in (known_metrics or {}).items():
+            known_by_key.setdefault(pair[0], []).append((pair, values))
+        tasks = [
+            {
+                "members": [int(position) for position in members],
+                "home": home.tolist(),
+                "wkbs": [bytes(wkbs[position]) for position in members],
+                "records": [records[position] for position in members],
+                "search_distance": float(search_distance),
+                "options": options,
+            }
+            for members, home in tiles
+        ]
+        if metric_keys is not None:
+            for task in tasks:
+                task["metric_keys"] = [
+                    metric_keys[position] for position in task["members"]
+                ]
+                task["known_metrics"] = _known_metrics_within(
+                    known_by_key, task["metric_keys"]
+                )
+        executor = ProcessPoolExecutor(
+            max_workers=min(worker_count, max(1, len(tasks))),
+            mp_context=_spawn_context(),
+        )
+        try:
+            running = {
+                executor.submit(_evaluate_tile, task) for task in tasks
+            }
+            completed = 0
+            while running:
+                finished, running = wait(
+                    running,
+                    timeout=(
+                        IDLE_CALLBACK_SECONDS
+                        if idle_callback is not None else None
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                # Tiles own disjoint pairs, so merging them in completion
+                # order gives the same rows as merging them in tile order.
+                for future in finished:
+                    result = future.result()
+                    accept(merge(result), result["rows"])
+                    completed += 1
+                    if progress_callback is not None:
+                        progress_callback(completed, len(tasks))
+                if idle_callback is not None:
+                    idle_callback()
+        except BaseException:
+            # A failed tile or a raising callback (a cancelled run) ends the
+            # pass; running tiles are abandoned rather than awaited.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown(wait=True)
+
+    rows.sort(key=lambda row: row[:2])
+    failures.sort(key=lambda failure: failure[:2])
+    measured.sort(key=lambda entry: entry[:2])
+    return CandidateCollection(
+        rows=tuple(rows),
+        failures=tuple(failures),
+        tile_count=len(tiles),
+        worker_count=worker_count,
+        measured=tuple(measured),
+        **totals,
+    )
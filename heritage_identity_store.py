@@ -2,23 +2,32 @@
 
 This module deliberately has no QGIS imports.  Callers should pass geometry as
 WKB bytes (preferred), WKT text, or a JSON-compatible GeoJSON-like value.
+
+Decisions persist as a JSON document or, for ``.sqlite``/``.sqlite3``/``.db``
+paths, in a WAL-mode SQLite table keyed by ``pair_key``.  The SQLite store
+reads records on lookup and writes only new or changed decisions; a JSON
+store beside a missing SQLite path is migrated on load.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 import hashlib
 import json
 import os
 from pathlib import Path
 import re
+import sqlite3
 import tempfile
 import unicodedata
-from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 
 STORE_SCHEMA_VERSION = 1
+SQLITE_STORE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+# Stays below SQLite's historical limit of 999 bound parameters.
+_SQLITE_BATCH_SIZE = 500
 VALID_DECISIONS = frozenset({"keep", "link", "merge"})
 _EMPTY_TEXT = frozenset({"", "-", "n/a", "na", "none", "null", "<null>"})
 
@@ -107,6 +116,7 @@ def build_source_identity(
     address: Any = None,
     geometry: Any = None,
     extra_content: Any = None,
+    geometry_digest: Optional[str] = None,
 ) -> SourceIdentity:
     """Build an identity from source role, native identifiers, and geometry.
 
@@ -114,13 +124,20 @@ def build_source_identity(
     still appended so multiple polygons sharing one native code remain distinct.
     Without a native code, normalized name/project/address and geometry form the
     fallback identity.
+
+    ``geometry_digest`` is a precomputed :func:`geometry_signature` of
+    ``geometry``; when given, ``geometry`` is not hashed again.
     """
     normalized_role = normalize_identity_text(role) or "other"
     normalized_code = normalize_identity_text(native_code)
     normalized_name = normalize_identity_text(name)
     normalized_project = normalize_identity_text(project_name)
     normalized_address = normalize_identity_text(address)
-    geom_signature = geometry_signature(geometry)
+    geom_signature = (
+        geometry_digest
+        if geometry_digest is not None
+        else geometry_signature(geometry)
+    )
 
     identity_content = {
         "name": normalized_name,
@@ -198,8 +215,82 @@ class DecisionLookup:
         return self.status == "reusable"
 
 
+@dataclass(frozen=True)
+class DecisionLookups:
+    """Results of :meth:`DecisionStore.lookup_many`, parallel to its input.
+
+    Candidates without two usable UIDs get the status ``"invalid"``; like
+    ``"missing"`` and ``"stale"`` ones they need a new review.
+    """
+
+    candidates: Tuple[Mapping[str, Any], ...]
+    lookups: Tuple[DecisionLookup, ...]
+
+    def _with_status(self, status: str) -> List[Tuple[Any, DecisionLookup]]:
+        return [
+            (candidate, lookup)
+            for candidate, lookup in zip(self.candidates, self.lookups)
+            if lookup.status == status
+        ]
+
+    @property
+    def reusable(self) -> List[Tuple[Any, DecisionLookup]]:
+        return self._with_status("reusable")
+
+    @property
+    def stale(self) -> List[Tuple[Any, DecisionLookup]]:
+        return self._with_status("stale")
+
+    @property
+    def missing(self) -> List[Tuple[Any, DecisionLookup]]:
+        return self._with_status("missing")
+
+    @property
+    def pending(self) -> List[Mapping[str, Any]]:
+        """Candidates without a reusable decision, in input order."""
+        return [
+            candidate
+            for candidate, lookup in zip(self.candidates, self.lookups)
+            if not lookup.reusable
+        ]
+
+
+def _classify_decision(
+    record: Optional[DecisionRecord],
+    left_fingerprint: str,
+    right_fingerprint: str,
+    policy_version: str,
+) -> DecisionLookup:
+    """Compare a stored record with fingerprints in canonical UID order."""
+    if record is None:
+        return DecisionLookup(status="missing")
+    if (
+        record.policy_version != policy_version
+        or record.left_fingerprint != left_fingerprint
+        or record.right_fingerprint != right_fingerprint
+    ):
+        return DecisionLookup(status="stale", record=record)
+    return DecisionLookup(
+        status="reusable",
+        decision=record.decision,
+        record=record,
+    )
+
+
+def is_sqlite_store_path(path: Union[os.PathLike, str]) -> bool:
+    """Return whether ``path`` names an SQLite decision store."""
+    return Path(path).suffix.lower() in SQLITE_STORE_SUFFIXES
+
+
+_DECISION_COLUMNS = tuple(field.name for field in fields(DecisionRecord))
+
+
 class DecisionStore:
-    """In-memory review decisions with safe JSON persistence."""
+    """In-memory review decisions with safe JSON persistence.
+
+    :meth:`load` and :meth:`save` switch to :class:`SQLiteDecisionStore`
+    for SQLite paths.
+    """
 
     def __init__(
         self,
@@ -208,8 +299,15 @@ class DecisionStore:
         load_status: str = "new",
     ):
         self._records: Dict[str, DecisionRecord] = dict(records or {})
+        self._pairs_by_uid: Dict[str, set] = {}
+        for record in self._records.values():
+            self._index_record(record)
         self.load_status = load_status
 
+    def _index_record(self, record: DecisionRecord) -> None:
+        for uid in (record.left_uid, record.right_uid):
+            self._pairs_by_uid.setdefault(uid, set()).add(record.pair_key)
+
     def __len__(self) -> int:
         return len(self._records)
 
@@ -219,6 +317,15 @@ class DecisionStore:
         path: Union[os.PathLike, str],
     ) -> "DecisionStore":
         """Load current-schema decisions; malformed or old files become empty."""
+        if is_sqlite_store_path(path):
+            return SQLiteDecisionStore.open(path)
+        return cls._load_json(path)
+
+    @classmethod
+    def _load_json(
+        cls,
+        path: Union[os.PathLike, str],
+    ) -> "DecisionStore":
         source_path = Path(path)
         if not source_path.exists():
             return cls(load_status="missing")
@@ -320,9 +427,67 @@ class DecisionStore:
             decision=decision,
             decided_at=decided_at or datetime.now(timezone.utc).isoformat(),
         )
-        self._records[record.pair_key] = record
+        self._remember(record)
         return record
 
+    def _remember(self, record: DecisionRecord) -> None:
+        self._records[record.pair_key] = record
+        self._index_record(record)
+
+    def _stored_record(self, pair_key: str) -> Optional[DecisionRecord]:
+        return self._records.get(pair_key)
+
+    def _stored_records(
+        self,
+        pair_keys: Iterable[str],
+    ) -> Dict[str, DecisionRecord]:
+        return {
+            pair_key: self._records[pair_key]
+            for pair_key in pair_keys
+            if pair_key in self._records
+        }
+
+    def decisions_for_uids(self, uids: Iterable[str]) -> List[DecisionRecord]:
+        """Return every stored decision touching one of ``uids``."""
+        pair_keys = set()
+        for uid in uids:
+            pair_keys.update(self._pairs_by_uid.get(str(uid).strip(), ()))
+        return [
+            self._records[pair_key] for pair_key in sorted(pair_keys)
+        ]
+
+    def stale_decisions(
+        self,
+        fingerprints: Mapping[str, str],
+    ) -> List[DecisionRecord]:
+        """Return stored decisions whose fingerprint for a UID has changed.
+
+        ``fingerprints`` maps current source UIDs to their ``SRC_FP``; the
+        result lists every decision that can no longer be reused because
+        one of those records changed, without looking at candidates.
+        """
+        current = {
+            str(uid).strip(): str(fingerprint)
+            for uid, fingerprint in fingerprints.items()
+        }
+        return [
+            record
+            for record in self.decisions_for_uids(current)
+            if current.get(record.left_uid, record.left_fingerprint)
+            != record.left_fingerprint
+            or current.get(record.right_uid, record.right_fingerprint)
+            != record.right_fingerprint
+        ]
+
+    def _all_records(self) -> Dict[str, DecisionRecord]:
+        return dict(self._records)
+
+    def records(self) -> List[DecisionRecord]:
+        """Return every stored decision in pair-key order."""
+        return [
+            record for _key, record in sorted(self._all_records().items())
+        ]
+
     def lookup(
         self,
         uid_a: str,
@@ -334,25 +499,63 @@ class DecisionStore:
     ) -> DecisionLookup:
         """Return reusable only when policy and both fingerprints still match."""
         left_uid, right_uid = canonical_uid_pair(uid_a, uid_b)
-        record = self._records.get(decision_pair_key(left_uid, right_uid))
-        if record is None:
-            return DecisionLookup(status="missing")
-
+        record = self._stored_record(decision_pair_key(left_uid, right_uid))
         fingerprints = {
             str(uid_a).strip(): str(fingerprint_a),
             str(uid_b).strip(): str(fingerprint_b),
         }
-        is_current = (
-            record.policy_version == str(policy_version)
-            and record.left_fingerprint == fingerprints[left_uid]
-            and record.right_fingerprint == fingerprints[right_uid]
+        return _classify_decision(
+            record,
+            fingerprints[left_uid],
+            fingerprints[right_uid],
+            str(policy_version),
         )
-        if not is_current:
-            return DecisionLookup(status="stale", record=record)
-        return DecisionLookup(
-            status="reusable",
-            decision=record.decision,
-            record=record,
+
+    def lookup_many(
+        self,
+        candidates: Iterable[Mapping[str, Any]],
+        *,
+        policy_version: str,
+    ) -> DecisionLookups:
+        """Look up candidate dictionaries in one pass.
+
+        Each candidate carries ``left_uid``, ``left_fingerprint``,
+        ``right_uid`` and ``right_fingerprint``.  Stored records are fetched
+        together, so an SQLite store answers a whole run in a few queries.
+        """
+        candidates = tuple(candidates)
+        keyed = []
+        for candidate in candidates:
+            try:
+                uid_a = str(candidate["left_uid"]).strip()
+                left_uid, right_uid = canonical_uid_pair(
+                    uid_a, candidate["right_uid"]
+                )
+                fingerprints = (
+                    str(candidate["left_fingerprint"]),
+                    str(candidate["right_fingerprint"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                keyed.append(None)
+                continue
+            if uid_a != left_uid:
+                fingerprints = fingerprints[::-1]
+            keyed.append(
+                (decision_pair_key(left_uid, right_uid), fingerprints)
+            )
+        stored = self._stored_records(
+            entry[0] for entry in keyed if entry is not None
+        )
+        policy_version = str(policy_version)
+        return DecisionLookups(
+            candidates=candidates,
+            lookups=tuple(
+                DecisionLookup(status="invalid") if entry is None
+                else _classify_decision(
+                    stored.get(entry[0]), *entry[1], policy_version
+                )
+                for entry in keyed
+            ),
         )
 
     def to_document(self) -> Dict[str, Any]:
@@ -360,12 +563,22 @@ class DecisionStore:
             "schema_version": STORE_SCHEMA_VERSION,
             "decisions": {
                 key: asdict(record)
-                for key, record in sorted(self._records.items())
+                for key, record in sorted(self._all_records().items())
             },
         }
 
+    def close(self) -> None:
+        """Release file handles; the in-memory store holds none."""
+
     def save(self, path: Union[os.PathLike, str]) -> None:
-        """Atomically replace a JSON store, leaving the prior file on failure."""
+        """Atomically replace a JSON store, leaving the prior file on failure.
+
+        An SQLite path is replaced with this store's decisions in one
+        transaction instead.
+        """
+        if is_sqlite_store_path(path):
+            _replace_sqlite_store(path, self._all_records().values())
+            return
         target_path = Path(path)
         target_path.parent.mkdir(parents=True, exist_ok=True)
         temporary_path: Optional[Path] = None
@@ -398,3 +611,256 @@ class DecisionStore:
                     temporary_path.unlink()
                 except FileNotFoundError:
                     pass
+
+
+def _connect_sqlite_store(path: Path) -> sqlite3.Connection:
+    """Open a decision database, creating the current schema if needed.
+
+    Raises :class:`sqlite3.DatabaseError` for a non-database file and
+    :class:`ValueError` for a database written by another schema version.
+    """
+    connection = sqlite3.connect(str(path))
+    try:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, STORE_SCHEMA_VERSION):
+            raise ValueError(f"Unsupported decision store schema: {version}")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            "pair_key TEXT PRIMARY KEY NOT NULL, "
+            + ", ".join(
+                f"{column} TEXT NOT NULL" for column in _DECISION_COLUMNS[1:]
+            )
+            + ")"
+        )
+        for column in ("left_uid", "right_uid"):
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS decisions_{column} "
+                f"ON decisions ({column})"
+            )
+        connection.execute(f"PRAGMA user_version = {STORE_SCHEMA_VERSION}")
+        connection.commit()
+    except (sqlite3.DatabaseError, ValueError):
+        connection.close()
+        raise
+    return connection
+
+
+def _upsert_decisions(connection: sqlite3.Connection, records: Any) -> None:
+    connection.executemany(
+        f"INSERT OR REPLACE INTO decisions ({', '.join(_DECISION_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _DECISION_COLUMNS)})",
+        (
+            tuple(getattr(record, column) for column in _DECISION_COLUMNS)
+            for record in sorted(records, key=lambda item: item.pair_key)
+        ),
+    )
+
+
+def _remove_sqlite_files(path: Path) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            Path(f"{path}{suffix}").unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _replace_sqlite_store(path: Union[os.PathLike, str], records: Any) -> None:
+    """Make ``path`` hold exactly ``records``, replacing unreadable files."""
+    target_path = Path(path)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        connection = _connect_sqlite_store(target_path)
+    except (sqlite3.DatabaseError, ValueError):
+        _remove_sqlite_files(target_path)
+        connection = _connect_sqlite_store(target_path)
+    try:
+        with connection:
+            connection.execute("DELETE FROM decisions")
+            _upsert_decisions(connection, records)
+    finally:
+        connection.close()
+
+
+class SQLiteDecisionStore(DecisionStore):
+    """Review decisions read from and written to an SQLite file on demand.
+
+    Lookups query the ``pair_key`` primary key instead of loading every
+    decision.  Recorded decisions stay in memory until :meth:`save`, which
+    writes only those in one transaction, so a cancelled run still leaves
+    the file untouched.
+    """
+
+    def __init__(
+        self,
+        path: Union[os.PathLike, str],
+        connection: Optional[sqlite3.Connection] = None,
+        *,
+        load_status: str = "new",
+    ):
+        super().__init__(load_status=load_status)
+        self.path = Path(path)
+        self._connection = connection
+        # Without a readable database the next save replaces the file.
+        self._replace_on_save = connection is None
+        self._dirty: Dict[str, DecisionRecord] = {}
+
+    @classmethod
+    def open(cls, path: Union[os.PathLike, str]) -> "SQLiteDecisionStore":
+        """Open ``path``; migrate a sibling JSON store if the file is new.
+
+        Malformed or other-schema files load as empty and are replaced on
+        the next :meth:`save`, like their JSON counterparts.
+        """
+        source_path = Path(path)
+        if not source_path.exists():
+            legacy_path = source_path.with_suffix(".json")
+            if legacy_path.is_file():
+                return cls._migrate(source_path, legacy_path)
+            return cls(source_path, load_status="missing")
+        try:
+            connection = _connect_sqlite_store(source_path)
+        except sqlite3.DatabaseError:
+            return cls(source_path, load_status="malformed")
+        except ValueError:
+            return cls(source_path, load_status="unsupported_schema")
+        return cls(source_path, connection, load_status="loaded")
+
+    @classmethod
+    def _migrate(
+        cls,
+        path: Path,
+        legacy_path: Path,
+    ) -> "DecisionStore":
+        legacy = DecisionStore._load_json(legacy_path)
+        if legacy.load_status != "loaded":
+            return cls(path, load_status=legacy.load_status)
+        try:
+            _replace_sqlite_store(path, legacy._all_records().values())
+            connection = _connect_sqlite_store(path)
+        except (OSError, sqlite3.Error, ValueError):
+            # An unwritable folder keeps the JSON decisions usable in memory.
+            return legacy
+        return cls(path, connection, load_status="migrated")
+
+    def __len__(self) -> int:
+        stored = 0
+        if self._connection is not None:
+            stored = self._connection.execute(
+                "SELECT COUNT(*) FROM decisions"
+            ).fetchone()[0]
+        new_keys = [
+            pair_key for pair_key in self._dirty
+            if self._select(pair_key) is None
+        ]
+        return stored + len(new_keys)
+
+    def _select(self, pair_key: str) -> Optional[DecisionRecord]:
+        return self._select_where("pair_key", [pair_key]).get(pair_key)
+
+    def _select_where(
+        self,
+        column: str,
+        values: Iterable[str],
+    ) -> Dict[str, DecisionRecord]:
+        """Return stored records whose ``column`` is one of ``values``."""
+        records: Dict[str, DecisionRecord] = {}
+        if self._connection is None:
+            return records
+        values = sorted(set(values))
+        for start in range(0, len(values), _SQLITE_BATCH_SIZE):
+            batch = values[start:start + _SQLITE_BATCH_SIZE]
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_DECISION_COLUMNS)} FROM decisions "
+                f"WHERE {column} IN ({', '.join('?' for _ in batch)})",
+                batch,
+            )
+            for row in rows:
+                record = self._parse_record(dict(zip(_DECISION_COLUMNS, row)))
+                if record is not None:
+                    records[record.pair_key] = record
+        return records
+
+    def _remember(self, record: DecisionRecord) -> None:
+        self._records[record.pair_key] = record
+        self._dirty[record.pair_key] = record
+
+    def _stored_record(self, pair_key: str) -> Optional[DecisionRecord]:
+        if pair_key not in self._records:
+            record = self._select(pair_key)
+            if record is None:
+                return None
+            self._records[pair_key] = record
+        return self._records[pair_key]
+
+    def _stored_records(
+        self,
+        pair_keys: Iterable[str],
+    ) -> Dict[str, DecisionRecord]:
+        pair_keys = set(pair_keys)
+        found = {
+            pair_key: self._records[pair_key]
+            for pair_key in pair_keys
+            if pair_key in self._records
+        }
+        selected = self._select_where("pair_key", pair_keys - set(found))
+        self._records.update(selected)
+        found.update(selected)
+        return found
+
+    def decisions_for_uids(self, uids: Iterable[str]) -> List[DecisionRecord]:
+        """Return every stored decision touching one of ``uids``.
+
+        Both UID columns are indexed; unsaved decisions are included.
+        """
+        uids = {str(uid).strip() for uid in uids}
+        records = self._select_where("left_uid", uids)
+        records.update(self._select_where("right_uid", uids))
+        records.update(
+            (pair_key, record)
+            for pair_key, record in self._dirty.items()
+            if record.left_uid in uids or record.right_uid in uids
+        )
+        return [records[pair_key] for pair_key in sorted(records)]
+
+    def _all_records(self) -> Dict[str, DecisionRecord]:
+        records: Dict[str, DecisionRecord] = {}
+        if self._connection is not None:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_DECISION_COLUMNS)} FROM decisions"
+            )
+            for row in rows:
+                record = self._parse_record(dict(zip(_DECISION_COLUMNS, row)))
+                if record is not None:
+                    records[record.pair_key] = record
+        records.update(self._dirty)
+        return records
+
+    def save(self, path: Union[os.PathLike, str]) -> None:
+        """Write new or changed decisions to this store's own file.
+
+        Any other target receives a full copy in its own format.
+        """
+        target_path = Path(path)
+        if not is_sqlite_store_path(target_path) or (
+            target_path.resolve() != self.path.resolve()
+        ):
+            super().save(target_path)
+            return
+        if self._replace_on_save:
+            _replace_sqlite_store(target_path, self._dirty.values())
+            self._replace_on_save = False
+            self.close()
+            self._connection = _connect_sqlite_store(target_path)
+        else:
+            if self._connection is None:
+                self._connection = _connect_sqlite_store(target_path)
+            with self._connection as connection:
+                _upsert_decisions(connection, self._dirty.values())
+        self._dirty = {}
+
+    def close(self) -> None:
+        """Close the database; WAL content is checkpointed into the file."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
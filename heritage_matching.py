@@ -5,8 +5,7 @@ by the plugin with a spatial index and reduced to the metrics consumed here.
 This keeps the policy testable in a normal Python runtime.
 """
 
-from dataclasses import dataclass
-from difflib import SequenceMatcher
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 import hashlib
 import json
@@ -20,6 +19,11 @@ try:
         canonical_heritage_text,
         clean_heritage_text,
     )
+    from .heritage_similarity import (
+        longest_match_size,
+        sequence_ratio,
+        sequence_ratio_at_least,
+    )
 except ImportError:
     # Keep this policy module directly runnable by the validation scripts and
     # the normal-Python unit tests outside a loaded QGIS plugin package.
@@ -28,6 +32,11 @@ except ImportError:
         canonical_heritage_text,
         clean_heritage_text,
     )
+    from heritage_similarity import (
+        longest_match_size,
+        sequence_ratio,
+        sequence_ratio_at_least,
+    )
 
 
 ROLE_NATIONAL_DESIGNATED = "national_designated"
@@ -304,23 +313,49 @@ def addresses_match(left, right):
     )
 
 
-def name_similarity(left, right):
+def name_similarity(left, right, memo=None):
+    """Return the difflib ratio of two canonical names.
+
+    ``memo`` is an optional per-run :class:`heritage_similarity.SimilarityMemo`.
+    """
     left_key = canonical_name(left)
     right_key = canonical_name(right)
     if not left_key or not right_key:
         return 0.0
     if left_key == right_key:
         return 1.0
-    return SequenceMatcher(None, left_key, right_key).ratio()
+    if memo is not None:
+        return memo.ratio(left_key, right_key)
+    return sequence_ratio(left_key, right_key)
 
 
-def name_contains(left, right, rules=None):
+def name_similarity_at_least(left, right, threshold, memo=None):
+    """Return ``name_similarity(left, right) >= threshold``, exiting early."""
     left_key = canonical_name(left)
     right_key = canonical_name(right)
+    if not left_key or not right_key:
+        return 0.0 >= threshold
+    if left_key == right_key:
+        return 1.0 >= threshold
+    if memo is not None:
+        return memo.ratio_at_least(left_key, right_key, threshold)
+    return sequence_ratio_at_least(left_key, right_key, threshold)
+
+
+def name_contains(left, right, rules=None):
     active_rules = rules or DEFAULT_MATCHING_RULES
     thresholds = active_rules["thresholds"]
-    min_chars = int(thresholds["name_containment_min_chars"])
-    min_fraction = float(thresholds["name_containment_min_fraction"])
+    return _names_contain(
+        left,
+        right,
+        int(thresholds["name_containment_min_chars"]),
+        float(thresholds["name_containment_min_fraction"]),
+    )
+
+
+def _names_contain(left, right, min_chars, min_fraction):
+    left_key = canonical_name(left)
+    right_key = canonical_name(right)
     if min(len(left_key), len(right_key)) < min_chars:
         return False
     if left_key in right_key or right_key in left_key:
@@ -329,13 +364,7 @@ def name_contains(left, right, rules=None):
     # Administrative prefixes are not consistently repeated between sources
     # (for example "서울 탑골공원" vs "탑골공원 팔각정").  Treat a substantial
     # shared core as a review signal, not as an automatic identity match.
-    matcher = SequenceMatcher(None, left_key, right_key)
-    shared = matcher.find_longest_match(
-        0,
-        len(left_key),
-        0,
-        len(right_key),
-    ).size
+    shared = longest_match_size(left_key, right_key)
     return (
         shared >= min_chars
         and shared / min(len(left_key), len(right_key)) >= min_fraction
@@ -379,6 +408,16 @@ def _pair_kind(left_role, right_role):
     return None
 
 
+def roles_can_pair(left_role, right_role):
+    """Return whether the policy ever compares records of these roles.
+
+    Protection zones are handled by a separate workflow and never pair.
+    """
+    if ROLE_PROTECTION_ZONE in (left_role, right_role):
+        return False
+    return _pair_kind(left_role, right_role) is not None
+
+
 def excavation_area_review_family(left, right):
     """Return a shared explicit area-name family eligible for review.
 
@@ -488,12 +527,56 @@ def _normalized_geometry_pair(value):
     return re.sub(r"[^a-z]+", "_", text).strip("_") or "unknown"
 
 
-def _geometry_allows_automatic_decision(geometry_pair, rules):
-    allowed = {
-        _normalized_geometry_pair(item)
-        for item in rules.get("automatic_geometry_pairs", ())
-    }
-    return _normalized_geometry_pair(geometry_pair) in allowed
+@dataclass(frozen=True)
+class _CompiledRules:
+    """Thresholds, weights and name sets of one ruleset as plain values."""
+
+    exact_name_distance: float
+    review_name_similarity: float
+    review_overlap_ratio: float
+    address_overlap_ratio: float
+    project_name_similarity: float
+    automation_name_similarity: float
+    automation_overlap_ratio: float
+    containment_min_chars: int
+    containment_min_fraction: float
+    name_weight: float
+    overlap_weight: float
+    address_weight: float
+    generic_names: frozenset
+    automatic_geometry_pairs: frozenset
+
+
+def _compile_rules(rules):
+    active_rules = rules or DEFAULT_MATCHING_RULES
+    thresholds = active_rules["thresholds"]
+    weights = active_rules["score_weights"]
+    return _CompiledRules(
+        exact_name_distance=float(thresholds["exact_name_distance_m"]),
+        review_name_similarity=float(thresholds["review_name_similarity"]),
+        review_overlap_ratio=float(thresholds["review_overlap_ratio"]),
+        address_overlap_ratio=float(thresholds["address_overlap_ratio"]),
+        project_name_similarity=float(thresholds["project_name_similarity"]),
+        automation_name_similarity=float(
+            thresholds["automation_name_similarity"]
+        ),
+        automation_overlap_ratio=float(thresholds["automation_overlap_ratio"]),
+        containment_min_chars=int(thresholds["name_containment_min_chars"]),
+        containment_min_fraction=float(
+            thresholds["name_containment_min_fraction"]
+        ),
+        name_weight=float(weights["name_similarity"]),
+        overlap_weight=float(weights["overlap_ratio"]),
+        address_weight=float(weights["address"]),
+        generic_names=frozenset(
+            canonical_name(item)
+            for item in active_rules.get("generic_names", ())
+        ),
+        automatic_geometry_pairs=frozenset(
+            _normalized_geometry_pair(item)
+            for item in active_rules.get("automatic_geometry_pairs", ())
+        ),
+    )
 
 
 def evaluate_candidate(
@@ -512,28 +595,317 @@ def evaluate_candidate(
     boundary_distance=None,
     geometry_pair="polygon_polygon",
     rules=None,
+    similarity_memo=None,
 ):
     """Evaluate one spatially reduced pair.
 
     ``overlap_ratio`` is intersection area divided by the smaller polygon area.
-    The caller may pass zero for non-polygon geometries.
+    The caller may pass zero for non-polygon geometries.  ``similarity_memo``
+    is an optional per-run :class:`heritage_similarity.SimilarityMemo` shared across pairs.
     """
-    active_rules = rules or DEFAULT_MATCHING_RULES
-    thresholds = active_rules["thresholds"]
-    weights = active_rules["score_weights"]
+    values = _evaluate_pair(
+        _compile_rules(rules),
+        left,
+        right,
+        _record_name(left),
+        _record_name(right),
+        intersects=intersects,
+        overlap_ratio=overlap_ratio,
+        distance=distance,
+        preset=preset,
+        coverage_left=coverage_left,
+        coverage_right=coverage_right,
+        iou=iou,
+        area_ratio=area_ratio,
+        centroid_distance=centroid_distance,
+        boundary_distance=boundary_distance,
+        geometry_pair=geometry_pair,
+        similarity_memo=similarity_memo,
+    )
+    return MatchCandidate(*values) if values else None
+
+
+MATCH_CANDIDATE_FIELDS = tuple(item.name for item in fields(MatchCandidate))
+# Geometry keywords of evaluate_candidate with the defaults used when a batch
+# omits an optional column; intersects and overlap_ratio are required.
+PAIR_METRIC_DEFAULTS = {
+    "intersects": None,
+    "overlap_ratio": None,
+    "distance": 0.0,
+    "coverage_left": None,
+    "coverage_right": None,
+    "iou": None,
+    "area_ratio": None,
+    "centroid_distance": None,
+    "boundary_distance": None,
+    "geometry_pair": "polygon_polygon",
+}
+_REQUIRED_METRICS = frozenset({"intersects", "overlap_ratio"})
+
+
+@dataclass(frozen=True)
+class CandidateTable:
+    """Accepted pairs of :func:`evaluate_candidates`, stored column-wise.
+
+    ``rows`` are positions in the evaluated batch and ``left``/``right`` are
+    record positions.  ``columns`` maps every :class:`MatchCandidate` field
+    to a tuple with one value per accepted pair.
+    """
+
+    rows: tuple = ()
+    left: tuple = ()
+    right: tuple = ()
+    columns: dict = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def candidate(self, index):
+        """Return accepted pair ``index`` as a :class:`MatchCandidate`."""
+        return MatchCandidate(*(
+            self.columns[name][index] for name in MATCH_CANDIDATE_FIELDS
+        ))
+
+    def __iter__(self):
+        """Yield ``(left, right, MatchCandidate)`` in batch order."""
+        for index in range(len(self.rows)):
+            yield self.left[index], self.right[index], self.candidate(index)
+
+
+def _metric_column(metrics, name, count):
+    names = getattr(getattr(metrics, "dtype", None), "names", None)
+    present = name in names if names is not None else name in metrics
+    if not present:
+        if name in _REQUIRED_METRICS:
+            raise KeyError(f"Pair metrics require a {name!r} column")
+        return [PAIR_METRIC_DEFAULTS[name]] * count
+    column = metrics[name]
+    # NumPy scalars would otherwise leak into the rounded candidate fields.
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+def evaluate_candidates(
+    records,
+    left,
+    right,
+    metrics,
+    *,
+    preset=PRESET_BALANCED,
+    rules=None,
+    similarity_memo=None,
+):
+    """Evaluate a batch of spatially reduced pairs against one ruleset.
+
+    ``left`` and ``right`` are parallel sequences of positions in
+    ``records``.  ``metrics`` maps the geometry keywords of
+    :func:`evaluate_candidate` to parallel sequences, or is a NumPy
+    structured array with those field names; omitted optional columns take
+    the single-pair defaults.  Thresholds are parsed and each record's name
+    is derived once per batch.  The accepted rows equal calling
+    :func:`evaluate_candidate` pair by pair.
+    """
+    left = left.tolist() if hasattr(left, "tolist") else list(left)
+    right = right.tolist() if hasattr(right, "tolist") else list(right)
+    count = len(left)
+    if len(right) != count:
+        raise ValueError("left and right positions must have equal length")
+    columns = [
+        _metric_column(metrics, name, count) for name in PAIR_METRIC_DEFAULTS
+    ]
+    if any(len(column) != count for column in columns):
+        raise ValueError("every metric column needs one value per pair")
+
+    policy = _compile_rules(rules)
+    names = {}
+    accepted_rows = []
+    accepted_left = []
+    accepted_right = []
+    accepted = []
+    for row, (first, second, pair_metrics) in enumerate(
+        zip(left, right, zip(*columns))
+    ):
+        if first not in names:
+            names[first] = _record_name(records[first])
+        if second not in names:
+            names[second] = _record_name(records[second])
+        values = _evaluate_pair(
+            policy,
+            records[first],
+            records[second],
+            names[first],
+            names[second],
+            preset=preset,
+            similarity_memo=similarity_memo,
+            **dict(zip(PAIR_METRIC_DEFAULTS, pair_metrics)),
+        )
+        if values:
+            accepted_rows.append(row)
+            accepted_left.append(first)
+            accepted_right.append(second)
+            accepted.append(values)
+    transposed = list(zip(*accepted)) or [() for _name in MATCH_CANDIDATE_FIELDS]
+    return CandidateTable(
+        rows=tuple(accepted_rows),
+        left=tuple(accepted_left),
+        right=tuple(accepted_right),
+        columns=dict(zip(MATCH_CANDIDATE_FIELDS, transposed)),
+    )
+
+
+@dataclass(frozen=True)
+class PairScreen:
+    """Geometry evidence a pair still needs after the attribute pre-screen.
+
+    ``distance_limit`` is ``None`` when only overlap rules can accept the
+    pair, so it must intersect; otherwise a non-intersecting pair can still
+    match within that many metres.
+    """
+
+    pair_kind: str
+    distance_limit: float = None
+
+    @property
+    def requires_intersection(self):
+        return self.distance_limit is None
+
+    def allows(self, intersects, distance=None):
+        """Return whether the geometry evidence so far can still match.
+
+        Pass ``distance`` once it is known; without it a non-intersecting
+        pair is kept whenever a distance rule could apply.
+        """
+        if intersects:
+            return True
+        if self.distance_limit is None:
+            return False
+        return distance is None or distance <= self.distance_limit
+
+
+def _screen_pair(policy, left, right, left_name, right_name, similarity_memo):
     left_role = left.get("role", ROLE_OTHER)
     right_role = right.get("role", ROLE_OTHER)
     pair_kind = _pair_kind(left_role, right_role)
     if not pair_kind:
         return None
+    if pair_kind == "excavation_area_parts":
+        if not excavation_area_review_family(left, right):
+            return None
+        return PairScreen(pair_kind, policy.exact_name_distance)
+
+    similarity = name_similarity(left_name, right_name, similarity_memo)
+    if left_name and right_name and similarity == 1.0:
+        return PairScreen(pair_kind, policy.exact_name_distance)
+    # The remaining rules all need an intersection plus one of these
+    # attribute signals; the thresholds on overlap are checked later.
+    if (
+        similarity >= policy.review_name_similarity
+        or _names_contain(
+            left_name,
+            right_name,
+            policy.containment_min_chars,
+            policy.containment_min_fraction,
+        )
+        or addresses_match(left.get("address"), right.get("address"))
+    ):
+        return PairScreen(pair_kind)
+    if pair_kind == "excavation_distribution":
+        excavation = left if left_role == ROLE_EXCAVATION else right
+        distribution = right if left_role == ROLE_EXCAVATION else left
+        project = excavation.get("project_name")
+        distribution_name = _record_name(distribution)
+        if _names_contain(
+            project,
+            distribution_name,
+            policy.containment_min_chars,
+            policy.containment_min_fraction,
+        ) or name_similarity_at_least(
+            project,
+            distribution_name,
+            policy.project_name_similarity,
+            similarity_memo,
+        ):
+            return PairScreen(pair_kind)
+    return None
+
 
-    left_name = _record_name(left)
-    right_name = _record_name(right)
-    similarity = name_similarity(left_name, right_name)
+def screen_candidate(left, right, *, rules=None, similarity_memo=None):
+    """Pre-screen a pair on attributes alone, before any geometry work.
+
+    Returns ``None`` when :func:`evaluate_candidate` rejects the pair for
+    every geometry, because the pair kind is incompatible or no name,
+    address or project signal exists.  Otherwise returns a
+    :class:`PairScreen` describing which geometry evidence can still lead
+    to a candidate.  The result does not depend on the preset.
+    """
+    return _screen_pair(
+        _compile_rules(rules),
+        left,
+        right,
+        _record_name(left),
+        _record_name(right),
+        similarity_memo,
+    )
+
+
+def screen_candidates(records, left, right, *, rules=None, similarity_memo=None):
+    """Return :func:`screen_candidate` results for parallel positions."""
+    policy = _compile_rules(rules)
+    names = {}
+    screens = []
+    for first, second in zip(left, right):
+        if first not in names:
+            names[first] = _record_name(records[first])
+        if second not in names:
+            names[second] = _record_name(records[second])
+        screens.append(_screen_pair(
+            policy,
+            records[first],
+            records[second],
+            names[first],
+            names[second],
+            similarity_memo,
+        ))
+    return screens
+
+
+def _evaluate_pair(
+    policy,
+    left,
+    right,
+    left_name,
+    right_name,
+    *,
+    intersects,
+    overlap_ratio,
+    distance,
+    preset,
+    coverage_left,
+    coverage_right,
+    iou,
+    area_ratio,
+    centroid_distance,
+    boundary_distance,
+    geometry_pair,
+    similarity_memo,
+):
+    """Return :class:`MatchCandidate` field values, or ``None`` if rejected."""
+    left_role = left.get("role", ROLE_OTHER)
+    right_role = right.get("role", ROLE_OTHER)
+    pair_kind = _pair_kind(left_role, right_role)
+    if not pair_kind:
+        return None
+
+    similarity = name_similarity(left_name, right_name, similarity_memo)
     exact = bool(left_name and right_name and similarity == 1.0)
-    containment = name_contains(left_name, right_name, active_rules)
-    generic_name = is_generic_name(left_name, active_rules) or is_generic_name(
-        right_name, active_rules
+    containment = _names_contain(
+        left_name,
+        right_name,
+        policy.containment_min_chars,
+        policy.containment_min_fraction,
+    )
+    generic_name = (
+        canonical_name(left_name) in policy.generic_names
+        or canonical_name(right_name) in policy.generic_names
     )
 
     same_address = addresses_match(left.get("address"), right.get("address"))
@@ -549,9 +921,18 @@ def evaluate_candidate(
         project = excavation.get("project_name")
         distribution_name = _record_name(distribution)
         project_signal = (
-            name_contains(project, distribution_name, active_rules)
-            or name_similarity(project, distribution_name)
-            >= float(thresholds["project_name_similarity"])
+            _names_contain(
+                project,
+                distribution_name,
+                policy.containment_min_chars,
+                policy.containment_min_fraction,
+            )
+            or name_similarity_at_least(
+                project,
+                distribution_name,
+                policy.project_name_similarity,
+                similarity_memo,
+            )
         )
 
     confidence = None
@@ -560,7 +941,7 @@ def evaluate_candidate(
         area_family = excavation_area_review_family(left, right)
         if not area_family or not (
             intersects
-            or distance <= float(thresholds["exact_name_distance_m"])
+            or distance <= policy.exact_name_distance
         ):
             return None
         confidence = "medium"
@@ -572,17 +953,15 @@ def evaluate_candidate(
             if generic_name
             else "exact_name_and_overlap"
         )
-    elif exact and distance <= float(thresholds["exact_name_distance_m"]):
+    elif exact and distance <= policy.exact_name_distance:
         confidence = "medium"
         rule = (
             "exact_generic_name_within_distance"
             if generic_name
             else "exact_name_within_50m"
         )
-    elif intersects and overlap_ratio >= float(
-        thresholds["review_overlap_ratio"]
-    ) and (
-        similarity >= float(thresholds["review_name_similarity"])
+    elif intersects and overlap_ratio >= policy.review_overlap_ratio and (
+        similarity >= policy.review_name_similarity
         or containment
     ):
         confidence = "medium"
@@ -593,7 +972,7 @@ def evaluate_candidate(
         )
     elif (
         intersects
-        and overlap_ratio >= float(thresholds["address_overlap_ratio"])
+        and overlap_ratio >= policy.address_overlap_ratio
         and same_address
     ):
         confidence = "medium"
@@ -601,7 +980,7 @@ def evaluate_candidate(
     elif (
         pair_kind == "excavation_distribution"
         and intersects
-        and overlap_ratio >= float(thresholds["review_overlap_ratio"])
+        and overlap_ratio >= policy.review_overlap_ratio
         and project_signal
     ):
         confidence = "medium"
@@ -630,30 +1009,25 @@ def evaluate_candidate(
             auto_apply = (
                 confidence == "high"
                 or (
-                    similarity >= float(
-                        thresholds["automation_name_similarity"]
-                    )
-                    and overlap_ratio >= float(
-                        thresholds["automation_overlap_ratio"]
-                    )
+                    similarity >= policy.automation_name_similarity
+                    and overlap_ratio >= policy.automation_overlap_ratio
                     and rule != "name_containment_and_overlap"
                 )
             )
 
-    if generic_name or not _geometry_allows_automatic_decision(
-        geometry_pair, active_rules
-    ):
+    normalized_pair = _normalized_geometry_pair(geometry_pair)
+    if generic_name or normalized_pair not in policy.automatic_geometry_pairs:
         auto_apply = False
 
     address_score = 1.0 if same_address else 0.0
     score = min(
         1.0,
-        (similarity * float(weights["name_similarity"]))
+        (similarity * policy.name_weight)
         + (
             min(max(float(overlap_ratio), 0.0), 1.0)
-            * float(weights["overlap_ratio"])
+            * policy.overlap_weight
         )
-        + (address_score * float(weights["address"])),
+        + (address_score * policy.address_weight),
     )
 
     if pair_kind == "excavation_area_parts":
@@ -669,29 +1043,28 @@ def evaluate_candidate(
     else:
         relation_type = RELATION_UNCERTAIN
 
-    normalized_pair = _normalized_geometry_pair(geometry_pair)
-
-    return MatchCandidate(
-        left_uid=str(left.get("uid")),
-        right_uid=str(right.get("uid")),
-        pair_kind=pair_kind,
-        confidence=confidence,
-        score=round(score, 4),
-        rule=rule,
-        recommended_decision=recommended,
-        representative_uid=_representative_uid(left, right),
-        auto_apply=auto_apply,
-        name_similarity=round(similarity, 4),
-        overlap_ratio=round(float(overlap_ratio), 4),
-        distance=round(float(distance), 3),
-        coverage_left=_metric(coverage_left),
-        coverage_right=_metric(coverage_right),
-        iou=_metric(iou),
-        area_ratio=_metric(area_ratio),
-        centroid_distance=_metric(centroid_distance, 3),
-        boundary_distance=_metric(boundary_distance, 3),
-        geometry_pair=normalized_pair,
-        relation_type=relation_type,
+    # Field order of MatchCandidate.
+    return (
+        str(left.get("uid")),
+        str(right.get("uid")),
+        pair_kind,
+        confidence,
+        round(score, 4),
+        rule,
+        recommended,
+        _representative_uid(left, right),
+        auto_apply,
+        round(similarity, 4),
+        round(float(overlap_ratio), 4),
+        round(float(distance), 3),
+        _metric(coverage_left),
+        _metric(coverage_right),
+        _metric(iou),
+        _metric(area_ratio),
+        _metric(centroid_distance, 3),
+        _metric(boundary_distance, 3),
+        normalized_pair,
+        relation_type,
     )
 
 
@@ -1,6 +1,21 @@
-"""Interactive review dialog for source-aware duplicate candidates."""
+"""Interactive review dialog for source-aware duplicate candidates.
+
+The candidate table is a model/view stack. :class:`CandidateReviewModel`
+renders cells from the candidate dictionaries on demand and keeps one
+decision code per row in an ``array('B')``. :class:`CandidateFilterProxy`
+filters rows by pair kind. The decision column gets a combo-box editor only
+while a cell is being edited, so opening a nationwide review does not create
+one widget or one table item per cell.
+
+A streaming dialog opens while candidates are still being generated.  It
+loads further pages as they arrive and keeps the bulk actions and the
+generate button disabled until :meth:`DuplicateReviewDialog.generation_finished`.
+Loaded rows can be confirmed page by page; confirmed rows are handed to the
+``confirm_callback`` and can no longer be changed.
+"""
 
 import logging
+from array import array
 
 from qgis.PyQt import QtCore, QtWidgets
 
@@ -11,6 +26,7 @@ from .heritage_matching import (
     DECISION_MERGE,
     source_role_label,
 )
+from .review_queue import ReviewQueue
 
 
 PAIR_KIND_LABELS = {
@@ -45,6 +61,316 @@ RULE_LABELS_EN = {
 
 LOGGER = logging.getLogger(__name__)
 
+DECISION_ORDER = (
+    DECISION_KEEP,
+    DECISION_LINK,
+    DECISION_MERGE,
+)
+DECISION_LABELS_EN = {
+    DECISION_KEEP: "Keep separate",
+    DECISION_LINK: "Link only",
+    DECISION_MERGE: "Merge numbering identity",
+}
+DECISION_ROLE = QtCore.Qt.UserRole
+
+COLUMN_LABELS_EN = (
+    "Decision",
+    "Confidence",
+    "Role / source A",
+    "Name A",
+    "Address A",
+    "Role / source B",
+    "Name B",
+    "Address B",
+    "Overlap",
+    "Distance",
+    "Evidence",
+)
+
+
+def decision_label(decision, ui_lang="ko"):
+    labels = DECISION_LABELS_EN if ui_lang == "en" else DECISION_LABELS
+    return labels.get(decision, decision)
+
+
+class CandidateReviewModel(QtCore.QAbstractTableModel):
+    """Table model over duplicate candidates and their pending decisions.
+
+    Cell text is built in :meth:`data` only for the rows the view paints.
+    Decisions are indexes into :data:`DECISION_ORDER`, and the per-decision
+    counts are updated with every change instead of being recounted.
+    """
+
+    def __init__(
+        self,
+        candidates,
+        columns,
+        ui_lang="ko",
+        parent=None,
+        queue=None,
+    ):
+        super().__init__(parent)
+        self.candidates = []
+        self.columns = tuple(columns)
+        self.ui_lang = ui_lang
+        self.queue = queue
+        self._rule_labels = (
+            RULE_LABELS_EN if ui_lang == "en" else RULE_LABELS
+        )
+        self._codes = array("B")
+        self._counts = [0] * len(DECISION_ORDER)
+        self._rows_by_kind = {}
+        self.locked_rows = 0
+        self._load(candidates)
+
+    def _load(self, candidates):
+        for candidate in candidates:
+            row = len(self.candidates)
+            code = self._code(
+                candidate.get("recommended_decision")
+                if candidate.get("auto_apply")
+                else DECISION_KEEP
+            )
+            self.candidates.append(candidate)
+            self._codes.append(code)
+            self._counts[code] += 1
+            self._rows_by_kind.setdefault(
+                candidate.get("pair_kind"),
+                [],
+            ).append(row)
+
+    def canFetchMore(self, parent=None):
+        if parent is not None and parent.isValid():
+            return False
+        return bool(self.queue)
+
+    def fetchMore(self, parent=None):
+        """Append the next page of :attr:`queue` below the loaded rows."""
+        if self.canFetchMore(parent):
+            self._insert(self.queue.pop_page())
+
+    def fetch_all(self):
+        if self.queue:
+            self._insert(self.queue.drain())
+
+    def _insert(self, candidates):
+        candidates = [dict(candidate) for candidate in candidates]
+        if not candidates:
+            return
+        first = len(self.candidates)
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            first,
+            first + len(candidates) - 1,
+        )
+        self._load(candidates)
+        self.endInsertRows()
+
+    def queued_count(self):
+        return len(self.queue) if self.queue is not None else 0
+
+    @staticmethod
+    def _code(decision):
+        try:
+            return DECISION_ORDER.index(decision)
+        except ValueError:
+            return 0
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.candidates)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if (
+            role == QtCore.Qt.DisplayRole
+            and orientation == QtCore.Qt.Horizontal
+            and 0 <= section < len(self.columns)
+        ):
+            return self.columns[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if (
+            index.isValid()
+            and index.column() == 0
+            and index.row() >= self.locked_rows
+        ):
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def lock_rows(self, count):
+        """Make the first ``count`` rows read-only once they are confirmed."""
+        self.locked_rows = max(
+            self.locked_rows,
+            min(int(count), len(self._codes)),
+        )
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == DECISION_ROLE:
+            return self.decision(row)
+        if role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return None
+        if index.column() == 0:
+            if role == QtCore.Qt.EditRole:
+                return self.decision(row)
+            return decision_label(self.decision(row), self.ui_lang)
+        return self._cell_text(self.candidates[row], index.column())
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if (
+            not index.isValid()
+            or index.column() != 0
+            or role not in (QtCore.Qt.EditRole, DECISION_ROLE)
+            or value not in DECISION_ORDER
+            or index.row() < self.locked_rows
+        ):
+            return False
+        if self.set_decision(index.row(), value):
+            self.dataChanged.emit(index, index)
+        return True
+
+    def _cell_text(self, candidate, column):
+        if column == 1:
+            confidence = candidate.get("confidence", "")
+            if candidate.get("auto_apply"):
+                confidence = f"{confidence} · 자동추천"
+            return str(confidence or "")
+        if column == 2:
+            return self._role_and_source(candidate, "left")
+        if column == 3:
+            return str(candidate.get("left_name") or "")
+        if column == 4:
+            return str(candidate.get("left_address") or "")
+        if column == 5:
+            return self._role_and_source(candidate, "right")
+        if column == 6:
+            return str(candidate.get("right_name") or "")
+        if column == 7:
+            return str(candidate.get("right_address") or "")
+        if column == 8:
+            return f"{float(candidate.get('overlap_ratio', 0)) * 100:.1f}%"
+        if column == 9:
+            return f"{float(candidate.get('distance', 0)):.1f}m"
+        if column == 10:
+            return str(self._rule_labels.get(
+                candidate.get("rule"),
+                candidate.get("rule", ""),
+            ) or "")
+        return ""
+
+    def _role_and_source(self, candidate, side):
+        role = source_role_label(
+            candidate.get(f"{side}_role"),
+            self.ui_lang,
+        )
+        source = str(candidate.get(f"{side}_source") or "").strip()
+        return f"{role} · {source}" if source else role
+
+    def pair_kinds(self):
+        kinds = set(self._rows_by_kind)
+        if self.queue is not None:
+            kinds |= self.queue.pair_kinds()
+        return kinds
+
+    def rows(self, pair_kind=""):
+        """Return source rows of ``pair_kind``, or every row when empty."""
+        if not pair_kind:
+            return range(len(self.candidates))
+        return self._rows_by_kind.get(pair_kind, [])
+
+    def decision(self, row):
+        return DECISION_ORDER[self._codes[row]]
+
+    def set_decision(self, row, decision):
+        """Store one decision without notifying views; return if it changed.
+
+        Confirmed rows keep their decision.
+        """
+        if row < self.locked_rows:
+            return False
+        code = self._code(decision)
+        previous = self._codes[row]
+        if previous == code:
+            return False
+        self._codes[row] = code
+        self._counts[previous] -= 1
+        self._counts[code] += 1
+        return True
+
+    def apply_decisions(self, rows, decision_for_row):
+        """Set ``decision_for_row(row)`` on ``rows`` with one view update."""
+        changed_rows = [
+            row
+            for row in rows
+            if self.set_decision(row, decision_for_row(row))
+        ]
+        if changed_rows:
+            self.dataChanged.emit(
+                self.index(min(changed_rows), 0),
+                self.index(max(changed_rows), 0),
+            )
+        return len(changed_rows)
+
+    def counts(self):
+        """Return decision counts of the loaded rows."""
+        return {
+            decision: self._counts[code]
+            for code, decision in enumerate(DECISION_ORDER)
+        }
+
+
+class CandidateFilterProxy(QtCore.QSortFilterProxyModel):
+    """Show only candidate rows of one pair kind."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pair_kind = ""
+
+    def set_pair_kind(self, pair_kind):
+        self.pair_kind = pair_kind or ""
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self.pair_kind:
+            return True
+        model = self.sourceModel()
+        return model.candidates[source_row].get("pair_kind") == self.pair_kind
+
+
+class DecisionDelegate(QtWidgets.QStyledItemDelegate):
+    """Combo-box editor created only while a decision cell is edited."""
+
+    def __init__(self, ui_lang="ko", parent=None):
+        super().__init__(parent)
+        self.ui_lang = ui_lang
+
+    def createEditor(self, parent, option, index):
+        combo = QtWidgets.QComboBox(parent)
+        for decision in DECISION_ORDER:
+            combo.addItem(decision_label(decision, self.ui_lang), decision)
+        combo.activated.connect(
+            lambda _index, editor=combo: self.commitData.emit(editor)
+        )
+        return combo
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentIndex(
+            max(0, editor.findData(index.data(QtCore.Qt.EditRole)))
+        )
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentData(), QtCore.Qt.EditRole)
+
 
 class DuplicateReviewDialog(QtWidgets.QDialog):
     """Review candidate relations before numbering."""
@@ -69,15 +395,38 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
         parent=None,
         ui_lang="ko",
         zoom_callback=None,
+        streaming=False,
+        confirm_callback=None,
     ):
         super().__init__(parent)
         self.ui_lang = ui_lang
-        self.candidates = [dict(candidate) for candidate in candidates]
+        self.streaming = bool(streaming)
+        self.confirm_callback = (
+            confirm_callback if callable(confirm_callback) else None
+        )
+        self.last_confirm_error = None
+        # A ReviewQueue is shown page by page as the reviewer scrolls; a
+        # plain list is shown whole, in the given order.
+        queue = candidates if isinstance(candidates, ReviewQueue) else None
         self.zoom_callback = (
             zoom_callback if callable(zoom_callback) else None
         )
         self.last_zoom_error = None
-        self.action_combos = []
+        self.model = CandidateReviewModel(
+            (
+                []
+                if queue is not None
+                else [dict(candidate) for candidate in candidates]
+            ),
+            self.COLUMNS if self.ui_lang != "en" else COLUMN_LABELS_EN,
+            ui_lang=self.ui_lang,
+            parent=self,
+            queue=queue,
+        )
+        self.model.fetchMore()
+        self.candidates = self.model.candidates
+        self.proxy = CandidateFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
         self.setWindowTitle(self._t(
             "중복 후보 실행 전 검토",
             "Review Duplicate Candidates",
@@ -121,17 +470,7 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
         ))
         self.pair_filter = QtWidgets.QComboBox()
         self.pair_filter.addItem(self._t("전체", "All"), "")
-        present_kinds = {
-            candidate.get("pair_kind") for candidate in self.candidates
-        }
-        pair_labels = (
-            PAIR_KIND_LABELS_EN
-            if self.ui_lang == "en"
-            else PAIR_KIND_LABELS
-        )
-        for kind, label in pair_labels.items():
-            if kind in present_kinds:
-                self.pair_filter.addItem(label, kind)
+        self._refresh_pair_filter()
         toolbar.addWidget(self.pair_filter)
 
         self.btn_recommended = QtWidgets.QPushButton(
@@ -143,22 +482,9 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
         toolbar.addWidget(self.btn_recommended)
         toolbar.addWidget(self.btn_keep)
         self.bulk_action = QtWidgets.QComboBox()
-        for decision in (
-            DECISION_KEEP,
-            DECISION_LINK,
-            DECISION_MERGE,
-        ):
-            english_decisions = {
-                DECISION_KEEP: "Keep separate",
-                DECISION_LINK: "Link only",
-                DECISION_MERGE: "Merge numbering identity",
-            }
+        for decision in DECISION_ORDER:
             self.bulk_action.addItem(
-                (
-                    english_decisions[decision]
-                    if self.ui_lang == "en"
-                    else DECISION_LABELS[decision]
-                ),
+                decision_label(decision, self.ui_lang),
                 decision,
             )
         self.btn_bulk_apply = QtWidgets.QPushButton(
@@ -179,118 +505,51 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
             self.zoom_callback is not None and bool(self.candidates)
         )
         toolbar.addWidget(self.btn_zoom)
+        self.btn_confirm = QtWidgets.QPushButton(
+            self._t("불러온 후보 확정", "Confirm loaded candidates")
+        )
+        self.btn_confirm.setToolTip(self._t(
+            "지금까지 불러온 후보의 판정을 바로 저장합니다. 확정한 판정은 "
+            "바꿀 수 없고, 실행이 중단되어도 다음 실행에서 이어 씁니다.",
+            "Saves the decisions of the loaded candidates now. Confirmed "
+            "decisions are locked and carry over to the next run even if "
+            "this run stops.",
+        ))
+        self.btn_confirm.setVisible(self.confirm_callback is not None)
+        toolbar.addWidget(self.btn_confirm)
         toolbar.addStretch(1)
 
         self.summary = QtWidgets.QLabel()
         toolbar.addWidget(self.summary)
         layout.addLayout(toolbar)
 
-        self.table = QtWidgets.QTableWidget(
-            len(self.candidates),
-            len(self.COLUMNS),
-        )
-        self.table.setHorizontalHeaderLabels(
-            self.COLUMNS
-            if self.ui_lang != "en"
-            else (
-                "Decision",
-                "Confidence",
-                "Role / source A",
-                "Name A",
-                "Address A",
-                "Role / source B",
-                "Name B",
-                "Address B",
-                "Overlap",
-                "Distance",
-                "Evidence",
-            )
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(
+            0,
+            DecisionDelegate(self.ui_lang, self.table),
+        )
+        self.table.setEditTriggers(
+            QtWidgets.QAbstractItemView.CurrentChanged
+            | QtWidgets.QAbstractItemView.SelectedClicked
+            | QtWidgets.QAbstractItemView.EditKeyPressed
         )
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(
             QtWidgets.QAbstractItemView.SelectRows
         )
         self.table.setSortingEnabled(False)
+        self.table.setWordWrap(False)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Fixed
+        )
         layout.addWidget(self.table, 1)
 
-        for row, candidate in enumerate(self.candidates):
-            combo = QtWidgets.QComboBox()
-            for decision in (
-                DECISION_KEEP,
-                DECISION_LINK,
-                DECISION_MERGE,
-            ):
-                english_decisions = {
-                    DECISION_KEEP: "Keep separate",
-                    DECISION_LINK: "Link only",
-                    DECISION_MERGE: "Merge numbering identity",
-                }
-                combo.addItem(
-                    (
-                        english_decisions[decision]
-                        if self.ui_lang == "en"
-                        else DECISION_LABELS[decision]
-                    ),
-                    decision,
-                )
-            default_decision = (
-                candidate.get("recommended_decision")
-                if candidate.get("auto_apply")
-                else DECISION_KEEP
-            )
-            combo.setCurrentIndex(
-                max(0, combo.findData(default_decision))
-            )
-            combo.currentIndexChanged.connect(self._update_summary)
-            self.table.setCellWidget(row, 0, combo)
-            self.action_combos.append(combo)
-
-            confidence = candidate.get("confidence", "")
-            if candidate.get("auto_apply"):
-                confidence = f"{confidence} · 자동추천"
-            self._set_item(row, 1, confidence)
-            self._set_item(
-                row,
-                2,
-                self._role_and_source(candidate, "left"),
-            )
-            self._set_item(row, 3, candidate.get("left_name", ""))
-            self._set_item(row, 4, candidate.get("left_address", ""))
-            self._set_item(
-                row,
-                5,
-                self._role_and_source(candidate, "right"),
-            )
-            self._set_item(row, 6, candidate.get("right_name", ""))
-            self._set_item(row, 7, candidate.get("right_address", ""))
-            self._set_item(
-                row,
-                8,
-                f"{float(candidate.get('overlap_ratio', 0)) * 100:.1f}%",
-            )
-            self._set_item(
-                row,
-                9,
-                f"{float(candidate.get('distance', 0)):.1f}m",
-            )
-            self._set_item(
-                row,
-                10,
-                (
-                    RULE_LABELS_EN
-                    if self.ui_lang == "en"
-                    else RULE_LABELS
-                ).get(
-                    candidate.get("rule"),
-                    candidate.get("rule", ""),
-                ),
-            )
-
+        # ResizeToContents would measure every row on each model change;
+        # size the columns once from the rows Qt samples instead.
+        self.table.resizeColumnsToContents()
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeToContents
-        )
         header.setSectionResizeMode(3, QtWidgets.QHeaderView.Stretch)
         header.setSectionResizeMode(6, QtWidgets.QHeaderView.Stretch)
 
@@ -310,6 +569,7 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
+        self.btn_generate = buttons.button(QtWidgets.QDialogButtonBox.Ok)
 
         self.pair_filter.currentIndexChanged.connect(
             self._apply_pair_filter
@@ -320,70 +580,148 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
         self.btn_keep.clicked.connect(self._keep_visible)
         self.btn_bulk_apply.clicked.connect(self._bulk_apply_to_visible)
         self.btn_zoom.clicked.connect(self._zoom_selected_candidate)
-        self.table.cellDoubleClicked.connect(
-            self._zoom_candidate_at_row
+        self.btn_confirm.clicked.connect(self.confirm_loaded)
+        self.table.doubleClicked.connect(self._zoom_candidate_at_index)
+        self.model.dataChanged.connect(self._update_summary)
+        self.model.rowsInserted.connect(self._update_summary)
+        self._update_controls()
+
+    def _refresh_pair_filter(self):
+        """List the relation kinds queued so far, in label order."""
+        present_kinds = self.model.pair_kinds()
+        pair_labels = (
+            PAIR_KIND_LABELS_EN
+            if self.ui_lang == "en"
+            else PAIR_KIND_LABELS
+        )
+        wanted = [
+            (kind, label)
+            for kind, label in pair_labels.items()
+            if kind in present_kinds
+        ]
+        listed = [
+            self.pair_filter.itemData(index)
+            for index in range(1, self.pair_filter.count())
+        ]
+        if listed == [kind for kind, _label in wanted]:
+            return
+        current = self.pair_filter.currentData()
+        self.pair_filter.blockSignals(True)
+        while self.pair_filter.count() > 1:
+            self.pair_filter.removeItem(1)
+        for kind, label in wanted:
+            self.pair_filter.addItem(label, kind)
+        self.pair_filter.setCurrentIndex(
+            max(0, self.pair_filter.findData(current))
+        )
+        self.pair_filter.blockSignals(False)
+
+    def _update_controls(self):
+        finished = not self.streaming
+        for button in (
+            self.btn_recommended,
+            self.btn_keep,
+            self.btn_bulk_apply,
+            self.btn_generate,
+        ):
+            button.setEnabled(finished)
+        self.btn_confirm.setEnabled(
+            self.model.locked_rows < self.model.rowCount()
+        )
+        self.btn_zoom.setEnabled(
+            self.zoom_callback is not None and bool(self.candidates)
         )
         self._update_summary()
 
-    def _t(self, ko_text, en_text):
-        return en_text if self.ui_lang == "en" else ko_text
-
-    def _set_item(self, row, column, text):
-        item = QtWidgets.QTableWidgetItem(str(text or ""))
-        item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
-        self.table.setItem(row, column, item)
+    def candidates_arrived(self):
+        """Show newly queued candidates while generation is running.
 
-    def _role_and_source(self, candidate, side):
-        role = source_role_label(
-            candidate.get(f"{side}_role"),
-            self.ui_lang,
+        A page is loaded only when the reviewer has reached the last loaded
+        row; otherwise Qt loads it when they scroll there.
+        """
+        scroll_bar = self.table.verticalScrollBar()
+        if (
+            self.model.rowCount() == 0
+            or scroll_bar.value() >= scroll_bar.maximum()
+        ):
+            self.model.fetchMore()
+        self._refresh_pair_filter()
+        self._update_controls()
+
+    def generation_finished(self):
+        """Enable bulk actions and generation once every candidate is queued."""
+        self.streaming = False
+        self.candidates_arrived()
+
+    def confirm_loaded(self):
+        """Hand the loaded, unconfirmed rows to ``confirm_callback``.
+
+        Returns the number of rows confirmed.  When the callback raises, the
+        rows stay editable and the error is kept in
+        :attr:`last_confirm_error`.
+        """
+        first = self.model.locked_rows
+        last = self.model.rowCount()
+        if self.confirm_callback is None or first >= last:
+            return 0
+        try:
+            self.confirm_callback(self._decisions(range(first, last)))
+        except Exception as exc:  # pragma: no cover - logger detail varies
+            self.last_confirm_error = exc
+            LOGGER.exception("Failed to save confirmed review decisions")
+            return 0
+        self.last_confirm_error = None
+        self.model.lock_rows(last)
+        self.model.dataChanged.emit(
+            self.model.index(first, 0),
+            self.model.index(last - 1, 0),
         )
-        source = str(candidate.get(f"{side}_source") or "").strip()
-        return f"{role} · {source}" if source else role
+        self._update_controls()
+        return last - first
 
-    def _row_visible(self, row):
-        return not self.table.isRowHidden(row)
+    def _t(self, ko_text, en_text):
+        return en_text if self.ui_lang == "en" else ko_text
+
+    def _visible_rows(self):
+        # Bulk actions cover the whole relation, not just the loaded pages.
+        self.model.fetch_all()
+        return self.model.rows(self.proxy.pair_kind)
 
     def _apply_pair_filter(self):
-        selected = self.pair_filter.currentData()
-        for row, candidate in enumerate(self.candidates):
-            self.table.setRowHidden(
-                row,
-                bool(
-                    selected
-                    and candidate.get("pair_kind") != selected
-                ),
-            )
+        self.proxy.set_pair_kind(self.pair_filter.currentData())
 
     def _apply_recommended_to_visible(self):
-        for row, candidate in enumerate(self.candidates):
-            if not self._row_visible(row):
-                continue
-            combo = self.action_combos[row]
-            index = combo.findData(
-                candidate.get("recommended_decision", DECISION_KEEP)
-            )
-            combo.setCurrentIndex(max(0, index))
-        self._update_summary()
+        candidates = self.candidates
+        self.model.apply_decisions(
+            self._visible_rows(),
+            lambda row: candidates[row].get(
+                "recommended_decision",
+                DECISION_KEEP,
+            ),
+        )
 
     def _keep_visible(self):
-        for row, combo in enumerate(self.action_combos):
-            if self._row_visible(row):
-                combo.setCurrentIndex(combo.findData(DECISION_KEEP))
-        self._update_summary()
+        self.model.apply_decisions(
+            self._visible_rows(),
+            lambda _row: DECISION_KEEP,
+        )
 
     def _bulk_apply_to_visible(self):
         decision = self.bulk_action.currentData()
-        for row, combo in enumerate(self.action_combos):
-            if self._row_visible(row):
-                combo.setCurrentIndex(combo.findData(decision))
-        self._update_summary()
+        self.model.apply_decisions(
+            self._visible_rows(),
+            lambda _row: decision,
+        )
 
     def _zoom_selected_candidate(self):
-        row = self.table.currentRow()
-        if row < 0:
-            row = 0
-        self._zoom_candidate_at_row(row)
+        index = self.table.currentIndex()
+        if index.isValid():
+            self._zoom_candidate_at_index(index)
+        else:
+            self._zoom_candidate_at_row(0)
+
+    def _zoom_candidate_at_index(self, index):
+        self._zoom_candidate_at_row(self.proxy.mapToSource(index).row())
 
     def _zoom_candidate_at_row(self, row, _column=None):
         if (
@@ -402,36 +740,46 @@ class DuplicateReviewDialog(QtWidgets.QDialog):
                 row,
             )
 
-    def _update_summary(self):
-        counts = {
-            DECISION_KEEP: 0,
-            DECISION_LINK: 0,
-            DECISION_MERGE: 0,
-        }
-        for combo in self.action_combos:
-            counts[combo.currentData()] += 1
-        self.summary.setText(
-            (
+    def _update_summary(self, *_args):
+        counts = self.model.counts()
+        queued = self.model.queued_count()
+        confirmed = self.model.locked_rows
+        if self.ui_lang == "en":
+            text = (
                 f"Keep {counts[DECISION_KEEP]} · "
                 f"Link {counts[DECISION_LINK]} · "
                 f"Merge {counts[DECISION_MERGE]}"
-                if self.ui_lang == "en"
-                else (
-                    f"별도 {counts[DECISION_KEEP]} · "
-                    f"연결 {counts[DECISION_LINK]} · "
-                    f"대표화 {counts[DECISION_MERGE]}"
-                )
             )
-        )
+            if queued:
+                text += f" · {queued} not yet loaded"
+            if confirmed:
+                text += f" · {confirmed} confirmed"
+            if self.streaming:
+                text += " · still searching for candidates"
+        else:
+            text = (
+                f"별도 {counts[DECISION_KEEP]} · "
+                f"연결 {counts[DECISION_LINK]} · "
+                f"대표화 {counts[DECISION_MERGE]}"
+            )
+            if queued:
+                text += f" · 미표시 {queued}건"
+            if confirmed:
+                text += f" · 확정 {confirmed}건"
+            if self.streaming:
+                text += " · 후보를 계속 찾는 중"
+        self.summary.setText(text)
 
     def decisions(self):
+        # Candidates never scrolled into view keep their default decision.
+        self.model.fetch_all()
+        return self._decisions(range(len(self.candidates)))
+
+    def _decisions(self, rows):
         result = []
-        for candidate, combo in zip(
-            self.candidates,
-            self.action_combos,
-        ):
-            item = dict(candidate)
-            item["decision"] = combo.currentData()
+        for row in rows:
+            item = dict(self.candidates[row])
+            item["decision"] = self.model.decision(row)
             item["decision_source"] = (
                 "auto"
                 if (
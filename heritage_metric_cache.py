@@ -0,0 +1,232 @@
+"""Persistent candidate geometry metrics for incremental re-matching.
+
+Every distribution-map run measures the same candidate pairs again although
+most source records did not change.  :class:`CandidateMetricCache` keeps the
+ten geometry metrics of each measured pair in a SQLite file next to the
+review decision store, keyed by both content fingerprints, the matching
+ruleset SHA-256 and the analysis CRS.  A rerun then only measures pairs that
+involve a changed or new record.
+
+Pairs are stored once in fingerprint order;
+:func:`heritage_candidate_metrics.known_pair_metrics` returns them in the
+orientation the caller asks for.  Entries not used for ``max_age_days`` and
+the least recently used entries beyond ``max_entries`` are evicted on
+:meth:`CandidateMetricCache.save`.
+
+The module has no QGIS dependency.  The cache only speeds runs up, so a
+malformed file is replaced instead of failing the run.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+import time
+
+try:
+    from .heritage_candidate_metrics import METRIC_COLUMNS, reverse_metrics
+except ImportError:
+    from heritage_candidate_metrics import METRIC_COLUMNS, reverse_metrics
+
+
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_MAX_ENTRIES = 2_000_000
+DEFAULT_MAX_AGE_DAYS = 90
+_SECONDS_PER_DAY = 86_400
+
+_KEY_COLUMNS = ("ruleset_sha256", "analysis_crs", "left_fp", "right_fp")
+
+
+def canonical_metric_pair(left_key, right_key, values):
+    """Return ``((low, high), values)`` with values oriented to that order."""
+    left_key = str(left_key)
+    right_key = str(right_key)
+    if left_key <= right_key:
+        return (left_key, right_key), tuple(values)
+    return (right_key, left_key), reverse_metrics(values)
+
+
+class CandidateMetricCache:
+    """Candidate-pair metrics for one ruleset and analysis CRS.
+
+    Use :meth:`open`; :meth:`known_metrics` loads the reusable pairs of a
+    record set, :meth:`record` and :meth:`mark_used` buffer changes, and
+    :meth:`save` writes them and evicts old entries.  ``load_status`` is
+    ``"missing"``, ``"loaded"`` or ``"reset"`` when an unreadable file was
+    replaced.
+    """
+
+    def __init__(
+        self,
+        connection,
+        *,
+        ruleset_sha256,
+        analysis_crs,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_age_days=DEFAULT_MAX_AGE_DAYS,
+        load_status="new",
+        clock=time.time,
+    ):
+        self._connection = connection
+        self.ruleset_sha256 = str(ruleset_sha256 or "unknown")
+        self.analysis_crs = str(analysis_crs or "unknown")
+        self.max_entries = max(1, int(max_entries))
+        self.max_age_days = max(0.0, float(max_age_days))
+        self.load_status = load_status
+        self._clock = clock
+        self._pending = {}
+        self._used = set()
+        self.reused_pair_count = 0
+        self.stored_pair_count = 0
+        self.evicted_pair_count = 0
+
+    @classmethod
+    def open(cls, path, *, ruleset_sha256, analysis_crs, **options):
+        """Open or create the cache file at ``path``."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        load_status = "loaded" if target.exists() else "missing"
+        try:
+            connection = cls._connect(target)
+        except sqlite3.DatabaseError:
+            target.unlink()
+            connection = cls._connect(target)
+            load_status = "reset"
+        return cls(
+            connection,
+            ruleset_sha256=ruleset_sha256,
+            analysis_crs=analysis_crs,
+            load_status=load_status,
+            **options,
+        )
+
+    @staticmethod
+    def _connect(target):
+        connection = sqlite3.connect(str(target))
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, CACHE_SCHEMA_VERSION):
+                connection.execute("DROP TABLE IF EXISTS pair_metrics")
+            metric_columns = ", ".join(
+                f"{column} {'TEXT' if column == 'geometry_pair' else 'REAL'}"
+                for column in METRIC_COLUMNS
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pair_metrics ("
+                "ruleset_sha256 TEXT NOT NULL, analysis_crs TEXT NOT NULL, "
+                "left_fp TEXT NOT NULL, right_fp TEXT NOT NULL, "
+                f"{metric_columns}, used_at REAL NOT NULL, "
+                f"PRIMARY KEY ({', '.join(_KEY_COLUMNS)}))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS pair_metrics_used_at "
+                "ON pair_metrics (used_at)"
+            )
+            connection.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+            connection.commit()
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM pair_metrics"
+        ).fetchone()[0]
+
+    def known_metrics(self, fingerprints):
+        """Return ``{(low, high): values}`` for pairs within ``fingerprints``.
+
+        Values follow :data:`METRIC_COLUMNS` in fingerprint order; pass the
+        mapping to :func:`known_pair_metrics` or the candidate engine.
+        """
+        wanted = sorted({str(item) for item in fingerprints if item})
+        connection = self._connection
+        connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS wanted_fp (fp TEXT PRIMARY KEY)"
+        )
+        connection.execute("DELETE FROM wanted_fp")
+        connection.executemany(
+            "INSERT INTO wanted_fp (fp) VALUES (?)",
+            ((item,) for item in wanted),
+        )
+        rows = connection.execute(
+            f"SELECT left_fp, right_fp, {', '.join(METRIC_COLUMNS)} "
+            "FROM pair_metrics "
+            "JOIN wanted_fp AS first ON first.fp = left_fp "
+            "JOIN wanted_fp AS second ON second.fp = right_fp "
+            "WHERE ruleset_sha256 = ? AND analysis_crs = ?",
+            (self.ruleset_sha256, self.analysis_crs),
+        )
+        known = {}
+        for row in rows:
+            values = list(row[2:])
+            values[0] = bool(values[0])
+            known[(row[0], row[1])] = tuple(values)
+        connection.execute("DELETE FROM wanted_fp")
+        return known
+
+    def record(self, left_key, right_key, values):
+        """Buffer freshly measured metrics oriented from left to right."""
+        if not left_key or not right_key:
+            return
+        pair, canonical = canonical_metric_pair(left_key, right_key, values)
+        self._pending[pair] = canonical
+
+    def mark_used(self, pairs):
+        """Refresh the age of reused ``(left_key, right_key)`` pairs."""
+        for left_key, right_key in pairs:
+            if left_key and right_key:
+                self._used.add(tuple(sorted((str(left_key), str(right_key)))))
+
+    def save(self):
+        """Write buffered metrics, then evict by age and by size."""
+        now = float(self._clock())
+        context = (self.ruleset_sha256, self.analysis_crs)
+        columns = _KEY_COLUMNS + METRIC_COLUMNS + ("used_at",)
+        with self._connection as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO pair_metrics ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                (
+                    context + pair + tuple(values) + (now,)
+                    for pair, values in sorted(self._pending.items())
+                ),
+            )
+            connection.executemany(
+                "UPDATE pair_metrics SET used_at = ? WHERE "
+                + " AND ".join(f"{column} = ?" for column in _KEY_COLUMNS),
+                (
+                    (now,) + context + pair
+                    for pair in sorted(self._used - set(self._pending))
+                ),
+            )
+            evicted = connection.execute(
+                "DELETE FROM pair_metrics WHERE used_at < ?",
+                (now - self.max_age_days * _SECONDS_PER_DAY,),
+            ).rowcount
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                evicted += connection.execute(
+                    "DELETE FROM pair_metrics WHERE rowid IN ("
+                    "SELECT rowid FROM pair_metrics "
+                    "ORDER BY used_at, rowid LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        self.reused_pair_count += len(self._used)
+        self.stored_pair_count += len(self._pending)
+        self.evicted_pair_count += max(0, evicted)
+        self._pending = {}
+        self._used = set()
+        return max(0, evicted)
+
+    def close(self):
+        self._connection.close()
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "metric_cache_reused_pairs": self.reused_pair_count,
+            "metric_cache_stored_pairs": self.stored_pair_count,
+            "metric_cache_evicted_pairs": self.evicted_pair_count,
+        }
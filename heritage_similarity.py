@@ -0,0 +1,156 @@
+"""Bounded name-similarity kernel for duplicate matching.
+
+:func:`sequence_ratio` returns exactly ``difflib.SequenceMatcher(None, a,
+b).ratio()``.  It runs the same longest-matching-block recursion without
+building a matcher object, which dominates the cost for short site names.
+Sequences of 200 or more elements are delegated to :mod:`difflib`, because
+its automatic "popular element" junk heuristic only applies at that length.
+
+:func:`sequence_ratio_at_least` answers threshold questions and exits early
+when the length or character-multiset upper bounds already rule a pair out.
+:class:`SimilarityMemo` caches ratios for one processing run.
+"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+
+
+# difflib.SequenceMatcher applies its autojunk heuristic from this length.
+AUTOJUNK_MIN_LENGTH = 200
+DEFAULT_MEMO_SIZE = 200_000
+
+
+def _ratio(matches, length):
+    # Same expression as difflib._calculate_ratio, so floats compare equal.
+    if length:
+        return 2.0 * matches / length
+    return 1.0
+
+
+def _positions(sequence):
+    positions = {}
+    for index, element in enumerate(sequence):
+        positions.setdefault(element, []).append(index)
+    return positions
+
+
+def _longest_match(left, positions, left_lo, left_hi, right_lo, right_hi):
+    """Return ``(i, j, size)`` like ``SequenceMatcher.find_longest_match``.
+
+    Without junk elements difflib's extension passes cannot grow the block,
+    so the dynamic-programming scan alone reproduces its tie-breaking.
+    """
+    best_i, best_j, best_size = left_lo, right_lo, 0
+    lengths = {}
+    for i in range(left_lo, left_hi):
+        next_lengths = {}
+        for j in positions.get(left[i], ()):
+            if j < right_lo:
+                continue
+            if j >= right_hi:
+                break
+            size = next_lengths[j] = lengths.get(j - 1, 0) + 1
+            if size > best_size:
+                best_i, best_j, best_size = i - size + 1, j - size + 1, size
+        lengths = next_lengths
+    return best_i, best_j, best_size
+
+
+def matching_characters(left, right):
+    """Return the total size of difflib's matching blocks for two sequences."""
+    if len(right) >= AUTOJUNK_MIN_LENGTH:
+        return sum(
+            block.size
+            for block in SequenceMatcher(None, left, right).get_matching_blocks()
+        )
+    positions = _positions(right)
+    total = 0
+    queue = [(0, len(left), 0, len(right))]
+    while queue:
+        left_lo, left_hi, right_lo, right_hi = queue.pop()
+        i, j, size = _longest_match(
+            left, positions, left_lo, left_hi, right_lo, right_hi
+        )
+        if size:
+            total += size
+            if left_lo < i and right_lo < j:
+                queue.append((left_lo, i, right_lo, j))
+            if i + size < left_hi and j + size < right_hi:
+                queue.append((i + size, left_hi, j + size, right_hi))
+    return total
+
+
+def longest_match_size(left, right):
+    """Return ``SequenceMatcher(None, left, right)`` longest block size."""
+    if len(right) >= AUTOJUNK_MIN_LENGTH:
+        return SequenceMatcher(None, left, right).find_longest_match(
+            0, len(left), 0, len(right)
+        ).size
+    return _longest_match(
+        left, _positions(right), 0, len(left), 0, len(right)
+    )[2]
+
+
+def sequence_ratio(left, right):
+    """Return ``SequenceMatcher(None, left, right).ratio()``."""
+    return _ratio(matching_characters(left, right), len(left) + len(right))
+
+
+def _bounds_allow(left, right, threshold):
+    length = len(left) + len(right)
+    if _ratio(min(len(left), len(right)), length) < threshold:
+        return False
+    shared = sum((Counter(left) & Counter(right)).values())
+    return _ratio(shared, length) >= threshold
+
+
+def sequence_ratio_at_least(left, right, threshold):
+    """Return whether :func:`sequence_ratio` is at least ``threshold``.
+
+    The length bound and the character-multiset bound are difflib's
+    ``real_quick_ratio`` and ``quick_ratio``; both can only overestimate the
+    ratio, so a pair they reject is never accepted by the full ratio.
+    """
+    if not _bounds_allow(left, right, threshold):
+        return False
+    return sequence_ratio(left, right) >= threshold
+
+
+class SimilarityMemo:
+    """Ratios for one run, keyed on the ordered pair of compared keys.
+
+    ``SequenceMatcher`` is not symmetric in general, so ``(a, b)`` and
+    ``(b, a)`` are separate entries.  The memo is cleared when it reaches
+    ``max_entries`` rather than growing with a nationwide run.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MEMO_SIZE):
+        self.max_entries = max(1, int(max_entries))
+        self._ratios = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._ratios)
+
+    def ratio(self, left, right):
+        key = (left, right)
+        value = self._ratios.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = sequence_ratio(left, right)
+        if len(self._ratios) >= self.max_entries:
+            self._ratios.clear()
+        self._ratios[key] = value
+        return value
+
+    def ratio_at_least(self, left, right, threshold):
+        value = self._ratios.get((left, right))
+        if value is not None:
+            self.hits += 1
+            return value >= threshold
+        if not _bounds_allow(left, right, threshold):
+            return False
+        return self.ratio(left, right) >= threshold
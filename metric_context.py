@@ -4,6 +4,11 @@ The plugin receives source data in many coordinate reference systems.  This
 module keeps the source, analysis, and output CRS roles explicit so that a
 value named ``DIST_M`` or ``area_m2`` is never calculated in degrees or feet.
 
+Point layers such as distribution maps hold tens of thousands of features.
+:func:`transform_coordinates` hands a whole coordinate array to one
+``QgsCoordinateTransform`` call, so reprojecting those points does not pay
+for a geometry copy and a transform call per feature.
+
 QGIS is an optional import on purpose: the pure UTM-selection helpers remain
 usable in ordinary Python environments, while :class:`MetricContext` gives a
 clear error if its QGIS-dependent API is used without QGIS.
@@ -13,7 +18,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 try:  # pragma: no cover - availability is environment-specific
@@ -22,10 +27,12 @@ try:  # pragma: no cover - availability is environment-specific
         QgsCoordinateTransform,
         QgsCoordinateTransformContext,
         QgsGeometry,
+        QgsLineString,
         QgsPointXY,
         QgsProject,
         QgsRectangle,
         QgsUnitTypes,
+        QgsWkbTypes,
     )
 
     QGIS_AVAILABLE = True
@@ -167,6 +174,73 @@ def _point_xy(value: Any):
     )
 
 
+def is_flat_point(geometry: Any) -> bool:
+    """Return whether ``geometry`` is a non-empty single-part 2D point."""
+
+    return (
+        geometry is not None
+        and not geometry.isNull()
+        and not geometry.isEmpty()
+        and geometry.wkbType() == QgsWkbTypes.Point
+    )
+
+
+def transform_coordinates(
+    transform: Any,
+    xs: Iterable[float],
+    ys: Iterable[float],
+) -> Tuple[List[float], List[float]]:
+    """Return ``(xs, ys)`` transformed by ``transform`` in one call.
+
+    The coordinates travel as one ``QgsLineString``, whose transform passes
+    the whole array to PROJ at once.  The line is never validated, so a
+    single coordinate is as acceptable as many.  ``QgsCsException`` is left
+    to the caller, which knows the features involved.
+    """
+
+    _require_qgis()
+    xs = [float(x) for x in xs]
+    ys = [float(y) for y in ys]
+    if len(xs) != len(ys):
+        raise MetricContextError("Coordinate arrays must have equal length.")
+    if not xs:
+        return [], []
+    line = QgsLineString(xs, ys)
+    line.transform(transform)
+    return list(line.xVector()), list(line.yVector())
+
+
+def transform_point_geometries(geometries: Sequence[Any], transform: Any):
+    """Return transformed copies of the flat points among ``geometries``.
+
+    The result is aligned with ``geometries``.  Items that are not
+    :func:`is_flat_point` map to ``None``, and so does every item when the
+    batch transform fails, leaving the caller to transform those one by one
+    and report the failing feature.
+    """
+
+    results = [None] * len(geometries)
+    positions = [
+        position
+        for position, geometry in enumerate(geometries)
+        if is_flat_point(geometry)
+    ]
+    if not positions:
+        return results
+    points = [geometries[position].constGet() for position in positions]
+    try:
+        xs, ys = transform_coordinates(
+            transform,
+            [point.x() for point in points],
+            [point.y() for point in points],
+        )
+    except Exception:
+        return results
+    for position, x, y in zip(positions, xs, ys):
+        results[position] = QgsGeometry.fromPointXY(QgsPointXY(x, y))
+    return results
+
+
 def _crs_payload(crs: Any) -> Dict[str, Any]:
     authid = crs.authid()
     return {
@@ -341,6 +415,83 @@ class MetricContext:
 
         return self.transform_geometry(geometry, source_crs, self.analysis_crs)
 
+    def transform_coordinates(
+        self,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        source_crs: Any = None,
+        target_crs: Any = None,
+    ) -> Tuple[List[float], List[float]]:
+        """Return coordinate arrays transformed in one call.
+
+        The defaults mirror :meth:`transform_point`: source CRS to analysis
+        CRS.
+        """
+
+        source = _validated_crs(
+            self.source_crs if source_crs is None else source_crs,
+            "Coordinate source",
+        )
+        target = _validated_crs(
+            self.analysis_crs if target_crs is None else target_crs,
+            "Coordinate target",
+        )
+        if source == target:
+            xs = [float(x) for x in xs]
+            ys = [float(y) for y in ys]
+            if len(xs) != len(ys):
+                raise MetricContextError(
+                    "Coordinate arrays must have equal length."
+                )
+            return xs, ys
+        try:
+            return transform_coordinates(
+                QgsCoordinateTransform(source, target, self.transform_context),
+                xs,
+                ys,
+            )
+        except MetricContextError:
+            raise
+        except Exception as error:
+            raise MetricContextError(
+                "Coordinate transform failed: "
+                f"{source.authid()} -> {target.authid()}."
+            ) from error
+
+    def to_analysis_geometries(
+        self,
+        geometries: Iterable[Any],
+        source_crs: Any = None,
+    ) -> List[Any]:
+        """Return analysis-CRS copies of ``geometries`` in their order.
+
+        Flat single-part points are transformed together with
+        :func:`transform_point_geometries`; every other geometry, and every
+        point of a failed batch, goes through :meth:`to_analysis_geometry`.
+        """
+
+        geometries = list(geometries)
+        source = _validated_crs(
+            self.source_crs if source_crs is None else source_crs,
+            "Geometry source",
+        )
+        results = [None] * len(geometries)
+        if source != self.analysis_crs:
+            results = transform_point_geometries(
+                geometries,
+                QgsCoordinateTransform(
+                    source,
+                    self.analysis_crs,
+                    self.transform_context,
+                ),
+            )
+        return [
+            result
+            if result is not None
+            else self.to_analysis_geometry(geometry, source)
+            for geometry, result in zip(geometries, results)
+        ]
+
     def to_output_geometry(self, geometry: Any, source_crs: Any = None):
         """Return a geometry copy in the declared output CRS."""
 
@@ -466,7 +617,10 @@ __all__ = [
     "MetricContext",
     "MetricContextError",
     "QGIS_AVAILABLE",
+    "is_flat_point",
     "local_utm_authid",
     "local_utm_epsg",
+    "transform_coordinates",
+    "transform_point_geometries",
     "utm_zone_for_longitude",
 ]
@@ -0,0 +1,175 @@
+"""Run-scoped prepared GEOS engines for repeated pair predicates.
+
+Duplicate matching compares one geometry with every spatial-index hit.
+Without preparation GEOS converts and indexes a large designated-site polygon
+again for each of its hundreds of neighbours.  :class:`PreparedGeometryCache`
+keeps one prepared ``QgsGeometryEngine`` per geometry for a whole processing
+run, so the source-aware and cross-family passes share the work, and counts
+how many predicate calls went through a prepared engine.
+
+QGIS is an optional import, as in :mod:`metric_context`; the cache itself
+only needs an engine factory and is therefore testable without QGIS.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import zlib
+
+
+try:  # pragma: no cover - availability is environment-specific
+    from qgis.core import QgsGeometry
+
+    QGIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised outside QGIS
+    QGIS_AVAILABLE = False
+
+
+DEFAULT_MAX_ENGINES = 4096
+
+
+def _engine_value(result):
+    """Return an engine call's value across PyQGIS binding generations.
+
+    Some bindings return ``(value, error_message)`` for engine predicates.
+    """
+    if isinstance(result, tuple):
+        return result[0]
+    return result
+
+
+def geometry_boundary(geometry):
+    """Return a geometry's boundary, or ``None`` when it has none.
+
+    ``QgsGeometry.boundary()`` was added after some supported QGIS releases;
+    the abstract geometry API exposes the same operation on older LTR builds.
+    """
+    try:
+        boundary = geometry.boundary()
+    except AttributeError:
+        raw = geometry.constGet().boundary()
+        if raw is None:
+            return None
+        boundary = QgsGeometry(raw.clone())
+    if boundary is None or boundary.isEmpty():
+        return None
+    return boundary
+
+
+def _qgis_engine(geometry):
+    engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+    if engine is None:
+        return None
+    engine.prepareGeometry()
+    return engine
+
+
+def _geometry_checksum(geometry):
+    try:
+        payload = bytes(geometry.asWkb())
+    except (TypeError, ValueError):
+        payload = geometry.asWkt().encode("utf-8")
+    return zlib.crc32(payload), len(payload)
+
+
+class PreparedGeometry:
+    """One geometry bound to its prepared engine.
+
+    Methods mirror the ``QgsGeometry`` calls used by duplicate matching and
+    fall back to them when GEOS could not prepare the geometry.
+    """
+
+    def __init__(self, cache, key, geometry, engine):
+        self._cache = cache
+        self._key = key
+        self.geometry = geometry
+        self._engine = engine
+        self._boundary = None
+
+    def _call(self, method, other, fallback):
+        if self._engine is None:
+            self._cache.unprepared_calls += 1
+            return fallback(other)
+        self._cache.prepared_calls += 1
+        return _engine_value(getattr(self._engine, method)(other.constGet()))
+
+    def intersects(self, other):
+        return bool(self._call("intersects", other, self.geometry.intersects))
+
+    def distance(self, other):
+        return float(self._call("distance", other, self.geometry.distance))
+
+    def intersection(self, other):
+        if self._engine is None:
+            self._cache.unprepared_calls += 1
+            return self.geometry.intersection(other)
+        self._cache.prepared_calls += 1
+        result = _engine_value(self._engine.intersection(other.constGet()))
+        return QgsGeometry(result) if result is not None else QgsGeometry()
+
+    def boundary_distance(self, other):
+        """Measure boundary-to-boundary distance like the plugin helper.
+
+        Contained polygons therefore no longer collapse to a zero geometry
+        distance; points and collections use the ordinary distance.
+        """
+        if self._boundary is None:
+            boundary = geometry_boundary(self.geometry)
+            self._boundary = (
+                self._cache.prepared(self._key + ("boundary",), boundary)
+                if boundary is not None else False
+            )
+        other_boundary = geometry_boundary(other)
+        if self._boundary is False or other_boundary is None:
+            return self.distance(other)
+        return self._boundary.distance(other_boundary)
+
+
+class PreparedGeometryCache:
+    """Least-recently-used prepared engines for one processing run.
+
+    Keys are caller-chosen tuples such as ``(layer_id, feature_id)``.  A
+    WKB checksum guards each entry, so a key whose geometry was repaired or
+    replaced between passes gets a fresh engine instead of a stale one.
+    """
+
+    def __init__(self, max_engines=DEFAULT_MAX_ENGINES, engine_factory=None):
+        self.max_engines = max(1, int(max_engines))
+        self._engine_factory = engine_factory or _qgis_engine
+        self._entries = OrderedDict()
+        self.prepared_calls = 0
+        self.unprepared_calls = 0
+        self.engines_built = 0
+        self.engines_reused = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def prepared(self, key, geometry):
+        """Return a :class:`PreparedGeometry` for ``geometry`` under ``key``."""
+        key = tuple(key)
+        checksum = _geometry_checksum(geometry)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == checksum:
+            self._entries.move_to_end(key)
+            self.engines_reused += 1
+            return PreparedGeometry(self, key, geometry, entry[1])
+        try:
+            engine = self._engine_factory(geometry)
+        except Exception:
+            engine = None
+        self.engines_built += 1
+        self._entries[key] = (checksum, engine)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_engines:
+            self._entries.popitem(last=False)
+        return PreparedGeometry(self, key, geometry, engine)
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "prepared_predicate_calls": self.prepared_calls,
+            "unprepared_predicate_calls": self.unprepared_calls,
+            "prepared_engines_built": self.engines_built,
+            "prepared_engines_reused": self.engines_reused,
+        }
@@ -0,0 +1,324 @@
+"""Streamed, paged review of duplicate candidates.
+
+Both matching passes used to collect and sort every candidate before the
+review dialog could open.  :class:`ReviewQueue` is a heap that releases one
+page at a time in review order.  :class:`ReviewStream` fills it while the
+candidate generation is still running: each batch of new candidates is
+checked against the saved decisions, reusable ones are set aside and the
+rest are queued, so the dialog can open on the first page.  Pages taken
+while generation runs hold the best candidates found so far.
+
+Each candidate carries a canonical ``order``, its position in the finished
+candidate list, as the tie-breaker.  :meth:`ReviewQueue.drain` and
+:meth:`ReviewStream.in_review_order` therefore return exactly the list that
+a stable ``sort`` of the finished list produced, whatever order the batches
+arrived in.
+
+Pages the reviewer confirms are written to a :class:`ReviewCheckpoint`, an
+SQLite decision store beside the main one.  The main store is still saved
+only after the map output commits; a checkpoint left by a cancelled or
+failed run is merged into it on the next run.
+"""
+
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from pathlib import Path
+
+try:
+    from .heritage_identity_store import VALID_DECISIONS, DecisionStore
+except ImportError:
+    # Importable outside the plugin package, like the other run helpers.
+    from heritage_identity_store import VALID_DECISIONS, DecisionStore
+
+
+DEFAULT_REVIEW_PAGE_SIZE = 500
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+def review_priority(candidate):
+    """Sort key of source-aware candidates: auto-apply, score, then names."""
+    return (
+        not candidate.get("auto_apply", False),
+        -float(candidate.get("score", 0)),
+        str(candidate.get("left_name", "")),
+        str(candidate.get("right_name", "")),
+    )
+
+
+def candidate_pair(candidate):
+    """Return the sorted UID pair that identifies a candidate."""
+    return tuple(sorted((
+        str(candidate.get("left_uid", "")),
+        str(candidate.get("right_uid", "")),
+    )))
+
+
+def cross_family_priority(candidate):
+    """Sort key of cross-family candidates: score, then the UID pair."""
+    return (
+        -float(candidate.get("score", 0)),
+        str(candidate.get("left_uid", "")),
+        str(candidate.get("right_uid", "")),
+    )
+
+
+class ReviewQueue:
+    """Candidates ordered by ``key`` and released ``page_size`` at a time.
+
+    Ties are broken by each candidate's ``order``, which defaults to its
+    insertion position; explicit orders must be mutually comparable.
+    """
+
+    def __init__(
+        self,
+        candidates=(),
+        key=review_priority,
+        page_size=DEFAULT_REVIEW_PAGE_SIZE,
+    ):
+        if int(page_size) < 1:
+            raise ValueError("page_size must be positive")
+        self.key = key
+        self.page_size = int(page_size)
+        self._sequence = count()
+        self._heap = []
+        self._pair_kinds = set()
+        self.extend(candidates)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def _entry(self, candidate, order):
+        self._pair_kinds.add(candidate.get("pair_kind"))
+        sequence = next(self._sequence)
+        return (
+            self.key(candidate),
+            sequence if order is None else order,
+            sequence,
+            candidate,
+        )
+
+    def push(self, candidate, order=None):
+        heapq.heappush(self._heap, self._entry(candidate, order))
+
+    def extend(self, candidates, orders=None):
+        candidates = list(candidates)
+        orders = [None] * len(candidates) if orders is None else list(orders)
+        if self._heap:
+            for candidate, order in zip(candidates, orders):
+                self.push(candidate, order)
+            return
+        self._heap.extend(
+            self._entry(candidate, order)
+            for candidate, order in zip(candidates, orders)
+        )
+        heapq.heapify(self._heap)
+
+    def pair_kinds(self):
+        """Return the pair kinds of every candidate ever queued."""
+        return set(self._pair_kinds)
+
+    def pop_page(self, size=None):
+        """Remove and return the next ``size`` candidates in priority order."""
+        size = self.page_size if size is None else int(size)
+        heap = self._heap
+        return [
+            heapq.heappop(heap)[-1]
+            for _ in range(min(size, len(heap)))
+        ]
+
+    def pages(self):
+        while self._heap:
+            yield self.pop_page()
+
+    def drain(self):
+        """Remove and return every remaining candidate in priority order."""
+        remaining = sorted(self._heap)
+        self._heap = []
+        return [entry[-1] for entry in remaining]
+
+
+class ReviewStream:
+    """Route candidate batches to saved-decision reuse or the review queue.
+
+    With a ``decision_store`` every batch is looked up with
+    :meth:`DecisionStore.lookup_many`; reusable decisions are kept aside
+    and the remaining candidates are pushed to ``queue``.
+    """
+
+    def __init__(self, queue, decision_store=None, policy_version=None):
+        self.queue = queue
+        self.decision_store = decision_store
+        self.policy_version = policy_version
+        self.candidates = []
+        self.pending = []
+        self.reused = []
+        self.stale_count = 0
+        self._orders = {}
+        self._sequence = count()
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def add(self, candidates, orders=None):
+        """Queue one batch; return the number of candidates to review.
+
+        ``orders`` are the canonical positions of ``candidates`` as tuples;
+        a missing order is the candidate's arrival position.
+        """
+        candidates = list(candidates)
+        if orders is None:
+            orders = [None] * len(candidates)
+        orders = [
+            (next(self._sequence),) if order is None else order
+            for order in orders
+        ]
+        if not candidates:
+            return 0
+        self.candidates.extend(candidates)
+        for candidate, order in zip(candidates, orders):
+            self._orders[candidate_pair(candidate)] = order
+        if self.decision_store is None:
+            statuses = [None] * len(candidates)
+        else:
+            lookups = self.decision_store.lookup_many(
+                candidates,
+                policy_version=self.policy_version,
+            )
+            statuses = lookups.lookups
+        queued = []
+        queued_orders = []
+        for candidate, order, lookup in zip(candidates, orders, statuses):
+            if lookup is not None and lookup.reusable:
+                reused = dict(candidate)
+                reused["decision"] = lookup.decision
+                reused["decision_source"] = "reused"
+                self.reused.append(reused)
+                continue
+            if lookup is not None and lookup.status == "stale":
+                self.stale_count += 1
+            queued.append(candidate)
+            queued_orders.append(order)
+        self.pending.extend(queued)
+        self.queue.extend(queued, queued_orders)
+        return len(queued)
+
+    def order_of(self, candidate):
+        """Return the review-order sort key of a candidate or decision."""
+        order = self._orders.get(candidate_pair(candidate))
+        return (
+            self.queue.key(candidate),
+            order is None,
+            order if order is not None else 0,
+        )
+
+    def in_review_order(self, decisions):
+        """Return ``decisions`` sorted as the finished list would be.
+
+        Items whose pair this stream never saw follow the known items of
+        the same priority, in their given order.
+        """
+        return sorted(decisions, key=self.order_of)
+
+    def reused_decisions(self):
+        return self.in_review_order(self.reused)
+
+
+class ReviewCheckpoint:
+    """Confirmed review pages persisted before the run's output commits.
+
+    The checkpoint is an SQLite decision store at :meth:`path_for` of the
+    main store.  It is opened on the first confirmed page, so a run without
+    confirmed pages leaves no file behind.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._store = None
+        self.confirmed = 0
+
+    @staticmethod
+    def path_for(decision_store_path):
+        path = Path(decision_store_path)
+        return path.with_name(f"{path.stem}{CHECKPOINT_SUFFIX}{path.suffix}")
+
+    def confirm(self, decisions, policy_version):
+        """Record and save one confirmed page; return the decisions written.
+
+        Items without a storable decision, two UIDs and two fingerprints are
+        skipped, as the main store would reject them.
+        """
+        if self._store is None:
+            self._store = DecisionStore.load(self.path)
+        written = 0
+        for item in decisions:
+            if item.get("decision") not in VALID_DECISIONS:
+                continue
+            try:
+                self._store.record(
+                    item["left_uid"],
+                    item["left_fingerprint"],
+                    item["right_uid"],
+                    item["right_fingerprint"],
+                    decision=item["decision"],
+                    policy_version=policy_version,
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            written += 1
+        if written:
+            self._store.save(self.path)
+            self.confirmed += written
+        return written
+
+    def merge_into(self, store):
+        """Copy decisions left by an earlier run into ``store``.
+
+        Returns the number of decisions copied.  A decision the main store
+        already holds with a newer ``decided_at`` is kept.
+        """
+        if not self.path.exists():
+            return 0
+        checkpoint = DecisionStore.load(self.path)
+        try:
+            records = checkpoint.records()
+        finally:
+            checkpoint.close()
+        merged = 0
+        for record in records:
+            if any(
+                existing.pair_key == record.pair_key
+                and existing.decided_at >= record.decided_at
+                for existing in store.decisions_for_uids([record.left_uid])
+            ):
+                continue
+            store.record(
+                record.left_uid,
+                record.left_fingerprint,
+                record.right_uid,
+                record.right_fingerprint,
+                decision=record.decision,
+                policy_version=record.policy_version,
+                decided_at=record.decided_at,
+            )
+            merged += 1
+        return merged
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def discard(self):
+        """Close and delete the checkpoint once the main store holds it."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                Path(f"{self.path}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+        self.confirmed = 0
@@ -261,6 +261,7 @@ def _semantic_processing(value: Any) -> Any:
                 "artifact_errors",
                 "elapsed_seconds",
                 "gpkg_layers",
+                "zone_tagging_seconds",
             }:
                 continue
             result[str(key)] = _semantic_processing(item)
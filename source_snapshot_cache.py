@@ -0,0 +1,422 @@
+"""Preprocessed source-layer snapshots reused between runs.
+
+Nationwide designated-heritage layers change a few times a year, yet every
+run reprojected each source feature, repaired its geometry and rebuilt its
+source identity again.  :class:`SourceSnapshotCache` keeps the normalized
+features of a source layer in a local GeoPackage: the target-CRS geometry
+after repair, ``SRC_UID``/``SRC_FP``, a repair status and the source
+attributes.  Later runs read the snapshot through an extent filter instead.
+
+A snapshot is keyed by :func:`snapshot_key`, which covers the source file
+checksums, the target CRS, the applied encoding and everything else that
+changes the normalized features.  One GeoPackage per key keeps eviction
+simple: the least recently used files are deleted until the directory fits
+``max_bytes``.  The index is a small SQLite file, and like
+:mod:`heritage_metric_cache` a malformed index is replaced instead of
+failing the run.
+
+QGIS is an optional import, as in :mod:`prepared_geometry`; the key, the
+attribute encoding and the index are testable without QGIS.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections import namedtuple
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import time
+
+try:  # pragma: no cover - availability is environment-specific
+    from qgis.core import (
+        QgsFeature,
+        QgsField,
+        QgsFields,
+        QgsVectorFileWriter,
+        QgsVectorLayer,
+        QgsWkbTypes,
+    )
+    from qgis.PyQt.QtCore import QByteArray, QDate, QDateTime, Qt, QTime, QVariant
+
+    QGIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised outside QGIS
+    QGIS_AVAILABLE = False
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+SNAPSHOT_LAYER_NAME = "snapshot"
+INDEX_FILE_NAME = "index.sqlite"
+
+STATUS_VALID = 0
+STATUS_REPAIRED = 1
+STATUS_INVALID = 2
+
+# The part of a ``SourceIdentity`` that consolidation reads back.
+CachedIdentity = namedtuple("CachedIdentity", ("uid", "content_fingerprint"))
+
+
+def snapshot_key(*, source_checksums, target_crs, encoding, **context):
+    """Return the SHA-256 key of one normalized source layer.
+
+    ``source_checksums`` are the ``bundle_sha256`` values of the source
+    files; ``context`` holds any further JSON-compatible inputs, such as the
+    source role and the fields used for the source identity.
+    """
+    payload = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "sources": sorted(str(item) for item in source_checksums),
+        "target_crs": str(target_crs or ""),
+        "encoding": str(encoding or "").casefold(),
+        "context": context,
+    }
+    return hashlib.sha256(
+        json.dumps(
+            payload,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _encode_value(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "isNull") and value.isNull():
+        return None
+    kind = type(value).__name__
+    if kind in ("QDate", "QDateTime", "QTime"):
+        return {"$type": kind, "value": _iso_text(value, kind)}
+    if isinstance(value, (bytes, bytearray)) or kind == "QByteArray":
+        return {
+            "$type": "bytes",
+            "value": base64.b64encode(bytes(value)).decode("ascii"),
+        }
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            "$type": "map",
+            "value": {
+                str(key): _encode_value(item) for key, item in value.items()
+            },
+        }
+    return str(value)
+
+
+def _iso_text(value, kind):
+    if not QGIS_AVAILABLE:
+        return value.toString()
+    return value.toString(
+        Qt.ISODate if kind == "QDate" else Qt.ISODateWithMs
+    )
+
+
+def _decode_value(value):
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    kind = value.get("$type")
+    text = value.get("value")
+    if kind == "map":
+        return {key: _decode_value(item) for key, item in text.items()}
+    if kind == "bytes":
+        data = base64.b64decode(text)
+        return QByteArray(data) if QGIS_AVAILABLE else data
+    if not QGIS_AVAILABLE:
+        return text
+    if kind == "QDate":
+        return QDate.fromString(text, Qt.ISODate)
+    if kind == "QDateTime":
+        return QDateTime.fromString(text, Qt.ISODateWithMs)
+    if kind == "QTime":
+        return QTime.fromString(text, Qt.ISODateWithMs)
+    return text
+
+
+def encode_attributes(values):
+    """Serialize a feature's attribute list, keeping date and binary types."""
+    return json.dumps(
+        [_encode_value(value) for value in values],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def decode_attributes(text):
+    """Return the attribute list written by :func:`encode_attributes`."""
+    return [_decode_value(value) for value in json.loads(text or "[]")]
+
+
+class SourceSnapshotCache:
+    """Directory of snapshot GeoPackages with a size-bounded LRU index.
+
+    Use :meth:`open`; :meth:`lookup` returns a snapshot path and refreshes
+    its age, :meth:`store` registers a written snapshot and evicts the
+    least recently used ones beyond ``max_bytes``, and :meth:`purge`
+    removes every snapshot.
+    """
+
+    def __init__(
+        self,
+        directory,
+        connection,
+        *,
+        max_bytes=DEFAULT_MAX_BYTES,
+        load_status="new",
+        clock=time.time,
+    ):
+        self.directory = Path(directory)
+        self._connection = connection
+        self.max_bytes = max(0, int(max_bytes))
+        self.load_status = load_status
+        self._clock = clock
+        self.hit_count = 0
+        self.miss_count = 0
+        self.stored_count = 0
+        self.evicted_count = 0
+
+    @classmethod
+    def open(cls, directory, **options):
+        """Open or create the snapshot directory and its index."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        index_path = directory / INDEX_FILE_NAME
+        load_status = "loaded" if index_path.exists() else "missing"
+        try:
+            connection = cls._connect(index_path)
+        except sqlite3.DatabaseError:
+            index_path.unlink()
+            connection = cls._connect(index_path)
+            load_status = "reset"
+        return cls(directory, connection, load_status=load_status, **options)
+
+    @staticmethod
+    def _connect(index_path):
+        connection = sqlite3.connect(str(index_path))
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SNAPSHOT_FORMAT_VERSION):
+                connection.execute("DROP TABLE IF EXISTS snapshots")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "key TEXT PRIMARY KEY, file_name TEXT NOT NULL, "
+                "layer_name TEXT, feature_count INTEGER NOT NULL, "
+                "size_bytes INTEGER NOT NULL, created_at REAL NOT NULL, "
+                "used_at REAL NOT NULL)"
+            )
+            connection.execute(
+                f"PRAGMA user_version = {SNAPSHOT_FORMAT_VERSION}"
+            )
+            connection.commit()
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM snapshots"
+        ).fetchone()[0]
+
+    def total_bytes(self):
+        return int(self._connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM snapshots"
+        ).fetchone()[0])
+
+    def path_for(self, key):
+        """Return where the snapshot of ``key`` is (or will be) written."""
+        return self.directory / f"{key}.gpkg"
+
+    def lookup(self, key):
+        """Return the snapshot path of ``key``, or ``None`` on a miss."""
+        row = self._connection.execute(
+            "SELECT file_name FROM snapshots WHERE key = ?",
+            (key,),
+        ).fetchone()
+        path = self.directory / row[0] if row else None
+        if path is None or not path.is_file():
+            if row:
+                with self._connection as connection:
+                    connection.execute(
+                        "DELETE FROM snapshots WHERE key = ?",
+                        (key,),
+                    )
+            self.miss_count += 1
+            return None
+        with self._connection as connection:
+            connection.execute(
+                "UPDATE snapshots SET used_at = ? WHERE key = ?",
+                (float(self._clock()), key),
+            )
+        self.hit_count += 1
+        return path
+
+    def store(self, key, path, *, feature_count, layer_name=None):
+        """Register the snapshot written to ``path`` and evict by size.
+
+        Returns the evicted keys; a snapshot larger than ``max_bytes`` is
+        evicted at once.
+        """
+        path = Path(path)
+        now = float(self._clock())
+        with self._connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshots (key, file_name, "
+                "layer_name, feature_count, size_bytes, created_at, "
+                "used_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path.name,
+                    layer_name,
+                    int(feature_count),
+                    _file_size(path),
+                    now,
+                    now,
+                ),
+            )
+        self.stored_count += 1
+        return self.evict()
+
+    def evict(self):
+        """Delete least recently used snapshots until ``max_bytes`` fits."""
+        excess = self.total_bytes() - self.max_bytes
+        evicted = []
+        if excess <= 0:
+            return evicted
+        rows = self._connection.execute(
+            "SELECT key, file_name, size_bytes FROM snapshots "
+            "ORDER BY used_at, created_at, key"
+        ).fetchall()
+        for key, file_name, size_bytes in rows:
+            if excess <= 0:
+                break
+            _remove_snapshot_files(self.directory / file_name)
+            evicted.append(key)
+            excess -= int(size_bytes)
+        with self._connection as connection:
+            connection.executemany(
+                "DELETE FROM snapshots WHERE key = ?",
+                ((key,) for key in evicted),
+            )
+        self.evicted_count += len(evicted)
+        return evicted
+
+    def purge(self):
+        """Remove every snapshot; return ``(snapshot_count, bytes_freed)``."""
+        count = len(self)
+        freed = 0
+        for path in sorted(self.directory.glob("*.gpkg*")):
+            freed += _file_size(path)
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        with self._connection as connection:
+            connection.execute("DELETE FROM snapshots")
+        return count, freed
+
+    def close(self):
+        self._connection.close()
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "source_snapshot_hits": self.hit_count,
+            "source_snapshot_misses": self.miss_count,
+            "source_snapshots_stored": self.stored_count,
+            "source_snapshots_evicted": self.evicted_count,
+        }
+
+
+def _file_size(path):
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove_snapshot_files(path):
+    for candidate in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+        try:
+            candidate.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            continue
+
+
+def snapshot_fields():
+    """Return the GeoPackage fields of a snapshot layer."""
+    fields = QgsFields()
+    fields.append(QgsField("SRC_UID", QVariant.String))
+    fields.append(QgsField("SRC_FP", QVariant.String))
+    fields.append(QgsField("SRC_STATUS", QVariant.Int))
+    fields.append(QgsField("SRC_ATTRS", QVariant.String))
+    return fields
+
+
+def snapshot_feature(fields, geometry, source_feature, status, identity=None):
+    """Build one snapshot row for a normalized ``source_feature``."""
+    feature = QgsFeature(fields)
+    if geometry is not None and not geometry.isNull():
+        feature.setGeometry(geometry)
+    feature["SRC_UID"] = identity.uid if identity else None
+    feature["SRC_FP"] = identity.content_fingerprint if identity else None
+    feature["SRC_STATUS"] = int(status)
+    feature["SRC_ATTRS"] = encode_attributes(source_feature.attributes())
+    return feature
+
+
+def restore_source_feature(row, source_fields):
+    """Rebuild the source feature of a snapshot row for attribute lookups."""
+    feature = QgsFeature(source_fields)
+    feature.setAttributes(decode_attributes(row["SRC_ATTRS"]))
+    if row.hasGeometry():
+        feature.setGeometry(row.geometry())
+    return feature
+
+
+def write_snapshot(path, features, crs, transform_context):
+    """Write ``features`` to a new GeoPackage at ``path`` atomically."""
+    path = Path(path)
+    temporary_path = path.with_name(f".{path.name}.partial.gpkg")
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.fileEncoding = "UTF-8"
+    options.layerName = SNAPSHOT_LAYER_NAME
+    try:
+        writer = QgsVectorFileWriter.create(
+            str(temporary_path),
+            snapshot_fields(),
+            QgsWkbTypes.Unknown,
+            crs,
+            transform_context,
+            options,
+        )
+        if writer.hasError() != QgsVectorFileWriter.NoError:
+            raise OSError(writer.errorMessage())
+        for feature in features:
+            if not writer.addFeature(feature):
+                raise OSError(writer.errorMessage())
+        writer.flushBuffer()
+        del writer
+        os.replace(str(temporary_path), str(path))
+    finally:
+        _remove_snapshot_files(temporary_path)
+
+
+def open_snapshot(path):
+    """Return the snapshot layer at ``path``, or ``None`` if unreadable."""
+    layer = QgsVectorLayer(
+        f"{path}|layername={SNAPSHOT_LAYER_NAME}",
+        Path(path).stem,
+        "ogr",
+    )
+    return layer if layer.isValid() else None
@@ -0,0 +1,79 @@
+"""Bulk-loaded spatial indexes over feature bounds.
+
+Duplicate matching and the Zone lookup used to copy every feature into a
+``QgsFeature`` with its full geometry only to call
+``QgsSpatialIndex.addFeature``, and every insert split R-tree nodes again.
+:func:`bulk_spatial_index` streams ``(feature_id, bounds)`` entries into the
+``QgsSpatialIndex`` iterator constructor instead, which packs the tree with
+the sort-tile-recursive (STR) bulk loader in one pass.  Each fetched entry
+carries only a rectangle geometry, so no second copy of the source
+geometries is held while the index is built.
+
+QGIS is an optional import, as in :mod:`prepared_geometry`;
+:func:`geometry_bounds` only needs ``isEmpty`` and ``boundingBox`` and is
+therefore testable without QGIS.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+
+try:  # pragma: no cover - availability is environment-specific
+    from qgis.core import (
+        QgsAbstractFeatureIterator,
+        QgsFeatureIterator,
+        QgsFeatureRequest,
+        QgsGeometry,
+        QgsSpatialIndex,
+    )
+
+    QGIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised outside QGIS
+    QgsAbstractFeatureIterator = object
+    QGIS_AVAILABLE = False
+
+
+def geometry_bounds(items):
+    """Yield ``(feature_id, bounds)`` for ``(feature_id, geometry)`` items.
+
+    Null and empty geometries are skipped, as ``addFeature`` skipped them.
+    """
+    for feature_id, geometry in items:
+        if geometry is None or geometry.isEmpty():
+            continue
+        yield feature_id, geometry.boundingBox()
+
+
+class _BoundsIterator(QgsAbstractFeatureIterator):
+    """Feature iterator that yields one bounds rectangle per entry."""
+
+    def __init__(self, entries):
+        super().__init__(QgsFeatureRequest())
+        self._entries = entries
+
+    def fetchFeature(self, feature):
+        entry = next(self._entries, None)
+        if entry is None:
+            return False
+        feature_id, bounds = entry
+        feature.setId(feature_id)
+        feature.setGeometry(QgsGeometry.fromRect(bounds))
+        feature.setValid(True)
+        return True
+
+    def rewind(self):
+        return False
+
+    def close(self):
+        return True
+
+
+def bulk_spatial_index(entries):
+    """Return a ``QgsSpatialIndex`` bulk-loaded from ``(id, bounds)``."""
+    entries = iter(entries)
+    first = next(entries, None)
+    if first is None:
+        return QgsSpatialIndex()
+    iterator = _BoundsIterator(chain((first,), entries))
+    return QgsSpatialIndex(QgsFeatureIterator(iterator))
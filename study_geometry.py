@@ -0,0 +1,185 @@
+"""Dissolved study-area geometry shared by one processing run.
+
+Consolidation, numbering and the buffer tiers each merged the study layer
+with a sequential ``combine()`` loop, which copies the growing union once per
+parcel, and then transformed the result to the analysis CRS again.
+:class:`StudyGeometry` dissolves the parcels once with a cascaded
+``unaryUnion``, keeps one copy per CRS, and builds buffer rings and a prepared
+GEOS engine for ``within``/``distance`` only on first use.
+
+QGIS is an optional import, as in :mod:`prepared_geometry`; the union,
+transform and engine factory are injectable, so the per-CRS cache is
+testable without QGIS.
+"""
+
+from __future__ import annotations
+
+try:
+    from .prepared_geometry import _engine_value, _qgis_engine
+except ImportError:
+    # Importable outside the plugin package, like the other run helpers.
+    from prepared_geometry import _engine_value, _qgis_engine
+
+try:  # pragma: no cover - availability is environment-specific
+    from qgis.core import (
+        QgsCoordinateTransform,
+        QgsCoordinateTransformContext,
+        QgsGeometry,
+    )
+
+    QGIS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised outside QGIS
+    QGIS_AVAILABLE = False
+
+
+def crs_key(crs):
+    """Return a hashable key identifying ``crs``."""
+    to_wkt = getattr(crs, "toWkt", None)
+    return to_wkt() if callable(to_wkt) else crs
+
+
+def _qgis_union(geometries):
+    return QgsGeometry.unaryUnion(geometries)
+
+
+def _qgis_transform(transform_context):
+    if transform_context is None:
+        transform_context = QgsCoordinateTransformContext()
+
+    def transform(geometry, source_crs, target_crs):
+        result = QgsGeometry(geometry)
+        result.transform(
+            QgsCoordinateTransform(source_crs, target_crs, transform_context)
+        )
+        return result
+
+    return transform
+
+
+def _copy(geometry):
+    return QgsGeometry(geometry) if QGIS_AVAILABLE else geometry
+
+
+class StudyGeometry:
+    """The study layer's parcels dissolved once and cached per CRS.
+
+    ``geometry()`` returns copies, so callers may transform or edit the
+    result without touching the cached union.
+    """
+
+    def __init__(
+        self,
+        geometries,
+        crs,
+        transform_context=None,
+        union=None,
+        transform=None,
+        engine_factory=None,
+    ):
+        self.crs = crs
+        self._union = union or _qgis_union
+        self._transform = transform or _qgis_transform(transform_context)
+        self._engine_factory = engine_factory or _qgis_engine
+        self._parts = [
+            geometry for geometry in geometries
+            if geometry is not None and not geometry.isNull()
+        ]
+        self._geometries = {}
+        self._engines = {}
+        self._buffers = {}
+        self.unions_built = 0
+        self.transforms_built = 0
+
+    @classmethod
+    def from_layer(cls, layer, transform_context=None):
+        """Collect the geometries of every feature of ``layer``."""
+        return cls(
+            (
+                feature.geometry()
+                for feature in layer.getFeatures()
+                if feature.hasGeometry()
+            ),
+            layer.crs(),
+            transform_context=transform_context,
+        )
+
+    def is_empty(self):
+        return self._source_geometry() is None
+
+    def _source_geometry(self):
+        key = crs_key(self.crs)
+        if key not in self._geometries:
+            geometry = None
+            if self._parts:
+                geometry = self._union(self._parts)
+                self.unions_built += 1
+                if geometry is not None and geometry.isNull():
+                    geometry = None
+            self._geometries[key] = geometry
+            self._parts = []
+        return self._geometries[key]
+
+    def _cached(self, crs=None):
+        source = self._source_geometry()
+        if crs is None or source is None:
+            return source
+        key = crs_key(crs)
+        if key not in self._geometries:
+            self._geometries[key] = self._transform(source, self.crs, crs)
+            self.transforms_built += 1
+        return self._geometries[key]
+
+    def geometry(self, crs=None):
+        """Return the dissolved study area in ``crs`` (default: its own)."""
+        geometry = self._cached(crs)
+        return None if geometry is None else _copy(geometry)
+
+    def _engine(self, crs):
+        key = crs_key(self.crs if crs is None else crs)
+        if key not in self._engines:
+            geometry = self._cached(crs)
+            engine = None
+            if geometry is not None:
+                try:
+                    engine = self._engine_factory(geometry)
+                except Exception:
+                    engine = None
+            self._engines[key] = engine
+        return self._engines[key]
+
+    def within(self, other, crs=None):
+        """Whether ``other`` (already in ``crs``) lies within the study area."""
+        geometry = self._cached(crs)
+        if geometry is None or other is None or other.isNull():
+            return False
+        engine = self._engine(crs)
+        if engine is None:
+            return bool(other.within(geometry))
+        return bool(_engine_value(engine.contains(other.constGet())))
+
+    def distance(self, other, crs=None):
+        """Distance from ``other`` (already in ``crs``) to the study area."""
+        geometry = self._cached(crs)
+        if geometry is None:
+            return 0.0
+        engine = self._engine(crs)
+        if engine is None:
+            return float(geometry.distance(other))
+        return float(_engine_value(engine.distance(other.constGet())))
+
+    def buffers(self, distances, segments, crs=None):
+        """Return ``[{'dist', 'geom'}]`` rings in ascending distance order."""
+        geometry = self._cached(crs)
+        if geometry is None:
+            return []
+        key = crs_key(self.crs if crs is None else crs)
+        rings = []
+        for distance in sorted(distances):
+            buffer_key = (key, distance, segments)
+            if buffer_key not in self._buffers:
+                self._buffers[buffer_key] = geometry.buffer(distance, segments)
+            rings.append({
+                "dist": distance,
+                "geom": _copy(self._buffers[buffer_key]),
+            })
+        return rings
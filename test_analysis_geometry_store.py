@@ -0,0 +1,124 @@
+import unittest
+
+from analysis_geometry_store import AnalysisGeometryStore
+
+
+class Geometry:
+    def __init__(self, name):
+        self.name = name
+
+    def boundingBox(self):
+        return ("bounds", self.name)
+
+
+class CountingContext:
+    def __init__(self, analysis_crs="EPSG:5186"):
+        self.analysis_crs = analysis_crs
+        self.transformed = []
+        self.batches = []
+
+    def to_analysis_geometry(self, geometry, source_crs=None):
+        self.transformed.append(geometry.name)
+        return Geometry(f"{geometry.name}@{self.analysis_crs}")
+
+    def to_analysis_geometries(self, geometries, source_crs=None):
+        self.batches.append([geometry.name for geometry in geometries])
+        return [
+            Geometry(f"{geometry.name}@{self.analysis_crs}")
+            for geometry in geometries
+        ]
+
+
+def store(**options):
+    return AnalysisGeometryStore(size_of=lambda geometry: 10, **options)
+
+
+class AnalysisGeometryStoreTests(unittest.TestCase):
+    def test_features_are_transformed_once_and_keep_their_bounds(self):
+        geometries = store()
+        context = CountingContext()
+
+        first = geometries.get(context, "layer", 1, Geometry("a"))
+        second = geometries.get(context, "layer", 1, Geometry("a"))
+
+        self.assertEqual(context.transformed, ["a"])
+        self.assertEqual(second.geometry.name, "a@EPSG:5186")
+        self.assertEqual(first.bounds, ("bounds", "a@EPSG:5186"))
+        self.assertEqual(geometries.statistics()["analysis_geometry_hits"], 1)
+
+    def test_get_many_batches_only_missing_features(self):
+        geometries = store()
+        context = CountingContext()
+        geometries.get(context, "layer", 2, Geometry("b"))
+
+        stored = geometries.get_many(
+            context,
+            "layer",
+            [(1, Geometry("a")), (2, Geometry("b")), (3, Geometry("c"))],
+        )
+
+        self.assertEqual(
+            [item.geometry.name for item in stored],
+            ["a@EPSG:5186", "b@EPSG:5186", "c@EPSG:5186"],
+        )
+        self.assertEqual(context.batches, [["a", "c"]])
+
+    def test_repair_invalidates_the_stored_revision(self):
+        geometries = store()
+        context = CountingContext()
+        geometries.get(context, "layer", 1, Geometry("invalid"))
+
+        geometries.invalidate("layer", 1)
+        repaired = geometries.get(context, "layer", 1, Geometry("repaired"))
+
+        self.assertEqual(repaired.geometry.name, "repaired@EPSG:5186")
+        self.assertEqual(geometries.revision("layer", 1), 1)
+        self.assertEqual(
+            geometries.statistics()["analysis_geometry_invalidations"],
+            1,
+        )
+
+    def test_layers_and_analysis_crs_are_part_of_the_key(self):
+        geometries = store()
+        utm = CountingContext("EPSG:32652")
+
+        geometries.get(CountingContext(), "first", 1, Geometry("a"))
+        other_layer = geometries.get(utm, "second", 1, Geometry("b"))
+        other_crs = geometries.get(utm, "first", 1, Geometry("a"))
+
+        self.assertEqual(other_layer.geometry.name, "b@EPSG:32652")
+        self.assertEqual(other_crs.geometry.name, "a@EPSG:32652")
+
+    def test_least_recently_used_entries_are_evicted_by_size(self):
+        geometries = store(max_bytes=25)
+        context = CountingContext()
+        geometries.get(context, "layer", 1, Geometry("a"))
+        geometries.get(context, "layer", 2, Geometry("b"))
+        geometries.get(context, "layer", 1, Geometry("a"))
+
+        geometries.get(context, "layer", 3, Geometry("c"))
+        geometries.get(context, "layer", 1, Geometry("a"))
+        geometries.get(context, "layer", 2, Geometry("b"))
+
+        self.assertEqual(context.transformed, ["a", "b", "c", "b"])
+        self.assertEqual(geometries.total_bytes, 20)
+        self.assertEqual(
+            geometries.statistics()["analysis_geometry_evictions"],
+            2,
+        )
+
+    def test_oversized_geometries_are_returned_without_being_kept(self):
+        geometries = AnalysisGeometryStore(
+            max_bytes=5,
+            size_of=lambda geometry: 10,
+        )
+        context = CountingContext()
+
+        stored = geometries.get(context, "layer", 1, Geometry("a"))
+
+        self.assertEqual(stored.geometry.name, "a@EPSG:5186")
+        self.assertEqual(len(geometries), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import math
+import unittest
+
+from buffer_tiers import BufferTiers
+
+
+class RecordingRingTest:
+    def __init__(self, inside=()):
+        self.inside = set(inside)
+        self.calls = []
+
+    def __call__(self, key, ring_index):
+        self.calls.append((key, ring_index))
+        return (key, ring_index) in self.inside
+
+
+class BufferTiersTests(unittest.TestCase):
+    def test_distances_away_from_edges_skip_the_ring_test(self):
+        ring_test = RecordingRingTest()
+        tiers = BufferTiers([100.0, 500.0, 1000.0], ring_test)
+
+        self.assertEqual(tiers.tier("a", 0.0), 0)
+        self.assertEqual(tiers.tier("b", 250.0), 1)
+        self.assertEqual(tiers.tier("c", 900.0), 2)
+        self.assertEqual(tiers.tier("d", 2000.0), 3)
+        self.assertEqual(ring_test.calls, [])
+
+    def test_edge_band_is_decided_by_the_ring_test(self):
+        ring_test = RecordingRingTest(inside={("near", 1)})
+        tiers = BufferTiers([100.0, 500.0], ring_test)
+
+        self.assertEqual(tiers.tier("near", 499.0), 1)
+        self.assertEqual(tiers.tier("outside", 503.0), 2)
+        self.assertEqual(ring_test.calls, [("near", 1), ("outside", 1)])
+
+    def test_tolerance_has_an_absolute_floor(self):
+        tiers = BufferTiers([10.0], RecordingRingTest())
+
+        self.assertEqual(tiers.edge_tolerance(10.0), 1.0)
+        self.assertEqual(tiers.edge_tolerance(5000.0), 50.0)
+
+    def test_missing_distance_tests_every_ring_in_order(self):
+        ring_test = RecordingRingTest(inside={("a", 2)})
+        tiers = BufferTiers([100.0, 500.0, 1000.0], ring_test)
+
+        self.assertEqual(tiers.tier("a"), 2)
+        self.assertEqual(tiers.tier("b", math.nan), 3)
+        self.assertEqual(
+            ring_test.calls,
+            [("a", 0), ("a", 1), ("a", 2), ("b", 0), ("b", 1), ("b", 2)],
+        )
+
+    def test_no_rings_return_tier_zero(self):
+        tiers = BufferTiers([], RecordingRingTest())
+
+        self.assertEqual(len(tiers), 0)
+        self.assertEqual(tiers.tier("a", 10.0), 0)
+
+    def test_statistics_count_both_decisions(self):
+        ring_test = RecordingRingTest(inside={("edge", 0)})
+        tiers = BufferTiers([100.0, 500.0], ring_test)
+        tiers.tier("far", 300.0)
+        tiers.tier("edge", 100.0)
+
+        self.assertEqual(
+            tiers.statistics(),
+            {"tier_distance_decisions": 2, "tier_ring_tests": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
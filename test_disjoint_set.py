@@ -0,0 +1,68 @@
+import unittest
+
+from disjoint_set import DisjointSet
+
+
+class DisjointSetTests(unittest.TestCase):
+    def test_components_follow_first_added_members(self):
+        sets = DisjointSet(["uid-c", "uid-a", "uid-b", "uid-d"])
+
+        self.assertTrue(sets.union("uid-b", "uid-d"))
+        self.assertTrue(sets.union("uid-a", "uid-d"))
+        self.assertFalse(sets.union("uid-d", "uid-a"))
+
+        self.assertEqual(
+            sets.components(),
+            [["uid-c"], ["uid-a", "uid-b", "uid-d"]],
+        )
+        self.assertTrue(sets.connected("uid-a", "uid-b"))
+        self.assertFalse(sets.connected("uid-a", "uid-c"))
+
+    def test_min_size_skips_singletons(self):
+        sets = DisjointSet(["uid-a", "uid-b", "uid-c"])
+        sets.union("uid-c", "uid-a")
+
+        self.assertEqual(sets.components(min_size=2), [["uid-a", "uid-c"]])
+
+    def test_union_order_does_not_change_components(self):
+        pairs = [(f"uid-{left}", f"uid-{left + 1}") for left in range(0, 40, 2)]
+        pairs += [("uid-1", "uid-39"), ("uid-20", "uid-3")]
+        forward = DisjointSet(f"uid-{item}" for item in range(41))
+        backward = DisjointSet(f"uid-{item}" for item in range(41))
+
+        for left, right in pairs:
+            forward.union(left, right)
+        for left, right in reversed(pairs):
+            backward.union(right, left)
+
+        self.assertEqual(forward.components(), backward.components())
+
+    def test_unknown_items_are_added_on_union(self):
+        sets = DisjointSet()
+
+        sets.union("uid-b", "uid-a")
+
+        self.assertIn("uid-a", sets)
+        self.assertEqual(len(sets), 2)
+        self.assertEqual(sets.components(), [["uid-b", "uid-a"]])
+
+    def test_fresh_partition_shares_slots_but_not_unions(self):
+        numbers = DisjointSet(["uid-a", "uid-b", "uid-c"])
+        entities = numbers.fresh()
+
+        numbers.union("uid-a", "uid-b")
+        entities.union("uid-b", "uid-c")
+        numbers.add("uid-d")
+
+        self.assertEqual(
+            numbers.components(),
+            [["uid-a", "uid-b"], ["uid-c"], ["uid-d"]],
+        )
+        self.assertEqual(
+            entities.components(),
+            [["uid-a"], ["uid-b", "uid-c"], ["uid-d"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
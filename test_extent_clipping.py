@@ -0,0 +1,75 @@
+import unittest
+
+from extent_clipping import (
+    QGIS_AVAILABLE,
+    bounds_contain,
+    bounds_disjoint,
+    rectangle_bounds_of_ring,
+)
+
+
+class RectangleRingTests(unittest.TestCase):
+    def test_extent_ring_is_detected_in_either_orientation(self):
+        clockwise = [(0, 10), (20, 10), (20, 0), (0, 0), (0, 10)]
+
+        self.assertEqual(rectangle_bounds_of_ring(clockwise), (0, 0, 20, 10))
+        self.assertEqual(
+            rectangle_bounds_of_ring(list(reversed(clockwise))),
+            (0, 0, 20, 10),
+        )
+
+    def test_non_rectangles_are_rejected(self):
+        rings = [
+            [(0, 0), (20, 0), (20, 10), (0, 0)],
+            [(0, 0), (20, 0), (0, 10), (20, 10), (0, 0)],
+            [(0, 0), (20, 1), (20, 10), (0, 10), (0, 0)],
+            [(0, 0), (10, 0), (20, 0), (20, 10), (0, 10), (0, 0)],
+        ]
+
+        for ring in rings:
+            with self.subTest(ring=ring):
+                self.assertIsNone(rectangle_bounds_of_ring(ring))
+
+    def test_touching_bounds_are_neither_disjoint_nor_escaping(self):
+        extent = (0, 0, 100, 50)
+
+        self.assertFalse(bounds_disjoint(extent, (100, 10, 120, 20)))
+        self.assertTrue(bounds_disjoint(extent, (100.5, 10, 120, 20)))
+        self.assertTrue(bounds_contain(extent, (0, 0, 100, 50)))
+        self.assertFalse(bounds_contain(extent, (90, 40, 101, 45)))
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python runtime is not available")
+class ExtentClipperQgisTests(unittest.TestCase):
+    def test_fast_paths_match_geos_intersection(self):
+        from qgis.core import QgsGeometry, QgsRectangle
+
+        from extent_clipping import ExtentClipper
+
+        extent = QgsGeometry.fromRect(QgsRectangle(0, 0, 100, 50))
+        clipper = ExtentClipper(extent)
+        self.assertEqual(clipper.inner_bounds, (0, 0, 100, 50))
+
+        for wkt in (
+            "POLYGON((10 10,20 10,20 20,10 20,10 10))",
+            "POLYGON((90 40,110 40,110 60,90 60,90 40))",
+            "POLYGON((101 10,111 10,111 20,101 20,101 10))",
+            "POLYGON((100 10,110 10,110 20,100 20,100 10))",
+            "LINESTRING(-10 25,50 25)",
+            "POINT(0 0)",
+            "POINT(-1 0)",
+        ):
+            geometry = QgsGeometry.fromWkt(wkt)
+            with self.subTest(wkt=wkt):
+                intersects = geometry.intersects(extent)
+                self.assertEqual(clipper.intersects(geometry), intersects)
+                if intersects:
+                    self.assertTrue(
+                        clipper.clip(geometry).isGeosEqual(
+                            geometry.intersection(extent)
+                        )
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
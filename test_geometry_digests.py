@@ -0,0 +1,84 @@
+import threading
+import unittest
+
+from geometry_digests import GeometryDigests
+from heritage_identity_store import geometry_signature
+
+
+class GeometryDigestsTests(unittest.TestCase):
+    def test_digest_matches_geometry_signature_and_is_cached(self):
+        digests = GeometryDigests()
+        serialized = []
+
+        def payload():
+            serialized.append(1)
+            return b"wkb-a"
+
+        first = digests.digest(("layer", "wkb"), 1, payload)
+        second = digests.digest(("layer", "wkb"), 1, payload)
+
+        self.assertEqual(first, geometry_signature(b"wkb-a"))
+        self.assertEqual(second, first)
+        self.assertEqual(len(serialized), 1)
+        self.assertEqual(digests.statistics()["geometry_digests_computed"], 1)
+        self.assertEqual(digests.statistics()["geometry_digests_reused"], 1)
+
+    def test_sources_do_not_share_feature_ids(self):
+        digests = GeometryDigests()
+
+        digests.digest(("a", "wkb"), 1, b"first")
+
+        self.assertEqual(
+            digests.digest(("b", "wkb"), 1, b"second"),
+            geometry_signature(b"second"),
+        )
+        self.assertIsNone(digests.get(("c", "wkb"), 1))
+
+    def test_digest_many_hashes_only_missing_features(self):
+        digests = GeometryDigests()
+        digests.digest("layer", 1, b"one")
+
+        result = digests.digest_many(
+            "layer",
+            [(1, b"ignored"), (2, lambda: b"two"), (3, "POINT (1 2)")],
+        )
+
+        self.assertEqual(result, {
+            1: geometry_signature(b"one"),
+            2: geometry_signature(b"two"),
+            3: geometry_signature("POINT (1 2)"),
+        })
+        self.assertEqual(digests.computed, 3)
+        self.assertEqual(digests.reused, 1)
+
+    def test_large_batches_are_hashed_on_worker_threads(self):
+        digests = GeometryDigests(parallel_min_bytes=1)
+        caller = threading.get_ident()
+        resolved_on = set()
+
+        def payload(index):
+            def serialize():
+                resolved_on.add(threading.get_ident())
+                return bytes([index]) * 64
+            return serialize
+
+        items = [(index, payload(index)) for index in range(40)]
+        result = digests.digest_many("layer", items, max_workers=4)
+
+        self.assertEqual(
+            result,
+            {index: geometry_signature(bytes([index]) * 64) for index in range(40)},
+        )
+        self.assertEqual(resolved_on, {caller})
+        self.assertEqual(digests.parallel_batches, 1)
+
+    def test_small_batches_stay_serial(self):
+        digests = GeometryDigests()
+
+        digests.digest_many("layer", [(1, b"x")], max_workers=4)
+
+        self.assertEqual(digests.parallel_batches, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,508 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import unittest
+from unittest.mock import patch
+
+from heritage_candidate_metrics import (
+    PARALLEL_MIN_FEATURES,
+    SCAN_PARALLEL_MIN_FEATURES,
+    SHAPELY_AVAILABLE,
+    CandidateMetricTable,
+    default_scan_thread_count,
+    default_worker_count,
+    evaluate_metric_table,
+    evaluation_record,
+    known_pair_metrics,
+)
+from heritage_matching import (
+    PRESET_BALANCED,
+    ROLE_DISTRIBUTION,
+    ROLE_LOCAL_DESIGNATED,
+    ROLE_PROTECTION_ZONE,
+    evaluate_candidate,
+)
+
+if SHAPELY_AVAILABLE:
+    from shapely.geometry import Point, box
+
+    from heritage_candidate_metrics import (
+        build_candidate_metric_table,
+        collect_candidates,
+        geometries_from_wkb,
+        partition_tiles,
+    )
+
+
+def record(uid, role, name):
+    return {"uid": uid, "role": role, "name": name, "site_name": name}
+
+
+class NullVariant:
+    def isNull(self):
+        return True
+
+
+def scattered_layer(count=240):
+    roles = (ROLE_DISTRIBUTION, ROLE_LOCAL_DESIGNATED, ROLE_PROTECTION_ZONE)
+    wkbs = []
+    records = []
+    for index in range(count):
+        x = (index * 37) % 900
+        y = (index * 53) % 700
+        size = (5, 40, 160)[index % 3]
+        geometry = (
+            Point(x, y) if index % 11 == 0 else box(x, y, x + size, y + size)
+        )
+        wkbs.append(geometry.wkb)
+        records.append(record(
+            f"u{index}", roles[index % 3], f"합성 유적 {index % 9}"
+        ))
+    return wkbs, records
+
+
+def single_row_table(**metrics):
+    values = {
+        "intersects": True,
+        "overlap_ratio": 0.8,
+        "distance": 0.0,
+        "coverage_left": 0.8,
+        "coverage_right": 1.0,
+        "iou": 0.8,
+        "area_ratio": 0.8,
+        "centroid_distance": 1.0,
+        "boundary_distance": 0.0,
+        "geometry_pair": "polygon_polygon",
+    }
+    values.update(metrics)
+    return CandidateMetricTable(
+        left=(0,),
+        right=(1,),
+        checked_pair_count=1,
+        **{key: (value,) for key, value in values.items()},
+    )
+
+
+class MetricTableEvaluationTests(unittest.TestCase):
+    def test_table_rows_match_direct_evaluation(self):
+        records = [
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+            record("m1", ROLE_DISTRIBUTION, "합성 A유적"),
+        ]
+        table = single_row_table()
+
+        results = list(evaluate_metric_table(
+            records, table, preset=PRESET_BALANCED
+        ))
+
+        expected = evaluate_candidate(
+            records[0],
+            records[1],
+            preset=PRESET_BALANCED,
+            **table.metrics(0),
+        )
+        self.assertEqual(results, [(0, 1, expected)])
+
+    def test_rejected_rows_are_skipped_and_batches_are_reported(self):
+        records = [
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+            record("m1", ROLE_DISTRIBUTION, "전혀 다른 유적"),
+        ]
+        progress = []
+
+        results = list(evaluate_metric_table(
+            records,
+            single_row_table(overlap_ratio=0.01),
+            preset=PRESET_BALANCED,
+            batch_callback=lambda done, total: progress.append((done, total)),
+        ))
+
+        self.assertEqual(results, [])
+        self.assertEqual(progress, [(1, 1)])
+
+
+class KnownMetricTests(unittest.TestCase):
+    def test_known_metrics_are_returned_in_the_requested_orientation(self):
+        values = single_row_table(
+            coverage_left=0.25, geometry_pair="polygon_point"
+        ).values(0)
+        known = {("fp-a", "fp-b"): values}
+
+        forward = known_pair_metrics(known, "fp-a", "fp-b")
+        backward = known_pair_metrics(known, "fp-b", "fp-a")
+
+        self.assertEqual(forward, values)
+        self.assertEqual(backward[3:5], (1.0, 0.25))
+        self.assertEqual(backward[-1], "point_polygon")
+        self.assertEqual(backward[:3], values[:3])
+        self.assertIsNone(known_pair_metrics(known, "fp-a", "fp-c"))
+
+
+class WorkerPayloadTests(unittest.TestCase):
+    def test_evaluation_record_keeps_plain_policy_fields(self):
+        plain = evaluation_record({
+            "uid": "d1",
+            "role": ROLE_LOCAL_DESIGNATED,
+            "name": "합성 A유적",
+            "address": NullVariant(),
+            "project_name": 12,
+            "geometry": object(),
+        })
+
+        self.assertEqual(plain["uid"], "d1")
+        self.assertIsNone(plain["address"])
+        self.assertEqual(plain["project_name"], 12)
+        self.assertNotIn("geometry", plain)
+
+    def test_small_layers_stay_in_process(self):
+        self.assertEqual(
+            default_worker_count(PARALLEL_MIN_FEATURES - 1, cpu_count=16), 1
+        )
+        self.assertEqual(
+            default_worker_count(PARALLEL_MIN_FEATURES, cpu_count=16), 8
+        )
+        self.assertEqual(
+            default_worker_count(PARALLEL_MIN_FEATURES, cpu_count=1), 1
+        )
+
+    def test_scan_threads_follow_the_number_of_large_layers(self):
+        large = SCAN_PARALLEL_MIN_FEATURES
+        self.assertEqual(
+            default_scan_thread_count([large, large - 1, 10], cpu_count=16),
+            1,
+        )
+        self.assertEqual(
+            default_scan_thread_count([large, large, large], cpu_count=16),
+            3,
+        )
+        self.assertEqual(
+            default_scan_thread_count([large] * 12, cpu_count=16), 8
+        )
+        self.assertEqual(
+            default_scan_thread_count([large, large], cpu_count=2), 1
+        )
+
+
+@unittest.skipUnless(SHAPELY_AVAILABLE, "Shapely 2 is not available")
+class BulkMetricEngineTests(unittest.TestCase):
+    def test_overlapping_polygons_receive_directional_coverage(self):
+        records = [
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+            record("m1", ROLE_DISTRIBUTION, "합성 A유적"),
+        ]
+        table = build_candidate_metric_table(
+            [box(0, 0, 10, 10).wkb, box(5, 0, 10, 10).wkb],
+            records,
+            search_distance=50,
+        )
+
+        self.assertEqual(len(table), 1)
+        metrics = table.metrics(0)
+        self.assertTrue(metrics["intersects"])
+        self.assertAlmostEqual(metrics["coverage_left"], 0.5)
+        self.assertAlmostEqual(metrics["coverage_right"], 1.0)
+        self.assertAlmostEqual(metrics["overlap_ratio"], 1.0)
+        self.assertAlmostEqual(metrics["iou"], 0.5)
+        self.assertAlmostEqual(metrics["area_ratio"], 0.5)
+        self.assertAlmostEqual(metrics["centroid_distance"], 2.5)
+        self.assertAlmostEqual(metrics["boundary_distance"], 0.0)
+        self.assertEqual(metrics["geometry_pair"], "polygon_polygon")
+
+    def test_contained_polygon_reports_boundary_distance(self):
+        records = [
+            record("d1", ROLE_LOCAL_DESIGNATED, "A"),
+            record("m1", ROLE_DISTRIBUTION, "B"),
+        ]
+        table = build_candidate_metric_table(
+            [box(0, 0, 100, 100).wkb, box(40, 40, 60, 60).wkb],
+            records,
+            search_distance=50,
+        )
+
+        self.assertAlmostEqual(table.metrics(0)["distance"], 0.0)
+        self.assertAlmostEqual(table.metrics(0)["boundary_distance"], 40.0)
+
+    def test_points_fall_back_to_geometry_distance(self):
+        records = [
+            record("d1", ROLE_LOCAL_DESIGNATED, "A"),
+            record("m1", ROLE_DISTRIBUTION, "A"),
+        ]
+        table = build_candidate_metric_table(
+            [Point(0, 0).wkb, Point(30, 40).wkb],
+            records,
+            search_distance=50,
+        )
+
+        metrics = table.metrics(0)
+        self.assertFalse(metrics["intersects"])
+        self.assertAlmostEqual(metrics["distance"], 50.0)
+        self.assertAlmostEqual(metrics["boundary_distance"], 50.0)
+        self.assertEqual(metrics["overlap_ratio"], 0.0)
+        self.assertEqual(metrics["geometry_pair"], "point_point")
+
+    def test_excluded_roles_are_counted_but_not_measured(self):
+        records = [
+            record("p1", ROLE_PROTECTION_ZONE, "A"),
+            record("p2", ROLE_PROTECTION_ZONE, "A"),
+            record("d1", ROLE_LOCAL_DESIGNATED, "A"),
+        ]
+        table = build_candidate_metric_table(
+            [box(0, 0, 10, 10).wkb] * 3,
+            records,
+            search_distance=50,
+            excluded_roles={ROLE_PROTECTION_ZONE},
+        )
+
+        self.assertEqual(table.checked_pair_count, 2)
+        self.assertEqual(len(table), 0)
+
+    def test_groups_that_never_pair_are_counted_as_skipped(self):
+        records = [
+            record("m1", ROLE_DISTRIBUTION, "A"),
+            record("m2", ROLE_DISTRIBUTION, "A"),
+            record("d1", ROLE_LOCAL_DESIGNATED, "A"),
+        ]
+        table = build_candidate_metric_table(
+            [box(0, 0, 10, 10).wkb] * 3,
+            records,
+            search_distance=50,
+            groups=[0, 0, 1],
+            group_pairs={(0, 1)},
+        )
+
+        self.assertEqual(list(zip(table.left, table.right)), [(0, 2), (1, 2)])
+        self.assertEqual(table.checked_pair_count, 2)
+        self.assertEqual(table.skipped_pair_count, 1)
+
+    def test_known_metrics_replace_measurement_for_unchanged_pairs(self):
+        wkbs, records = scattered_layer(60)
+        keys = [f"fp{index}" for index in range(len(records))]
+        first = build_candidate_metric_table(
+            wkbs, records, search_distance=50, metric_keys=keys
+        )
+        known = {
+            (keys[left], keys[right]): first.values(row)
+            for row, (left, right) in enumerate(zip(first.left, first.right))
+            if 7 not in (left, right)
+        }
+
+        second = build_candidate_metric_table(
+            wkbs,
+            records,
+            search_distance=50,
+            metric_keys=keys,
+            known_metrics=known,
+        )
+
+        self.assertEqual(replace(second, reused_rows=()), first)
+        self.assertEqual(len(second.reused_rows), len(known))
+        remeasured = [
+            (second.left[row], second.right[row])
+            for row in range(len(second))
+            if row not in set(second.reused_rows)
+        ]
+        self.assertTrue(remeasured)
+        self.assertTrue(all(7 in pair for pair in remeasured))
+
+    def test_pairs_are_unique_and_ordered(self):
+        records = [
+            record(f"m{index}", ROLE_DISTRIBUTION, "A") for index in range(4)
+        ]
+        table = build_candidate_metric_table(
+            [box(index, 0, index + 1, 1).wkb for index in range(4)],
+            records,
+            search_distance=0.5,
+            batch_size=2,
+        )
+
+        self.assertEqual(
+            list(zip(table.left, table.right)),
+            [(0, 1), (1, 2), (2, 3)],
+        )
+        self.assertEqual(table.checked_pair_count, 3)
+
+
+@unittest.skipUnless(SHAPELY_AVAILABLE, "Shapely 2 is not available")
+class TiledCandidateTests(unittest.TestCase):
+    def test_every_geometry_is_home_in_exactly_one_tile(self):
+        wkbs, _records = scattered_layer()
+
+        tiles = partition_tiles(geometries_from_wkb(wkbs), 50, 9)
+
+        homes = sorted(
+            int(position)
+            for members, home in tiles
+            for position in members[home]
+        )
+        self.assertEqual(homes, list(range(len(wkbs))))
+        self.assertGreater(len(tiles), 1)
+
+    def test_parallel_rows_equal_in_process_rows(self):
+        wkbs, records = scattered_layer()
+        options = {
+            "search_distance": 50,
+            "preset": PRESET_BALANCED,
+            "groups": [index % 3 for index in range(len(records))],
+            "group_pairs": {(0, 1)},
+        }
+
+        serial = collect_candidates(wkbs, records, **options)
+        parallel = collect_candidates(
+            wkbs, records, workers=2, tile_count=9, **options
+        )
+
+        self.assertTrue(serial.rows)
+        self.assertEqual(parallel.rows, serial.rows)
+        self.assertEqual(
+            parallel.checked_pair_count, serial.checked_pair_count
+        )
+        self.assertEqual(
+            parallel.skipped_pair_count, serial.skipped_pair_count
+        )
+        self.assertEqual(parallel.worker_count, 2)
+
+    def test_streamed_rows_are_the_collection_rows(self):
+        wkbs, records = scattered_layer()
+        options = {"search_distance": 50, "preset": PRESET_BALANCED}
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                streamed = []
+                idle = []
+                collection = collect_candidates(
+                    wkbs,
+                    records,
+                    workers=workers,
+                    tile_count=9,
+                    batch_size=7,
+                    rows_callback=streamed.extend,
+                    idle_callback=lambda: idle.append(True),
+                    **options,
+                )
+
+                self.assertTrue(collection.rows)
+                self.assertEqual(
+                    sorted(streamed, key=lambda row: row[:2]),
+                    list(collection.rows),
+                )
+                self.assertEqual(bool(idle), workers > 1)
+
+    def test_raising_idle_callback_abandons_running_tiles(self):
+        wkbs, records = scattered_layer()
+
+        class Closed(Exception):
+            pass
+
+        def closed():
+            raise Closed()
+
+        with patch.object(
+            ProcessPoolExecutor,
+            "shutdown",
+            autospec=True,
+            side_effect=ProcessPoolExecutor.shutdown,
+        ) as shutdown:
+            with self.assertRaises(Closed):
+                collect_candidates(
+                    wkbs,
+                    records,
+                    search_distance=50,
+                    preset=PRESET_BALANCED,
+                    workers=2,
+                    tile_count=9,
+                    idle_callback=closed,
+                )
+
+        self.assertFalse(shutdown.call_args.kwargs["wait"])
+
+    def test_parallel_reports_only_freshly_measured_pairs(self):
+        wkbs, records = scattered_layer()
+        keys = [f"fp{index}" for index in range(len(records))]
+        options = {
+            "search_distance": 50,
+            "preset": PRESET_BALANCED,
+            "metric_keys": keys,
+        }
+        first = collect_candidates(wkbs, records, **options)
+        known = {
+            (keys[left], keys[right]): values
+            for left, right, values in first.measured
+            if left % 5
+        }
+
+        serial = collect_candidates(
+            wkbs, records, known_metrics=known, **options
+        )
+        parallel = collect_candidates(
+            wkbs, records, known_metrics=known, workers=2, tile_count=9,
+            **options
+        )
+
+        self.assertEqual(serial.rows, first.rows)
+        self.assertEqual(parallel.rows, first.rows)
+        self.assertEqual(parallel.measured, serial.measured)
+        self.assertEqual(serial.reused_pair_count, len(known))
+        self.assertEqual(
+            len(serial.measured) + len(known), len(first.measured)
+        )
+        self.assertTrue(all(left % 5 == 0 for left, _r, _v in serial.measured))
+
+    def test_prescreen_skips_overlays_without_changing_rows(self):
+        wkbs, records = scattered_layer()
+        for position in range(0, len(records), 4):
+            records[position]["name"] = records[position]["site_name"] = (
+                f"무관한 이름 {position}"
+            )
+        options = {"search_distance": 50, "preset": PRESET_BALANCED}
+
+        screened = collect_candidates(wkbs, records, **options)
+        unscreened = collect_candidates(
+            wkbs, records, prescreen=False, **options
+        )
+
+        self.assertTrue(screened.rows)
+        self.assertEqual(screened.rows, unscreened.rows)
+        self.assertGreater(screened.screened_pair_count, 0)
+        self.assertEqual(unscreened.screened_pair_count, 0)
+
+    def test_known_pairs_are_not_reported_again(self):
+        wkbs, records = scattered_layer(60)
+        options = {"search_distance": 50, "preset": PRESET_BALANCED}
+        first = collect_candidates(wkbs, records, **options)
+        seen = {row[:2] for row in first.rows[:3]}
+
+        second = collect_candidates(
+            wkbs, records, candidate_pairs=seen, **options
+        )
+
+        self.assertEqual(second.rows, first.rows[3:])
+
+    def test_groups_limit_pairs_to_listed_group_pairs(self):
+        records = [
+            record("m1", ROLE_DISTRIBUTION, "합성 A유적"),
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+            record("d2", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+        ]
+
+        collection = collect_candidates(
+            [box(0, 0, 10, 10).wkb, Point(5, 5).wkb, box(0, 0, 10, 10).wkb],
+            records,
+            search_distance=50,
+            preset=PRESET_BALANCED,
+            groups=[0, 1, 2],
+            group_pairs={(1, 0)},
+            families=["polygon", "point", "polygon"],
+            area_overlap=False,
+        )
+
+        self.assertEqual(
+            [(left, right) for left, right, _item in collection.rows],
+            [(0, 1)],
+        )
+        evaluated = collection.rows[0][2]
+        self.assertEqual(evaluated.overlap_ratio, 1.0)
+        self.assertEqual(evaluated.coverage_left, 0.0)
+        self.assertEqual(evaluated.geometry_pair, "polygon_point")
+        self.assertEqual(collection.checked_pair_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,13 @@
 import json
 from pathlib import Path
+import sqlite3
 import tempfile
 import unittest
 from unittest import mock
 
 from heritage_identity_store import (
     DecisionStore,
+    SQLiteDecisionStore,
     build_source_identity,
     canonical_uid_pair,
     decision_pair_key,
@@ -100,6 +102,18 @@ class SourceIdentityTests(unittest.TestCase):
 
         self.assertEqual(geometry_signature(first), geometry_signature(second))
 
+    def test_precomputed_geometry_digest_gives_the_same_identity(self):
+        fields = {"native_code": "N-1", "name": "공주 유적"}
+
+        self.assertEqual(
+            build_source_identity(
+                "국가지정",
+                geometry_digest=geometry_signature(b"wkb-a"),
+                **fields,
+            ),
+            build_source_identity("국가지정", geometry=b"wkb-a", **fields),
+        )
+
 
 class DecisionStoreTests(unittest.TestCase):
     def setUp(self):
@@ -295,6 +309,92 @@ class DecisionStoreTests(unittest.TestCase):
         self.assertEqual(after_failure, old_content)
         self.assertEqual(remaining_temporary_files, [])
 
+    def candidate(self, left, right, **changes):
+        candidate = {
+            "left_uid": left.uid,
+            "left_fingerprint": left.content_fingerprint,
+            "right_uid": right.uid,
+            "right_fingerprint": right.content_fingerprint,
+        }
+        candidate.update(changes)
+        return candidate
+
+    def test_lookup_many_matches_single_lookups_in_input_order(self):
+        third = build_source_identity(
+            "발굴조사", native_code="E-3", geometry=b"excavation"
+        )
+        store = DecisionStore()
+        store.record(
+            self.first.uid,
+            self.first.content_fingerprint,
+            self.second.uid,
+            self.second.content_fingerprint,
+            decision="merge",
+            policy_version="policy-1",
+        )
+        store.record(
+            self.first.uid,
+            self.first.content_fingerprint,
+            third.uid,
+            third.content_fingerprint,
+            decision="keep",
+            policy_version="policy-1",
+        )
+        candidates = [
+            self.candidate(self.second, self.first),
+            self.candidate(third, self.first, left_fingerprint="changed"),
+            self.candidate(self.second, third),
+            self.candidate(self.first, self.first),
+        ]
+
+        lookups = store.lookup_many(candidates, policy_version="policy-1")
+
+        self.assertEqual(
+            [lookup.status for lookup in lookups.lookups],
+            ["reusable", "stale", "missing", "invalid"],
+        )
+        self.assertEqual(lookups.reusable[0][1].decision, "merge")
+        self.assertEqual(lookups.pending, candidates[1:])
+        for candidate, lookup in zip(candidates[:3], lookups.lookups):
+            self.assertEqual(
+                store.lookup(
+                    candidate["left_uid"],
+                    candidate["left_fingerprint"],
+                    candidate["right_uid"],
+                    candidate["right_fingerprint"],
+                    policy_version="policy-1",
+                ),
+                lookup,
+            )
+
+    def test_stale_decisions_lists_pairs_of_changed_sources(self):
+        third = build_source_identity(
+            "발굴조사", native_code="E-3", geometry=b"excavation"
+        )
+        store = DecisionStore()
+        for other in (self.second, third):
+            store.record(
+                self.first.uid,
+                self.first.content_fingerprint,
+                other.uid,
+                other.content_fingerprint,
+                decision="link",
+                policy_version="policy-1",
+            )
+
+        unchanged = store.stale_decisions({
+            self.first.uid: self.first.content_fingerprint,
+            third.uid: third.content_fingerprint,
+        })
+        changed = store.stale_decisions({third.uid: "changed"})
+
+        self.assertEqual(unchanged, [])
+        self.assertEqual(len(store.decisions_for_uids([self.first.uid])), 2)
+        self.assertEqual(
+            [(record.left_uid, record.right_uid) for record in changed],
+            [tuple(sorted((self.first.uid, third.uid)))],
+        )
+
     def test_invalid_decision_is_rejected(self):
         store = DecisionStore()
         with self.assertRaises(ValueError):
@@ -308,5 +408,167 @@ class DecisionStoreTests(unittest.TestCase):
             )
 
 
+class SQLiteDecisionStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "decisions.sqlite"
+        self.first = build_source_identity(
+            "국가지정", native_code="N-1", geometry=b"national"
+        )
+        self.second = build_source_identity(
+            "문화유적분포지도", native_code="D-2", geometry=b"distribution"
+        )
+        self.third = build_source_identity(
+            "발굴조사", native_code="E-3", geometry=b"excavation"
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, store, left, right, decision="merge"):
+        return store.record(
+            left.uid,
+            left.content_fingerprint,
+            right.uid,
+            right.content_fingerprint,
+            decision=decision,
+            policy_version="policy-1",
+            decided_at="2026-07-30T00:00:00+00:00",
+        )
+
+    def lookup(self, store, left, right):
+        return store.lookup(
+            right.uid,
+            right.content_fingerprint,
+            left.uid,
+            left.content_fingerprint,
+            policy_version="policy-1",
+        )
+
+    def test_save_writes_only_recorded_decisions(self):
+        store = DecisionStore.load(self.path)
+        self.assertIsInstance(store, SQLiteDecisionStore)
+        self.assertEqual(store.load_status, "missing")
+        self.record(store, self.first, self.second)
+        store.save(self.path)
+        store.close()
+
+        reopened = DecisionStore.load(self.path)
+        self.assertEqual(reopened.load_status, "loaded")
+        self.assertTrue(
+            self.lookup(reopened, self.first, self.second).reusable
+        )
+        self.record(reopened, self.first, self.third, decision="keep")
+        changes = reopened._connection.total_changes
+        reopened.save(self.path)
+        written = reopened._connection.total_changes - changes
+        self.assertEqual(len(reopened), 2)
+        reopened.close()
+
+        self.assertEqual(written, 1)
+        with sqlite3.connect(str(self.path)) as connection:
+            journal_mode = connection.execute(
+                "PRAGMA journal_mode"
+            ).fetchone()[0]
+        self.assertEqual(journal_mode, "wal")
+
+    def test_unsaved_decisions_do_not_reach_the_file(self):
+        store = DecisionStore.load(self.path)
+        self.record(store, self.first, self.second)
+        store.save(self.path)
+        self.record(store, self.first, self.third)
+        pending = self.lookup(store, self.first, self.third)
+        store.close()
+
+        reopened = DecisionStore.load(self.path)
+        saved = self.lookup(reopened, self.first, self.third)
+        reopened.close()
+
+        self.assertEqual(pending.status, "reusable")
+        self.assertEqual(saved.status, "missing")
+
+    def test_json_store_is_migrated_once(self):
+        legacy = DecisionStore()
+        self.record(legacy, self.first, self.second, decision="link")
+        legacy.save(self.path.with_suffix(".json"))
+
+        migrated = DecisionStore.load(self.path)
+        result = self.lookup(migrated, self.first, self.second)
+        migrated.close()
+        reopened = DecisionStore.load(self.path)
+        stored = len(reopened)
+        reopened.close()
+
+        self.assertEqual(migrated.load_status, "migrated")
+        self.assertEqual(result.decision, "link")
+        self.assertEqual(reopened.load_status, "loaded")
+        self.assertEqual(stored, 1)
+
+    def test_malformed_database_is_replaced_on_save(self):
+        self.path.write_bytes(b"not a database" * 20)
+
+        store = DecisionStore.load(self.path)
+        self.assertEqual(store.load_status, "malformed")
+        self.assertEqual(len(store), 0)
+        self.record(store, self.first, self.second)
+        store.save(self.path)
+        store.close()
+
+        reopened = DecisionStore.load(self.path)
+        self.assertEqual(len(reopened), 1)
+        reopened.close()
+
+    def test_batched_lookups_and_uid_index_read_the_database(self):
+        store = DecisionStore.load(self.path)
+        self.record(store, self.first, self.second)
+        self.record(store, self.second, self.third, decision="keep")
+        store.save(self.path)
+        store.close()
+
+        reopened = DecisionStore.load(self.path)
+        lookups = reopened.lookup_many(
+            [
+                {
+                    "left_uid": self.third.uid,
+                    "left_fingerprint": self.third.content_fingerprint,
+                    "right_uid": self.second.uid,
+                    "right_fingerprint": self.second.content_fingerprint,
+                },
+                {
+                    "left_uid": self.first.uid,
+                    "left_fingerprint": self.first.content_fingerprint,
+                    "right_uid": self.third.uid,
+                    "right_fingerprint": self.third.content_fingerprint,
+                },
+            ],
+            policy_version="policy-1",
+        )
+        touching = reopened.decisions_for_uids([self.second.uid])
+        stale = reopened.stale_decisions({self.first.uid: "changed"})
+        reopened.close()
+
+        self.assertEqual(
+            [lookup.status for lookup in lookups.lookups],
+            ["reusable", "missing"],
+        )
+        self.assertEqual(len(touching), 2)
+        self.assertEqual(
+            [(record.left_uid, record.right_uid) for record in stale],
+            [tuple(sorted((self.first.uid, self.second.uid)))],
+        )
+
+    def test_document_and_json_export_include_stored_and_new_decisions(self):
+        store = DecisionStore.load(self.path)
+        self.record(store, self.first, self.second)
+        store.save(self.path)
+        self.record(store, self.second, self.third, decision="keep")
+
+        exported = Path(self.directory.name) / "export.json"
+        store.save(exported)
+        store.close()
+
+        self.assertEqual(len(DecisionStore.load(exported)), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,12 @@
+import itertools
 import re
 import unittest
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without NumPy
+    np = None
+
 from heritage_matching import (
     DEFAULT_MATCHING_RULES_PATH,
     DECISION_KEEP,
@@ -25,10 +31,13 @@ from heritage_matching import (
     addresses_match,
     detect_source_role,
     evaluate_candidate,
+    evaluate_candidates,
     excavation_area_review_family,
     is_generic_name,
     load_matching_rules,
     matching_rules_metadata,
+    roles_can_pair,
+    screen_candidate,
     selected_content_fingerprint,
 )
 
@@ -214,6 +223,21 @@ class MatchingPolicyTests(unittest.TestCase):
             overlap_ratio=1.0,
         ))
 
+    def test_role_pairs_without_policy_kind_never_pair(self):
+        self.assertTrue(roles_can_pair(ROLE_LOCAL_DESIGNATED, ROLE_DISTRIBUTION))
+        self.assertTrue(roles_can_pair(ROLE_EXCAVATION, ROLE_EXCAVATION))
+        self.assertTrue(roles_can_pair(ROLE_SURFACE, ROLE_OTHER))
+        self.assertFalse(roles_can_pair(ROLE_DISTRIBUTION, ROLE_DISTRIBUTION))
+        self.assertFalse(
+            roles_can_pair(ROLE_LOCAL_DESIGNATED, ROLE_NATIONAL_DESIGNATED)
+        )
+        self.assertFalse(roles_can_pair(ROLE_SURFACE, ROLE_PROTECTION_ZONE))
+        for left in (ROLE_DISTRIBUTION, ROLE_EXCAVATION, ROLE_SURFACE):
+            for right in (ROLE_LOCAL_DESIGNATED, ROLE_OTHER, ROLE_EXCAVATION):
+                self.assertEqual(
+                    roles_can_pair(left, right), roles_can_pair(right, left)
+                )
+
     def test_conservative_preset_does_not_auto_apply_exact_match(self):
         designated = record("d1", ROLE_LOCAL_DESIGNATED, "봉업사지")
         distribution = record("m1", ROLE_DISTRIBUTION, "봉업사지")
@@ -385,6 +409,127 @@ class MatchingPolicyTests(unittest.TestCase):
         ))
 
 
+def batch_fixture():
+    records = [
+        record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적", address="가동 1"),
+        record("m1", ROLE_DISTRIBUTION, "합성 A유적", address="가동 1"),
+        record("e1", ROLE_EXCAVATION, "합성 B유적 I지역", project="합성 A유적"),
+        record("e2", ROLE_EXCAVATION, "합성 B유적 II지역"),
+        record("s1", ROLE_SURFACE, "유적"),
+        record("m2", ROLE_DISTRIBUTION, "합성 A유적 건물지"),
+    ]
+    pairs = list(itertools.permutations(range(len(records)), 2))
+    metrics = {
+        "intersects": [index % 3 != 2 for index in range(len(pairs))],
+        "overlap_ratio": [(index % 5) / 4 for index in range(len(pairs))],
+        "distance": [float(index * 7 % 90) for index in range(len(pairs))],
+        "geometry_pair": [
+            ("polygon_polygon", "point_polygon")[index % 4 == 0]
+            for index in range(len(pairs))
+        ],
+    }
+    return records, pairs, metrics
+
+
+class BatchEvaluationTests(unittest.TestCase):
+    def test_batch_rows_equal_single_pair_evaluation(self):
+        records, pairs, metrics = batch_fixture()
+
+        for preset in (PRESET_BALANCED, PRESET_AUTOMATION):
+            table = evaluate_candidates(
+                records,
+                [pair[0] for pair in pairs],
+                [pair[1] for pair in pairs],
+                metrics,
+                preset=preset,
+            )
+            expected = []
+            for row, (left, right) in enumerate(pairs):
+                evaluated = evaluate_candidate(
+                    records[left],
+                    records[right],
+                    preset=preset,
+                    **{name: values[row] for name, values in metrics.items()},
+                )
+                if evaluated:
+                    expected.append((left, right, evaluated))
+
+            self.assertTrue(expected)
+            self.assertEqual(list(table), expected)
+            self.assertEqual(
+                table.columns["rule"],
+                tuple(item.rule for _left, _right, item in expected),
+            )
+
+    def test_prescreen_never_drops_an_accepted_pair(self):
+        records, pairs, _metrics = batch_fixture()
+        geometry_cases = [
+            (intersects, overlap, distance)
+            for intersects in (True, False)
+            for overlap in (0.0, 0.3, 0.9)
+            for distance in (0.0, 30.0, 80.0)
+        ]
+        rejected_early = 0
+        for left, right in pairs:
+            screen = screen_candidate(records[left], records[right])
+            for intersects, overlap, distance in geometry_cases:
+                if intersects:
+                    distance = 0.0
+                evaluated = evaluate_candidate(
+                    records[left],
+                    records[right],
+                    intersects=intersects,
+                    overlap_ratio=overlap if intersects else 0.0,
+                    distance=distance,
+                )
+                if screen is None or not screen.allows(intersects, distance):
+                    rejected_early += 1
+                    self.assertIsNone(evaluated, (left, right))
+
+        self.assertGreater(rejected_early, 0)
+
+    def test_pair_without_any_attribute_signal_is_screened_out(self):
+        self.assertIsNone(screen_candidate(
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적"),
+            record("m1", ROLE_DISTRIBUTION, "전혀 다른 곳"),
+        ))
+        screen = screen_candidate(
+            record("d1", ROLE_LOCAL_DESIGNATED, "합성 A유적 건물지"),
+            record("m1", ROLE_DISTRIBUTION, "합성 A유적"),
+        )
+        self.assertTrue(screen.requires_intersection)
+        self.assertFalse(screen.allows(False))
+
+    def test_required_columns_are_reported(self):
+        records, pairs, metrics = batch_fixture()
+        del metrics["overlap_ratio"]
+
+        with self.assertRaises(KeyError):
+            evaluate_candidates(records, [0], [1], metrics)
+
+    @unittest.skipUnless(np is not None, "NumPy is not available")
+    def test_structured_array_matches_parallel_sequences(self):
+        records, pairs, metrics = batch_fixture()
+        structured = np.zeros(len(pairs), dtype=[
+            ("intersects", bool),
+            ("overlap_ratio", float),
+            ("distance", float),
+            ("geometry_pair", "U20"),
+        ])
+        for name, values in metrics.items():
+            structured[name] = values
+        left = np.array([pair[0] for pair in pairs])
+        right = np.array([pair[1] for pair in pairs])
+
+        from_array = evaluate_candidates(records, left, right, structured)
+        from_lists = evaluate_candidates(
+            records, left.tolist(), right.tolist(), metrics
+        )
+
+        self.assertEqual(from_array, from_lists)
+        self.assertIs(type(from_array.columns["overlap_ratio"][0]), float)
+
+
 class AddressSafetyTests(unittest.TestCase):
     def test_address_prefix_can_be_omitted(self):
         self.assertTrue(addresses_match(
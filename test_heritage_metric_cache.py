@@ -0,0 +1,103 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from heritage_candidate_metrics import known_pair_metrics
+from heritage_metric_cache import CandidateMetricCache
+
+
+VALUES = (True, 0.8, 0.0, 0.5, 1.0, 0.5, 0.5, 2.5, 0.0, "polygon_point")
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CandidateMetricCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "candidate_metrics.sqlite"
+        self.clock = Clock()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def open(self, ruleset="rules-a", crs="EPSG:5186", **options):
+        return CandidateMetricCache.open(
+            self.path,
+            ruleset_sha256=ruleset,
+            analysis_crs=crs,
+            clock=self.clock,
+            **options,
+        )
+
+    def test_saved_metrics_are_reused_in_either_orientation(self):
+        cache = self.open()
+        self.assertEqual(cache.load_status, "missing")
+        cache.record("fp-b", "fp-a", VALUES)
+        cache.save()
+        cache.close()
+
+        reopened = self.open()
+        known = reopened.known_metrics(["fp-a", "fp-b", "fp-c"])
+        reopened.close()
+
+        self.assertEqual(reopened.load_status, "loaded")
+        self.assertEqual(known_pair_metrics(known, "fp-b", "fp-a"), VALUES)
+        self.assertEqual(
+            known_pair_metrics(known, "fp-a", "fp-b")[3:5], (1.0, 0.5)
+        )
+
+    def test_pairs_need_both_fingerprints_ruleset_and_crs(self):
+        cache = self.open()
+        cache.record("fp-a", "fp-b", VALUES)
+        cache.save()
+        cache.close()
+
+        for options, fingerprints in (
+            ({}, ["fp-a", "fp-changed"]),
+            ({"ruleset": "rules-b"}, ["fp-a", "fp-b"]),
+            ({"crs": "EPSG:32652"}, ["fp-a", "fp-b"]),
+        ):
+            cache = self.open(**options)
+            self.assertEqual(cache.known_metrics(fingerprints), {})
+            cache.close()
+
+    def test_unused_entries_expire_and_oldest_entries_are_evicted(self):
+        cache = self.open(max_entries=2, max_age_days=10)
+        cache.record("fp-a", "fp-b", VALUES)
+        cache.record("fp-a", "fp-c", VALUES)
+        cache.save()
+        self.clock.now += 86_400
+        cache.record("fp-a", "fp-d", VALUES)
+        cache.mark_used([("fp-c", "fp-a")])
+        self.assertEqual(cache.save(), 1)
+        self.assertEqual(
+            set(cache.known_metrics(["fp-a", "fp-b", "fp-c", "fp-d"])),
+            {("fp-a", "fp-c"), ("fp-a", "fp-d")},
+        )
+
+        self.clock.now += 11 * 86_400
+        self.assertEqual(cache.save(), 2)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.statistics()["metric_cache_evicted_pairs"], 3)
+        cache.close()
+
+    def test_unreadable_file_is_replaced(self):
+        self.path.write_bytes(b"not a sqlite database" * 10)
+
+        cache = self.open()
+        cache.record("fp-a", "fp-b", VALUES)
+        cache.save()
+
+        self.assertEqual(cache.load_status, "reset")
+        self.assertEqual(len(cache), 1)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from difflib import SequenceMatcher
+import random
+import unittest
+
+from heritage_similarity import (
+    AUTOJUNK_MIN_LENGTH,
+    SimilarityMemo,
+    longest_match_size,
+    sequence_ratio,
+    sequence_ratio_at_least,
+)
+
+
+def random_names(seed, count, alphabet="가나다라마바사유적지구12ab"):
+    generator = random.Random(seed)
+    for _ in range(count):
+        yield tuple(
+            "".join(
+                generator.choice(alphabet)
+                for _ in range(generator.randint(0, 18))
+            )
+            for _side in range(2)
+        )
+
+
+class SequenceRatioTests(unittest.TestCase):
+    def test_ratio_and_longest_block_match_difflib(self):
+        for left, right in random_names(5, 3000):
+            matcher = SequenceMatcher(None, left, right)
+            self.assertEqual(sequence_ratio(left, right), matcher.ratio())
+            self.assertEqual(
+                longest_match_size(left, right),
+                matcher.find_longest_match(0, len(left), 0, len(right)).size,
+            )
+
+    def test_long_sequences_keep_difflib_autojunk_semantics(self):
+        left = "가나" * AUTOJUNK_MIN_LENGTH
+        right = "나가다" * AUTOJUNK_MIN_LENGTH
+
+        self.assertEqual(
+            sequence_ratio(left, right),
+            SequenceMatcher(None, left, right).ratio(),
+        )
+
+    def test_threshold_answers_equal_full_ratio_comparison(self):
+        generator = random.Random(9)
+        for left, right in random_names(7, 2000):
+            threshold = generator.random()
+            self.assertEqual(
+                sequence_ratio_at_least(left, right, threshold),
+                SequenceMatcher(None, left, right).ratio() >= threshold,
+            )
+
+
+class SimilarityMemoTests(unittest.TestCase):
+    def test_memo_is_keyed_on_ordered_pairs(self):
+        memo = SimilarityMemo()
+
+        first = memo.ratio("아차산성", "아차산보루")
+        again = memo.ratio("아차산성", "아차산보루")
+        memo.ratio("아차산보루", "아차산성")
+
+        self.assertEqual(first, again)
+        self.assertEqual((memo.hits, memo.misses), (1, 2))
+        self.assertEqual(len(memo), 2)
+
+    def test_early_exit_does_not_store_rejected_pairs(self):
+        memo = SimilarityMemo()
+
+        self.assertFalse(memo.ratio_at_least("가", "가나다라마바사", 0.9))
+        self.assertEqual(len(memo), 0)
+        self.assertTrue(memo.ratio_at_least("봉업사지", "봉업사지터", 0.8))
+        self.assertEqual(len(memo), 1)
+
+    def test_memo_is_cleared_at_its_size_limit(self):
+        memo = SimilarityMemo(max_entries=2)
+
+        for right in ("ab", "ac", "ad"):
+            memo.ratio("aa", right)
+
+        self.assertEqual(len(memo), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -289,6 +289,46 @@ class MetricContextQgisTests(unittest.TestCase):
             provenance["analysis_selection"]["metric_guarantee"]
         )
 
+    def test_batched_coordinates_match_per_point_transforms(self):
+        from qgis.core import QgsPointXY
+
+        context = MetricContext.create("EPSG:4326", (127.1, 36.45))
+        xs = [127.1 + index * 0.001 for index in range(50)]
+        ys = [36.45 + index * 0.0005 for index in range(50)]
+
+        batched_xs, batched_ys = context.transform_coordinates(xs, ys)
+
+        for x, y, batched_x, batched_y in zip(xs, ys, batched_xs, batched_ys):
+            single = context.transform_point(QgsPointXY(x, y))
+            self.assertAlmostEqual(batched_x, single.x(), places=6)
+            self.assertAlmostEqual(batched_y, single.y(), places=6)
+        self.assertEqual(context.transform_coordinates([], []), ([], []))
+        with self.assertRaises(MetricContextError):
+            context.transform_coordinates([127.1], [])
+
+    def test_analysis_geometries_batch_points_and_keep_order(self):
+        from qgis.core import QgsGeometry
+
+        context = MetricContext.create("EPSG:4326", (127.1, 36.45))
+        geometries = [
+            QgsGeometry.fromWkt("POINT(127.1 36.45)"),
+            QgsGeometry.fromWkt(
+                "POLYGON((127.1 36.45,127.101 36.45,127.101 36.451,"
+                "127.1 36.451,127.1 36.45))"
+            ),
+            QgsGeometry.fromWkt("POINT Z(127.2 36.5 12)"),
+            QgsGeometry.fromWkt("POINT(127.3 36.55)"),
+        ]
+
+        batched = context.to_analysis_geometries(geometries)
+
+        self.assertEqual(len(batched), len(geometries))
+        for source, result in zip(geometries, batched):
+            expected = context.to_analysis_geometry(source)
+            self.assertEqual(result.wkbType(), expected.wkbType())
+            self.assertEqual(result.asWkt(6), expected.asWkt(6))
+        self.assertEqual(geometries[0].asWkt(), "Point (127.1 36.45)")
+
 
 @unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python runtime is not available")
 class MetricContextDialogQgisTests(unittest.TestCase):
@@ -0,0 +1,114 @@
+import unittest
+
+from prepared_geometry import QGIS_AVAILABLE, PreparedGeometryCache
+
+
+class FakeGeometry:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def asWkb(self):
+        return self.payload
+
+    def constGet(self):
+        return self
+
+    def intersects(self, _other):
+        return True
+
+    def distance(self, _other):
+        return 7.0
+
+
+class FakeEngine:
+    def __init__(self, geometry):
+        self.geometry = geometry
+
+    def intersects(self, _other):
+        return True, ""
+
+    def distance(self, _other):
+        return 3.0
+
+
+class PreparedGeometryCacheTests(unittest.TestCase):
+    def test_engine_is_prepared_once_per_key_and_counted(self):
+        built = []
+
+        def factory(geometry):
+            built.append(geometry)
+            return FakeEngine(geometry)
+
+        cache = PreparedGeometryCache(engine_factory=factory)
+        geometry = FakeGeometry(b"polygon")
+        other = FakeGeometry(b"point")
+
+        first = cache.prepared(("layer", 1), geometry)
+        second = cache.prepared(("layer", 1), FakeGeometry(b"polygon"))
+
+        self.assertTrue(first.intersects(other))
+        self.assertEqual(second.distance(other), 3.0)
+        self.assertEqual(len(built), 1)
+        self.assertEqual(cache.statistics()["prepared_predicate_calls"], 2)
+        self.assertEqual(cache.statistics()["prepared_engines_reused"], 1)
+
+    def test_changed_geometry_gets_a_fresh_engine(self):
+        built = []
+
+        def factory(geometry):
+            built.append(geometry.payload)
+            return FakeEngine(geometry)
+
+        cache = PreparedGeometryCache(engine_factory=factory)
+
+        cache.prepared(("layer", 1), FakeGeometry(b"before"))
+        cache.prepared(("layer", 1), FakeGeometry(b"repaired"))
+
+        self.assertEqual(built, [b"before", b"repaired"])
+
+    def test_least_recently_used_engines_are_evicted(self):
+        cache = PreparedGeometryCache(max_engines=2, engine_factory=FakeEngine)
+
+        for feature_id in range(3):
+            cache.prepared(("layer", feature_id), FakeGeometry(b"x"))
+
+        self.assertEqual(len(cache), 2)
+        cache.prepared(("layer", 0), FakeGeometry(b"x"))
+        self.assertEqual(cache.statistics()["prepared_engines_built"], 4)
+
+    def test_unprepared_geometries_fall_back_to_geometry_calls(self):
+        cache = PreparedGeometryCache(engine_factory=lambda _geometry: None)
+
+        prepared = cache.prepared(("layer", 1), FakeGeometry(b"x"))
+
+        self.assertEqual(prepared.distance(FakeGeometry(b"y")), 7.0)
+        self.assertEqual(cache.statistics()["unprepared_predicate_calls"], 1)
+        self.assertEqual(cache.statistics()["prepared_predicate_calls"], 0)
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python runtime is not available")
+class PreparedGeometryQgisTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from qgis.core import QgsApplication
+
+        cls.app = QgsApplication.instance() or QgsApplication([], False)
+
+    def test_prepared_predicates_match_geometry_predicates(self):
+        from qgis.core import QgsGeometry
+
+        polygon = QgsGeometry.fromWkt("POLYGON((0 0,100 0,100 100,0 100,0 0))")
+        inner = QgsGeometry.fromWkt("POLYGON((40 40,60 40,60 60,40 60,40 40))")
+        outside = QgsGeometry.fromWkt("POINT(130 40)")
+        prepared = PreparedGeometryCache().prepared(("layer", 1), polygon)
+
+        self.assertTrue(prepared.intersects(inner))
+        self.assertFalse(prepared.intersects(outside))
+        self.assertAlmostEqual(prepared.distance(outside), 30.0)
+        self.assertAlmostEqual(prepared.intersection(inner).area(), 400.0)
+        self.assertAlmostEqual(prepared.boundary_distance(inner), 40.0)
+        self.assertAlmostEqual(prepared.boundary_distance(outside), 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -387,8 +387,8 @@ class QgisDialogWorkflowTests(unittest.TestCase):
             "도형을 삭제하는 화면" in intro_text
             or "does not delete geometry" in intro_text
         )
-        self.assertIn("시도지정문화유산", dialog.table.item(0, 2).text())
-        self.assertEqual(dialog.table.item(0, 4).text(), "공주시 A동")
+        self.assertIn("시도지정문화유산", dialog.model.index(0, 2).data())
+        self.assertEqual(dialog.model.index(0, 4).data(), "공주시 A동")
 
         dialog.pair_filter.setCurrentIndex(
             dialog.pair_filter.findData("designated_distribution")
@@ -401,6 +401,138 @@ class QgisDialogWorkflowTests(unittest.TestCase):
         self.assertEqual(decisions[0]["decision"], "link")
         self.assertEqual(decisions[1]["decision"], "keep")
 
+    def test_duplicate_review_model_filters_without_cell_widgets(self):
+        kinds = ("designated_distribution", "surface")
+        candidates = [
+            {
+                "left_uid": f"l{index}",
+                "right_uid": f"r{index}",
+                "left_role": "local_designated",
+                "right_role": "distribution",
+                "left_name": f"유적 {index}",
+                "right_name": f"유적 {index}",
+                "pair_kind": kinds[index % 2],
+                "confidence": "high",
+                "overlap_ratio": 0.5,
+                "distance": 1,
+                "rule": "exact_name_and_overlap",
+                "recommended_decision": "merge",
+                "auto_apply": index % 4 == 0,
+            }
+            for index in range(2000)
+        ]
+        dialog = self.review_dialog_class(candidates)
+        self.addCleanup(dialog.close)
+
+        self.assertIsNone(
+            dialog.table.indexWidget(dialog.proxy.index(0, 0))
+        )
+        self.assertEqual(dialog.model.counts()["merge"], 500)
+        self.assertEqual(dialog.model.index(1, 8).data(), "50.0%")
+
+        dialog.pair_filter.setCurrentIndex(
+            dialog.pair_filter.findData("surface")
+        )
+        self.assertEqual(dialog.proxy.rowCount(), 1000)
+        dialog._apply_recommended_to_visible()
+        self.assertIn("대표화 1500", dialog.summary.text())
+
+        self.assertTrue(
+            dialog.proxy.setData(dialog.proxy.index(0, 0), "link")
+        )
+        decisions = dialog.decisions()
+        self.assertEqual(decisions[1]["decision"], "link")
+        self.assertEqual(decisions[1]["decision_source"], "user")
+        self.assertEqual(decisions[4]["decision_source"], "auto")
+        self.assertEqual(decisions[2]["decision"], "keep")
+        self.assertIn("연결 1", dialog.summary.text())
+
+    def test_duplicate_review_pages_through_a_review_queue(self):
+        from ArchDistribution.review_queue import ReviewQueue
+
+        candidates = [
+            {
+                "left_uid": f"l{index}",
+                "right_uid": f"r{index}",
+                "left_role": "excavation",
+                "right_role": "distribution",
+                "pair_kind": "excavation_distribution",
+                "score": index / 100,
+                "rule": "fuzzy_name_and_overlap",
+                "recommended_decision": "keep",
+                "auto_apply": False,
+            }
+            for index in range(12)
+        ]
+        dialog = self.review_dialog_class(
+            ReviewQueue(candidates, page_size=5)
+        )
+        self.addCleanup(dialog.close)
+
+        self.assertEqual(dialog.model.rowCount(), 5)
+        self.assertEqual(dialog.candidates[0]["left_uid"], "l11")
+        self.assertIn("미표시 7건", dialog.summary.text())
+
+        dialog.model.fetchMore()
+        self.assertEqual(dialog.model.rowCount(), 10)
+
+        decisions = dialog.decisions()
+        self.assertEqual(
+            [item["left_uid"] for item in decisions],
+            [f"l{index}" for index in reversed(range(12))],
+        )
+        self.assertNotIn("미표시", dialog.summary.text())
+
+    def test_streaming_review_confirms_pages_before_generation_ends(self):
+        from ArchDistribution.review_queue import ReviewQueue
+
+        def candidate(index):
+            return {
+                "left_uid": f"l{index}",
+                "right_uid": f"r{index}",
+                "left_role": "excavation",
+                "right_role": "distribution",
+                "pair_kind": "excavation_distribution",
+                "score": index / 100,
+                "rule": "fuzzy_name_and_overlap",
+                "recommended_decision": "keep",
+                "auto_apply": False,
+            }
+
+        queue = ReviewQueue([candidate(index) for index in range(3)])
+        confirmed = []
+        dialog = self.review_dialog_class(
+            queue,
+            streaming=True,
+            confirm_callback=confirmed.append,
+        )
+        self.addCleanup(dialog.close)
+
+        self.assertFalse(dialog.btn_generate.isEnabled())
+        self.assertFalse(dialog.btn_bulk_apply.isEnabled())
+        self.assertIn("후보를 계속 찾는 중", dialog.summary.text())
+        self.assertTrue(
+            dialog.proxy.setData(dialog.proxy.index(0, 0), "link")
+        )
+
+        self.assertEqual(dialog.confirm_loaded(), 3)
+        self.assertEqual(
+            [item["decision"] for item in confirmed[0]],
+            ["link", "keep", "keep"],
+        )
+        self.assertFalse(
+            dialog.proxy.setData(dialog.proxy.index(0, 0), "merge")
+        )
+
+        queue.extend([candidate(index) for index in range(3, 5)])
+        dialog.candidates_arrived()
+        dialog.generation_finished()
+
+        self.assertEqual(dialog.model.rowCount(), 5)
+        self.assertTrue(dialog.btn_generate.isEnabled())
+        self.assertIn("확정 3건", dialog.summary.text())
+        self.assertEqual(dialog.decisions()[0]["decision"], "link")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -80,7 +80,7 @@ class DuplicateReviewZoomTests(unittest.TestCase):
         dialog.btn_zoom.click()
         self.assertEqual(received[-1]["left_uid"], "designated-1")
 
-        dialog.table.setCurrentCell(1, 3)
+        dialog.table.setCurrentIndex(dialog.proxy.index(1, 3))
         dialog.btn_zoom.click()
         self.assertEqual(received[-1]["left_uid"], "excavation-2")
 
@@ -92,7 +92,7 @@ class DuplicateReviewZoomTests(unittest.TestCase):
         )
         self.addCleanup(dialog.close)
 
-        dialog.table.cellDoubleClicked.emit(1, 6)
+        dialog.table.doubleClicked.emit(dialog.proxy.index(1, 6))
         self.assertEqual(received[-1]["right_uid"], "distribution-2")
         self.assertIsNone(dialog.last_zoom_error)
 
@@ -100,7 +100,7 @@ class DuplicateReviewZoomTests(unittest.TestCase):
             raise RuntimeError("canvas unavailable")
 
         dialog.zoom_callback = fail_zoom
-        dialog.table.cellDoubleClicked.emit(0, 3)
+        dialog.table.doubleClicked.emit(dialog.proxy.index(0, 3))
         self.assertIsInstance(dialog.last_zoom_error, RuntimeError)
         self.assertEqual(dialog.result(), 0)
 
@@ -2,6 +2,7 @@ import json
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 
 try:
@@ -827,6 +828,67 @@ class QgisMatchingIntegrationTests(unittest.TestCase):
             )
         )
 
+    def test_role_without_any_geometry_still_reaches_matching(self):
+        layer = self.make_layer([
+            {
+                "uid": "d1",
+                "role": self.roles["designated"],
+                "name": "공주 빈도형유적",
+                "wkt": "POLYGON((0 0,10 0,10 10,0 10,0 0))",
+            },
+            {
+                "uid": "m1",
+                "role": self.roles["distribution"],
+                "name": "공주 빈도형유적",
+                "wkt": "POLYGON EMPTY",
+            },
+        ])
+        result = self.plugin_class(None).apply_source_aware_matching(
+            layer,
+            decision_provider=self.recommended,
+        )
+        self.assertEqual(
+            result["main"].featureCount() + result["suppressed"].featureCount(),
+            2,
+        )
+
+    def test_callback_errors_stop_the_bulk_engine_without_fallback(self):
+        module = sys.modules[self.plugin_class.__module__]
+
+        class Closed(Exception):
+            pass
+
+        for error in (module.DuplicateReviewCancelled, Closed):
+            with self.subTest(error=error.__name__):
+                plugin = self.plugin_class(None)
+                runs = []
+                logged = []
+
+                def collect(*_args, **options):
+                    runs.append(options.get("workers", 1))
+                    options["idle_callback"]()
+
+                def closed():
+                    raise error()
+
+                with patch.object(
+                    module, "collect_candidates", side_effect=collect
+                ), patch.object(
+                    plugin, "_candidate_worker_count", return_value=2
+                ), patch.object(plugin, "log", side_effect=logged.append):
+                    with self.assertRaises(error):
+                        plugin._bulk_candidates(
+                            [],
+                            [],
+                            10.0,
+                            preset=None,
+                            ruleset=None,
+                            idle_callback=closed,
+                        )
+
+                self.assertEqual(runs, [2])
+                self.assertEqual(logged, [])
+
 
 if __name__ == "__main__":
     unittest.main()
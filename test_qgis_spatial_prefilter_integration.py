@@ -371,6 +371,181 @@ class QgisSpatialPrefilterIntegrationTests(unittest.TestCase):
         self.assertFalse(values_by_name["site-c"])
         self.assertEqual(zone.full_scan_count, 1)
 
+    def test_parallel_source_scans_match_sequential_scans(self):
+        def run(workers):
+            QgsProject.instance().clear()
+            sources = [
+                self.make_source([
+                    {
+                        "name": f"layer-{layer_index}-site-{index}",
+                        "wkt": (
+                            f"POLYGON(({index * 3} {layer_index * 20},"
+                            f"{index * 3 + 2} {layer_index * 20},"
+                            f"{index * 3 + 2} {layer_index * 20 + 2},"
+                            f"{index * 3} {layer_index * 20 + 2},"
+                            f"{index * 3} {layer_index * 20}))"
+                        ),
+                    }
+                    for index in range(30)
+                ])
+                for layer_index in range(3)
+            ]
+            study = self.make_study("EPSG:3857", (500, 500, 510, 510))
+            project = QgsProject.instance()
+            project.addMapLayer(study)
+            for source in sources:
+                project.addMapLayer(source)
+            plugin = self.make_plugin()
+            plugin._candidate_worker_count = lambda _count: workers
+            result = plugin.consolidate_heritage_layers(
+                [source.id() for source in sources],
+                QgsGeometry.fromRect(QgsRectangle(0, 0, 80, 80)),
+                study,
+                project.layerTreeRoot().addGroup(f"sources_{workers}"),
+                source_roles={
+                    source.id(): self.other_role for source in sources
+                },
+                matching_decision_provider=lambda candidates: candidates,
+            )
+            scans = plugin._current_processing_stats["source_scans"]
+            return (
+                sorted(
+                    feature["SRC_NAME"]
+                    for feature in result["main"].getFeatures()
+                ),
+                [
+                    (scan["layer"], scan["collected_count"])
+                    for scan in scans
+                ],
+            )
+
+        self.assertEqual(run(3), run(1))
+
+    def test_cached_source_snapshot_matches_fresh_scan(self):
+        import tempfile
+
+        from qgis.core import QgsVectorFileWriter
+
+        with tempfile.TemporaryDirectory() as directory:
+            memory_source = self.make_source([
+                {
+                    "name": f"site-{index}",
+                    "wkt": (
+                        f"POLYGON(({index * 10} 0,{index * 10 + 6} 0,"
+                        f"{index * 10 + 6} 6,{index * 10} 6,{index * 10} 0))"
+                    ),
+                }
+                for index in range(12)
+            ])
+            source_path = str(Path(directory) / "heritage_source.gpkg")
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            QgsVectorFileWriter.writeAsVectorFormatV3(
+                memory_source,
+                source_path,
+                QgsProject.instance().transformContext(),
+                options,
+            )
+
+            def run():
+                QgsProject.instance().clear()
+                source = QgsVectorLayer(source_path, "heritage_source", "ogr")
+                study = self.make_study("EPSG:3857", (500, 500, 510, 510))
+                project = QgsProject.instance()
+                project.addMapLayer(study)
+                project.addMapLayer(source)
+                plugin = self.make_plugin()
+                plugin._user_data_directory = lambda: Path(directory)
+                result = plugin.consolidate_heritage_layers(
+                    [source.id()],
+                    QgsGeometry.fromRect(QgsRectangle(0, 0, 55, 10)),
+                    study,
+                    project.layerTreeRoot().addGroup("sources"),
+                    source_roles={source.id(): self.other_role},
+                    matching_decision_provider=lambda candidates: candidates,
+                )
+                rows = sorted(
+                    (
+                        feature["SRC_NAME"],
+                        feature["SRC_UID"],
+                        feature["SRC_FP"],
+                        feature.geometry().asWkt(3),
+                    )
+                    for feature in result["main"].getFeatures()
+                )
+                return rows, plugin._current_processing_stats
+
+            fresh_rows, fresh_stats = run()
+            cached_rows, cached_stats = run()
+
+        self.assertEqual(len(fresh_rows), 6)
+        self.assertEqual(cached_rows, fresh_rows)
+        self.assertEqual(fresh_stats["source_snapshots_stored"], 1)
+        self.assertEqual(cached_stats["source_snapshot_hits"], 1)
+        self.assertEqual(
+            cached_stats["source_scans"][0]["bbox_candidate_count"],
+            fresh_stats["source_scans"][0]["bbox_candidate_count"],
+        )
+
+    def test_changed_datum_transformation_misses_the_snapshot_cache(self):
+        import tempfile
+
+        from qgis.core import (
+            QgsCoordinateReferenceSystem,
+            QgsCoordinateTransformContext,
+            QgsVectorFileWriter,
+        )
+
+        source_crs = QgsCoordinateReferenceSystem("EPSG:4326")
+        target_crs = QgsCoordinateReferenceSystem("EPSG:5186")
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = str(Path(directory) / "heritage_source.gpkg")
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            QgsVectorFileWriter.writeAsVectorFormatV3(
+                self.make_source(
+                    [{
+                        "name": "site",
+                        "wkt": "POLYGON((127 37,127.1 37,127.1 37.1,127 37))",
+                    }],
+                    crs="EPSG:4326",
+                ),
+                source_path,
+                QgsProject.instance().transformContext(),
+                options,
+            )
+            source = QgsVectorLayer(source_path, "heritage_source", "ogr")
+            job = {
+                "geometry_type": source.geometryType(),
+                "source_role": self.other_role,
+                "name_field": "NAME",
+                "project_name_field": "PROJECT",
+                "addr_field": None,
+                "code_field": None,
+            }
+            plugin = self.make_plugin()
+            default_context = QgsCoordinateTransformContext()
+            chosen_context = QgsCoordinateTransformContext()
+            chosen_context.addCoordinateOperation(
+                source_crs,
+                target_crs,
+                "+proj=pipeline +step +proj=axisswap +order=2,1",
+            )
+
+            default_key = plugin._source_snapshot_key(
+                source, target_crs, job, default_context
+            )
+            repeated_key = plugin._source_snapshot_key(
+                source, target_crs, job, QgsCoordinateTransformContext()
+            )
+            chosen_key = plugin._source_snapshot_key(
+                source, target_crs, job, chosen_context
+            )
+
+        self.assertIsNotNone(default_key)
+        self.assertEqual(repeated_key, default_key)
+        self.assertNotEqual(chosen_key, default_key)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,227 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from heritage_identity_store import DecisionStore
+from review_queue import (
+    ReviewCheckpoint,
+    ReviewQueue,
+    ReviewStream,
+    cross_family_priority,
+    review_priority,
+)
+
+
+def candidate(index, score, auto_apply=False, name="유적"):
+    return {
+        "left_uid": f"l{index}",
+        "right_uid": f"r{index}",
+        "left_name": name,
+        "right_name": name,
+        "score": score,
+        "auto_apply": auto_apply,
+        "pair_kind": "surface" if index % 2 else "designated_distribution",
+    }
+
+
+def stored_candidate(index, score=0.5):
+    item = candidate(index, score)
+    item.update({
+        "left_fingerprint": f"fl{index}",
+        "right_fingerprint": f"fr{index}",
+    })
+    return item
+
+
+class ReviewQueueTests(unittest.TestCase):
+    def test_pages_follow_the_stable_sort_order(self):
+        candidates = [
+            candidate(index, score=(index * 7) % 5 / 4, auto_apply=index % 3 == 0)
+            for index in range(23)
+        ]
+        queue = ReviewQueue(candidates, page_size=5)
+
+        pages = list(queue.pages())
+
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertEqual(
+            [item for page in pages for item in page],
+            sorted(candidates, key=review_priority),
+        )
+        self.assertFalse(queue)
+
+    def test_drain_after_a_page_returns_the_rest_in_order(self):
+        candidates = [candidate(index, score=index % 4) for index in range(10)]
+        queue = ReviewQueue(candidates, key=cross_family_priority, page_size=3)
+        expected = sorted(candidates, key=cross_family_priority)
+
+        first = queue.pop_page()
+        queue.push(candidate(99, score=10))
+
+        self.assertEqual(first, expected[:3])
+        self.assertEqual(queue.drain(), [candidate(99, score=10)] + expected[3:])
+        self.assertEqual(queue.pop_page(), [])
+
+    def test_pair_kinds_include_popped_candidates(self):
+        queue = ReviewQueue([candidate(0, 1), candidate(1, 0)], page_size=1)
+
+        queue.pop_page()
+
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(
+            queue.pair_kinds(),
+            {"surface", "designated_distribution"},
+        )
+
+    def test_page_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ReviewQueue(page_size=0)
+
+    def test_explicit_orders_break_ties_whatever_the_arrival(self):
+        candidates = [candidate(index, score=index % 2) for index in range(8)]
+        queue = ReviewQueue(page_size=3)
+
+        for position in (5, 1, 7, 0, 3, 6, 2, 4):
+            queue.push(candidates[position], order=(position,))
+
+        self.assertEqual(
+            queue.drain(),
+            sorted(candidates, key=review_priority),
+        )
+
+
+class ReviewStreamTests(unittest.TestCase):
+    def test_batches_in_any_order_give_the_finished_review_order(self):
+        candidates = [
+            candidate(index, score=index % 3, name=f"유적{index % 2}")
+            for index in range(12)
+        ]
+        queue = ReviewQueue(page_size=4)
+        stream = ReviewStream(queue)
+
+        for batch in ((6, 7, 8), (0, 1, 2), (9, 10, 11), (3, 4, 5)):
+            stream.add(
+                [candidates[position] for position in batch],
+                [(position,) for position in batch],
+            )
+        expected = sorted(candidates, key=review_priority)
+
+        self.assertEqual(len(stream), 12)
+        self.assertEqual(stream.in_review_order(stream.pending), expected)
+        self.assertEqual(queue.drain(), expected)
+
+    def test_arrival_order_is_the_default_tie_breaker(self):
+        queue = ReviewQueue()
+        stream = ReviewStream(queue)
+        first = candidate(0, score=1)
+        second = candidate(1, score=1)
+
+        stream.add([first])
+        stream.add([second])
+
+        self.assertEqual(
+            stream.in_review_order([dict(second), dict(first)]),
+            [first, second],
+        )
+
+    def test_saved_decisions_are_reused_or_queued_when_stale(self):
+        store = DecisionStore()
+        reusable = stored_candidate(0, score=0.2)
+        changed = stored_candidate(1, score=0.9)
+        new = stored_candidate(2, score=0.5)
+        for item in (reusable, changed):
+            store.record(
+                item["left_uid"],
+                item["left_fingerprint"],
+                item["right_uid"],
+                item["right_fingerprint"],
+                decision="merge",
+                policy_version="v1",
+            )
+        changed = dict(changed, right_fingerprint="changed")
+        queue = ReviewQueue()
+        stream = ReviewStream(queue, store, "v1")
+
+        queued = stream.add([reusable, changed, new])
+
+        self.assertEqual(queued, 2)
+        self.assertEqual(stream.stale_count, 1)
+        self.assertEqual(
+            [(item["left_uid"], item["decision_source"])
+             for item in stream.reused_decisions()],
+            [("l0", "reused")],
+        )
+        self.assertEqual(queue.drain(), [changed, new])
+
+
+class ReviewCheckpointTests(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        self.store_path = Path(self.temp.name) / "decisions.sqlite"
+        self.checkpoint = ReviewCheckpoint(
+            ReviewCheckpoint.path_for(self.store_path)
+        )
+        self.addCleanup(self.checkpoint.close)
+
+    def test_path_sits_beside_the_main_store(self):
+        self.assertEqual(
+            self.checkpoint.path,
+            Path(self.temp.name) / "decisions.checkpoint.sqlite",
+        )
+
+    def test_confirmed_pages_merge_into_the_next_run(self):
+        first = dict(stored_candidate(0), decision="merge")
+        second = dict(stored_candidate(1), decision="keep")
+        unusable = dict(candidate(2, 0.1), decision="merge")
+
+        self.assertEqual(self.checkpoint.confirm([first, unusable], "v1"), 1)
+        self.assertEqual(self.checkpoint.confirm([second], "v1"), 1)
+        self.checkpoint.close()
+        store = DecisionStore.load(self.store_path)
+        self.addCleanup(store.close)
+
+        merged = ReviewCheckpoint(self.checkpoint.path).merge_into(store)
+
+        self.assertEqual(merged, 2)
+        self.assertEqual(store.lookup("l0", "fl0", "r0", "fr0",
+                                      policy_version="v1").decision, "merge")
+        self.assertEqual(
+            store.lookup("l1", "fl1", "r1", "fr1",
+                         policy_version="v1").decision,
+            "keep",
+        )
+
+    def test_newer_main_store_decisions_are_kept(self):
+        item = dict(stored_candidate(0), decision="merge")
+        self.checkpoint.confirm([item], "v1")
+        self.checkpoint.close()
+        store = DecisionStore()
+        store.record(
+            "l0", "fl0", "r0", "fr0",
+            decision="keep",
+            policy_version="v1",
+            decided_at="2999-01-01T00:00:00+00:00",
+        )
+
+        self.assertEqual(self.checkpoint.merge_into(store), 0)
+        self.assertEqual(
+            store.lookup("l0", "fl0", "r0", "fr0",
+                         policy_version="v1").decision,
+            "keep",
+        )
+
+    def test_discard_removes_the_file_and_a_missing_file_merges_nothing(self):
+        self.checkpoint.confirm(
+            [dict(stored_candidate(0), decision="merge")], "v1"
+        )
+        self.assertTrue(self.checkpoint.path.exists())
+
+        self.checkpoint.discard()
+
+        self.assertFalse(self.checkpoint.path.exists())
+        self.assertEqual(self.checkpoint.merge_into(DecisionStore()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
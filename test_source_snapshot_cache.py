@@ -0,0 +1,239 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from source_snapshot_cache import (
+    QGIS_AVAILABLE,
+    STATUS_REPAIRED,
+    SourceSnapshotCache,
+    decode_attributes,
+    encode_attributes,
+    snapshot_key,
+)
+
+if QGIS_AVAILABLE:
+    from qgis.core import (
+        QgsCoordinateReferenceSystem,
+        QgsCoordinateTransformContext,
+        QgsFeature,
+        QgsFeatureRequest,
+        QgsField,
+        QgsFields,
+        QgsGeometry,
+        QgsRectangle,
+    )
+    from qgis.PyQt.QtCore import QDate, QVariant
+
+    from source_snapshot_cache import (
+        open_snapshot,
+        restore_source_feature,
+        snapshot_feature,
+        snapshot_fields,
+        write_snapshot,
+    )
+    from heritage_identity_store import build_source_identity
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class SnapshotKeyTests(unittest.TestCase):
+    def key(self, **changes):
+        values = {
+            "source_checksums": ["a" * 64],
+            "target_crs": "EPSG:5186",
+            "encoding": "CP949",
+            "role": "designated",
+        }
+        values.update(changes)
+        return snapshot_key(**values)
+
+    def test_key_is_stable_and_ignores_checksum_order(self):
+        self.assertEqual(
+            self.key(source_checksums=["b", "a"]),
+            self.key(source_checksums=["a", "b"]),
+        )
+        self.assertEqual(self.key(encoding="cp949"), self.key())
+
+    def test_every_normalization_input_changes_the_key(self):
+        base = self.key()
+        for changes in (
+            {"source_checksums": ["c" * 64]},
+            {"target_crs": "EPSG:32652"},
+            {"coordinate_operation": "+proj=pipeline +step +proj=noop"},
+            {"encoding": "UTF-8"},
+            {"role": "distribution"},
+            {"subset": "\"NAME\" IS NOT NULL"},
+        ):
+            with self.subTest(changes=changes):
+                self.assertNotEqual(self.key(**changes), base)
+
+
+class AttributeEncodingTests(unittest.TestCase):
+    def test_plain_values_round_trip(self):
+        values = [None, "유적", 3, 2.5, True, ["a", 1], {"$type": "x"}]
+
+        self.assertEqual(decode_attributes(encode_attributes(values)), values)
+
+    def test_binary_values_round_trip(self):
+        decoded = decode_attributes(encode_attributes([b"\x00\xff"]))
+
+        self.assertEqual(bytes(decoded[0]), b"\x00\xff")
+
+    def test_null_variants_become_none(self):
+        class NullVariant:
+            def isNull(self):
+                return True
+
+        self.assertEqual(decode_attributes(encode_attributes([NullVariant()])), [None])
+
+
+class SourceSnapshotCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        self.directory = Path(self.temp.name) / "snapshots"
+        self.clock = FakeClock()
+
+    def open(self, **options):
+        cache = SourceSnapshotCache.open(
+            self.directory,
+            clock=self.clock,
+            **options,
+        )
+        self.addCleanup(cache.close)
+        return cache
+
+    def write(self, cache, key, size):
+        path = cache.path_for(key)
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_lookup_misses_until_a_snapshot_is_stored(self):
+        cache = self.open()
+
+        self.assertIsNone(cache.lookup("k1"))
+        path = self.write(cache, "k1", 10)
+        self.assertEqual(cache.store("k1", path, feature_count=3), [])
+
+        self.assertEqual(cache.lookup("k1"), path)
+        self.assertEqual(cache.statistics()["source_snapshot_hits"], 1)
+        self.assertEqual(cache.statistics()["source_snapshot_misses"], 1)
+
+    def test_least_recently_used_snapshots_are_evicted_by_size(self):
+        cache = self.open(max_bytes=25)
+        first = self.write(cache, "k1", 10)
+        cache.store("k1", first, feature_count=1)
+        second = self.write(cache, "k2", 10)
+        cache.store("k2", second, feature_count=1)
+        cache.lookup("k1")
+
+        third = self.write(cache, "k3", 10)
+        evicted = cache.store("k3", third, feature_count=1)
+
+        self.assertEqual(evicted, ["k2"])
+        self.assertFalse(second.exists())
+        self.assertTrue(first.exists())
+        self.assertEqual(cache.total_bytes(), 20)
+
+    def test_oversized_snapshot_is_not_kept(self):
+        cache = self.open(max_bytes=5)
+        path = self.write(cache, "k1", 10)
+
+        self.assertEqual(cache.store("k1", path, feature_count=1), ["k1"])
+        self.assertIsNone(cache.lookup("k1"))
+
+    def test_deleted_snapshot_file_is_a_miss(self):
+        cache = self.open()
+        path = self.write(cache, "k1", 10)
+        cache.store("k1", path, feature_count=1)
+        path.unlink()
+
+        self.assertIsNone(cache.lookup("k1"))
+        self.assertEqual(len(cache), 0)
+
+    def test_purge_removes_every_snapshot(self):
+        cache = self.open()
+        for key in ("k1", "k2"):
+            cache.store(key, self.write(cache, key, 10), feature_count=1)
+        (self.directory / "k1.gpkg-wal").write_bytes(b"w")
+
+        self.assertEqual(cache.purge(), (2, 21))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(sorted(self.directory.glob("*.gpkg*")), [])
+        self.assertTrue((self.directory / "index.sqlite").exists())
+
+    def test_malformed_index_is_replaced(self):
+        self.directory.mkdir(parents=True)
+        (self.directory / "index.sqlite").write_bytes(b"not sqlite" * 100)
+
+        cache = self.open()
+
+        self.assertEqual(cache.load_status, "reset")
+        self.assertEqual(len(cache), 0)
+
+    def test_index_survives_reopening(self):
+        cache = self.open()
+        path = self.write(cache, "k1", 10)
+        cache.store("k1", path, feature_count=4, layer_name="지정유산")
+        cache.close()
+
+        reopened = self.open()
+
+        self.assertEqual(reopened.load_status, "loaded")
+        self.assertEqual(reopened.lookup("k1"), path)
+        with sqlite3.connect(str(self.directory / "index.sqlite")) as db:
+            row = db.execute(
+                "SELECT feature_count, layer_name FROM snapshots"
+            ).fetchone()
+        self.assertEqual(row, (4, "지정유산"))
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python bindings are not available")
+class SnapshotGeoPackageTests(unittest.TestCase):
+    def test_snapshot_round_trips_geometry_identity_and_attributes(self):
+        source_fields = QgsFields()
+        source_fields.append(QgsField("NAME", QVariant.String))
+        source_fields.append(QgsField("SURVEYED", QVariant.Date))
+        source = QgsFeature(source_fields)
+        source.setAttributes(["유적", QDate(2024, 5, 1)])
+        geometry = QgsGeometry.fromWkt("POLYGON((0 0, 10 0, 10 10, 0 10, 0 0))")
+        identity = build_source_identity("designated", name="유적")
+        far = QgsGeometry.fromWkt("POLYGON((90 90, 95 90, 95 95, 90 95, 90 90))")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "snapshot.gpkg"
+            fields = snapshot_fields()
+            write_snapshot(
+                path,
+                [
+                    snapshot_feature(fields, geometry, source, STATUS_REPAIRED, identity),
+                    snapshot_feature(fields, far, source, 0, identity),
+                ],
+                QgsCoordinateReferenceSystem("EPSG:5186"),
+                QgsCoordinateTransformContext(),
+            )
+            layer = open_snapshot(path)
+            rows = list(layer.getFeatures(
+                QgsFeatureRequest().setFilterRect(QgsRectangle(0, 0, 20, 20))
+            ))
+            self.assertEqual(len(rows), 1)
+            restored = restore_source_feature(rows[0], source_fields)
+            self.assertEqual(rows[0]["SRC_UID"], identity.uid)
+            self.assertEqual(rows[0]["SRC_FP"], identity.content_fingerprint)
+            self.assertEqual(rows[0]["SRC_STATUS"], STATUS_REPAIRED)
+            self.assertEqual(restored["NAME"], "유적")
+            self.assertEqual(restored["SURVEYED"], QDate(2024, 5, 1))
+            self.assertTrue(restored.geometry().equals(geometry))
+            del layer
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from spatial_index import QGIS_AVAILABLE, geometry_bounds
+
+
+class FakeGeometry:
+    def __init__(self, bounds):
+        self.bounds = bounds
+
+    def isEmpty(self):
+        return self.bounds is None
+
+    def boundingBox(self):
+        return self.bounds
+
+
+class GeometryBoundsTests(unittest.TestCase):
+    def test_null_and_empty_geometries_are_not_indexed(self):
+        entries = list(geometry_bounds([
+            (1, FakeGeometry((0, 0, 1, 1))),
+            (2, None),
+            (3, FakeGeometry(None)),
+            (4, FakeGeometry((2, 2, 3, 3))),
+        ]))
+
+        self.assertEqual(entries, [(1, (0, 0, 1, 1)), (4, (2, 2, 3, 3))])
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python runtime is not available")
+class BulkSpatialIndexQgisTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from qgis.core import QgsApplication
+
+        cls.app = QgsApplication.instance() or QgsApplication([], False)
+
+    def test_bulk_index_returns_the_same_hits_as_incremental_inserts(self):
+        from qgis.core import QgsFeature, QgsGeometry, QgsRectangle, QgsSpatialIndex
+
+        from spatial_index import bulk_spatial_index
+
+        geometries = {
+            feature_id: QgsGeometry.fromWkt(
+                f"POINT({feature_id % 40 * 3} {feature_id // 40 * 3})"
+                if feature_id % 3 == 0 else
+                "POLYGON(({x} {y},{x1} {y},{x1} {y1},{x} {y1},{x} {y}))".format(
+                    x=feature_id % 40 * 3,
+                    y=feature_id // 40 * 3,
+                    x1=feature_id % 40 * 3 + 2,
+                    y1=feature_id // 40 * 3 + 2,
+                )
+            )
+            for feature_id in range(1, 1601)
+        }
+        incremental = QgsSpatialIndex()
+        for feature_id, geometry in geometries.items():
+            feature = QgsFeature(feature_id)
+            feature.setGeometry(geometry)
+            incremental.addFeature(feature)
+        bulk = bulk_spatial_index(geometry_bounds(geometries.items()))
+
+        for x, y in ((0, 0), (17.5, 30), (60, 60), (119, 119)):
+            search = QgsRectangle(x, y, x + 4.5, y + 4.5)
+            self.assertEqual(
+                sorted(bulk.intersects(search)),
+                sorted(incremental.intersects(search)),
+            )
+        self.assertEqual(bulk_spatial_index([]).intersects(search), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+
+from study_geometry import QGIS_AVAILABLE, StudyGeometry
+
+if QGIS_AVAILABLE:
+    from qgis.core import (
+        QgsCoordinateReferenceSystem,
+        QgsCoordinateTransformContext,
+        QgsGeometry,
+    )
+
+
+class FakeGeometry:
+    def __init__(self, name, null=False):
+        self.name = name
+        self._null = null
+
+    def isNull(self):
+        return self._null
+
+    def buffer(self, distance, segments):
+        return FakeGeometry(f"{self.name}+{distance}/{segments}")
+
+
+class StudyGeometryCacheTests(unittest.TestCase):
+    def build(self, parts, engine_factory=lambda geometry: None):
+        unions = []
+        transforms = []
+
+        def union(geometries):
+            unions.append([geometry.name for geometry in geometries])
+            return FakeGeometry("|".join(geometry.name for geometry in geometries))
+
+        def transform(geometry, source_crs, target_crs):
+            transforms.append((source_crs, target_crs))
+            return FakeGeometry(f"{geometry.name}@{target_crs}")
+
+        study = StudyGeometry(
+            parts,
+            "EPSG:5186",
+            union=union,
+            transform=transform,
+            engine_factory=engine_factory,
+        )
+        return study, unions, transforms
+
+    def test_parts_are_dissolved_once_in_a_single_union(self):
+        study, unions, _transforms = self.build(
+            [FakeGeometry("a"), FakeGeometry("skip", null=True), FakeGeometry("b")]
+        )
+
+        self.assertEqual(study.geometry().name, "a|b")
+        self.assertEqual(study.geometry("EPSG:5186").name, "a|b")
+        self.assertFalse(study.is_empty())
+        self.assertEqual(unions, [["a", "b"]])
+
+    def test_each_target_crs_is_transformed_once(self):
+        study, _unions, transforms = self.build([FakeGeometry("a")])
+
+        self.assertEqual(study.geometry("EPSG:32652").name, "a@EPSG:32652")
+        study.geometry("EPSG:32652")
+        study.geometry("EPSG:4326")
+
+        self.assertEqual(
+            transforms,
+            [("EPSG:5186", "EPSG:32652"), ("EPSG:5186", "EPSG:4326")],
+        )
+        self.assertEqual(study.transforms_built, 2)
+
+    def test_empty_layer_has_no_geometry_or_buffers(self):
+        study, unions, _transforms = self.build([])
+
+        self.assertTrue(study.is_empty())
+        self.assertIsNone(study.geometry("EPSG:32652"))
+        self.assertEqual(study.buffers([100], 8), [])
+        self.assertEqual(study.distance(FakeGeometry("x")), 0.0)
+        self.assertEqual(unions, [])
+
+    def test_buffers_are_sorted_and_reused(self):
+        study, _unions, _transforms = self.build([FakeGeometry("a")])
+
+        rings = study.buffers([500, 100], 8)
+        again = study.buffers([100], 8)
+
+        self.assertEqual([ring["dist"] for ring in rings], [100, 500])
+        self.assertEqual(rings[0]["geom"].name, "a+100/8")
+        self.assertIs(rings[0]["geom"], again[0]["geom"])
+
+    def test_engine_is_built_once_per_crs(self):
+        built = []
+
+        class Engine:
+            def distance(self, other):
+                return (12.5, "")
+
+        def engine_factory(geometry):
+            built.append(geometry.name)
+            return Engine()
+
+        study, _unions, _transforms = self.build(
+            [FakeGeometry("a")],
+            engine_factory=engine_factory,
+        )
+        other = FakeGeometry("x")
+        other.constGet = lambda: other
+
+        self.assertEqual(study.distance(other, "EPSG:32652"), 12.5)
+        self.assertEqual(study.distance(other, "EPSG:32652"), 12.5)
+        self.assertEqual(built, ["a@EPSG:32652"])
+
+
+@unittest.skipUnless(QGIS_AVAILABLE, "QGIS Python bindings are not available")
+class QgisStudyGeometryTests(unittest.TestCase):
+    def test_union_matches_sequential_combine(self):
+        parts = [
+            QgsGeometry.fromWkt(
+                f"POLYGON(({x} 0, {x + 15} 0, {x + 15} 10, {x} 10, {x} 0))"
+            )
+            for x in range(0, 100, 10)
+        ]
+        combined = QgsGeometry(parts[0])
+        for part in parts[1:]:
+            combined = combined.combine(part)
+        crs = QgsCoordinateReferenceSystem("EPSG:5186")
+
+        study = StudyGeometry(parts, crs, QgsCoordinateTransformContext())
+
+        self.assertAlmostEqual(study.geometry().area(), combined.area())
+        self.assertLess(study.geometry().symDifference(combined).area(), 1e-9)
+        inside = QgsGeometry.fromWkt("POINT(50 5)")
+        outside = QgsGeometry.fromWkt("POINT(50 30)")
+        self.assertTrue(study.within(inside))
+        self.assertFalse(study.within(outside))
+        self.assertAlmostEqual(study.distance(outside), 20.0)
+        self.assertAlmostEqual(study.distance(inside), 0.0)
+
+    def test_geometry_returns_independent_copies(self):
+        crs = QgsCoordinateReferenceSystem("EPSG:5186")
+        study = StudyGeometry(
+            [QgsGeometry.fromWkt("POLYGON((0 0, 10 0, 10 10, 0 10, 0 0))")],
+            crs,
+            QgsCoordinateTransformContext(),
+        )
+
+        copy = study.geometry()
+        copy.translate(100, 0)
+
+        self.assertEqual(study.geometry().boundingBox().xMinimum(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
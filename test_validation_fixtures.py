@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 import unittest
 
-from validation.run_synthetic_policy import run_fixture
+from validation.run_synthetic_policy import run_fixture, similarity_equivalence
 
 
 class SyntheticPolicyFixtureTests(unittest.TestCase):
@@ -21,6 +21,17 @@ class SyntheticPolicyFixtureTests(unittest.TestCase):
         self.assertEqual(expected["false_merge_tolerance"], 0)
         self.assertEqual(expected["source_deletion_tolerance"], 0)
 
+    def test_similarity_kernel_matches_difflib_on_policy_fixture(self):
+        root = Path(__file__).resolve().parent
+        fixture = json.loads((
+            root / "validation/fixtures/policy_cases.json"
+        ).read_text(encoding="utf-8"))
+
+        equivalence = similarity_equivalence(fixture)
+
+        self.assertTrue(equivalence["identical"])
+        self.assertGreater(equivalence["pair_count"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
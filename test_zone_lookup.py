@@ -0,0 +1,174 @@
+import unittest
+
+from zone_lookup import ZoneLookup
+
+
+class Rect:
+    """Closed axis-aligned rectangle standing in for a QgsGeometry."""
+
+    def __init__(self, xmin, ymin, xmax, ymax):
+        self.bounds = (xmin, ymin, xmax, ymax)
+
+    def boundingBox(self):
+        return self
+
+    def constGet(self):
+        return self
+
+    def intersects(self, other):
+        a, b = self.bounds, other.bounds
+        return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+    def interiors_meet(self, other):
+        a, b = self.bounds, other.bounds
+        return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+    def touches(self, other):
+        return self.intersects(other) and not self.interiors_meet(other)
+
+    def contains(self, other):
+        a, b = self.bounds, other.bounds
+        return a[0] <= b[0] and a[1] <= b[1] and b[2] <= a[2] and b[3] <= a[3]
+
+
+class Boundary:
+    def __init__(self, rect):
+        self.rect = rect
+
+    def intersects(self, other):
+        a, b = self.rect.bounds, other.bounds
+        strictly_inside = (
+            a[0] < b[0] and a[1] < b[1] and b[2] < a[2] and b[3] < a[3]
+        )
+        return self.rect.intersects(other) and not strictly_inside
+
+
+class CountingEngine:
+    def __init__(self, geometry, calls):
+        self.geometry = geometry
+        self.calls = calls
+
+    def intersects(self, other):
+        self.calls.append(("intersects", self.geometry, other))
+        return self.geometry.intersects(other)
+
+    def contains(self, other):
+        return self.geometry.contains(other)
+
+    def touches(self, other):
+        return self.geometry.touches(other)
+
+
+class ListIndex:
+    def __init__(self, records):
+        self.records = records
+
+    def intersects(self, bounds):
+        return [
+            zone_id
+            for zone_id, (geometry, _name) in reversed(self.records.items())
+            if geometry.intersects(bounds)
+        ]
+
+
+def lookup(records, calls, built=None):
+    def engine_factory(geometry):
+        if built is not None:
+            built.append(geometry)
+        return CountingEngine(geometry, calls)
+
+    return ZoneLookup(
+        ListIndex(records),
+        records,
+        engine_factory=engine_factory,
+        boundary=Boundary,
+    )
+
+
+class ZoneLookupTests(unittest.TestCase):
+    def setUp(self):
+        # A partition of three side-by-side Zones sharing their edges.
+        self.records = {
+            1: (Rect(0, 0, 10, 10), "1구역"),
+            2: (Rect(10, 0, 20, 10), "2구역"),
+            3: (Rect(20, 0, 30, 10), "3구역"),
+        }
+
+    def test_names_follow_zone_id_order_on_a_shared_edge(self):
+        calls = []
+        zones = lookup(self.records, calls)
+
+        self.assertEqual(
+            zones.zone_names(Rect(8, 2, 12, 4)),
+            ["1구역", "2구역"],
+        )
+        self.assertEqual(zones.zone_names(Rect(10, 2, 10, 4)), ["1구역", "2구역"])
+        self.assertEqual(zones.zone_names(Rect(40, 0, 50, 5)), [])
+        self.assertEqual(zones.contained_lookups, 0)
+
+    def test_contained_feature_skips_neighbouring_zones(self):
+        calls = []
+        zones = lookup(self.records, calls)
+        feature = Rect(2, 2, 8, 8)
+
+        class WideIndex(ListIndex):
+            # A concave neighbour's bounding box can cover the feature.
+            def intersects(self, bounds):
+                return [2, 1] if bounds is feature else super().intersects(bounds)
+
+        zones.spatial_index = WideIndex(self.records)
+
+        self.assertEqual(zones.zone_names(feature), ["1구역"])
+        self.assertEqual(zones.contained_lookups, 1)
+        self.assertEqual(zones.skipped_zone_tests, 1)
+        tested = [
+            geometry
+            for _call, geometry, other in calls
+            if other is feature and isinstance(geometry, Rect)
+        ]
+        self.assertEqual(tested, [self.records[1][0]])
+
+    def test_overlapping_zones_are_still_tested(self):
+        calls = []
+        records = {
+            1: (Rect(0, 0, 10, 10), "문화재구역"),
+            2: (Rect(5, 0, 15, 10), "1구역"),
+            3: (Rect(10, 0, 20, 10), "2구역"),
+        }
+        zones = lookup(records, calls)
+
+        self.assertEqual(
+            zones.zone_names(Rect(6, 2, 8, 4)),
+            ["문화재구역", "1구역"],
+        )
+        self.assertEqual(zones.overlapping_zones(1), frozenset({2}))
+        self.assertEqual(zones.contained_lookups, 1)
+
+    def test_engines_are_prepared_once_per_zone(self):
+        calls = []
+        built = []
+        zones = lookup(self.records, calls, built)
+
+        for _ in range(3):
+            zones.zone_names(Rect(12, 2, 14, 4))
+
+        self.assertEqual(built.count(self.records[2][0]), 1)
+
+    def test_unprepared_zones_fall_back_to_geometry_predicates(self):
+        zones = ZoneLookup(
+            ListIndex(self.records),
+            self.records,
+            engine_factory=lambda geometry: None,
+            boundary=Boundary,
+        )
+
+        self.assertEqual(zones.zone_names(Rect(12, 2, 14, 4)), ["2구역"])
+        self.assertEqual(zones.contained_lookups, 0)
+
+    def test_empty_lookup_is_false(self):
+        self.assertFalse(ZoneLookup(None, {}))
+        self.assertEqual(ZoneLookup(None, {}).zone_names(Rect(0, 0, 1, 1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Synthetic benchmark for the bulk candidate-metrics engine.
+
+Run this with any Python that has Shapely 2 and NumPy; QGIS is not needed.
+It prints one JSON document and never writes the repository, allowing a
+maintainer to review the measurement before committing it below
+``validation/results``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import platform
+import sys
+import time
+
+
+REPOSITORY = Path(__file__).resolve().parents[1]
+if str(REPOSITORY) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY))
+
+from heritage_candidate_metrics import (  # noqa: E402
+    SHAPELY_AVAILABLE,
+    build_candidate_metric_table,
+    collect_candidates,
+    evaluate_metric_table,
+)
+from heritage_matching import (  # noqa: E402
+    PRESET_BALANCED,
+    ROLE_DISTRIBUTION,
+    ROLE_LOCAL_DESIGNATED,
+    load_matching_rules,
+)
+
+
+def synthetic_layer(feature_count):
+    """Return overlapping designated/distribution squares on a grid."""
+    from shapely.geometry import box
+
+    columns = int(math.ceil(math.sqrt(max(1, feature_count // 2))))
+    wkbs = []
+    records = []
+    for feature_id in range(feature_count):
+        site = feature_id // 2
+        x = (site % columns) * 120.0 + (feature_id % 2) * 10.0
+        y = (site // columns) * 120.0
+        wkbs.append(box(x, y, x + 60.0, y + 60.0).wkb)
+        records.append({
+            "uid": f"synthetic:{feature_id}",
+            "role": (
+                ROLE_LOCAL_DESIGNATED if feature_id % 2 else ROLE_DISTRIBUTION
+            ),
+            "name": f"합성 유적 {site}",
+            "site_name": f"합성 유적 {site}",
+        })
+    return wkbs, records
+
+
+def run(feature_count, workers=1):
+    rules = load_matching_rules()
+    tolerance = float(rules["thresholds"]["exact_name_distance_m"])
+    wkbs, records = synthetic_layer(feature_count)
+
+    started = time.perf_counter()
+    table = build_candidate_metric_table(
+        wkbs,
+        records,
+        search_distance=tolerance,
+    )
+    measured_at = time.perf_counter()
+    candidates = sum(
+        1 for _item in evaluate_metric_table(
+            records,
+            table,
+            preset=PRESET_BALANCED,
+            rules=rules,
+        )
+    )
+    finished = time.perf_counter()
+    collection = collect_candidates(
+        wkbs,
+        records,
+        search_distance=tolerance,
+        preset=PRESET_BALANCED,
+        rules=rules,
+        workers=workers,
+    )
+    collected_at = time.perf_counter()
+
+    import shapely
+
+    return {
+        "schema_version": 1,
+        "benchmark": "bulk-candidate-metrics",
+        "synthetic": True,
+        "feature_count": feature_count,
+        "checked_pair_count": table.checked_pair_count,
+        "measured_pair_count": len(table),
+        "candidate_count": candidates,
+        "metric_seconds": round(measured_at - started, 6),
+        "evaluation_seconds": round(finished - measured_at, 6),
+        "total_seconds": round(finished - started, 6),
+        "workers": collection.worker_count,
+        "tile_count": collection.tile_count,
+        "collection_candidate_count": len(collection.rows),
+        "collection_seconds": round(collected_at - finished, 6),
+        "completed": True,
+        "runtime": {
+            "python": platform.python_version(),
+            "shapely": shapely.__version__,
+            "geos": ".".join(str(part) for part in shapely.geos_version),
+            "operating_system": platform.platform(),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--features", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=1)
+    arguments = parser.parse_args()
+    if arguments.features < 1:
+        parser.error("--features must be positive")
+    if arguments.workers < 1:
+        parser.error("--workers must be positive")
+    if not SHAPELY_AVAILABLE:
+        raise SystemExit("Shapely 2 and NumPy are required for this benchmark")
+    print(json.dumps(
+        run(arguments.features, arguments.workers),
+        ensure_ascii=False,
+        sort_keys=True,
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Synthetic point-reprojection benchmark for research releases.
+
+Run this with QGIS Python.  It prints one JSON document and never writes the
+repository, allowing a maintainer to review the measurement before committing
+it below ``validation/results``.
+
+The ``per_feature`` path copies and transforms one ``QgsGeometry`` per
+point, as consolidation and numbering did before.  The ``batched`` path uses
+:meth:`metric_context.MetricContext.to_analysis_geometries`, which reprojects
+the coordinates of every flat point in one transform call.  Both paths must
+return the same coordinates.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import platform
+import sys
+import time
+
+
+REPOSITORY = Path(__file__).resolve().parents[1]
+if str(REPOSITORY) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY))
+
+from qgis.core import (  # noqa: E402
+    Qgis,
+    QgsApplication,
+    QgsGeometry,
+    QgsPointXY,
+)
+
+from metric_context import MetricContext  # noqa: E402
+
+
+def synthetic_points(feature_count):
+    """Return geographic points spread over a Korean county."""
+    columns = int(math.ceil(math.sqrt(feature_count)))
+    return [
+        QgsGeometry.fromPointXY(QgsPointXY(
+            127.0 + (index % columns) * 0.0005,
+            36.3 + (index // columns) * 0.0005,
+        ))
+        for index in range(feature_count)
+    ]
+
+
+def timed(function, repeats):
+    """Return the best wall time of ``repeats`` calls and the last result."""
+    best = None
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(feature_count, repeats):
+    geometries = synthetic_points(feature_count)
+    context = MetricContext.create("EPSG:4326", (127.1, 36.45))
+
+    per_feature_seconds, per_feature = timed(
+        lambda: [context.to_analysis_geometry(item) for item in geometries],
+        repeats,
+    )
+    batched_seconds, batched = timed(
+        lambda: context.to_analysis_geometries(geometries),
+        repeats,
+    )
+    maximum_difference = max(
+        max(
+            abs(left.asPoint().x() - right.asPoint().x()),
+            abs(left.asPoint().y() - right.asPoint().y()),
+        )
+        for left, right in zip(per_feature, batched)
+    )
+    if maximum_difference > 1e-6:
+        raise RuntimeError("batched and per-feature transforms disagree")
+
+    return {
+        "schema_version": 1,
+        "benchmark": "point-reprojection",
+        "synthetic": True,
+        "feature_count": feature_count,
+        "repeats": repeats,
+        "source_crs": "EPSG:4326",
+        "analysis_crs": context.analysis_crs.authid(),
+        "per_feature_seconds": round(per_feature_seconds, 6),
+        "batched_seconds": round(batched_seconds, 6),
+        "batched_speedup": (
+            round(per_feature_seconds / batched_seconds, 3)
+            if batched_seconds else None
+        ),
+        "maximum_coordinate_difference_m": maximum_difference,
+        "completed": True,
+        "runtime": {
+            "qgis": Qgis.QGIS_VERSION,
+            "python": platform.python_version(),
+            "operating_system": platform.platform(),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--features", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+    if arguments.features < 1:
+        parser.error("--features must be positive")
+    if arguments.repeats < 1:
+        parser.error("--repeats must be positive")
+    app = QgsApplication.instance() or QgsApplication([], False)
+    app.initQgis()
+    try:
+        result = run(arguments.features, arguments.repeats)
+    finally:
+        app.exitQgis()
+    print(json.dumps(
+        result,
+        ensure_ascii=False,
+        sort_keys=True,
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@
 Run this with QGIS Python.  It prints one JSON document and never writes the
 repository, allowing a maintainer to review the measurement before committing
 it below ``validation/results``.
+
+``--build incremental`` inserts one ``QgsFeature`` copy per record, as the
+plugin did before, and ``--build bulk`` uses the STR bulk loader of
+:mod:`spatial_index`.  The default ``--build both`` runs each build in its
+own child process, so both peak RSS values start from a fresh interpreter.
 """
 
 from __future__ import annotations
@@ -12,11 +17,18 @@ import argparse
 import json
 import math
 import os
+from pathlib import Path
 import platform
+import subprocess
 import sys
 import time
 
-from qgis.core import (
+
+REPOSITORY = Path(__file__).resolve().parents[1]
+if str(REPOSITORY) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY))
+
+from qgis.core import (  # noqa: E402
     Qgis,
     QgsApplication,
     QgsFeature,
@@ -25,6 +37,11 @@ from qgis.core import (
     QgsSpatialIndex,
 )
 
+from spatial_index import bulk_spatial_index  # noqa: E402
+
+
+BUILD_MODES = ("incremental", "bulk")
+
 
 def peak_rss_mib():
     """Return OS peak working-set MiB when the platform exposes it."""
@@ -77,22 +94,34 @@ def peak_rss_mib():
         return None
 
 
-def run(feature_count):
+def grid_bounds(feature_count):
     columns = int(math.ceil(math.sqrt(feature_count)))
-    index = QgsSpatialIndex()
     bounds = []
-    started = time.perf_counter()
     for feature_id in range(feature_count):
         column = feature_id % columns
         row = feature_id // columns
         x = column * 3.0
         y = row * 3.0
-        rectangle = QgsRectangle(x, y, x + 1.0, y + 1.0)
+        bounds.append(QgsRectangle(x, y, x + 1.0, y + 1.0))
+    return bounds
+
+
+def build_index(bounds, build):
+    if build == "bulk":
+        return bulk_spatial_index(enumerate(bounds))
+    index = QgsSpatialIndex()
+    for feature_id, rectangle in enumerate(bounds):
         feature = QgsFeature(feature_id)
         feature.setId(feature_id)
         feature.setGeometry(QgsGeometry.fromRect(rectangle))
         index.addFeature(feature)
-        bounds.append(rectangle)
+    return index
+
+
+def run(feature_count, build="incremental"):
+    bounds = grid_bounds(feature_count)
+    started = time.perf_counter()
+    index = build_index(bounds, build)
     indexed_at = time.perf_counter()
 
     raw_hits = 0
@@ -109,10 +138,11 @@ def run(feature_count):
 
     theoretical_pairs = feature_count * (feature_count - 1) // 2
     return {
-        "schema_version": 1,
+        "schema_version": 2,
         "benchmark": "qgsspatialindex-local-candidate-generation",
         "synthetic": True,
         "feature_count": feature_count,
+        "index_build": build,
         "index_build_seconds": round(indexed_at - started, 6),
         "query_seconds": round(finished - indexed_at, 6),
         "total_seconds": round(finished - started, 6),
@@ -133,23 +163,72 @@ def run(feature_count):
     }
 
 
+def compare(feature_count):
+    """Run each build mode in a child process and compare the results."""
+    builds = {}
+    for build in BUILD_MODES:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--features",
+                str(feature_count),
+                "--build",
+                build,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        builds[build] = json.loads(completed.stdout)
+    incremental = builds["incremental"]
+    bulk = builds["bulk"]
+    if bulk["unique_candidate_pairs"] != incremental["unique_candidate_pairs"]:
+        raise RuntimeError("bulk and incremental indexes returned other hits")
+    return {
+        "schema_version": 2,
+        "benchmark": "qgsspatialindex-build-comparison",
+        "synthetic": True,
+        "feature_count": feature_count,
+        "builds": builds,
+        "bulk_build_speedup": (
+            round(
+                incremental["index_build_seconds"]
+                / bulk["index_build_seconds"],
+                3,
+            )
+            if bulk["index_build_seconds"] else None
+        ),
+        "completed": True,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--features", type=int, default=100_000)
+    parser.add_argument(
+        "--build",
+        choices=BUILD_MODES + ("both",),
+        default="both",
+    )
     arguments = parser.parse_args()
     if arguments.features < 1:
         parser.error("--features must be positive")
-    app = QgsApplication.instance() or QgsApplication([], False)
-    app.initQgis()
-    try:
-        print(json.dumps(
-            run(arguments.features),
-            ensure_ascii=False,
-            sort_keys=True,
-            indent=2,
-        ))
-    finally:
-        app.exitQgis()
+    if arguments.build == "both":
+        result = compare(arguments.features)
+    else:
+        app = QgsApplication.instance() or QgsApplication([], False)
+        app.initQgis()
+        try:
+            result = run(arguments.features, arguments.build)
+        finally:
+            app.exitQgis()
+    print(json.dumps(
+        result,
+        ensure_ascii=False,
+        sort_keys=True,
+        indent=2,
+    ))
 
 
 if __name__ == "__main__":
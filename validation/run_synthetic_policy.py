@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+from difflib import SequenceMatcher
 import json
 from pathlib import Path
 import sys
@@ -15,7 +16,71 @@ if str(REPOSITORY) not in sys.path:
 
 from cartographic_filtering import is_insignificant_extent_fragment
 from heritage_grouping import resolve_heritage_identity
-from heritage_matching import evaluate_candidate
+from heritage_matching import canonical_name, evaluate_candidate
+from heritage_similarity import sequence_ratio
+
+
+class DifflibSimilarity:
+    """Reference similarity memo backed directly by ``difflib``."""
+
+    def ratio(self, left, right):
+        return SequenceMatcher(None, left, right).ratio()
+
+    def ratio_at_least(self, left, right, threshold):
+        return self.ratio(left, right) >= threshold
+
+
+def _case_names(case):
+    names = []
+    for side in ("left", "right"):
+        record = case[side]
+        for key in ("site_name", "name", "project_name"):
+            value = canonical_name(record.get(key))
+            if value and value not in names:
+                names.append(value)
+    return names
+
+
+def similarity_equivalence(document):
+    """Compare the similarity kernel with ``difflib`` on every fixture pair.
+
+    Both orderings of every canonical name pair are checked, and each
+    matching case is evaluated once with the kernel and once with the
+    ``difflib`` reference; the complete candidate must be identical.
+    """
+    reference = DifflibSimilarity()
+    pair_count = 0
+    for case in document["cases"]:
+        if case["kind"] != "matching":
+            continue
+        names = _case_names(case)
+        for left in names:
+            for right in names:
+                if left == right:
+                    continue
+                pair_count += 1
+                if sequence_ratio(left, right) != reference.ratio(left, right):
+                    raise AssertionError(
+                        f"{case['id']}: similarity differs for "
+                        f"{left!r} / {right!r}"
+                    )
+        spatial = dict(case["spatial"])
+        spatial.setdefault("distance", 0.0)
+        kernel = evaluate_candidate(
+            case["left"], case["right"], preset="balanced", **spatial
+        )
+        expected = evaluate_candidate(
+            case["left"],
+            case["right"],
+            preset="balanced",
+            similarity_memo=reference,
+            **spatial,
+        )
+        if kernel != expected:
+            raise AssertionError(
+                f"{case['id']}: candidate differs from the difflib reference"
+            )
+    return {"pair_count": pair_count, "identical": True}
 
 
 def run_fixture(document):
@@ -72,6 +137,7 @@ def main():
         "case_count": len(results),
         "passed": all(item["passed"] for item in results),
         "cases": results,
+        "similarity_equivalence": similarity_equivalence(document),
     }, ensure_ascii=False, sort_keys=True, indent=2))
 
 
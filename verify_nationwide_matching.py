@@ -22,9 +22,10 @@ from heritage_matching import (
     ROLE_PROTECTION_ZONE,
     ROLE_SURFACE,
     detect_source_role,
-    evaluate_candidate,
+    evaluate_candidates,
     is_designated_role,
 )
+from heritage_similarity import SimilarityMemo
 
 
 NAME_FIELDS = (
@@ -37,6 +38,8 @@ NAME_FIELDS = (
 PROJECT_FIELDS = ("사업명", "조사명", "공사명")
 ADDRESS_FIELDS = ("소재지", "유적소재지", "주소", "지번")
 CODE_FIELDS = ("유산코드", "CODE")
+# Tree hits are evaluated in columnar batches of this many pairs.
+COMPARE_BATCH_SIZE = 10_000
 
 
 def first_field(layer, candidates):
@@ -123,9 +126,41 @@ def scan_layer(zip_path, layer):
 def compare_collections(left_records, right_records, counters):
     if not left_records or not right_records:
         return
+    # One record sequence: right positions follow the left collection.
+    records = list(left_records) + list(right_records)
+    offset = len(left_records)
     right_geometries = [record["geometry"] for record in right_records]
     tree = STRtree(right_geometries)
-    for left in left_records:
+    memo = SimilarityMemo()
+    left_positions = []
+    right_positions = []
+    metrics = {"intersects": [], "overlap_ratio": [], "distance": []}
+
+    def flush():
+        table = evaluate_candidates(
+            records,
+            left_positions,
+            right_positions,
+            metrics,
+            similarity_memo=memo,
+        )
+        columns = table.columns
+        counters["candidate_total"] += len(table)
+        counters.update(f"kind:{kind}" for kind in columns["pair_kind"])
+        counters.update(
+            f"confidence:{confidence}" for confidence in columns["confidence"]
+        )
+        counters.update(
+            "auto_apply" if auto_apply else "manual_review"
+            for auto_apply in columns["auto_apply"]
+        )
+        counters.update(f"rule:{rule}" for rule in columns["rule"])
+        left_positions.clear()
+        right_positions.clear()
+        for column in metrics.values():
+            column.clear()
+
+    for left_index, left in enumerate(left_records):
         min_x, min_y, max_x, max_y = left["geometry"].bounds
         search = box(min_x - 50, min_y - 50, max_x + 50, max_y + 50)
         for right_index in tree.query(search):
@@ -148,22 +183,14 @@ def compare_collections(left_records, right_records, counters):
                     if smaller_area > 0
                     else 1.0
                 )
-            candidate = evaluate_candidate(
-                left,
-                right,
-                intersects=intersects,
-                overlap_ratio=overlap,
-                distance=distance,
-            )
-            if not candidate:
-                continue
-            counters["candidate_total"] += 1
-            counters[f"kind:{candidate.pair_kind}"] += 1
-            counters[f"confidence:{candidate.confidence}"] += 1
-            counters[
-                "auto_apply" if candidate.auto_apply else "manual_review"
-            ] += 1
-            counters[f"rule:{candidate.rule}"] += 1
+            left_positions.append(left_index)
+            right_positions.append(offset + int(right_index))
+            metrics["intersects"].append(intersects)
+            metrics["overlap_ratio"].append(overlap)
+            metrics["distance"].append(distance)
+            if len(left_positions) >= COMPARE_BATCH_SIZE:
+                flush()
+    flush()
 
 
 def main(sites_dir):
@@ -0,0 +1,176 @@
+"""Prepared Zone polygons for tagging heritage features with 허용기준.
+
+Zone layers of 현상변경 허용기준 hold tens of thousands of complex polygons,
+and consolidation tested every bounding-box hit with a raw
+``intersects``, which converts the Zone polygon to GEOS again for each
+feature.  :class:`ZoneLookup` keeps one prepared engine per Zone instead.
+
+A feature lying in the interior of one Zone can only meet the Zones whose
+interiors overlap that Zone, so the remaining hits are skipped once such a
+containing Zone is found.  For the usual partition of non-overlapping Zones
+that leaves no further test; the overlapping set is computed once per Zone.
+
+GEOS prepared geometries build their indexes lazily and are not safe to
+share, so every scan thread prepares its own engines.  QGIS is an optional
+import, as in :mod:`prepared_geometry`; the engine factory is injectable and
+the lookup is testable without QGIS.
+"""
+
+from __future__ import annotations
+
+import threading
+
+try:
+    from .prepared_geometry import (
+        _engine_value,
+        _qgis_engine,
+        geometry_boundary,
+    )
+except ImportError:
+    # Importable outside the plugin package, like the other run helpers.
+    from prepared_geometry import _engine_value, _qgis_engine, geometry_boundary
+
+
+class ZoneLookup:
+    """Zone names intersecting a geometry, in ascending Zone id order.
+
+    ``records`` maps a Zone feature id to ``(geometry, name)`` in the
+    heritage output CRS; ``spatial_index`` answers ``intersects(bounds)``
+    with those ids.
+    """
+
+    def __init__(
+        self,
+        spatial_index,
+        records,
+        engine_factory=None,
+        boundary=None,
+    ):
+        self.spatial_index = spatial_index
+        self.records = records
+        self._engine_factory = engine_factory or _qgis_engine
+        self._boundary = boundary or geometry_boundary
+        self._local = threading.local()
+        self._overlapping = {}
+        self._lock = threading.Lock()
+        self.contained_lookups = 0
+        self.skipped_zone_tests = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def __bool__(self):
+        return bool(self.records) and self.spatial_index is not None
+
+    def _engines(self):
+        engines = getattr(self._local, "engines", None)
+        if engines is None:
+            engines = {}
+            self._local.engines = engines
+        return engines
+
+    def _prepare(self, geometry):
+        if geometry is None:
+            return None
+        try:
+            return self._engine_factory(geometry)
+        except Exception:
+            return None
+
+    def _engine(self, zone_id):
+        engines = self._engines()
+        key = ("zone", zone_id)
+        if key not in engines:
+            engines[key] = self._prepare(self.records[zone_id][0])
+        return engines[key]
+
+    def _boundary_engine(self, zone_id):
+        engines = self._engines()
+        key = ("boundary", zone_id)
+        if key not in engines:
+            engines[key] = self._prepare(
+                self._boundary(self.records[zone_id][0])
+            )
+        return engines[key]
+
+    def _intersects(self, zone_id, geometry):
+        engine = self._engine(zone_id)
+        if engine is None:
+            return bool(self.records[zone_id][0].intersects(geometry))
+        return bool(_engine_value(engine.intersects(geometry.constGet())))
+
+    def _contains_properly(self, zone_id, geometry):
+        """Whether ``geometry`` lies in the Zone without touching its edge."""
+        engine = self._engine(zone_id)
+        boundary_engine = self._boundary_engine(zone_id)
+        if engine is None or boundary_engine is None:
+            return False
+        raw = geometry.constGet()
+        if not _engine_value(engine.contains(raw)):
+            return False
+        return not _engine_value(boundary_engine.intersects(raw))
+
+    def overlapping_zones(self, zone_id):
+        """Return the Zone ids whose interiors overlap ``zone_id``'s."""
+        with self._lock:
+            cached = self._overlapping.get(zone_id)
+        if cached is not None:
+            return cached
+        zone_geometry = self.records[zone_id][0]
+        engine = self._engine(zone_id)
+        overlapping = set()
+        for other_id in self.spatial_index.intersects(
+            zone_geometry.boundingBox()
+        ):
+            if other_id == zone_id or other_id not in self.records:
+                continue
+            other = self.records[other_id][0]
+            if engine is None:
+                meets = zone_geometry.intersects(other)
+                touches = meets and zone_geometry.touches(other)
+            else:
+                raw = other.constGet()
+                meets = _engine_value(engine.intersects(raw))
+                touches = meets and _engine_value(engine.touches(raw))
+            if meets and not touches:
+                overlapping.add(other_id)
+        overlapping = frozenset(overlapping)
+        with self._lock:
+            self._overlapping[zone_id] = overlapping
+        return overlapping
+
+    def zone_names(self, geometry):
+        """Return the names of the Zones that ``geometry`` intersects."""
+        if not self:
+            return []
+        names = []
+        allowed = None
+        skipped = 0
+        for zone_id in sorted(
+            self.spatial_index.intersects(geometry.boundingBox())
+        ):
+            if zone_id not in self.records:
+                continue
+            if allowed is not None and zone_id not in allowed:
+                skipped += 1
+                continue
+            if not self._intersects(zone_id, geometry):
+                continue
+            name = self.records[zone_id][1]
+            if name:
+                names.append(str(name))
+            if allowed is None and self._contains_properly(zone_id, geometry):
+                allowed = self.overlapping_zones(zone_id)
+        if allowed is not None:
+            with self._lock:
+                self.contained_lookups += 1
+                self.skipped_zone_tests += skipped
+        return names
+
+    def statistics(self):
+        """Return counters for the run manifest."""
+        return {
+            "zone_count": len(self.records),
+            "zone_contained_lookups": self.contained_lookups,
+            "zone_tests_skipped": self.skipped_zone_tests,
+        }